@@ -4,7 +4,8 @@ from django.db import transaction
 from django.utils import timezone
 from django.utils.html import format_html
 
-from .models import Subscription, User
+from .auth.user_cache import invalidate_users
+from .models import AccountDeletion, Subscription, User
 
 
 @admin.register(User)
@@ -60,11 +61,13 @@ class CustomUserAdmin(UserAdmin):
     def bulk_verify_email(self, request, queryset):
         """Bulk verify user emails"""
         with transaction.atomic():
-            updated = queryset.filter(is_email_verified=False).update(
+            user_ids = list(queryset.filter(is_email_verified=False).values_list('pk', flat=True))
+            updated = User.objects.filter(pk__in=user_ids).update(
                 is_email_verified=True,
                 email_verification_token=None,
                 email_verification_sent_at=None
             )
+            invalidate_users(user_ids)
 
         self.message_user(
             request,
@@ -205,3 +208,14 @@ class SubscriptionAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(AccountDeletion)
+class AccountDeletionAdmin(admin.ModelAdmin):
+    list_display = ('user_id', 'status', 'current_step', 'attempts', 'created_at', 'completed_at')
+    list_filter = ('status',)
+    search_fields = ('user_id',)
+    readonly_fields = (
+        'user_id', 'status', 'current_step', 'deleted_rows', 'attempts',
+        'last_error', 'completed_at', 'created_at', 'updated_at'
+    )
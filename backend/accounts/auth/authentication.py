@@ -1,9 +1,16 @@
 """
-Custom authentication backend for email login
+Custom authentication backends: email login and cached JWT user resolution
 """
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
 from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from . import user_cache
 
 User = get_user_model()
 
@@ -41,3 +48,36 @@ class EmailOrUsernameModelBackend(ModelBackend):
             return User.objects.get(pk=user_id)
         except User.DoesNotExist:
             return None
+
+
+class CachedUserJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that loads the user together with the subscription
+
+    Resolves the user in one select_related query, or from the versioned
+    user snapshot cache when AUTH_USER_CACHE is enabled, so views reading
+    request.user.subscription do not issue another query.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = user_cache.get_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # 캐시에서 재구성된 사용자는 비밀번호 해시 대신 MD5 만 가지고 있음
+            password_md5 = getattr(user, 'password_md5', None) or get_md5_hash_password(user.password)
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != password_md5:
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
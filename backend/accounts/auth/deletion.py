@@ -0,0 +1,205 @@
+"""
+Account deletion pipeline
+
+Deleting a user used to cascade through every content, review, exam and
+payment row inside the request, with Django's collector loading all of them
+into memory and the whole tree locked in one transaction. The request now
+only deactivates and anonymizes the account and records an AccountDeletion
+job; the run_account_deletion task then removes the child rows in bounded
+raw-SQL batches, leaves before parents, and deletes the user row last.
+
+Each batch commits together with the job's progress, so an interrupted job
+resumes from its last step. Every statement is idempotent (it only matches
+rows that still belong to the user), so re-running a batch is harmless.
+"""
+import logging
+from collections import namedtuple
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ..models import AccountDeletion, NotificationPreference, Subscription
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+# 익명화된 이메일 도메인 (예약된 .invalid TLD: 메일이 발송되지 않음)
+ANONYMIZED_EMAIL_DOMAIN = 'deleted.invalid'
+
+# action: 'delete' 는 행 삭제, 그 외 값은 NULL 로 비울 컬럼 (SET_NULL 관계)
+DeletionStep = namedtuple('DeletionStep', ['name', 'model', 'where', 'action'])
+
+# 사용자 소유 콘텐츠 / 주간 시험 (다른 사용자의 행이 참조할 수 있는 부모)
+_OWNED_CONTENT = 'SELECT id FROM {content.Content} WHERE author_id = %s'
+_OWNED_TESTS = 'SELECT id FROM {exams.WeeklyTest} WHERE user_id = %s'
+_OWNED_QUESTIONS = (
+    'SELECT id FROM {exams.WeeklyTestQuestion} '
+    f'WHERE weekly_test_id IN ({_OWNED_TESTS}) OR content_id IN ({_OWNED_CONTENT})'
+)
+
+# FK 순서 (자식 → 부모). 사용자 행은 모든 단계가 끝난 뒤 ORM 으로 삭제합니다.
+DELETION_STEPS = (
+    DeletionStep('exam_answers', 'exams.WeeklyTestAnswer',
+                 f'user_id = %s OR question_id IN ({_OWNED_QUESTIONS})', 'delete'),
+    DeletionStep('exam_questions', 'exams.WeeklyTestQuestion',
+                 f'weekly_test_id IN ({_OWNED_TESTS}) OR content_id IN ({_OWNED_CONTENT})', 'delete'),
+    DeletionStep('weekly_tests', 'exams.WeeklyTest', 'user_id = %s', 'delete'),
+    DeletionStep('question_bank', 'exams.QuestionBankEntry', f'content_id IN ({_OWNED_CONTENT})', 'delete'),
+    DeletionStep('review_history', 'review.ReviewHistory',
+                 f'user_id = %s OR content_id IN ({_OWNED_CONTENT})', 'delete'),
+    DeletionStep('review_schedules', 'review.ReviewSchedule',
+                 f'user_id = %s OR content_id IN ({_OWNED_CONTENT})', 'delete'),
+    DeletionStep('reminder_deliveries', 'review.ReminderDelivery', 'user_id = %s', 'delete'),
+    DeletionStep('daily_review_stats', 'review.DailyReviewStats', 'user_id = %s', 'delete'),
+    DeletionStep('interval_retention_stats', 'review.IntervalRetentionStats', 'user_id = %s', 'delete'),
+    DeletionStep('contents', 'content.Content', 'author_id = %s', 'delete'),
+    # 다른 사용자의 콘텐츠가 참조하는 카테고리 (SET_NULL)
+    DeletionStep('category_references', 'content.Content',
+                 'category_id IN (SELECT id FROM {content.Category} WHERE user_id = %s)', 'category_id'),
+    DeletionStep('categories', 'content.Category', 'user_id = %s', 'delete'),
+    DeletionStep('billing_schedules', 'accounts.BillingSchedule',
+                 'subscription_id IN (SELECT id FROM {accounts.Subscription} WHERE user_id = %s)', 'delete'),
+    DeletionStep('payment_history', 'accounts.PaymentHistory', 'user_id = %s', 'delete'),
+    DeletionStep('notification_preference', 'accounts.NotificationPreference', 'user_id = %s', 'delete'),
+    DeletionStep('subscription', 'accounts.Subscription', 'user_id = %s', 'delete'),
+    DeletionStep('admin_log', 'admin.LogEntry', 'user_id = %s', 'delete'),
+    DeletionStep('outstanding_tokens', 'token_blacklist.OutstandingToken', 'user_id = %s', 'user_id'),
+)
+
+
+def _deletion_settings():
+    return settings.ACCOUNT_DELETION_SETTINGS
+
+
+def _table(label):
+    return connection.ops.quote_name(apps.get_model(label)._meta.db_table)
+
+
+def _installed(step):
+    """admin, token_blacklist 등 선택 앱이 빠진 환경에서는 해당 단계 생략"""
+    try:
+        apps.get_model(step.model)
+    except LookupError:
+        return False
+    return True
+
+
+def build_batch_sql(step):
+    """
+    단계 하나의 배치 SQL (LIMIT 으로 한 번에 처리할 행 수 제한)
+
+    Returns:
+        tuple: (sql, where 절의 사용자 ID 자리표시자 수)
+    """
+    model = apps.get_model(step.model)
+    table = _table(step.model)
+    pk = connection.ops.quote_name(model._meta.pk.column)
+
+    where = step.where
+    for label in ('content.Content', 'content.Category', 'exams.WeeklyTest',
+                  'exams.WeeklyTestQuestion', 'accounts.Subscription'):
+        where = where.replace('{%s}' % label, _table(label))
+
+    selection = f'SELECT {pk} FROM {table} WHERE {where} LIMIT %s'
+    if step.action == 'delete':
+        sql = f'DELETE FROM {table} WHERE {pk} IN ({selection})'
+    else:
+        column = connection.ops.quote_name(step.action)
+        sql = f'UPDATE {table} SET {column} = NULL WHERE {pk} IN ({selection})'
+    return sql, where.count('%s')
+
+
+def anonymize_user(user):
+    """
+    탈퇴 계정을 즉시 비활성화하고 개인 정보를 제거
+
+    이메일은 사용자 ID 기반의 주소로 바뀌므로 같은 이메일로 바로 재가입할 수 있습니다.
+    """
+    user.is_active = False
+    user.email = f'deleted-{user.pk}@{ANONYMIZED_EMAIL_DOMAIN}'
+    user.username = None
+    user.first_name = ''
+    user.last_name = ''
+    user.is_email_verified = False
+    user.email_verification_token = None
+    user.set_unusable_password()
+    user.save()
+
+    # 삭제 전까지 알림 발송/자동 갱신 대상에서 제외
+    NotificationPreference.objects.filter(user=user).update(email_notifications_enabled=False)
+    Subscription.objects.filter(user=user).update(auto_renewal=False)
+
+
+def schedule_account_deletion(user):
+    """
+    계정 탈퇴 처리: 즉시 익명화하고 하위 데이터 삭제 작업을 예약
+
+    Returns:
+        AccountDeletion: 생성(또는 기존) 삭제 작업
+    """
+    from ..tasks import run_account_deletion
+
+    with transaction.atomic():
+        anonymize_user(user)
+        deletion, _ = AccountDeletion.objects.get_or_create(user_id=user.pk)
+        transaction.on_commit(lambda: run_account_deletion.delay(deletion.pk))
+
+    logger.info(f"Account deletion scheduled for user {user.pk}")
+    return deletion
+
+
+def run_deletion(deletion, max_batches=None):
+    """
+    삭제 작업을 이어서 진행
+
+    current_step 부터 단계별로 BATCH_SIZE 행씩 삭제하고, 배치마다 진행 상황을
+    같은 트랜잭션에서 기록합니다. 모든 단계가 끝나면 사용자 행을 삭제합니다.
+
+    Args:
+        deletion: AccountDeletion
+        max_batches: 이번 실행에서 처리할 최대 배치 수 (None 이면 끝까지)
+
+    Returns:
+        bool: 삭제 완료 여부 (False 면 배치 한도에 도달해 재실행 필요)
+    """
+    if deletion.status == AccountDeletion.Status.COMPLETED:
+        return True
+
+    batch_size = _deletion_settings()['BATCH_SIZE']
+    names = [step.name for step in DELETION_STEPS]
+    start = names.index(deletion.current_step) if deletion.current_step in names else 0
+    batches = 0
+
+    for step in DELETION_STEPS[start:]:
+        if not _installed(step):
+            continue
+        sql, placeholders = build_batch_sql(step)
+        params = [deletion.user_id] * placeholders + [batch_size]
+
+        while True:
+            if max_batches is not None and batches >= max_batches:
+                return False
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute(sql, params)
+                    affected = cursor.rowcount
+                deletion.current_step = step.name
+                deletion.deleted_rows[step.name] = deletion.deleted_rows.get(step.name, 0) + affected
+                deletion.save(update_fields=['current_step', 'deleted_rows', 'updated_at'])
+            batches += 1
+            if affected < batch_size:
+                break
+
+    with transaction.atomic():
+        # 남은 관계가 없으므로 collector 는 빈 조회만 수행 (누락된 관계가 있어도 CASCADE 로 정리)
+        User.objects.filter(pk=deletion.user_id).delete()
+        deletion.status = AccountDeletion.Status.COMPLETED
+        deletion.completed_at = timezone.now()
+        deletion.last_error = ''
+        deletion.save(update_fields=['status', 'completed_at', 'last_error', 'updated_at'])
+
+    logger.info(f"Account {deletion.user_id} deleted ({sum(deletion.deleted_rows.values())} rows)")
+    return True
@@ -0,0 +1,69 @@
+"""
+User registration service
+
+Creates the user with its default subscription and notification preference
+in one transaction with one INSERT per table. The password is hashed before
+the transaction opens, so the slow hash never runs while the transaction is
+holding locks. The post_save receivers that would otherwise create the
+related rows (with an extra existence query) are skipped for users created
+here, and email auto-verification is part of the initial INSERT instead of a
+second full save.
+"""
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils.crypto import get_random_string
+
+from ..models import NotificationPreference, Subscription, SubscriptionTier
+from ..subscription import tier_utils
+
+User = get_user_model()
+
+# 신규 가입자의 기본 구독 등급
+DEFAULT_TIER = SubscriptionTier.BASIC
+
+
+def register_user(email, password, is_email_verified=False, **extra_fields):
+    """
+    사용자, 기본 구독, 알림 설정을 한 트랜잭션으로 생성
+
+    Args:
+        email: 이메일 (정규화됨)
+        password: 평문 비밀번호
+        is_email_verified: 이메일 인증 완료 상태로 생성할지 여부
+        **extra_fields: 추가 User 필드
+
+    Returns:
+        User: 생성된 사용자 (subscription, notification_preference 캐시 포함)
+
+    Raises:
+        IntegrityError: 이메일 중복
+    """
+    user = User(
+        email=User.objects.normalize_email(email),
+        is_email_verified=is_email_verified,
+        **extra_fields
+    )
+    user.set_password(password)
+    # post_save 기본 관계 생성 receiver 건너뛰기 (아래에서 직접 생성)
+    user._skip_default_relations = True
+
+    with transaction.atomic():
+        user.save(force_insert=True)
+
+        subscription = Subscription(
+            user=user,
+            tier=DEFAULT_TIER,
+            max_interval_days=tier_utils.get_max_interval(DEFAULT_TIER)
+        )
+        preference = NotificationPreference(
+            user=user,
+            unsubscribe_token=get_random_string(64)
+        )
+        # bulk_create 는 save() 를 거치지 않으므로 다음 알림 시각을 직접 계산
+        preference.next_daily_reminder_at = preference.next_daily_reminder()
+        Subscription.objects.bulk_create([subscription])
+        NotificationPreference.objects.bulk_create([preference])
+
+    User.subscription.related.set_cached_value(user, subscription)
+    User.notification_preference.related.set_cached_value(user, preference)
+    return user
@@ -0,0 +1,167 @@
+"""
+Authenticated-user snapshot cache
+
+JWT authentication resolves the user together with the subscription in one
+select_related query and, when AUTH_USER_CACHE is enabled, caches a snapshot
+of both rows in the shared cache. Subsequent requests rebuild the model
+instances from the snapshot without touching the database.
+
+Keys are versioned per user: every User/Subscription change (after commit)
+bumps the version, so a snapshot written by a request that read the old
+rows can never be served again. The snapshot omits the password hash; only
+its MD5 is kept for simplejwt's token revocation check, and the password
+field stays deferred on the rebuilt user.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import router, transaction
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+# 스냅샷에 넣지 않는 필드 (재구성된 인스턴스에서는 지연 로드)
+EXCLUDED_USER_FIELDS = ('password', 'email_verification_token')
+
+
+def _cache_settings():
+    return settings.AUTH_USER_CACHE
+
+
+def _cache():
+    return caches[_cache_settings()['CACHE_ALIAS']]
+
+
+def _version_key(user_id):
+    return f'auth_user_version:{user_id}'
+
+
+def _snapshot_key(user_id, version):
+    return f'auth_user:{user_id}:{version}'
+
+
+def _current_version(cache, user_id):
+    """사용자 스냅샷 버전 (없으면 현재 시각 기반으로 초기화: 이전 버전과 겹치지 않음)"""
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def _field_values(instance, exclude=()):
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if field.attname not in exclude
+    }
+
+
+def build_snapshot(user):
+    """
+    select_related 로 로드한 사용자의 캐시용 스냅샷
+
+    Returns:
+        dict: {'user': 필드 값, 'password_md5': str, 'subscription': 필드 값 또는 None}
+    """
+    from rest_framework_simplejwt.utils import get_md5_hash_password
+
+    try:
+        subscription = _field_values(user.subscription)
+    except User.subscription.RelatedObjectDoesNotExist:
+        subscription = None
+
+    return {
+        'user': _field_values(user, EXCLUDED_USER_FIELDS),
+        'password_md5': get_md5_hash_password(user.password),
+        'subscription': subscription,
+    }
+
+
+def user_from_snapshot(snapshot):
+    """
+    스냅샷에서 User (+ subscription 캐시) 재구성
+
+    제외된 필드는 지연 필드라 save() 는 로드된 필드만 갱신합니다.
+    """
+    from accounts.models import Subscription
+
+    db = router.db_for_read(User)
+    user_fields = snapshot['user']
+    user = User.from_db(db, list(user_fields), list(user_fields.values()))
+    user.password_md5 = snapshot['password_md5']
+
+    subscription_fields = snapshot['subscription']
+    if subscription_fields is not None:
+        subscription = Subscription.from_db(db, list(subscription_fields), list(subscription_fields.values()))
+        Subscription.user.field.set_cached_value(subscription, user)
+        User.subscription.related.set_cached_value(user, subscription)
+    return user
+
+
+def load_user(user_id):
+    """사용자와 구독을 한 번의 쿼리로 로드 (없으면 None)"""
+    return User.objects.select_related('subscription').filter(pk=user_id).first()
+
+
+def get_user(user_id):
+    """
+    인증용 사용자 조회 (스냅샷 캐시 → DB)
+
+    캐시 장애 시에는 DB 조회로 대체합니다.
+
+    Returns:
+        User 또는 None
+    """
+    if not _cache_settings()['ENABLED']:
+        return load_user(user_id)
+
+    try:
+        cache = _cache()
+        version = _current_version(cache, user_id)
+        snapshot = cache.get(_snapshot_key(user_id, version))
+    except Exception as e:
+        logger.warning(f"User cache unavailable: {e}")
+        return load_user(user_id)
+
+    if snapshot is not None:
+        return user_from_snapshot(snapshot)
+
+    user = load_user(user_id)
+    if user is not None:
+        try:
+            cache.set(_snapshot_key(user_id, version), build_snapshot(user), _cache_settings()['TIMEOUT'])
+        except Exception as e:
+            logger.warning(f"Failed to cache user snapshot: {e}")
+    return user
+
+
+def invalidate_user(user_id):
+    """
+    사용자 스냅샷 무효화 (트랜잭션 커밋 후 버전 증가)
+
+    커밋 전에 증가시키면 다른 요청이 아직 이전 값을 읽어 새 버전으로 캐시할 수 있습니다.
+    """
+    if not _cache_settings()['ENABLED']:
+        return
+
+    def bump():
+        try:
+            _cache().incr(_version_key(user_id))
+        except ValueError:
+            # 버전이 없으면 다음 조회가 새 버전으로 시작
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to invalidate user snapshot {user_id}: {e}")
+
+    transaction.on_commit(bump)
+
+
+def invalidate_users(user_ids):
+    """여러 사용자 스냅샷 무효화 (queryset.update 등 시그널이 없는 변경용)"""
+    for user_id in user_ids:
+        invalidate_user(user_id)
@@ -186,19 +186,20 @@ class UserViewSet(viewsets.ModelViewSet):
         """Common registration logic"""
         logger.info(f"User registration request: {request.data.get('email', 'unknown')}")
 
-        serializer = UserRegistrationSerializer(data=request.data)
+        # 이메일 인증 강제 설정 확인
+        enforce_email_verification = getattr(settings, 'ENFORCE_EMAIL_VERIFICATION', False)
+
+        # ENFORCE_EMAIL_VERIFICATION이 False일 때만 자동 인증 (생성 시 함께 저장)
+        serializer = UserRegistrationSerializer(
+            data=request.data,
+            context={'auto_verify_email': not enforce_email_verification}
+        )
         if serializer.is_valid():
             try:
                 user = serializer.save()
                 logger.info(f"User registration successful: {user.email}")
 
-                # 이메일 인증 강제 설정 확인
-                enforce_email_verification = getattr(settings, 'ENFORCE_EMAIL_VERIFICATION', False)
-
-                # ENFORCE_EMAIL_VERIFICATION이 False일 때만 자동 인증
                 if not enforce_email_verification:
-                    user.is_email_verified = True
-                    user.save()
                     logger.info(f"Development environment: Email auto-verified for {user.email}")
 
                     return StandardAPIResponse.created(
@@ -295,10 +296,10 @@ class UserViewSet(viewsets.ModelViewSet):
                     # Log the deletion before deleting
                     logger.warning(f"Account deletion initiated for user {email}")
 
-                    # Delete the account
+                    # Deactivate and anonymize now; related data is deleted in the background
                     serializer.save()
 
-                    logger.warning(f"Account deleted for user {email}")
+                    logger.warning(f"Account deactivated for user {email} (user_id={user.pk}), deletion scheduled")
 
                     return Response(
                         {'message': 'Account deleted successfully'},
@@ -0,0 +1,155 @@
+"""
+Measure reminder email latency during an exam generation burst
+
+Runs embedded Celery workers on an in-memory broker (no Redis needed) and
+queues a burst of simulated exam generations (each sleeping like a long LLM
+call), followed by reminder emails. The simulated tasks are sent to the
+queues the real tasks are routed to. Two topologies with the same total
+concurrency are compared:
+
+- shared: one worker consuming every queue with Celery's default prefetch
+  (the previous single `celery worker`), so reminders wait behind the burst
+- routed: an 'ai' profile worker and a 'realtime' profile worker
+  (CELERY_WORKER_PROFILES), so reminders are picked up immediately
+
+Latency is measured from sending a reminder to the task starting. Like
+run_worker, this lives in accounts because resee is not an installed app.
+
+Usage:
+    python manage.py benchmark_queue_latency
+    python manage.py benchmark_queue_latency --exams 40 --llm-seconds 2 --reminders 50
+"""
+import statistics
+import threading
+import time
+from contextlib import ExitStack
+
+from celery.contrib.testing.worker import start_worker
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from resee.celery import app
+from resee.workers import task_queue
+
+# Gap between reminders, like the fan-out loop queueing them one user at a time
+REMINDER_SPACING_SECONDS = 0.05
+
+_started = []
+_started_lock = threading.Lock()
+
+
+@app.task(name='benchmark.simulated_exam_generation', ignore_result=True)
+def simulated_exam_generation(seconds):
+    time.sleep(seconds)
+
+
+@app.task(name='benchmark.simulated_reminder', ignore_result=True)
+def simulated_reminder(sent_at):
+    with _started_lock:
+        _started.append(time.monotonic() - sent_at)
+
+
+def _worker(queues, concurrency, prefetch_multiplier, shutdown_timeout):
+    return start_worker(
+        app,
+        pool='threads',  # Simulated tasks only sleep; threads keep the workers in this process
+        concurrency=concurrency,
+        queues=queues,
+        prefetch_multiplier=prefetch_multiplier,
+        perform_ping_check=False,
+        shutdown_timeout=shutdown_timeout,
+    )
+
+
+def measure_reminder_latency(workers, exams, llm_seconds, reminders, timeout):
+    """
+    Queue the burst, then reminders, on running `workers` and collect reminder latencies
+
+    Args:
+        workers: list of (queues, concurrency, prefetch_multiplier)
+
+    Returns:
+        dict: {'median_s', 'p95_s', 'max_s'}
+    """
+    ai_queue = task_queue('exams.tasks.generate_exam_questions')
+    reminder_queue = task_queue('review.tasks.send_individual_review_reminder')
+    del _started[:]
+
+    with ExitStack() as stack:
+        for queues, concurrency, prefetch_multiplier in workers:
+            stack.enter_context(_worker(queues, concurrency, prefetch_multiplier, llm_seconds * exams + 10))
+
+        for _ in range(exams):
+            simulated_exam_generation.apply_async((llm_seconds,), queue=ai_queue)
+        # Reminders are sent by the hourly fan-out while the burst is being processed
+        time.sleep(min(llm_seconds, 1.0))
+        for _ in range(reminders):
+            simulated_reminder.apply_async((time.monotonic(),), queue=reminder_queue)
+            time.sleep(REMINDER_SPACING_SECONDS)
+
+        deadline = time.monotonic() + timeout
+        while len(_started) < reminders and time.monotonic() < deadline:
+            time.sleep(0.05)
+        latencies = sorted(_started)
+
+        # Drop the rest of the burst so shutdown only waits for running tasks
+        with app.connection_for_write() as connection:
+            connection.default_channel.queue_purge(ai_queue)
+
+    if len(latencies) < reminders:
+        raise CommandError(f'Only {len(latencies)}/{reminders} reminders started within {timeout}s')
+    return {
+        'median_s': round(statistics.median(latencies), 3),
+        'p95_s': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+        'max_s': round(latencies[-1], 3),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Benchmark reminder latency during an exam generation burst (shared vs routed workers)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--exams', type=int, default=24, help='Simulated exam generations in the burst')
+        parser.add_argument('--llm-seconds', type=float, default=3.0, help='Duration of each simulated generation')
+        parser.add_argument('--reminders', type=int, default=20, help='Reminder emails sent during the burst')
+        parser.add_argument('--concurrency', type=int, default=4, help='Total worker concurrency per topology')
+
+    def handle(self, *args, **options):
+        exams = max(options['exams'], 1)
+        reminders = max(options['reminders'], 1)
+        llm_seconds = options['llm_seconds']
+        concurrency = max(options['concurrency'], 2)
+
+        # Settings are read with the CELERY_ namespace. The memory transport polls its
+        # queues (once a second by default); Redis delivers immediately with BRPOP.
+        app.conf.update(
+            CELERY_BROKER_URL='memory://',
+            CELERY_BROKER_TRANSPORT_OPTIONS={'polling_interval': 0.01},
+            CELERY_TASK_ALWAYS_EAGER=False,
+        )
+        profiles = settings.CELERY_WORKER_PROFILES
+        all_queues = [queue.name for queue in settings.CELERY_TASK_QUEUES]
+        ai_share = concurrency // 2
+        timeout = exams * llm_seconds + 30
+
+        rows = [
+            ('shared (one worker, all queues, prefetch 4)', measure_reminder_latency(
+                [(all_queues, concurrency, 4)], exams, llm_seconds, reminders, timeout)),
+            ('routed (ai + realtime profiles)', measure_reminder_latency(
+                [(profiles['ai']['queues'], ai_share, profiles['ai']['prefetch_multiplier']),
+                 (profiles['realtime']['queues'], concurrency - ai_share,
+                  profiles['realtime']['prefetch_multiplier'])],
+                exams, llm_seconds, reminders, timeout)),
+        ]
+
+        self.stdout.write(
+            f'{exams} exam generations x {llm_seconds}s, {reminders} reminders, concurrency {concurrency}'
+        )
+        for name, result in rows:
+            self.stdout.write(
+                f"{name}: reminder latency median {result['median_s']}s, "
+                f"p95 {result['p95_s']}s, max {result['max_s']}s"
+            )
+
+        shared, routed = rows[0][1]['p95_s'], rows[1][1]['p95_s']
+        self.stdout.write(self.style.SUCCESS(f'Reminder p95 latency {shared}s -> {routed}s during the burst'))
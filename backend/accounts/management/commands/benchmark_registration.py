@@ -0,0 +1,96 @@
+"""
+Measure queries and time per signup
+
+Compares the previous registration path (create_user, post_save receivers
+creating the subscription and notification preference, then a second full
+save for email auto-verification) with accounts.auth.registration. Both
+include password hashing. The previous path also commits each write
+separately in autocommit mode. Created users are deleted afterwards.
+
+Usage:
+    python manage.py benchmark_registration
+    python manage.py benchmark_registration --users 100
+"""
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.auth.registration import register_user
+
+User = get_user_model()
+
+PASSWORD = 'benchmark-Passw0rd!'
+
+# Transaction control statements (logged on SQLite) are not counted as queries
+TRANSACTION_CONTROL = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE SAVEPOINT')
+
+
+def _legacy_register(email):
+    user = User.objects.create_user(email=email, password=PASSWORD)
+    user.is_email_verified = True
+    user.save()
+    return user
+
+
+def _register(email):
+    return register_user(email, PASSWORD, is_email_verified=True)
+
+
+def measure_signups(register, users):
+    """
+    Register `users` throwaway accounts with `register`
+
+    Returns:
+        dict: {'queries': queries per signup, 'median_ms', 'p95_ms'}
+    """
+    run = uuid.uuid4().hex[:8]
+    user_ids = []
+    query_counts = []
+    samples = []
+    try:
+        for i in range(users):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                user = register(f'benchmark-{run}-{i}@example.com')
+                samples.append((time.perf_counter() - started) * 1000)
+            user_ids.append(user.pk)
+            query_counts.append(sum(
+                1 for query in queries.captured_queries
+                if not query['sql'].upper().startswith(TRANSACTION_CONTROL)
+            ))
+    finally:
+        User.objects.filter(pk__in=user_ids).delete()
+
+    samples.sort()
+    return {
+        'queries': statistics.mean(query_counts),
+        'median_ms': round(statistics.median(samples), 2),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 2),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Benchmark queries and time per user registration'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20, help='Signups per variant')
+
+    def handle(self, *args, **options):
+        users = max(options['users'], 1)
+        rows = [
+            ('legacy (create_user + signals + save)', measure_signups(_legacy_register, users)),
+            ('registration service', measure_signups(_register, users)),
+        ]
+        for name, result in rows:
+            self.stdout.write(
+                f"{name}: {result['queries']:.1f} queries, "
+                f"median {result['median_ms']}ms, p95 {result['p95_ms']}ms per signup"
+            )
+
+        saved = rows[0][1]['queries'] - rows[1][1]['queries']
+        self.stdout.write(self.style.SUCCESS(f'Saved {saved:.1f} queries per signup ({users} signups each)'))
@@ -0,0 +1,91 @@
+"""
+Measure per-request throttle overhead
+
+Compares DRF's SimpleRateThrottle (get the timestamp history, trim it in
+Python, set it back) with the GCRA throttles in resee.throttling, on the
+configured 'throttle' cache. With Redis this measures the round trips (two
+vs one); with locmem it measures the CPU cost of the history list, which
+grows with the number of requests inside the window.
+
+Usage:
+    python manage.py benchmark_throttle
+    python manage.py benchmark_throttle --requests 5000
+"""
+import statistics
+import time
+import uuid
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import AnonRateThrottle
+
+from resee.throttling import RedisAnonRateThrottle
+
+
+class LegacyAnonRateThrottle(AnonRateThrottle):
+    """Previous behaviour: DRF history-list throttle on the throttle cache"""
+
+    @property
+    def cache(self):
+        return caches['throttle']
+
+
+def measure_throttle(throttle_class, requests):
+    """
+    Send `requests` anonymous requests from one address through a fresh throttle
+
+    The rate is set high enough that no request is rejected, so every call
+    takes the full path (and the legacy history keeps growing).
+
+    Returns:
+        dict: {'median_us', 'p95_us', 'mean_us'}
+    """
+    throttle_class = type(throttle_class.__name__, (throttle_class,), {
+        'rate': f'{requests * 2}/hour',
+        'scope': f'benchmark_{uuid.uuid4().hex[:8]}',
+    })
+    request = Request(APIRequestFactory().get('/', REMOTE_ADDR='203.0.113.10'))
+    samples = []
+    for _ in range(requests):
+        throttle = throttle_class()
+        started = time.perf_counter()
+        allowed = throttle.allow_request(request, None)
+        samples.append((time.perf_counter() - started) * 1000000)
+        if not allowed:
+            raise RuntimeError(f'{throttle_class.__name__} rejected a request below its rate')
+    caches['throttle'].delete(throttle.key)
+
+    samples.sort()
+    return {
+        'median_us': round(statistics.median(samples), 1),
+        'p95_us': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1),
+        'mean_us': round(statistics.mean(samples), 1),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Benchmark per-request overhead of the throttle backends'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=1000, help='Requests per throttle')
+
+    def handle(self, *args, **options):
+        requests = max(options['requests'], 1)
+        backend = caches['throttle'].__class__.__name__
+        rows = [
+            ('legacy (history list get/trim/set)', measure_throttle(LegacyAnonRateThrottle, requests)),
+            ('GCRA (single atomic update)', measure_throttle(RedisAnonRateThrottle, requests)),
+        ]
+
+        self.stdout.write(f'throttle cache: {backend}, {requests} requests from one client')
+        for name, result in rows:
+            self.stdout.write(
+                f"{name}: median {result['median_us']}us, p95 {result['p95_us']}us, "
+                f"mean {result['mean_us']}us per request"
+            )
+
+        legacy, gcra = rows[0][1]['mean_us'], rows[1][1]['mean_us']
+        ratio = gcra / legacy if legacy else 0
+        self.stdout.write(self.style.SUCCESS(f'GCRA mean overhead is {ratio:.2f}x the legacy throttle'))
@@ -0,0 +1,32 @@
+"""
+Start a Celery worker with a queue profile
+
+Profiles are defined in settings.CELERY_WORKER_PROFILES (see resee.workers).
+Lives in accounts because the resee project package is not an installed app.
+
+Usage:
+    python manage.py run_worker realtime
+    python manage.py run_worker ai --loglevel debug
+    python manage.py run_worker all --print
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from resee.celery import app
+from resee.workers import worker_argv
+
+
+class Command(BaseCommand):
+    help = 'Start a Celery worker consuming the queues of a worker profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument('profile', choices=sorted(settings.CELERY_WORKER_PROFILES), help='Worker profile')
+        parser.add_argument('--loglevel', default='info', help='Worker log level')
+        parser.add_argument('--print', action='store_true', help='Print the celery command line and exit')
+
+    def handle(self, *args, **options):
+        argv = worker_argv(options['profile'], loglevel=options['loglevel'])
+        self.stdout.write(f"celery -A resee {' '.join(argv)}")
+        if options['print']:
+            return
+        app.worker_main(argv)
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-18 21:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_alter_user_privacy_agreed_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user_id', models.BigIntegerField(help_text='삭제 대상 사용자 ID', unique=True)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '진행 중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=20)),
+                ('current_step', models.CharField(blank=True, help_text='마지막으로 처리한 삭제 단계', max_length=50)),
+                ('deleted_rows', models.JSONField(blank=True, default=dict, help_text='단계별 삭제(또는 갱신)된 행 수')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Account Deletion',
+                'verbose_name_plural': 'Account Deletions',
+                'db_table': 'accounts_account_deletion',
+                'indexes': [models.Index(fields=['status', 'updated_at'], name='accounts_ac_status_896d0a_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.16 on 2026-10-18 22:22
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_next_daily_reminder(apps, schema_editor):
+    """Schedule the next daily reminder of enabled preferences (all in settings.TIME_ZONE)."""
+    NotificationPreference = apps.get_model('accounts', 'NotificationPreference')
+
+    now = timezone.now()
+    tz = ZoneInfo(settings.TIME_ZONE)
+    local_day = now.astimezone(tz).date()
+    enabled = NotificationPreference.objects.filter(email_notifications_enabled=True, daily_reminder_enabled=True)
+
+    for reminder_time in enabled.values_list('daily_reminder_time', flat=True).distinct():
+        fire_at = datetime.combine(local_day, reminder_time, tzinfo=tz)
+        if fire_at <= now:
+            fire_at = datetime.combine(local_day + timedelta(days=1), reminder_time, tzinfo=tz)
+        enabled.filter(daily_reminder_time=reminder_time).update(
+            next_daily_reminder_at=fire_at.astimezone(dt_timezone.utc)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_account_deletion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationpreference',
+            name='next_daily_reminder_at',
+            field=models.DateTimeField(blank=True, help_text='다음 일일 알림 발송 시각 (UTC)', null=True),
+        ),
+        migrations.AddField(
+            model_name='notificationpreference',
+            name='time_zone',
+            field=models.CharField(default='Asia/Seoul', help_text='알림 시간 기준 시간대 (IANA 이름, 예: Asia/Seoul)', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='notificationpreference',
+            index=models.Index(condition=models.Q(('next_daily_reminder_at__isnull', False)), fields=['next_daily_reminder_at'], name='notif_pref_next_daily'),
+        ),
+        migrations.RunPython(backfill_next_daily_reminder, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,12 @@
 import logging
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.crypto import get_random_string
@@ -432,7 +436,8 @@ class BillingSchedule(TimestampMixin):
 @receiver(post_save, sender=User)
 def create_user_subscription(sender, instance, created, **kwargs):
     """Create a basic subscription for new users"""
-    if created:
+    # accounts.auth.registration 은 구독을 직접 생성
+    if created and not getattr(instance, '_skip_default_relations', False):
         try:
             # Check if subscription already exists
             _ = instance.subscription
@@ -469,6 +474,22 @@ def adjust_review_schedules_on_subscription_change(sender, instance, created, **
         )
 
 
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Invalidate the authenticated-user snapshot when the user changes"""
+    from .auth.user_cache import invalidate_user
+    if kwargs.get('created'):
+        return  # No snapshot can exist for a new user
+    invalidate_user(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Subscription)
+def invalidate_cached_subscription_user(sender, instance, **kwargs):
+    """Invalidate the authenticated-user snapshot when the subscription changes"""
+    from .auth.user_cache import invalidate_user
+    invalidate_user(instance.user_id)
+
+
 class NotificationPreference(TimestampMixin):
     """사용자별 이메일 알림 설정"""
 
@@ -493,6 +514,17 @@ class NotificationPreference(TimestampMixin):
         default='09:00',
         help_text='일일 복습 알림 시간'
     )
+    time_zone = models.CharField(
+        max_length=64,
+        default=settings.TIME_ZONE,
+        help_text='알림 시간 기준 시간대 (IANA 이름, 예: Asia/Seoul)'
+    )
+    # 알림 스케줄러가 발송 시각이 지난 행만 인덱스 범위로 읽도록 미리 계산 (비활성화 시 NULL)
+    next_daily_reminder_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='다음 일일 알림 발송 시각 (UTC)'
+    )
 
     # 저녁 리마인더 설정
     evening_reminder_enabled = models.BooleanField(
@@ -539,6 +571,13 @@ class NotificationPreference(TimestampMixin):
         db_table = 'accounts_notification_preference'
         verbose_name = 'Notification Preference'
         verbose_name_plural = 'Notification Preferences'
+        indexes = [
+            models.Index(
+                fields=['next_daily_reminder_at'],
+                condition=models.Q(next_daily_reminder_at__isnull=False),
+                name='notif_pref_next_daily',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - Notifications"
@@ -547,8 +586,40 @@ class NotificationPreference(TimestampMixin):
         # 구독 해지 토큰 자동 생성
         if not self.unsubscribe_token:
             self.unsubscribe_token = get_random_string(64)
+        # 알림 설정이 바뀔 수 있으므로 다음 발송 시각을 다시 계산
+        self.next_daily_reminder_at = self.next_daily_reminder()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'next_daily_reminder_at'}
         super().save(*args, **kwargs)
 
+    def next_daily_reminder(self, after=None):
+        """
+        다음 일일 알림 발송 시각
+
+        사용자 시간대(time_zone)의 daily_reminder_time 중 after 이후 가장 이른 시각입니다.
+
+        Args:
+            after: 기준 시각 (기본값: 현재)
+
+        Returns:
+            datetime: UTC 발송 시각 (알림이 꺼져 있으면 None)
+        """
+        if not (self.email_notifications_enabled and self.daily_reminder_enabled):
+            return None
+
+        after = after or timezone.now()
+        tz = ZoneInfo(self.time_zone)
+        reminder_time = self.daily_reminder_time
+        if isinstance(reminder_time, str):
+            reminder_time = time.fromisoformat(reminder_time)
+
+        local_day = after.astimezone(tz).date()
+        fire_at = datetime.combine(local_day, reminder_time, tzinfo=tz)
+        if fire_at <= after:
+            fire_at = datetime.combine(local_day + timedelta(days=1), reminder_time, tzinfo=tz)
+        return fire_at.astimezone(dt_timezone.utc)
+
     def generate_unsubscribe_url(self):
         """구독 해지 URL 생성"""
         from django.conf import settings
@@ -558,5 +629,52 @@ class NotificationPreference(TimestampMixin):
 @receiver(post_save, sender=User)
 def create_notification_preference(sender, instance, created, **kwargs):
     """사용자 생성시 알림 설정 자동 생성"""
-    if created:
+    if created and not getattr(instance, '_skip_default_relations', False):
         NotificationPreference.objects.create(user=instance)
+
+
+class AccountDeletion(TimestampMixin):
+    """
+    탈퇴 계정의 백그라운드 삭제 작업
+
+    탈퇴 요청 시 계정은 즉시 비활성화/익명화되고, 하위 테이블은 Celery 작업이
+    배치 단위로 삭제합니다. 배치마다 진행 상황을 기록하므로 중단된 작업은
+    마지막 단계부터 재개됩니다. 사용자 행이 마지막에 삭제되므로 FK 를 두지 않습니다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', '대기'
+        RUNNING = 'running', '진행 중'
+        COMPLETED = 'completed', '완료'
+        FAILED = 'failed', '실패'
+
+    user_id = models.BigIntegerField(unique=True, help_text='삭제 대상 사용자 ID')
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    current_step = models.CharField(
+        max_length=50,
+        blank=True,
+        help_text='마지막으로 처리한 삭제 단계'
+    )
+    deleted_rows = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='단계별 삭제(또는 갱신)된 행 수'
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'accounts_account_deletion'
+        verbose_name = 'Account Deletion'
+        verbose_name_plural = 'Account Deletions'
+        indexes = [
+            models.Index(fields=['status', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"Account deletion {self.user_id} ({self.status})"
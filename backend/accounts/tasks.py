@@ -0,0 +1,80 @@
+"""
+Celery tasks for account lifecycle operations
+"""
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def run_account_deletion(self, deletion_id: int):
+    """
+    탈퇴 계정의 하위 데이터를 배치 단위로 삭제
+
+    한 번 실행에 MAX_BATCHES_PER_RUN 배치까지만 처리하고, 남은 작업은 새 작업으로
+    다시 큐에 넣어 워커를 오래 점유하지 않습니다.
+
+    Args:
+        deletion_id: AccountDeletion ID
+    """
+    from .auth.deletion import run_deletion
+    from .models import AccountDeletion
+
+    deletion = AccountDeletion.objects.filter(pk=deletion_id).first()
+    if deletion is None or deletion.status == AccountDeletion.Status.COMPLETED:
+        return f"Account deletion {deletion_id} already finished"
+
+    AccountDeletion.objects.filter(pk=deletion.pk).update(
+        status=AccountDeletion.Status.RUNNING,
+        attempts=F('attempts') + 1,
+        updated_at=timezone.now()
+    )
+
+    try:
+        finished = run_deletion(deletion, max_batches=settings.ACCOUNT_DELETION_SETTINGS['MAX_BATCHES_PER_RUN'])
+    except Exception as exc:
+        logger.error(f"Error deleting account {deletion.user_id} at step '{deletion.current_step}': {str(exc)}")
+        failed = self.request.retries >= self.max_retries
+        AccountDeletion.objects.filter(pk=deletion.pk).update(
+            status=AccountDeletion.Status.FAILED if failed else AccountDeletion.Status.RUNNING,
+            last_error=str(exc),
+            updated_at=timezone.now()
+        )
+        if failed:
+            raise
+        raise self.retry(exc=exc)
+
+    if not finished:
+        run_account_deletion.delay(deletion_id)
+        return f"Account deletion {deletion_id} continues after step '{deletion.current_step}'"
+    return f"Account deletion {deletion_id} completed"
+
+
+@shared_task
+def resume_account_deletions():
+    """
+    주기 실행: 워커 중단 등으로 멈춘 삭제 작업 재개
+
+    STALE_AFTER_MINUTES 동안 진행 기록이 없는 미완료 작업(실패 포함)을 다시 큐에 넣습니다.
+    """
+    from .models import AccountDeletion
+
+    cutoff = timezone.now() - timedelta(minutes=settings.ACCOUNT_DELETION_SETTINGS['STALE_AFTER_MINUTES'])
+    stalled = list(
+        AccountDeletion.objects
+        .exclude(status=AccountDeletion.Status.COMPLETED)
+        .filter(updated_at__lt=cutoff)
+        .values_list('pk', flat=True)
+    )
+    for deletion_id in stalled:
+        run_account_deletion.delay(deletion_id)
+
+    if stalled:
+        logger.info(f"Resumed {len(stalled)} stalled account deletions")
+    return f"Resumed {len(stalled)} account deletions"
@@ -0,0 +1,176 @@
+"""
+Tests for the chunked account deletion pipeline.
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.auth.deletion import DELETION_STEPS, run_deletion, schedule_account_deletion
+from accounts.models import (AccountDeletion, NotificationPreference, PaymentHistory, Subscription,
+                             SubscriptionTier)
+from accounts.tasks import resume_account_deletions, run_account_deletion
+from content.models import Category, Content
+from exams.models import QuestionBankEntry, WeeklyTest, WeeklyTestAnswer, WeeklyTestQuestion
+from review.models import ReviewHistory, ReviewSchedule
+
+User = get_user_model()
+
+
+def create_user_data(user, contents=3):
+    """사용자 소유 데이터 (콘텐츠, 복습, 시험, 결제) 생성"""
+    category = Category.objects.create(name=f'category-{user.pk}', user=user)
+    test = WeeklyTest.objects.create(user=user)
+    for index in range(contents):
+        content = Content.objects.create(
+            title=f'content {index}', content='본문 ' * 20, author=user, category=category
+        )
+        ReviewSchedule.objects.get_or_create(
+            content=content, user=user, defaults={'next_review_date': timezone.now()}
+        )
+        ReviewHistory.objects.create(content=content, user=user, result='remembered')
+        question = WeeklyTestQuestion.objects.create(
+            weekly_test=test, content=content, question_text='Q', correct_answer='A', order=index + 1
+        )
+        WeeklyTestAnswer.objects.create(question=question, user=user, user_answer='A')
+        QuestionBankEntry.objects.create(
+            content=content, content_hash='h', question_type='true_false', question_text='Q', correct_answer='O'
+        )
+    PaymentHistory.objects.create(
+        user=user, payment_type=PaymentHistory.PaymentType.INITIAL, to_tier=SubscriptionTier.BASIC
+    )
+    return category
+
+
+@override_settings(ACCOUNT_DELETION_SETTINGS={
+    'BATCH_SIZE': 2, 'MAX_BATCHES_PER_RUN': 200, 'STALE_AFTER_MINUTES': 15,
+})
+class AccountDeletionPipelineTest(TestCase):
+    """Test anonymization, batched deletion and resumption."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='leaving@example.com', password='testpass123', is_email_verified=True
+        )
+        self.category = create_user_data(self.user)
+        self.other = User.objects.create_user(email='staying@example.com', password='testpass123')
+        create_user_data(self.other, contents=1)
+
+    def test_schedule_anonymizes_immediately(self):
+        with patch('accounts.tasks.run_account_deletion.delay') as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            deletion = schedule_account_deletion(self.user)
+
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+        self.assertEqual(self.user.email, f'deleted-{self.user.pk}@deleted.invalid')
+        self.assertFalse(self.user.has_usable_password())
+        self.assertFalse(NotificationPreference.objects.get(user=self.user).email_notifications_enabled)
+        self.assertFalse(Subscription.objects.get(user=self.user).auto_renewal)
+        self.assertEqual(deletion.status, AccountDeletion.Status.PENDING)
+        delay.assert_called_once_with(deletion.pk)
+        # 같은 이메일로 재가입 가능
+        User.objects.create_user(email='leaving@example.com', password='testpass123')
+
+    def test_run_deletion_removes_all_user_rows(self):
+        deletion = AccountDeletion.objects.create(user_id=self.user.pk)
+        self.assertTrue(run_deletion(deletion))
+
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse(Content.objects.filter(author_id=self.user.pk).exists())
+        self.assertFalse(ReviewHistory.objects.filter(user_id=self.user.pk).exists())
+        self.assertFalse(WeeklyTestAnswer.objects.filter(user_id=self.user.pk).exists())
+        self.assertFalse(Subscription.objects.filter(user_id=self.user.pk).exists())
+        self.assertEqual(deletion.status, AccountDeletion.Status.COMPLETED)
+        self.assertEqual(deletion.deleted_rows['contents'], 3)
+        self.assertEqual(deletion.deleted_rows['exam_answers'], 3)
+
+        # 다른 사용자의 데이터는 그대로
+        self.assertEqual(Content.objects.filter(author=self.other).count(), 1)
+        self.assertEqual(WeeklyTestAnswer.objects.filter(user=self.other).count(), 1)
+
+    def test_foreign_content_referencing_category_is_kept(self):
+        foreign = Content.objects.create(title='foreign', content='본문', author=self.other, category=self.category)
+        run_deletion(AccountDeletion.objects.create(user_id=self.user.pk))
+
+        foreign.refresh_from_db()
+        self.assertIsNone(foreign.category_id)
+
+    def test_resumes_from_recorded_step(self):
+        deletion = AccountDeletion.objects.create(user_id=self.user.pk)
+        self.assertFalse(run_deletion(deletion, max_batches=3))
+        self.assertEqual(deletion.current_step, 'exam_questions')
+
+        # 새로 로드한 작업은 기록된 단계부터 이어서 진행
+        resumed = AccountDeletion.objects.get(pk=deletion.pk)
+        self.assertTrue(run_deletion(resumed))
+        self.assertEqual(resumed.deleted_rows['exam_answers'], 3)
+        self.assertEqual(resumed.deleted_rows['exam_questions'], 3)
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+
+    def test_batches_are_bounded(self):
+        deletion = AccountDeletion.objects.create(user_id=self.user.pk)
+        run_deletion(deletion, max_batches=1)
+        self.assertEqual(WeeklyTestAnswer.objects.filter(user_id=self.user.pk).count(), 1)
+
+    def test_steps_cover_every_cascading_relation(self):
+        covered = {step.model for step in DELETION_STEPS}
+        for relation in User._meta.related_objects:
+            with self.subTest(relation=relation.related_model._meta.label):
+                self.assertIn(relation.related_model._meta.label, covered)
+
+    def test_task_continues_until_complete(self):
+        deletion = AccountDeletion.objects.create(user_id=self.user.pk)
+        with override_settings(ACCOUNT_DELETION_SETTINGS={
+            'BATCH_SIZE': 2, 'MAX_BATCHES_PER_RUN': 2, 'STALE_AFTER_MINUTES': 15,
+        }), patch('accounts.tasks.run_account_deletion.delay') as delay:
+            run_account_deletion.apply(args=[deletion.pk])
+
+        delay.assert_called_once_with(deletion.pk)
+        deletion.refresh_from_db()
+        self.assertEqual(deletion.status, AccountDeletion.Status.RUNNING)
+        self.assertEqual(deletion.attempts, 1)
+
+        run_account_deletion.apply(args=[deletion.pk])
+        deletion.refresh_from_db()
+        self.assertEqual(deletion.status, AccountDeletion.Status.COMPLETED)
+
+    def test_resume_requeues_stalled_jobs(self):
+        stalled = AccountDeletion.objects.create(user_id=self.user.pk)
+        AccountDeletion.objects.create(user_id=self.other.pk)
+        AccountDeletion.objects.filter(pk=stalled.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+
+        with patch('accounts.tasks.run_account_deletion.delay') as delay:
+            resume_account_deletions()
+
+        delay.assert_called_once_with(stalled.pk)
+
+
+class AccountDeleteEndpointTest(TestCase):
+    """Test DELETE /users/me/ schedules deletion instead of deleting inline."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com', password='testpass123', is_email_verified=True
+        )
+        create_user_data(self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def test_delete_schedules_job(self):
+        with patch('accounts.tasks.run_account_deletion.delay'):
+            response = self.client.delete('/api/accounts/users/me/', {
+                'password': 'testpass123',
+                'confirmation': 'DELETE'
+            }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+        self.assertTrue(AccountDeletion.objects.filter(user_id=self.user.pk).exists())
+        # 하위 데이터는 백그라운드 작업이 삭제
+        self.assertEqual(Content.objects.filter(author=self.user).count(), 3)
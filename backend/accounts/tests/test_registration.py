@@ -0,0 +1,95 @@
+"""
+Tests for the user registration service.
+"""
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.auth.registration import register_user
+from accounts.management.commands.benchmark_registration import TRANSACTION_CONTROL
+from accounts.models import NotificationPreference, Subscription, SubscriptionTier
+
+User = get_user_model()
+
+
+def data_queries(captured):
+    return [
+        query['sql'] for query in captured.captured_queries
+        if not query['sql'].upper().startswith(TRANSACTION_CONTROL)
+    ]
+
+
+class RegisterUserTest(TestCase):
+    """Test user, subscription and preference are created together."""
+
+    def test_creates_related_rows_with_one_insert_each(self):
+        with CaptureQueriesContext(connection) as captured:
+            user = register_user('New@Example.com', 'testpass123', is_email_verified=True)
+
+        queries = data_queries(captured)
+        self.assertEqual(len(queries), 3)
+        self.assertTrue(all(sql.startswith('INSERT') for sql in queries))
+
+        user.refresh_from_db()
+        self.assertEqual(user.email, 'New@example.com')
+        self.assertTrue(user.is_email_verified)
+        self.assertTrue(user.check_password('testpass123'))
+
+        subscription = Subscription.objects.get(user=user)
+        self.assertEqual(subscription.tier, SubscriptionTier.BASIC)
+        self.assertEqual(subscription.max_interval_days, 90)
+        preference = NotificationPreference.objects.get(user=user)
+        self.assertEqual(len(preference.unsubscribe_token), 64)
+        self.assertIsNotNone(preference.next_daily_reminder_at)
+
+    def test_returned_user_has_related_rows_cached(self):
+        user = register_user('cached@example.com', 'testpass123')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(user.subscription.tier, SubscriptionTier.BASIC)
+            self.assertTrue(user.notification_preference.email_notifications_enabled)
+
+    def test_duplicate_email_creates_nothing(self):
+        register_user('dup@example.com', 'testpass123')
+
+        with self.assertRaises(IntegrityError):
+            register_user('dup@example.com', 'testpass123')
+
+        self.assertEqual(User.objects.filter(email='dup@example.com').count(), 1)
+        self.assertEqual(Subscription.objects.count(), 1)
+
+    def test_create_user_still_creates_defaults(self):
+        user = User.objects.create_user(email='manager@example.com', password='testpass123')
+
+        self.assertTrue(Subscription.objects.filter(user=user).exists())
+        self.assertTrue(NotificationPreference.objects.filter(user=user).exists())
+
+
+class RegistrationEndpointQueryTest(TestCase):
+    """Test the signup endpoint writes each row once."""
+
+    @override_settings(ENFORCE_EMAIL_VERIFICATION=False)
+    def test_auto_verified_signup_has_no_second_save(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = APIClient().post('/api/accounts/users/', {
+                'email': 'signup@example.com',
+                'password': 'newpass123',
+                'password_confirm': 'newpass123',
+            })
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(any(sql.startswith('UPDATE "accounts_user"') for sql in data_queries(captured)))
+        self.assertTrue(User.objects.get(email='signup@example.com').is_email_verified)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command('benchmark_registration', '--users', '2', stdout=out)
+
+        self.assertIn('registration service: 3.0 queries', out.getvalue())
+        self.assertFalse(User.objects.filter(email__startswith='benchmark-').exists())
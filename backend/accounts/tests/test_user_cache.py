@@ -0,0 +1,117 @@
+"""
+Tests for cached authenticated-user resolution.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.auth.authentication import CachedUserJWTAuthentication
+from accounts.models import SubscriptionTier
+
+User = get_user_model()
+
+USER_CACHE = {'ENABLED': True, 'CACHE_ALIAS': 'default', 'TIMEOUT': 300}
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'user-cache-tests'}}
+
+
+class CachedUserJWTAuthenticationTest(TestCase):
+    """Test the user is resolved with the subscription in one query."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='cache@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.authentication = CachedUserJWTAuthentication()
+
+    def test_resolves_subscription_in_one_query(self):
+        token = AccessToken.for_user(self.user)
+
+        with self.assertNumQueries(1):
+            user = self.authentication.get_user(token)
+            tier = user.subscription.tier
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(tier, SubscriptionTier.BASIC)
+
+    def test_rejects_token_after_password_change(self):
+        token = AccessToken.for_user(self.user)
+        self.user.set_password('newpass123')
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(token)
+
+
+@override_settings(CACHES=LOCMEM, AUTH_USER_CACHE=USER_CACHE)
+class UserSnapshotCacheTest(TestCase):
+    """Test the versioned user snapshot cache."""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.user = User.objects.create_user(
+            email='snapshot@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.authentication = CachedUserJWTAuthentication()
+        self.token = AccessToken.for_user(self.user)
+
+    def test_second_request_uses_snapshot(self):
+        self.authentication.get_user(self.token)
+
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(self.token)
+            self.assertEqual(user.email, 'snapshot@example.com')
+            self.assertTrue(user.is_email_verified)
+            self.assertEqual(user.subscription.tier, SubscriptionTier.BASIC)
+            self.assertEqual(user.subscription.max_interval_days, 90)
+
+    @patch('review.tasks.adjust_review_schedules_on_subscription_change.delay')
+    def test_subscription_change_invalidates_snapshot(self, adjust_delay):
+        self.authentication.get_user(self.token)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            subscription = self.user.subscription
+            subscription.tier = SubscriptionTier.PRO
+            subscription.save()
+
+        with self.assertNumQueries(1):
+            user = self.authentication.get_user(self.token)
+        self.assertEqual(user.subscription.tier, SubscriptionTier.PRO)
+
+    def test_password_change_revokes_cached_user(self):
+        self.authentication.get_user(self.token)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password('newpass123')
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
+
+    def test_saving_cached_user_keeps_password(self):
+        self.authentication.get_user(self.token)
+        user = self.authentication.get_user(self.token)
+
+        user.weekly_goal = 10
+        user.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.weekly_goal, 10)
+        self.assertTrue(self.user.check_password('testpass123'))
+
+    def test_inactive_user_rejected_after_invalidation(self):
+        self.authentication.get_user(self.token)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
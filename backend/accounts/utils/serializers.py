@@ -1,3 +1,5 @@
+from zoneinfo import available_timezones
+
 from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.password_validation import validate_password
@@ -163,14 +165,23 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
-        """Create new user"""
+        """
+        Create new user with subscription and notification preference
+
+        context['auto_verify_email']: create the user as already email-verified
+        """
         from django.db import IntegrityError
 
+        from ..auth.registration import register_user
+
         try:
             # Remove password_confirm from user creation data
             validated_data.pop('password_confirm')
 
-            user = User.objects.create_user(**validated_data)
+            user = register_user(
+                is_email_verified=self.context.get('auto_verify_email', False),
+                **validated_data
+            )
             return user
         except IntegrityError:
             # Handle unique constraint violation for email
@@ -224,8 +235,10 @@ class AccountDeleteSerializer(serializers.Serializer):
         return value
 
     def save(self):
+        from ..auth.deletion import schedule_account_deletion
+
         user = self.context['request'].user
-        user.delete()
+        schedule_account_deletion(user)
         return user
 
 
@@ -325,8 +338,15 @@ class NotificationPreferenceSerializer(serializers.ModelSerializer):
             'email_notifications_enabled',
             'daily_reminder_enabled',
             'daily_reminder_time',
+            'time_zone',
         ]
 
     def validate_daily_reminder_time(self, value):
         """Validate daily reminder time format"""
         return value
+
+    def validate_time_zone(self, value):
+        """Validate IANA time zone name"""
+        if value not in available_timezones():
+            raise serializers.ValidationError('지원하지 않는 시간대입니다.')
+        return value
@@ -7,20 +7,320 @@ Provides:
 - JSON parsing utilities
 - Error handling
 - Logging
+- Token budget governor (per-user and global tokens per minute)
+- Retries, circuit breaking and hedging via ai_services.resilience
 """
 
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from typing import Any, Dict, Optional
 
 import anthropic
 from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
 from langchain_anthropic import ChatAnthropic
 
+from .resilience import CircuitOpen, call_with_retry, hedged_call
+
 logger = logging.getLogger(__name__)
 
 
+class TokenBudgetExceeded(Exception):
+    """Token budget exhausted for longer than the caller is willing to wait."""
+
+    def __init__(self, scope: str, retry_after: float):
+        super().__init__(f"AI token budget exhausted ({scope}), retry after {retry_after:.0f}s")
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class BudgetContext:
+    """User the current AI calls are charged to."""
+    user_id: Optional[int]
+    tier: str
+    max_wait: Optional[float] = None
+
+
+@dataclass
+class Reservation:
+    """Tokens reserved in one minute window before a call."""
+    minute: int
+    user_id: Optional[int]
+    tokens: int
+
+
+_budget_context: ContextVar[Optional[BudgetContext]] = ContextVar('ai_budget_context', default=None)
+
+
+def _user_tier(user) -> str:
+    subscription = getattr(user, 'subscription', None)
+    if subscription is None:
+        return 'free'
+    return str(subscription.tier).lower()
+
+
+@contextmanager
+def ai_budget_user(user, max_wait: Optional[float] = None):
+    """
+    Charge AI calls made inside the block to `user`'s tier budget.
+
+    Args:
+        user: User (None or anonymous: global budget only)
+        max_wait: Seconds a call may queue for budget (default: MAX_WAIT_SECONDS).
+                  Background tasks can afford to wait for the next window.
+    """
+    if user is not None and getattr(user, 'is_authenticated', False):
+        context = BudgetContext(user_id=user.pk, tier=_user_tier(user), max_wait=max_wait)
+    else:
+        context = BudgetContext(user_id=None, tier='free', max_wait=max_wait)
+    token = _budget_context.set(context)
+    try:
+        yield context
+    finally:
+        _budget_context.reset(token)
+
+
+class TokenGovernor:
+    """
+    Token-per-minute budgets shared by every process through the throttle cache.
+
+    Before a call, the estimated tokens (prompt size plus max_tokens) are
+    reserved in the current one-minute window for the global budget and the
+    user's tier budget. After the call the reservation is corrected to the
+    usage reported by the provider. When a budget is exhausted the call waits
+    for the next window if the caller allows it, otherwise it is rejected
+    with TokenBudgetExceeded so the service can degrade. Budgets sit below the
+    provider's rate limits, so bursts queue here instead of turning into 429s.
+    """
+
+    def __init__(self):
+        self.known_models = set()
+
+    def _settings(self) -> Dict[str, Any]:
+        return settings.AI_TOKEN_BUDGET_SETTINGS
+
+    def _cache(self):
+        return caches[self._settings()['CACHE_ALIAS']]
+
+    @staticmethod
+    def _window_key(minute: int, user_id: Optional[int] = None) -> str:
+        if user_id is None:
+            return f'ai_tokens:{minute}:global'
+        return f'ai_tokens:{minute}:user:{user_id}'
+
+    @staticmethod
+    def _usage_key(day: str, name: str) -> str:
+        return f'ai_usage:{day}:{name}'
+
+    @staticmethod
+    def _incr(cache, key: str, delta: int, timeout: int) -> int:
+        """Atomic add that creates the counter when missing."""
+        try:
+            return cache.incr(key, delta)
+        except ValueError:
+            if cache.add(key, delta, timeout):
+                return delta
+            return cache.incr(key, delta)
+
+    def estimate(self, prompt: str, max_tokens: Optional[int]) -> int:
+        """Upper bound for a call: prompt tokens (approximated from length) plus max output."""
+        output = max_tokens if isinstance(max_tokens, int) else 1024
+        return len(prompt) // self._settings()['CHARS_PER_TOKEN'] + output
+
+    def acquire(self, tokens: int) -> Optional[Reservation]:
+        """
+        Reserve `tokens` in the current window, queueing for later windows if allowed.
+
+        Returns:
+            Reservation, or None when budgets are disabled or the cache is unavailable
+
+        Raises:
+            TokenBudgetExceeded: budget still exhausted after the allowed wait
+        """
+        config = self._settings()
+        if not config['ENABLED']:
+            return None
+
+        context = _budget_context.get() or BudgetContext(user_id=None, tier='free')
+        max_wait = config['MAX_WAIT_SECONDS'] if context.max_wait is None else context.max_wait
+        user_budget = config['TIER_TOKENS_PER_MINUTE'].get(context.tier)
+        deadline = time.time() + max_wait
+        queued = False
+
+        while True:
+            now = time.time()
+            minute = int(now // 60)
+            try:
+                exceeded = self._reserve(minute, context.user_id, tokens, user_budget)
+            except Exception as e:
+                logger.warning(f"AI token budget unavailable, not enforcing: {e}")
+                return None
+
+            if exceeded is None:
+                if queued:
+                    self._count('queued')
+                return Reservation(minute=minute, user_id=context.user_id, tokens=tokens)
+
+            retry_after = (minute + 1) * 60 - now
+            if now + retry_after > deadline:
+                self._count('rejected')
+                raise TokenBudgetExceeded(exceeded, retry_after)
+            queued = True
+            time.sleep(retry_after)
+
+    def _reserve(self, minute: int, user_id: Optional[int], tokens: int,
+                 user_budget: Optional[int]) -> Optional[str]:
+        """Add the tokens to the window counters; roll back and return the exhausted scope if over."""
+        cache = self._cache()
+        keys = [(self._window_key(minute), self._settings()['GLOBAL_TOKENS_PER_MINUTE'], 'global')]
+        if user_id is not None and user_budget is not None:
+            keys.append((self._window_key(minute, user_id), user_budget, 'user'))
+
+        reserved = []
+        for key, budget, scope in keys:
+            used = self._incr(cache, key, tokens, 120)
+            reserved.append(key)
+            # 한 호출이 예산보다 커도 빈 윈도우에서는 허용 (영원히 대기하지 않도록)
+            if used > budget and used != tokens:
+                for rollback_key in reserved:
+                    cache.decr(rollback_key, tokens)
+                return scope
+        return None
+
+    def release(self, reservation: Optional[Reservation]) -> None:
+        """Return an unused reservation (the call failed before producing usage)."""
+        self._adjust(reservation, -reservation.tokens if reservation else 0)
+
+    def record(self, reservation: Optional[Reservation], model: str,
+               input_tokens: Optional[int], output_tokens: Optional[int]) -> None:
+        """Correct the reservation to the reported usage and update the daily usage counters."""
+        self.known_models.add(model)
+        if input_tokens is None or output_tokens is None:
+            self._count(f'{model}:calls')
+            return
+
+        if reservation is not None:
+            self._adjust(reservation, input_tokens + output_tokens - reservation.tokens)
+        try:
+            cache = self._cache()
+            day = timezone.localdate().strftime('%Y%m%d')
+            for name, value in (('calls', 1), ('input_tokens', input_tokens), ('output_tokens', output_tokens)):
+                self._incr(cache, self._usage_key(day, f'{model}:{name}'), value, 2 * 86400)
+        except Exception as e:
+            logger.warning(f"Failed to record AI token usage: {e}")
+
+    def _adjust(self, reservation: Optional[Reservation], delta: int) -> None:
+        if reservation is None or delta == 0:
+            return
+        try:
+            cache = self._cache()
+            keys = [self._window_key(reservation.minute)]
+            if reservation.user_id is not None:
+                keys.append(self._window_key(reservation.minute, reservation.user_id))
+            for key in keys:
+                self._incr(cache, key, delta, 120)
+        except Exception as e:
+            logger.warning(f"Failed to adjust AI token reservation: {e}")
+
+    def _count(self, name: str) -> None:
+        try:
+            day = timezone.localdate().strftime('%Y%m%d')
+            self._incr(self._cache(), self._usage_key(day, name), 1, 2 * 86400)
+        except Exception as e:
+            logger.warning(f"Failed to count AI budget event {name}: {e}")
+
+    def usage(self, user_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Current window and today's counters.
+
+        Returns:
+            dict: {'minute': {...}, 'today': {'models': {...}, 'queued', 'rejected'}}
+        """
+        config = self._settings()
+        cache = self._cache()
+        minute = int(time.time() // 60)
+        day = timezone.localdate().strftime('%Y%m%d')
+        fields = ('calls', 'input_tokens', 'output_tokens')
+
+        keys = [self._window_key(minute), self._usage_key(day, 'queued'), self._usage_key(day, 'rejected')]
+        if user_id is not None:
+            keys.append(self._window_key(minute, user_id))
+        for model in self.known_models:
+            keys.extend(self._usage_key(day, f'{model}:{field}') for field in fields)
+        values = cache.get_many(keys)
+
+        report = {
+            'minute': {
+                'global_tokens': values.get(self._window_key(minute), 0),
+                'global_budget': config['GLOBAL_TOKENS_PER_MINUTE'],
+            },
+            'today': {
+                'models': {
+                    model: {field: values.get(self._usage_key(day, f'{model}:{field}'), 0) for field in fields}
+                    for model in sorted(self.known_models)
+                },
+                'queued': values.get(self._usage_key(day, 'queued'), 0),
+                'rejected': values.get(self._usage_key(day, 'rejected'), 0),
+            },
+        }
+        if user_id is not None:
+            report['minute']['user_tokens'] = values.get(self._window_key(minute, user_id), 0)
+        return report
+
+
+token_governor = TokenGovernor()
+
+
+def governed_invoke(llm, prompt: str, hedge_after: Optional[float] = None):
+    """
+    llm.invoke(prompt) under the token budget, with retries behind the model's
+    circuit breaker, recording the reported usage.
+
+    Args:
+        llm: ChatAnthropic (or compatible) instance
+        prompt: Prompt text
+        hedge_after: Send a backup request if the first is slower than this (seconds).
+                     The backup reserves its own tokens but never queues for budget:
+                     it is skipped when the budget is exhausted.
+
+    Raises:
+        TokenBudgetExceeded: budget exhausted (callers degrade or skip the call)
+        CircuitOpen: the model's breaker is open
+    """
+    if hedge_after:
+        return hedged_call(
+            lambda: governed_invoke(llm, prompt), hedge_after,
+            hedge=lambda: _invoke_without_budget_wait(llm, prompt)
+        )
+
+    model = str(getattr(llm, 'model', None) or 'unknown')
+    reservation = token_governor.acquire(token_governor.estimate(prompt, getattr(llm, 'max_tokens', None)))
+    try:
+        response = call_with_retry(lambda: llm.invoke(prompt), model)
+    except Exception:
+        token_governor.release(reservation)
+        raise
+
+    usage = getattr(response, 'usage_metadata', None) or {}
+    token_governor.record(reservation, model, usage.get('input_tokens'), usage.get('output_tokens'))
+    return response
+
+
+def _invoke_without_budget_wait(llm, prompt: str):
+    """governed_invoke for a hedge copy: fails at once instead of waiting for budget."""
+    context = _budget_context.get() or BudgetContext(user_id=None, tier='free')
+    # The hedge runs in a copy of the caller's context, so this does not leak back
+    _budget_context.set(replace(context, max_wait=0))
+    return governed_invoke(llm, prompt)
+
+
 class BaseAIService(ABC):
     """
     Base class for all AI services using Anthropic Claude.
@@ -28,6 +328,9 @@ class BaseAIService(ABC):
     Provides common initialization, validation, and utility methods.
     """
 
+    # Latency-critical services (a user is waiting) hedge slow requests
+    hedge_requests = False
+
     def __init__(self, model: str = "claude-3-haiku-20240307", use_langchain: bool = True):
         """
         Initialize AI service.
@@ -38,6 +341,7 @@ class BaseAIService(ABC):
         """
         self.model = model
         self.use_langchain = use_langchain
+        token_governor.known_models.add(model)
         self.client = None
         self.llm = None
         self._initialize()
@@ -60,11 +364,17 @@ class BaseAIService(ABC):
                     model=self.model,
                     temperature=self._get_temperature(),
                     max_tokens=self._get_max_tokens(),
-                    api_key=api_key
+                    api_key=api_key,
+                    timeout=settings.AI_RESILIENCE_SETTINGS['REQUEST_TIMEOUT_SECONDS'],
+                    max_retries=0  # Retried by ai_services.resilience
                 )
                 logger.info(f"{self.__class__.__name__}: LangChain client initialized (model: {self.model})")
             else:
-                self.client = anthropic.Anthropic(api_key=api_key)
+                self.client = anthropic.Anthropic(
+                    api_key=api_key,
+                    timeout=settings.AI_RESILIENCE_SETTINGS['REQUEST_TIMEOUT_SECONDS'],
+                    max_retries=0
+                )
                 logger.info(f"{self.__class__.__name__}: Anthropic SDK client initialized (model: {self.model})")
         except Exception as e:
             logger.error(f"{self.__class__.__name__}: Failed to initialize client: {e}")
@@ -81,6 +391,12 @@ class BaseAIService(ABC):
         """Check if AI service is available."""
         return (self.llm is not None) or (self.client is not None)
 
+    def _hedge_after(self) -> Optional[float]:
+        """Seconds before a hedged request is sent (None: no hedging)."""
+        if not self.hedge_requests:
+            return None
+        return settings.AI_RESILIENCE_SETTINGS['HEDGE_AFTER_SECONDS']
+
     @abstractmethod
     def _get_temperature(self) -> float:
         """Get temperature for this service. Must be implemented by subclasses."""
@@ -173,8 +489,11 @@ class BaseAIService(ABC):
             return None
 
         try:
-            response = self.llm.invoke(prompt_template.format(**kwargs))
+            response = governed_invoke(self.llm, prompt_template.format(**kwargs), hedge_after=self._hedge_after())
             return response.content if response else None
+        except (TokenBudgetExceeded, CircuitOpen) as e:
+            logger.warning(f"{self.__class__.__name__}: {e}")
+            return None
         except Exception as e:
             logger.error(f"{self.__class__.__name__}: LangChain call failed: {e}", exc_info=True)
             return None
@@ -196,18 +515,34 @@ class BaseAIService(ABC):
             logger.warning(f"{self.__class__.__name__}: Anthropic SDK not initialized")
             return None
 
+        max_tokens = max_tokens or self._get_max_tokens()
         try:
-            message = self.client.messages.create(
+            reservation = token_governor.acquire(token_governor.estimate(prompt, max_tokens))
+        except TokenBudgetExceeded as e:
+            logger.warning(f"{self.__class__.__name__}: {e}")
+            return None
+
+        message = None
+        try:
+            message = call_with_retry(lambda: self.client.messages.create(
                 model=self.model,
-                max_tokens=max_tokens or self._get_max_tokens(),
+                max_tokens=max_tokens,
                 temperature=temperature or self._get_temperature(),
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
+            ), self.model)
+            usage = getattr(message, 'usage', None)
+            token_governor.record(
+                reservation, self.model,
+                getattr(usage, 'input_tokens', None), getattr(usage, 'output_tokens', None)
             )
 
             return message.content[0].text if message.content else None
 
+        except CircuitOpen as e:
+            logger.warning(f"{self.__class__.__name__}: {e}")
+            return None
         except anthropic.AuthenticationError as e:
             logger.error(f"{self.__class__.__name__}: API authentication failed: {e}")
             return None
@@ -223,3 +558,6 @@ class BaseAIService(ABC):
         except Exception as e:
             logger.error(f"{self.__class__.__name__}: API call failed: {e}", exc_info=True)
             return None
+        finally:
+            if message is None:
+                token_governor.release(reservation)
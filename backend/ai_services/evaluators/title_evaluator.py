@@ -28,6 +28,9 @@ class TitleEvaluator(BaseAIService):
     - Automatic remembered/forgot classification
     """
 
+    # A user is waiting for the evaluation: hedge slow requests
+    hedge_requests = True
+
     def __init__(self):
         # Use Claude 3 Haiku for cost-efficient evaluation
         super().__init__(
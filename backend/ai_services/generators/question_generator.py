@@ -32,6 +32,8 @@ class QuestionGenerator(BaseAIService):
             model="claude-3-haiku-20240307",
             use_langchain=True
         )
+        # Parse the prompt once; reused for every question
+        self.correct_answer_prompt = self._create_correct_answer_prompt()
 
     def _get_temperature(self) -> float:
         return 0.3
@@ -121,9 +123,8 @@ class QuestionGenerator(BaseAIService):
         """
         category_name = content.category.name if content.category else "기타"
 
-        prompt_template = self._create_correct_answer_prompt()
         response_text = self.call_langchain(
-            prompt_template,
+            self.correct_answer_prompt,
             title=content.title,
             category=category_name,
             content=content.content[:1500]
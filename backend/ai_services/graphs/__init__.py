@@ -6,14 +6,20 @@ LangGraph 기반 AI Workflows
 
 from .distractor_generation_graph import (
     create_distractor_generation_graph, generate_quality_choices,
+    get_distractor_generation_graph,
 )
 from .weekly_test_balance_graph import (
-    create_weekly_test_balance_graph, select_balanced_contents_for_test,
+    analyze_contents_difficulty, create_weekly_test_balance_graph, get_weekly_test_balance_graph,
+    select_balanced_contents_for_test, select_balanced_from_scores,
 )
 
 __all__ = [
     'generate_quality_choices',
     'create_distractor_generation_graph',
     'select_balanced_contents_for_test',
-    'create_weekly_test_balance_graph'
+    'select_balanced_from_scores',
+    'analyze_contents_difficulty',
+    'create_weekly_test_balance_graph',
+    'get_distractor_generation_graph',
+    'get_weekly_test_balance_graph',
 ]
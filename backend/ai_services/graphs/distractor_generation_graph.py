@@ -10,13 +10,17 @@ Distractor Generation Graph - 고품질 객관식 오답 생성
     - Type C: 유사 개념 혼동 (65-80점)
 
 Graph Flow:
-    START → Extract Concepts → Generate Distractors → Validate Quality
-    → [Quality ≥ 80?] → Improve (1회) or Finalize → END
+    START → Extract Concepts → Generate Distractors → Precheck (로컬 규칙)
+    → [규칙 위반?] → Improve (1회) or Finalize
+    → [통과] → Validate Quality (LLM) → [Quality ≥ 80?] → Improve (1회) or Finalize → END
 """
 
 import json
 import logging
+import math
 import random
+import re
+import threading
 from typing import Dict, List, Literal, Optional, TypedDict
 
 from django.conf import settings
@@ -24,8 +28,28 @@ from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import END, StateGraph
 
+from ai_services.base import governed_invoke
+
 logger = logging.getLogger(__name__)
 
+_compiled_graph = None
+_compiled_graph_lock = threading.Lock()
+
+# 로컬 사전 검증 기준 (생성 프롬프트의 제약 조건과 동일)
+MIN_LENGTH_RATIO = 0.8
+MAX_LENGTH_RATIO = 1.2
+
+# "모두 맞다", "정답 없음" 같은 메타 선택지 (선택지 전체가 메타 문구인 경우만)
+META_OPTION_PATTERN = re.compile(
+    r'^\s*(?:'
+    r'(?:위의?\s*)?(?:보기\s*)?(?:모두|전부|다)\s*(?:맞|옳|정답|틀|아니)\w*'
+    r'|(?:정답|답|해당\s*사항)\s*(?:이|은|는)?\s*없\w*'
+    r'|(?:all|none|both)\s+of\s+the\s+above'
+    r')\s*[.!]?\s*$',
+    re.IGNORECASE
+)
+_NORMALIZE_PATTERN = re.compile(r'[\s\W_]+')
+
 
 # ========== State Definition ==========
 
@@ -46,6 +70,7 @@ class DistractorGenerationState(TypedDict):
     distractors: List[Dict[str, any]]
 
     # Step 3: Validation
+    local_validation: Dict[str, any]
     validation_result: Dict[str, any]
     quality_score: float
     quality_issues: List[str]
@@ -55,60 +80,10 @@ class DistractorGenerationState(TypedDict):
     metadata: Dict[str, any]
 
 
-# ========== Helper Functions ==========
-
-def _parse_json_response(response_text: str) -> Optional[Dict]:
-    """JSON 응답 파싱 (코드 블록 제거 포함)"""
-    try:
-        text = response_text.strip()
-
-        # 코드 블록 제거
-        if text.startswith('```json'):
-            text = text[7:-3].strip()
-        elif text.startswith('```'):
-            text = text[3:-3].strip()
-
-        return json.loads(text)
-
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON parsing failed: {e}")
-        logger.debug(f"Raw response: {response_text[:300]}...")
-        return None
-    except Exception as e:
-        logger.error(f"Response parsing error: {e}")
-        return None
-
-
-def _get_llm(temperature: float = 0.3, max_tokens: int = 1000) -> ChatAnthropic:
-    """LLM 인스턴스 생성"""
-    api_key = getattr(settings, 'ANTHROPIC_API_KEY', None)
-
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY not configured")
-
-    return ChatAnthropic(
-        model="claude-3-haiku-20240307",
-        temperature=temperature,
-        max_tokens=max_tokens,
-        api_key=api_key
-    )
-
-
-# ========== Node Functions ==========
+# ========== Prompt Templates ==========
+# 모듈 로드 시 한 번만 파싱 (ChatPromptTemplate 은 불변이라 스레드 간 공유 가능)
 
-def extract_concepts_and_misconceptions(
-    state: DistractorGenerationState
-) -> DistractorGenerationState:
-    """
-    Step 1: 핵심 개념 및 오개념 추출
-
-    정답을 분석하여 교육학적으로 의미 있는 오개념을 도출합니다.
-    """
-    logger.info(f"[Extract] Analyzing: {state['content_title']}")
-
-    llm = _get_llm(temperature=0.3, max_tokens=800)
-
-    prompt = ChatPromptTemplate.from_template("""
+EXTRACT_PROMPT = ChatPromptTemplate.from_template("""
 다음 학습 콘텐츠와 정답을 분석하여 핵심 개념과 흔한 오개념을 추출하세요.
 
 **콘텐츠 정보:**
@@ -169,120 +144,7 @@ def extract_concepts_and_misconceptions(
 }}
 """)
 
-    try:
-        response = llm.invoke(prompt.format(
-            title=state['content_title'],
-            content=state['content_body'][:1500],
-            correct_answer=state['correct_answer']
-        ))
-
-        result = _parse_json_response(response.content)
-
-        if result:
-            state['core_concepts'] = result.get('core_concepts', [])
-            state['misconceptions'] = result.get('misconceptions', [])
-            state['similar_concepts'] = result.get('similar_concepts', [])
-
-            logger.info(
-                f"[Extract] Success - {len(state['misconceptions'])} misconceptions"
-            )
-        else:
-            logger.warning("[Extract] Failed to parse response, using defaults")
-            state['core_concepts'] = []
-            state['misconceptions'] = []
-            state['similar_concepts'] = []
-
-    except Exception as e:
-        logger.error(f"[Extract] Error: {e}", exc_info=True)
-        state['core_concepts'] = []
-        state['misconceptions'] = []
-        state['similar_concepts'] = []
-
-    return state
-
-
-def generate_typed_distractors(
-    state: DistractorGenerationState
-) -> DistractorGenerationState:
-    """
-    Step 2: 유형별 Distractor 생성 (★핵심★)
-
-    교육학적 오개념을 반영한 3가지 유형의 그럴듯한 오답을 생성합니다.
-    """
-    is_improvement = state['iteration'] > 0
-    mode = "Improve" if is_improvement else "Generate"
-
-    logger.info(f"[{mode}] Iteration {state['iteration']}")
-
-    llm = _get_llm(temperature=0.3, max_tokens=1200)
-
-    if is_improvement:
-        # 개선 모드
-        prompt = ChatPromptTemplate.from_template("""
-이전 오답의 문제점을 개선하여 재생성하세요.
-
-**정답:**
-{correct_answer}
-
-**이전 오답들:**
-{previous_distractors}
-
-**문제점:**
-{quality_issues}
-
-**개선 원칙:**
-1. 길이 균형: 정답 길이({correct_len}자)의 80-120% 범위
-2. 그럴듯함 향상: 명확히 틀렸지만 고민하게 만들기
-3. 오개념 명확화: 각 오답이 특정 오개념 반영
-
-**응답 형식 (JSON만):**
-{{
-  "distractors": [
-    {{
-      "type": "A",
-      "text": "개선된 Type A 오답",
-      "misconception": "반영한 오개념",
-      "plausibility_score": 70-85
-    }},
-    {{
-      "type": "B",
-      "text": "개선된 Type B 오답",
-      "misconception": "반영한 오개념",
-      "plausibility_score": 60-75
-    }},
-    {{
-      "type": "C",
-      "text": "개선된 Type C 오답",
-      "misconception": "반영한 오개념",
-      "plausibility_score": 65-80
-    }}
-  ]
-}}
-""")
-
-        response = llm.invoke(prompt.format(
-            correct_answer=state['correct_answer'],
-            previous_distractors=json.dumps(
-                state['distractors'], ensure_ascii=False, indent=2
-            ),
-            quality_issues='\n'.join(f"- {issue}" for issue in state['quality_issues']),
-            correct_len=len(state['correct_answer'])
-        ))
-
-    else:
-        # 초기 생성 모드
-        misconceptions = state['misconceptions']
-
-        # 오개념이 부족한 경우 기본값 사용
-        if len(misconceptions) < 3:
-            logger.warning("[Generate] Insufficient misconceptions, using defaults")
-            misconceptions = [
-                {"type": "A", "description": "반대 개념 혼동"},
-                {"type": "B", "description": "부분적 이해"},
-                {"type": "C", "description": "유사 개념 혼동"}
-            ]
-
-        prompt = ChatPromptTemplate.from_template("""
+GENERATE_PROMPT = ChatPromptTemplate.from_template("""
 다음 정답에 대해 교육학적으로 의미 있는 오답 3개를 생성하세요.
 
 **정답:**
@@ -346,70 +208,49 @@ def generate_typed_distractors(
 }}
 """)
 
-        correct_len = len(state['correct_answer'])
-        min_len = int(correct_len * 0.8)
-        max_len = int(correct_len * 1.2)
-
-        response = llm.invoke(prompt.format(
-            correct_answer=state['correct_answer'],
-            correct_len=correct_len,
-            min_len=min_len,
-            max_len=max_len,
-            core_concepts=json.dumps(state['core_concepts'], ensure_ascii=False),
-            misconceptions=json.dumps(misconceptions, ensure_ascii=False, indent=2),
-            similar_concepts=', '.join(state['similar_concepts']),
-            misconception_a=misconceptions[0].get('description', '반대 개념'),
-            misconception_b=misconceptions[1].get('description', '부분적 이해'),
-            misconception_c=misconceptions[2].get('description', '유사 개념')
-        ))
-
-    # JSON 파싱
-    try:
-        result = _parse_json_response(response.content)
-
-        if result and 'distractors' in result:
-            state['distractors'] = result['distractors']
-            logger.info(f"[{mode}] Success - {len(state['distractors'])} distractors")
-        else:
-            logger.warning(f"[{mode}] Failed to parse, keeping previous")
-            if not state.get('distractors'):
-                state['distractors'] = []
-
-    except Exception as e:
-        logger.error(f"[{mode}] Error: {e}", exc_info=True)
-        if not state.get('distractors'):
-            state['distractors'] = []
-
-    return state
-
+IMPROVE_PROMPT = ChatPromptTemplate.from_template("""
+이전 오답의 문제점을 개선하여 재생성하세요.
 
-def validate_choices_quality(
-    state: DistractorGenerationState
-) -> DistractorGenerationState:
-    """
-    Step 3: 선택지 품질 검증
+**정답:**
+{correct_answer}
 
-    5가지 기준으로 엄격하게 품질을 평가합니다.
-    """
-    logger.info("[Validate] Checking quality")
+**이전 오답들:**
+{previous_distractors}
 
-    # 오답이 3개 미만이면 품질 0점
-    if len(state.get('distractors', [])) < 3:
-        logger.warning("[Validate] Insufficient distractors (< 3)")
-        state['validation_result'] = {}
-        state['quality_score'] = 0.0
-        state['quality_issues'] = ["오답 개수 부족 (3개 미만)"]
-        return state
+**문제점:**
+{quality_issues}
 
-    llm = _get_llm(temperature=0.3, max_tokens=900)
+**개선 원칙:**
+1. 길이 균형: 정답 길이({correct_len}자)의 80-120% 범위
+2. 그럴듯함 향상: 명확히 틀렸지만 고민하게 만들기
+3. 오개념 명확화: 각 오답이 특정 오개념 반영
 
-    # 모든 선택지
-    all_choices = [state['correct_answer']] + [
-        d['text'] for d in state['distractors'][:3]
-    ]
-    lengths = [len(c) for c in all_choices]
+**응답 형식 (JSON만):**
+{{
+  "distractors": [
+    {{
+      "type": "A",
+      "text": "개선된 Type A 오답",
+      "misconception": "반영한 오개념",
+      "plausibility_score": 70-85
+    }},
+    {{
+      "type": "B",
+      "text": "개선된 Type B 오답",
+      "misconception": "반영한 오개념",
+      "plausibility_score": 60-75
+    }},
+    {{
+      "type": "C",
+      "text": "개선된 Type C 오답",
+      "misconception": "반영한 오개념",
+      "plausibility_score": 65-80
+    }}
+  ]
+}}
+""")
 
-    prompt = ChatPromptTemplate.from_template("""
+VALIDATE_PROMPT = ChatPromptTemplate.from_template("""
 다음 객관식 선택지의 품질을 엄격하게 평가하세요.
 
 **정답:** {correct_answer}
@@ -478,8 +319,279 @@ def validate_choices_quality(
 엄격하게 평가하세요. 80점 이상은 정말 우수한 경우에만 부여하세요.
 """)
 
+
+# ========== Helper Functions ==========
+
+def _parse_json_response(response_text: str) -> Optional[Dict]:
+    """JSON 응답 파싱 (코드 블록 제거 포함)"""
+    try:
+        text = response_text.strip()
+
+        # 코드 블록 제거
+        if text.startswith('```json'):
+            text = text[7:-3].strip()
+        elif text.startswith('```'):
+            text = text[3:-3].strip()
+
+        return json.loads(text)
+
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON parsing failed: {e}")
+        logger.debug(f"Raw response: {response_text[:300]}...")
+        return None
+    except Exception as e:
+        logger.error(f"Response parsing error: {e}")
+        return None
+
+
+def _get_llm(temperature: float = 0.3, max_tokens: int = 1000) -> ChatAnthropic:
+    """LLM 인스턴스 생성"""
+    api_key = getattr(settings, 'ANTHROPIC_API_KEY', None)
+
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not configured")
+
+    return ChatAnthropic(
+        model="claude-3-haiku-20240307",
+        temperature=temperature,
+        max_tokens=max_tokens,
+        api_key=api_key,
+        timeout=settings.AI_RESILIENCE_SETTINGS['REQUEST_TIMEOUT_SECONDS'],
+        max_retries=0  # governed_invoke 에서 재시도
+    )
+
+
+def _normalize_choice(text: str) -> str:
+    """중복 비교용 정규화 (공백/구두점 제거, 대소문자 무시)"""
+    return _NORMALIZE_PATTERN.sub('', text).casefold()
+
+
+def check_choices_locally(correct_answer: str, distractors: List[Dict]) -> Dict[str, any]:
+    """
+    결정적 로컬 규칙으로 선택지 구조 검증 (LLM 호출 없음)
+
+    - 오답 개수 (3개)
+    - 길이 균형 (정답 길이의 80-120%)
+    - 중복 (오답끼리 또는 정답과 동일)
+    - 메타 선택지 ("모두 맞다", "정답 없음" 등)
+
+    Returns:
+        {'passed': bool, 'score': float, 'issues': [...]}
+    """
+    issues = []
+    texts = [str(d.get('text') or '').strip() for d in distractors[:3]]
+
+    if len(texts) < 3 or not all(texts):
+        return {'passed': False, 'score': 0.0, 'issues': ["오답 개수 부족 (3개 미만)"]}
+
+    correct_len = len(correct_answer)
+    min_len = math.floor(correct_len * MIN_LENGTH_RATIO)
+    max_len = math.ceil(correct_len * MAX_LENGTH_RATIO)
+    penalty = 0
+
+    for label, text in zip('ABC', texts):
+        if not min_len <= len(text) <= max_len:
+            issues.append(
+                f"Type {label} 오답 길이 {len(text)}자: 정답({correct_len}자) 기준 {min_len}-{max_len}자 범위 밖"
+            )
+            penalty += 15
+        if META_OPTION_PATTERN.search(text):
+            issues.append(f"Type {label} 오답이 메타 선택지 (\"{text[:20]}\") - 금지")
+            penalty += 30
+
+    normalized = [_normalize_choice(text) for text in texts]
+    correct_normalized = _normalize_choice(correct_answer)
+    seen = set()
+    for label, value in zip('ABC', normalized):
+        if value == correct_normalized:
+            issues.append(f"Type {label} 오답이 정답과 동일")
+            penalty += 40
+        elif value in seen:
+            issues.append(f"Type {label} 오답이 다른 오답과 중복")
+            penalty += 30
+        seen.add(value)
+
+    return {
+        'passed': not issues,
+        'score': float(max(0, 100 - penalty)),
+        'issues': issues,
+    }
+
+
+# ========== Node Functions ==========
+
+def extract_concepts_and_misconceptions(
+    state: DistractorGenerationState
+) -> DistractorGenerationState:
+    """
+    Step 1: 핵심 개념 및 오개념 추출
+
+    정답을 분석하여 교육학적으로 의미 있는 오개념을 도출합니다.
+    """
+    logger.info(f"[Extract] Analyzing: {state['content_title']}")
+
+    llm = _get_llm(temperature=0.3, max_tokens=800)
+
+    try:
+        response = governed_invoke(llm, EXTRACT_PROMPT.format(
+            title=state['content_title'],
+            content=state['content_body'][:1500],
+            correct_answer=state['correct_answer']
+        ))
+
+        result = _parse_json_response(response.content)
+
+        if result:
+            state['core_concepts'] = result.get('core_concepts', [])
+            state['misconceptions'] = result.get('misconceptions', [])
+            state['similar_concepts'] = result.get('similar_concepts', [])
+
+            logger.info(
+                f"[Extract] Success - {len(state['misconceptions'])} misconceptions"
+            )
+        else:
+            logger.warning("[Extract] Failed to parse response, using defaults")
+            state['core_concepts'] = []
+            state['misconceptions'] = []
+            state['similar_concepts'] = []
+
+    except Exception as e:
+        logger.error(f"[Extract] Error: {e}", exc_info=True)
+        state['core_concepts'] = []
+        state['misconceptions'] = []
+        state['similar_concepts'] = []
+
+    return state
+
+
+def generate_typed_distractors(
+    state: DistractorGenerationState
+) -> DistractorGenerationState:
+    """
+    Step 2: 유형별 Distractor 생성 (★핵심★)
+
+    교육학적 오개념을 반영한 3가지 유형의 그럴듯한 오답을 생성합니다.
+    """
+    is_improvement = state['iteration'] > 0
+    mode = "Improve" if is_improvement else "Generate"
+
+    logger.info(f"[{mode}] Iteration {state['iteration']}")
+
+    llm = _get_llm(temperature=0.3, max_tokens=1200)
+
+    if is_improvement:
+        # 개선 모드
+
+        response = governed_invoke(llm, IMPROVE_PROMPT.format(
+            correct_answer=state['correct_answer'],
+            previous_distractors=json.dumps(
+                state['distractors'], ensure_ascii=False, indent=2
+            ),
+            quality_issues='\n'.join(f"- {issue}" for issue in state['quality_issues']),
+            correct_len=len(state['correct_answer'])
+        ))
+
+    else:
+        # 초기 생성 모드
+        misconceptions = state['misconceptions']
+
+        # 오개념이 부족한 경우 기본값 사용
+        if len(misconceptions) < 3:
+            logger.warning("[Generate] Insufficient misconceptions, using defaults")
+            misconceptions = [
+                {"type": "A", "description": "반대 개념 혼동"},
+                {"type": "B", "description": "부분적 이해"},
+                {"type": "C", "description": "유사 개념 혼동"}
+            ]
+
+        correct_len = len(state['correct_answer'])
+        min_len = int(correct_len * 0.8)
+        max_len = int(correct_len * 1.2)
+
+        response = governed_invoke(llm, GENERATE_PROMPT.format(
+            correct_answer=state['correct_answer'],
+            correct_len=correct_len,
+            min_len=min_len,
+            max_len=max_len,
+            core_concepts=json.dumps(state['core_concepts'], ensure_ascii=False),
+            misconceptions=json.dumps(misconceptions, ensure_ascii=False, indent=2),
+            similar_concepts=', '.join(state['similar_concepts']),
+            misconception_a=misconceptions[0].get('description', '반대 개념'),
+            misconception_b=misconceptions[1].get('description', '부분적 이해'),
+            misconception_c=misconceptions[2].get('description', '유사 개념')
+        ))
+
+    # JSON 파싱
+    try:
+        result = _parse_json_response(response.content)
+
+        if result and 'distractors' in result:
+            state['distractors'] = result['distractors']
+            logger.info(f"[{mode}] Success - {len(state['distractors'])} distractors")
+        else:
+            logger.warning(f"[{mode}] Failed to parse, keeping previous")
+            if not state.get('distractors'):
+                state['distractors'] = []
+
+    except Exception as e:
+        logger.error(f"[{mode}] Error: {e}", exc_info=True)
+        if not state.get('distractors'):
+            state['distractors'] = []
+
+    return state
+
+
+def precheck_choices(
+    state: DistractorGenerationState
+) -> DistractorGenerationState:
+    """
+    Step 3a: 로컬 사전 검증
+
+    구조적 규칙을 통과한 선택지만 LLM 품질 검증으로 보냅니다.
+    위반 시 로컬 점수/문제점을 품질 결과로 사용하여 개선 프롬프트에 전달합니다.
+    """
+    result = check_choices_locally(state['correct_answer'], state.get('distractors', []))
+    state['local_validation'] = result
+
+    if result['passed']:
+        logger.info("[Precheck] Passed local checks")
+    else:
+        logger.info(f"[Precheck] {len(result['issues'])} issues, skipping LLM validation")
+        state['validation_result'] = {'local_validation': result}
+        state['quality_score'] = result['score']
+        state['quality_issues'] = result['issues']
+
+    return state
+
+
+def validate_choices_quality(
+    state: DistractorGenerationState
+) -> DistractorGenerationState:
+    """
+    Step 3: 선택지 품질 검증
+
+    5가지 기준으로 엄격하게 품질을 평가합니다.
+    """
+    logger.info("[Validate] Checking quality")
+
+    # 오답이 3개 미만이면 품질 0점
+    if len(state.get('distractors', [])) < 3:
+        logger.warning("[Validate] Insufficient distractors (< 3)")
+        state['validation_result'] = {}
+        state['quality_score'] = 0.0
+        state['quality_issues'] = ["오답 개수 부족 (3개 미만)"]
+        return state
+
+    llm = _get_llm(temperature=0.3, max_tokens=900)
+
+    # 모든 선택지
+    all_choices = [state['correct_answer']] + [
+        d['text'] for d in state['distractors'][:3]
+    ]
+    lengths = [len(c) for c in all_choices]
+
     try:
-        response = llm.invoke(prompt.format(
+        response = governed_invoke(llm, VALIDATE_PROMPT.format(
             correct_answer=state['correct_answer'],
             all_choices=json.dumps(all_choices, ensure_ascii=False, indent=2),
             distractors=json.dumps(
@@ -548,6 +660,27 @@ def finalize_choices(
 
 # ========== Conditional Edge ==========
 
+def route_after_precheck(
+    state: DistractorGenerationState
+) -> Literal["validate", "improve", "finalize"]:
+    """
+    로컬 검증 결과에 따라 LLM 검증 여부 결정
+
+    - 통과: LLM 품질 검증
+    - 위반 + 개선 기회 남음: LLM 검증 없이 바로 개선
+    - 위반 + 개선 기회 없음: LLM 검증 없이 완료
+    """
+    if state['local_validation']['passed']:
+        return "validate"
+
+    if state['iteration'] >= 1:
+        logger.warning("[Decision] Local checks failed, max iteration reached → Finalize")
+        return "finalize"
+
+    logger.info("[Decision] Local checks failed → Improve")
+    return "improve"
+
+
 def should_improve(
     state: DistractorGenerationState
 ) -> Literal["improve", "finalize"]:
@@ -596,6 +729,7 @@ def create_distractor_generation_graph():
     # Nodes
     workflow.add_node("extract", extract_concepts_and_misconceptions)
     workflow.add_node("generate", generate_typed_distractors)
+    workflow.add_node("precheck", precheck_choices)
     workflow.add_node("validate", validate_choices_quality)
     workflow.add_node("increment", increment_iteration)
     workflow.add_node("finalize", finalize_choices)
@@ -603,9 +737,18 @@ def create_distractor_generation_graph():
     # Flow
     workflow.set_entry_point("extract")
     workflow.add_edge("extract", "generate")
-    workflow.add_edge("generate", "validate")
+    workflow.add_edge("generate", "precheck")
 
     # Conditional routing
+    workflow.add_conditional_edges(
+        "precheck",
+        route_after_precheck,
+        {
+            "validate": "validate",
+            "improve": "increment",
+            "finalize": "finalize"
+        }
+    )
     workflow.add_conditional_edges(
         "validate",
         should_improve,
@@ -626,6 +769,23 @@ def create_distractor_generation_graph():
     return app
 
 
+def get_distractor_generation_graph():
+    """
+    프로세스당 한 번만 컴파일된 Distractor 생성 그래프 반환
+
+    컴파일된 그래프는 호출마다 독립된 state 로 실행되므로
+    스레드/async 태스크 간에 공유해도 안전합니다.
+    """
+    global _compiled_graph
+
+    if _compiled_graph is None:
+        with _compiled_graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = create_distractor_generation_graph()
+
+    return _compiled_graph
+
+
 # ========== Main Function ==========
 
 def generate_quality_choices(
@@ -648,7 +808,7 @@ def generate_quality_choices(
             'metadata': {...}  # 품질 정보
         }
     """
-    graph = create_distractor_generation_graph()
+    graph = get_distractor_generation_graph()
 
     initial_state = {
         "content_title": content_title,
@@ -659,6 +819,7 @@ def generate_quality_choices(
         "misconceptions": [],
         "similar_concepts": [],
         "distractors": [],
+        "local_validation": {},
         "validation_result": {},
         "quality_score": 0.0,
         "quality_issues": [],
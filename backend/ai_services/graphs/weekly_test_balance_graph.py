@@ -9,6 +9,7 @@
 
 import logging
 import random
+import threading
 from typing import Dict, List, TypedDict
 
 from django.conf import settings
@@ -16,8 +17,30 @@ from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import END, StateGraph
 
+from ai_services.base import governed_invoke
+
 logger = logging.getLogger(__name__)
 
+_compiled_graph = None
+_compiled_graph_lock = threading.Lock()
+
+# 모듈 로드 시 한 번만 파싱 (ChatPromptTemplate 은 불변이라 공유 가능)
+DIFFICULTY_PROMPT = ChatPromptTemplate.from_template("""
+다음 학습 콘텐츠의 난이도를 평가하세요.
+
+**콘텐츠**:
+제목: {title}
+내용: {content}
+
+**난이도 기준**:
+- Easy (30-50점): 기본 개념, 단순 정의, 명확한 사실
+- Medium (50-70점): 개념 이해, 비교/대조, 적용
+- Hard (70-100점): 복잡한 개념, 심화 내용, 응용/분석
+
+**응답 형식** (한 줄로):
+difficulty: Easy|Medium|Hard, score: 30-100
+""")
+
 
 class WeeklyTestBalanceState(TypedDict):
     """주간 시험 밸런스 상태"""
@@ -40,30 +63,16 @@ def analyze_difficulty(state: WeeklyTestBalanceState) -> WeeklyTestBalanceState:
         model="claude-3-haiku-20240307",
         temperature=0.2,
         max_tokens=200,
-        api_key=settings.ANTHROPIC_API_KEY
+        api_key=settings.ANTHROPIC_API_KEY,
+        timeout=settings.AI_RESILIENCE_SETTINGS['REQUEST_TIMEOUT_SECONDS'],
+        max_retries=0  # governed_invoke 에서 재시도
     )
 
-    prompt = ChatPromptTemplate.from_template("""
-다음 학습 콘텐츠의 난이도를 평가하세요.
-
-**콘텐츠**:
-제목: {title}
-내용: {content}
-
-**난이도 기준**:
-- Easy (30-50점): 기본 개념, 단순 정의, 명확한 사실
-- Medium (50-70점): 개념 이해, 비교/대조, 적용
-- Hard (70-100점): 복잡한 개념, 심화 내용, 응용/분석
-
-**응답 형식** (한 줄로):
-difficulty: Easy|Medium|Hard, score: 30-100
-""")
-
     difficulty_scores = {}
 
     for content_data in state['contents']:
         try:
-            response = llm.invoke(prompt.format(
+            response = governed_invoke(llm, DIFFICULTY_PROMPT.format(
                 title=content_data['title'],
                 content=content_data['content'][:800]
             ))
@@ -87,10 +96,11 @@ difficulty: Easy|Medium|Hard, score: 30-100
 
         except Exception as e:
             logger.error(f"[Analyze] Failed for content {content_data['id']}: {e}")
-            # 기본값: Medium
+            # 기본값: Medium (fallback 표시로 실제 평가와 구분)
             difficulty_scores[content_data['id']] = {
                 'difficulty': 'Medium',
-                'score': 60
+                'score': 60,
+                'fallback': True
             }
 
     state['difficulty_scores'] = difficulty_scores
@@ -213,6 +223,18 @@ def create_weekly_test_balance_graph() -> StateGraph:
     return workflow.compile()
 
 
+def get_weekly_test_balance_graph():
+    """프로세스당 한 번만 컴파일된 밸런스 그래프 반환 (스레드/async 간 공유 안전)"""
+    global _compiled_graph
+
+    if _compiled_graph is None:
+        with _compiled_graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = create_weekly_test_balance_graph()
+
+    return _compiled_graph
+
+
 def select_balanced_contents_for_test(
     contents: List[Dict],
     target_count: int = 10
@@ -240,7 +262,7 @@ def select_balanced_contents_for_test(
         )
         target_count = len(contents)
 
-    graph = create_weekly_test_balance_graph()
+    graph = get_weekly_test_balance_graph()
 
     initial_state: WeeklyTestBalanceState = {
         'contents': contents,
@@ -262,3 +284,60 @@ def select_balanced_contents_for_test(
         'balance': result['balance'],
         'difficulty_scores': result['difficulty_scores']
     }
+
+
+def analyze_contents_difficulty(contents: List[Dict]) -> Dict[int, Dict]:
+    """
+    콘텐츠 난이도만 평가 (선택 없음)
+
+    문제 은행 배치에서 난이도를 미리 저장해 두기 위해 사용합니다.
+    평가에 실패한 콘텐츠는 기본 난이도 대신 결과에서 제외됩니다.
+
+    Args:
+        contents: [{'id': int, 'title': str, 'content': str}, ...]
+
+    Returns:
+        {content_id: {'difficulty': str, 'score': int}}
+    """
+    state: WeeklyTestBalanceState = {
+        'contents': contents,
+        'target_count': 0,
+        'difficulty_scores': {},
+        'selected_contents': [],
+        'balance': {}
+    }
+    return {
+        content_id: scores
+        for content_id, scores in analyze_difficulty(state)['difficulty_scores'].items()
+        if not scores.get('fallback')
+    }
+
+
+def select_balanced_from_scores(
+    difficulty_scores: Dict[int, Dict],
+    target_count: int = 10
+) -> Dict:
+    """
+    저장된 난이도로 균형 맞춰 선택 (LLM 호출 없음)
+
+    Args:
+        difficulty_scores: {content_id: {'difficulty': str, 'score': int}}
+        target_count: 목표 문제 수
+
+    Returns:
+        select_balanced_contents_for_test 와 같은 형태
+    """
+    state: WeeklyTestBalanceState = {
+        'contents': [],
+        'target_count': min(target_count, len(difficulty_scores)),
+        'difficulty_scores': difficulty_scores,
+        'selected_contents': [],
+        'balance': {}
+    }
+    result = select_balanced_contents(state)
+
+    return {
+        'selected_content_ids': result['selected_contents'],
+        'balance': result['balance'],
+        'difficulty_scores': difficulty_scores
+    }
@@ -0,0 +1,280 @@
+"""
+Resilience layer for LLM calls.
+
+Provides:
+- Per-call retries with full-jitter exponential backoff that honors the
+  provider's retry-after, bounded by a total deadline per call
+- A circuit breaker per model that opens after consecutive provider
+  failures (5xx, overload, timeouts, connection errors) and fails calls
+  immediately until a probe call succeeds again
+- Hedged requests: a backup request is sent when the first has not
+  answered within HEDGE_AFTER_SECONDS, and is used if the first fails
+
+The SDK clients are created with max_retries=0, so this layer is the only
+place calls are retried. Breaker state is per process: it reacts within a
+handful of calls and costs no cache round trip per request.
+"""
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Dict, Optional
+
+import anthropic
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpen(Exception):
+    """The model's circuit breaker is open; the call was not sent."""
+
+    def __init__(self, model: str, retry_after: float):
+        super().__init__(f"Circuit open for {model}, retry after {retry_after:.0f}s")
+        self.model = model
+        self.retry_after = retry_after
+
+
+def _resilience_settings() -> Dict[str, Any]:
+    return settings.AI_RESILIENCE_SETTINGS
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    return getattr(error, 'status_code', None)
+
+
+def is_provider_failure(error: Exception) -> bool:
+    """Failures that indicate a provider incident (count toward the breaker)."""
+    if isinstance(error, anthropic.APIConnectionError):  # includes APITimeoutError
+        return True
+    status = _status_code(error)
+    return isinstance(error, anthropic.APIStatusError) and status is not None and status >= 500
+
+
+def is_retryable(error: Exception) -> bool:
+    """Rate limits and provider failures; request errors (4xx) are never retried."""
+    return isinstance(error, anthropic.RateLimitError) or is_provider_failure(error)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Retry-After header of a provider response, in seconds."""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    value = headers.get('retry-after')
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, error: Exception) -> float:
+    """Delay before retry number `attempt` (1-based): retry-after, else full jitter."""
+    retry_after = retry_after_seconds(error)
+    if retry_after is not None:
+        return retry_after
+    config = _resilience_settings()
+    ceiling = min(config['BACKOFF_MAX_SECONDS'], config['BACKOFF_BASE_SECONDS'] * (2 ** (attempt - 1)))
+    return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed -> open after BREAKER_FAILURE_THRESHOLD provider failures in a row;
+    open -> half-open after BREAKER_COOLDOWN_SECONDS, letting one probe call
+    through; the probe closes the breaker on success or reopens it on failure.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < _resilience_settings()['BREAKER_COOLDOWN_SECONDS']:
+            return 'open'
+        return 'half_open'
+
+    def before_call(self) -> None:
+        """Raise CircuitOpen unless the call may be sent."""
+        with self.lock:
+            state = self.state
+            if state == 'closed':
+                return
+            if state == 'half_open' and not self.probing:
+                self.probing = True
+                return
+            cooldown = _resilience_settings()['BREAKER_COOLDOWN_SECONDS']
+            raise CircuitOpen(self.name, max(cooldown - (time.monotonic() - self.opened_at), 0.0))
+
+    def record_success(self) -> None:
+        with self.lock:
+            if self.opened_at is not None:
+                logger.info(f"Circuit for {self.name} closed")
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            if self.probing or self.failures >= _resilience_settings()['BREAKER_FAILURE_THRESHOLD']:
+                if self.opened_at is None or self.probing:
+                    logger.warning(f"Circuit for {self.name} opened after {self.failures} failures")
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+    def record_neutral(self) -> None:
+        """A call finished without telling anything about provider health (e.g. 4xx)."""
+        with self.lock:
+            self.probing = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(model: str) -> CircuitBreaker:
+    breaker = _breakers.get(model)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(model, CircuitBreaker(model))
+    return breaker
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """State of every breaker in this process (monitoring)."""
+    return {
+        name: {'state': breaker.state, 'consecutive_failures': breaker.failures}
+        for name, breaker in sorted(_breakers.items())
+    }
+
+
+def reset_breakers() -> None:
+    """Forget all breaker state (tests)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def call_with_retry(func: Callable[[], Any], model: str, sleep: Callable[[float], None] = time.sleep) -> Any:
+    """
+    Call `func` behind the model's breaker, retrying transient failures.
+
+    Retries stop at MAX_ATTEMPTS, or earlier when the next wait would pass
+    RETRY_DEADLINE_SECONDS, so a provider incident never holds a worker for
+    long.
+
+    Raises:
+        CircuitOpen: the breaker is open (no request was sent)
+        Exception: the last provider error, or any non-retryable error
+    """
+    config = _resilience_settings()
+    breaker = get_breaker(model)
+    deadline = time.monotonic() + config['RETRY_DEADLINE_SECONDS']
+    attempt = 0
+
+    while True:
+        attempt += 1
+        breaker.before_call()
+        try:
+            result = func()
+        except Exception as e:
+            if is_provider_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_neutral()
+            # A breaker opened by this failure fails the call now instead of after a wait
+            if not is_retryable(e) or attempt >= config['MAX_ATTEMPTS'] or breaker.state == 'open':
+                raise
+
+            delay = backoff_delay(attempt, e)
+            if time.monotonic() + delay > deadline:
+                logger.warning(f"{model}: giving up after {attempt} attempts (next retry in {delay:.1f}s): {e}")
+                raise
+            logger.warning(f"{model}: attempt {attempt} failed ({e}), retrying in {delay:.2f}s")
+            sleep(delay)
+            continue
+
+        breaker.record_success()
+        return result
+
+
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_slots: Optional[threading.BoundedSemaphore] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _hedge_executor, _hedge_slots
+    if _hedge_executor is None:
+        with _hedge_executor_lock:
+            if _hedge_executor is None:
+                workers = _resilience_settings()['HEDGE_MAX_WORKERS']
+                _hedge_slots = threading.BoundedSemaphore(workers)
+                _hedge_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ai-hedge')
+    return _hedge_executor
+
+
+_NOT_SENT = object()
+
+
+def _delayed_hedge(hedge: Callable[[], Any], first_done: threading.Event, hedge_after: float,
+                   sent: threading.Event) -> Any:
+    """Send the hedge unless the first request finishes within `hedge_after` seconds."""
+    try:
+        if first_done.wait(hedge_after):
+            return _NOT_SENT
+        logger.info(f"Hedging LLM request after {hedge_after:.1f}s")
+        sent.set()
+        return hedge()
+    finally:
+        _hedge_slots.release()
+
+
+def hedged_call(func: Callable[[], Any], hedge_after: float, hedge: Optional[Callable[[], Any]] = None) -> Any:
+    """
+    Run `func` on the caller's thread, with a backup request if it is slow.
+
+    If the first request has not finished after `hedge_after` seconds, `hedge`
+    (default: `func`) is sent from the hedge pool. The first request's result
+    is returned when it succeeds. When it fails and the hedge was sent, the
+    hedge's result is awaited for what is left of RETRY_DEADLINE_SECONDS.
+    Hedges are only sent while a pool slot is free, so they never queue behind
+    abandoned copies. Each copy is still bounded by the client's request
+    timeout. The hedge runs in the caller's context (token budget user).
+
+    Raises:
+        Exception: the first request's error, unless the hedge succeeded
+    """
+    started = time.monotonic()
+    executor = _executor()
+    first_done = threading.Event()
+    sent = threading.Event()
+    future = None
+    if _hedge_slots.acquire(blocking=False):
+        context = copy_context()
+        future = executor.submit(context.run, _delayed_hedge, hedge or func, first_done, hedge_after, sent)
+
+    try:
+        return func()
+    except Exception as error:
+        first_done.set()
+        if future is None or not sent.is_set():
+            raise
+        remaining = _resilience_settings()['RETRY_DEADLINE_SECONDS'] - (time.monotonic() - started)
+        try:
+            return future.result(timeout=max(remaining, 0))
+        except Exception:
+            raise error
+    finally:
+        first_done.set()
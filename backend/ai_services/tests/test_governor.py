@@ -0,0 +1,131 @@
+"""
+Tests for the AI token budget governor.
+"""
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from ai_services import base
+from ai_services.base import (BaseAIService, TokenBudgetExceeded, ai_budget_user, governed_invoke,
+                              token_governor)
+
+LOCMEM = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'governor-default'},
+    'throttle': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'governor-tests'},
+}
+BUDGETS = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'throttle',
+    'GLOBAL_TOKENS_PER_MINUTE': 10000,
+    'TIER_TOKENS_PER_MINUTE': {'free': 1000, 'pro': 5000},
+    'MAX_WAIT_SECONDS': 0,
+    'CHARS_PER_TOKEN': 2,
+}
+
+
+def user(pk=1, tier='free'):
+    return SimpleNamespace(pk=pk, is_authenticated=True, subscription=SimpleNamespace(tier=tier))
+
+
+def fake_llm(input_tokens=100, output_tokens=50, model='claude-test', max_tokens=500):
+    response = SimpleNamespace(content='{"ok": true}', usage_metadata={
+        'input_tokens': input_tokens, 'output_tokens': output_tokens,
+    })
+    return Mock(model=model, max_tokens=max_tokens, invoke=Mock(return_value=response))
+
+
+class GovernedService(BaseAIService):
+    def _get_temperature(self) -> float:
+        return 0.3
+
+    def _get_max_tokens(self) -> int:
+        return 500
+
+
+@override_settings(CACHES=LOCMEM, AI_TOKEN_BUDGET_SETTINGS=BUDGETS)
+class TokenGovernorTest(SimpleTestCase):
+    """Test reservations, corrections and budget enforcement."""
+
+    def setUp(self):
+        caches['throttle'].clear()
+        self.minute = int(base.time.time() // 60)
+
+    def window(self, user_id=None):
+        return caches['throttle'].get(token_governor._window_key(self.minute, user_id), 0)
+
+    def test_reservation_is_corrected_to_reported_usage(self):
+        with ai_budget_user(user()):
+            governed_invoke(fake_llm(input_tokens=120, output_tokens=30), 'x' * 200)
+
+        self.assertEqual(self.window(), 150)
+        self.assertEqual(self.window(1), 150)
+        usage = token_governor.usage(user_id=1)
+        self.assertEqual(usage['today']['models']['claude-test'],
+                         {'calls': 1, 'input_tokens': 120, 'output_tokens': 30})
+        self.assertEqual(usage['minute']['user_tokens'], 150)
+
+    def test_tier_budget_rejects_and_rolls_back(self):
+        with ai_budget_user(user(tier='free')):
+            governed_invoke(fake_llm(input_tokens=900, output_tokens=50), 'prompt')
+            llm = fake_llm()
+            with self.assertRaises(TokenBudgetExceeded) as raised:
+                governed_invoke(llm, 'prompt')
+
+        self.assertEqual(raised.exception.scope, 'user')
+        llm.invoke.assert_not_called()
+        self.assertEqual(self.window(), 950)
+        self.assertEqual(token_governor.usage()['today']['rejected'], 1)
+
+    def test_higher_tier_has_larger_budget(self):
+        with ai_budget_user(user(tier='pro')):
+            for _ in range(3):
+                governed_invoke(fake_llm(input_tokens=900, output_tokens=50), 'prompt')
+        self.assertEqual(self.window(1), 2850)
+
+    def test_global_budget_applies_without_user(self):
+        caches['throttle'].set(token_governor._window_key(self.minute), 9900, 120)
+        with self.assertRaises(TokenBudgetExceeded) as raised:
+            governed_invoke(fake_llm(), 'prompt')
+        self.assertEqual(raised.exception.scope, 'global')
+
+    def test_oversized_call_is_allowed_in_empty_window(self):
+        with ai_budget_user(user(tier='free')):
+            governed_invoke(fake_llm(max_tokens=4000, input_tokens=100, output_tokens=2000), 'prompt')
+        self.assertEqual(self.window(1), 2100)
+
+    def test_queues_for_next_window_when_allowed(self):
+        now = [self.minute * 60 + 59.0]
+        clock = SimpleNamespace(time=lambda: now[0], sleep=lambda seconds: now.__setitem__(0, now[0] + seconds))
+        caches['throttle'].set(token_governor._window_key(self.minute), 9900, 120)
+
+        with patch.object(base, 'time', clock), ai_budget_user(None, max_wait=5):
+            governed_invoke(fake_llm(), 'prompt')
+
+        self.assertEqual(caches['throttle'].get(token_governor._window_key(self.minute + 1)), 150)
+        self.assertEqual(token_governor.usage()['today']['queued'], 1)
+
+    def test_failed_call_releases_reservation(self):
+        llm = fake_llm()
+        llm.invoke.side_effect = RuntimeError('overloaded')
+        with self.assertRaises(RuntimeError):
+            governed_invoke(llm, 'prompt')
+        self.assertEqual(self.window(), 0)
+
+    @override_settings(ANTHROPIC_API_KEY='sk-ant-REDACTED')
+    def test_service_degrades_when_budget_exhausted(self):
+        service = GovernedService()
+        service.llm = fake_llm()
+        caches['throttle'].set(token_governor._window_key(self.minute), 10000, 120)
+
+        prompt = SimpleNamespace(format=lambda **kwargs: 'prompt')
+        self.assertIsNone(service.call_langchain(prompt))
+        service.llm.invoke.assert_not_called()
+
+    @override_settings(AI_TOKEN_BUDGET_SETTINGS={**BUDGETS, 'ENABLED': False})
+    def test_disabled_governor_only_invokes(self):
+        llm = fake_llm()
+        governed_invoke(llm, 'prompt')
+        llm.invoke.assert_called_once_with('prompt')
+        self.assertEqual(self.window(), 0)
@@ -0,0 +1,149 @@
+"""
+Tests for LangGraph workflows.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ai_services.graphs import distractor_generation_graph, weekly_test_balance_graph
+
+
+class CompiledGraphCacheTest(TestCase):
+    """Test graphs are compiled once per process and shared."""
+
+    def setUp(self):
+        distractor_generation_graph._compiled_graph = None
+        weekly_test_balance_graph._compiled_graph = None
+
+    def test_graph_compiled_once(self):
+        """Test repeated accessor calls return the same compiled graph."""
+        first = distractor_generation_graph.get_distractor_generation_graph()
+        second = distractor_generation_graph.get_distractor_generation_graph()
+
+        self.assertIs(first, second)
+        self.assertIs(
+            weekly_test_balance_graph.get_weekly_test_balance_graph(),
+            weekly_test_balance_graph.get_weekly_test_balance_graph()
+        )
+
+    def test_concurrent_access_compiles_once(self):
+        """Test threads racing on a cold cache trigger a single compile."""
+        real_create = distractor_generation_graph.create_distractor_generation_graph
+
+        with patch.object(
+            distractor_generation_graph, 'create_distractor_generation_graph', side_effect=real_create
+        ) as create:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                graphs = list(pool.map(
+                    lambda _: distractor_generation_graph.get_distractor_generation_graph(), range(16)
+                ))
+
+        self.assertEqual(create.call_count, 1)
+        self.assertEqual(len({id(graph) for graph in graphs}), 1)
+
+    def test_generate_quality_choices_reuses_graph(self):
+        """Test the main entry point does not rebuild the graph per call."""
+        with patch.object(distractor_generation_graph, 'create_distractor_generation_graph') as create:
+            create.return_value.invoke.side_effect = RuntimeError('no llm in tests')
+
+            distractor_generation_graph.generate_quality_choices('Title', 'Body', 'Answer')
+            distractor_generation_graph.generate_quality_choices('Title', 'Body', 'Answer')
+
+        self.assertEqual(create.call_count, 1)
+        self.assertEqual(create.return_value.invoke.call_count, 2)
+
+
+class FakeLLM:
+    """Returns canned JSON per prompt kind and records the calls."""
+
+    def __init__(self, generated, improved):
+        self.responses = {
+            '핵심 개념과 흔한 오개념': {'core_concepts': [], 'misconceptions': [], 'similar_concepts': []},
+            '오답 3개를 생성': {'distractors': generated},
+            '문제점을 개선': {'distractors': improved},
+            '품질을 엄격하게 평가': {'overall_score': 90, 'summary_issues': []},
+        }
+        self.calls = []
+
+    def invoke(self, prompt):
+        for marker, payload in self.responses.items():
+            if marker in prompt:
+                self.calls.append(marker)
+                return SimpleNamespace(content=json.dumps(payload, ensure_ascii=False))
+        raise AssertionError('unexpected prompt')
+
+
+def _distractors(*texts):
+    return [{'type': label, 'text': text} for label, text in zip('ABC', texts)]
+
+
+class DistractorPrecheckTest(TestCase):
+    """Test the deterministic local validator stage."""
+
+    answer = '리스트는 생성 후에도 요소를 수정할 수 있다'
+
+    def test_well_formed_choices_pass(self):
+        """Test balanced, distinct choices pass without issues."""
+        result = distractor_generation_graph.check_choices_locally(self.answer, _distractors(
+            '리스트는 생성 후에는 요소를 수정할 수 없다',
+            '리스트는 요소 추가만 가능하고 수정은 불가하다',
+            '튜플처럼 리스트도 요소를 바꿀 수 없는 구조다',
+        ))
+
+        self.assertTrue(result['passed'])
+        self.assertEqual(result['score'], 100.0)
+
+    def test_structural_problems_flagged(self):
+        """Test length, duplicate and meta-option problems are reported."""
+        result = distractor_generation_graph.check_choices_locally(self.answer, _distractors(
+            '리스트는 생성 후에도 요소를 수정할 수 있다!',
+            '모두 맞다',
+            '짧다',
+        ))
+
+        self.assertFalse(result['passed'])
+        issues = ' '.join(result['issues'])
+        self.assertIn('정답과 동일', issues)
+        self.assertIn('메타 선택지', issues)
+        self.assertIn('범위 밖', issues)
+        self.assertLess(result['score'], 50)
+
+    def test_missing_distractors_score_zero(self):
+        """Test fewer than three distractors fail immediately."""
+        result = distractor_generation_graph.check_choices_locally(self.answer, _distractors('a', 'b'))
+
+        self.assertEqual(result['score'], 0.0)
+
+    def test_local_failure_skips_llm_judge(self):
+        """Test locally rejected candidates go straight to regeneration."""
+        llm = FakeLLM(
+            generated=_distractors('모두 맞다', '정답 없음', '모두 맞다'),
+            improved=_distractors(
+                '리스트는 생성 후에는 요소를 수정할 수 없다',
+                '리스트는 요소 추가만 가능하고 수정은 불가하다',
+                '튜플처럼 리스트도 요소를 바꿀 수 없는 구조다',
+            ),
+        )
+
+        with patch.object(distractor_generation_graph, '_get_llm', return_value=llm):
+            result = distractor_generation_graph.generate_quality_choices('리스트', '본문', self.answer)
+
+        self.assertEqual(llm.calls.count('품질을 엄격하게 평가'), 1)
+        self.assertEqual(llm.calls.count('문제점을 개선'), 1)
+        self.assertEqual(result['metadata']['quality_score'], 90.0)
+        self.assertIn(self.answer, result['choices'])
+
+    def test_repeated_local_failure_finalizes_without_llm_judge(self):
+        """Test no LLM validation is spent when both attempts fail locally."""
+        bad = _distractors('모두 맞다', '정답 없음', '모두 맞다')
+        llm = FakeLLM(generated=bad, improved=bad)
+
+        with patch.object(distractor_generation_graph, '_get_llm', return_value=llm):
+            result = distractor_generation_graph.generate_quality_choices('리스트', '본문', self.answer)
+
+        self.assertNotIn('품질을 엄격하게 평가', llm.calls)
+        self.assertEqual(len(llm.calls), 3)
+        self.assertIn('local_validation', result['metadata']['validation_details'])
@@ -0,0 +1,249 @@
+"""
+Tests for LLM retries, circuit breaking and hedging.
+"""
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import anthropic
+import httpx
+from django.test import SimpleTestCase, override_settings
+
+from ai_services import resilience
+from ai_services.resilience import CircuitOpen, call_with_retry, get_breaker, hedged_call
+
+RESILIENCE = {
+    'MAX_ATTEMPTS': 3,
+    'BACKOFF_BASE_SECONDS': 0.5,
+    'BACKOFF_MAX_SECONDS': 8,
+    'RETRY_DEADLINE_SECONDS': 20,
+    'BREAKER_FAILURE_THRESHOLD': 2,
+    'BREAKER_COOLDOWN_SECONDS': 30,
+    'REQUEST_TIMEOUT_SECONDS': 15,
+    'HEDGE_AFTER_SECONDS': 0.05,
+    'HEDGE_MAX_WORKERS': 4,
+}
+REQUEST = httpx.Request('POST', 'https://api.anthropic.com/v1/messages')
+
+
+def status_error(error_class, status_code, headers=None):
+    response = httpx.Response(status_code, headers=headers or {}, request=REQUEST)
+    return error_class(f'HTTP {status_code}', response=response, body=None)
+
+
+def flaky(*outcomes):
+    """Callable raising/returning the given outcomes in order."""
+    return Mock(side_effect=list(outcomes))
+
+
+@override_settings(AI_RESILIENCE_SETTINGS={**RESILIENCE, 'BREAKER_FAILURE_THRESHOLD': 5})
+class RetryTest(SimpleTestCase):
+    """Test per-call retries and backoff."""
+
+    def setUp(self):
+        resilience.reset_breakers()
+        self.sleeps = []
+
+    def call(self, func, model='model-a'):
+        return call_with_retry(func, model, sleep=self.sleeps.append)
+
+    def test_retries_transient_failures(self):
+        func = flaky(status_error(anthropic.InternalServerError, 529), anthropic.APITimeoutError(REQUEST), 'ok')
+        self.assertEqual(self.call(func), 'ok')
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertTrue(all(0 <= delay <= 1.0 for delay in self.sleeps))
+
+    def test_honors_retry_after(self):
+        func = flaky(status_error(anthropic.RateLimitError, 429, {'retry-after': '3'}), 'ok')
+        self.assertEqual(self.call(func), 'ok')
+        self.assertEqual(self.sleeps, [3.0])
+
+    def test_gives_up_when_retry_after_exceeds_deadline(self):
+        func = flaky(status_error(anthropic.RateLimitError, 429, {'retry-after': '60'}), 'ok')
+        with self.assertRaises(anthropic.RateLimitError):
+            self.call(func)
+        self.assertEqual(func.call_count, 1)
+
+    def test_request_errors_are_not_retried(self):
+        func = flaky(status_error(anthropic.BadRequestError, 400), 'ok')
+        with self.assertRaises(anthropic.BadRequestError):
+            self.call(func)
+        self.assertEqual(func.call_count, 1)
+
+    def test_stops_after_max_attempts(self):
+        errors = [status_error(anthropic.InternalServerError, 500) for _ in range(5)]
+        func = flaky(*errors)
+        with self.assertRaises(anthropic.InternalServerError):
+            self.call(func, model='model-b')
+        self.assertEqual(func.call_count, 3)
+
+
+@override_settings(AI_RESILIENCE_SETTINGS=RESILIENCE)
+class CircuitBreakerTest(SimpleTestCase):
+    """Test the per-model breaker opens, fails fast and recovers."""
+
+    def setUp(self):
+        resilience.reset_breakers()
+
+    def test_opens_after_consecutive_provider_failures(self):
+        errors = [status_error(anthropic.InternalServerError, 503) for _ in range(3)]
+        with self.assertRaises(anthropic.InternalServerError):
+            call_with_retry(flaky(*errors), 'model-a', sleep=lambda _: None)
+
+        func = Mock(return_value='ok')
+        with self.assertRaises(CircuitOpen):
+            call_with_retry(func, 'model-a')
+        func.assert_not_called()
+        self.assertEqual(get_breaker('model-a').state, 'open')
+
+        # 다른 모델은 영향 없음
+        self.assertEqual(call_with_retry(func, 'model-b'), 'ok')
+
+    def test_rate_limits_do_not_open_breaker(self):
+        errors = [status_error(anthropic.RateLimitError, 429) for _ in range(3)]
+        with self.assertRaises(anthropic.RateLimitError):
+            call_with_retry(flaky(*errors), 'model-a', sleep=lambda _: None)
+        self.assertEqual(get_breaker('model-a').state, 'closed')
+
+    def test_half_open_probe_closes_or_reopens(self):
+        breaker = get_breaker('model-a')
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.opened_at = time.monotonic() - 31
+        self.assertEqual(breaker.state, 'half_open')
+
+        # 프로브 실패 → 다시 열림
+        with self.assertRaises(anthropic.InternalServerError):
+            call_with_retry(flaky(status_error(anthropic.InternalServerError, 503)), 'model-a',
+                            sleep=lambda _: None)
+        self.assertEqual(breaker.state, 'open')
+
+        breaker.opened_at = time.monotonic() - 31
+        self.assertEqual(call_with_retry(Mock(return_value='ok'), 'model-a'), 'ok')
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_only_one_probe_while_half_open(self):
+        breaker = get_breaker('model-a')
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.opened_at = time.monotonic() - 31
+
+        breaker.before_call()
+        with self.assertRaises(CircuitOpen):
+            breaker.before_call()
+
+
+@override_settings(AI_RESILIENCE_SETTINGS=RESILIENCE)
+class HedgedCallTest(SimpleTestCase):
+    """Test a slow first request is backed up by a hedge."""
+
+    def slow_failure(self):
+        time.sleep(0.2)
+        raise anthropic.APITimeoutError(REQUEST)
+
+    def test_fast_call_is_not_hedged(self):
+        func = Mock(return_value='ok')
+        hedge = Mock()
+        self.assertEqual(hedged_call(func, 0.5, hedge=hedge), 'ok')
+        self.assertEqual(func.call_count, 1)
+        hedge.assert_not_called()
+
+    def test_first_request_runs_on_callers_thread(self):
+        threads = []
+
+        def func():
+            threads.append(threading.current_thread())
+            time.sleep(0.1)
+            return 'first'
+
+        hedge = Mock(return_value='hedge')
+        self.assertEqual(hedged_call(func, 0.05, hedge=hedge), 'first')
+        self.assertEqual(threads, [threading.current_thread()])
+        hedge.assert_called_once()
+
+    def test_hedge_answers_when_slow_first_request_fails(self):
+        self.assertEqual(hedged_call(self.slow_failure, 0.05, hedge=Mock(return_value='hedge')), 'hedge')
+
+    def test_fast_failure_is_not_hedged(self):
+        hedge = Mock()
+        with self.assertRaises(anthropic.APITimeoutError):
+            hedged_call(Mock(side_effect=anthropic.APITimeoutError(REQUEST)), 0.5, hedge=hedge)
+        hedge.assert_not_called()
+
+    def test_no_hedge_while_pool_is_busy(self):
+        resilience._executor()
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+        hedge = Mock()
+
+        with patch.object(resilience, '_hedge_slots', slots):
+            with self.assertRaises(anthropic.APITimeoutError):
+                hedged_call(self.slow_failure, 0.05, hedge=hedge)
+        hedge.assert_not_called()
+
+    @override_settings(AI_RESILIENCE_SETTINGS={**RESILIENCE, 'RETRY_DEADLINE_SECONDS': 0.3})
+    def test_wait_for_hedge_is_bounded(self):
+        release = threading.Event()
+        started = time.monotonic()
+        try:
+            with self.assertRaises(anthropic.APITimeoutError):
+                hedged_call(self.slow_failure, 0.05, hedge=lambda: release.wait(5))
+        finally:
+            release.set()
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_raises_when_both_copies_fail(self):
+        def func():
+            time.sleep(0.1)
+            raise anthropic.APITimeoutError(REQUEST)
+
+        with self.assertRaises(anthropic.APITimeoutError):
+            hedged_call(func, 0.05)
+
+    def test_hedge_runs_in_callers_context(self):
+        from ai_services.base import _budget_context, ai_budget_user
+
+        with ai_budget_user(None, max_wait=7):
+            context = hedged_call(self.slow_failure, 0.05, hedge=_budget_context.get)
+        self.assertEqual(context.max_wait, 7)
+
+    def test_hedge_does_not_wait_for_budget(self):
+        from contextvars import copy_context
+
+        from ai_services.base import _budget_context, _invoke_without_budget_wait, ai_budget_user
+
+        with ai_budget_user(None, max_wait=7), \
+                patch('ai_services.base.governed_invoke', side_effect=lambda llm, prompt: _budget_context.get()):
+            context = copy_context().run(_invoke_without_budget_wait, Mock(), 'prompt')
+            self.assertEqual(_budget_context.get().max_wait, 7)
+        self.assertEqual(context.max_wait, 0)
+
+
+@override_settings(AI_RESILIENCE_SETTINGS=RESILIENCE, ANTHROPIC_API_KEY='sk-ant-REDACTED')
+class ServiceResilienceTest(SimpleTestCase):
+    """Test services degrade to None while a breaker is open."""
+
+    def setUp(self):
+        resilience.reset_breakers()
+
+    def test_call_langchain_returns_none_when_circuit_open(self):
+        from ai_services.evaluators.answer_evaluator import AnswerEvaluator
+
+        service = AnswerEvaluator()
+        service.llm = Mock(model='model-open', max_tokens=100)
+        breaker = get_breaker('model-open')
+        breaker.record_failure()
+        breaker.record_failure()
+
+        prompt = Mock(format=Mock(return_value='prompt'))
+        self.assertIsNone(service.call_langchain(prompt))
+        service.llm.invoke.assert_not_called()
+
+    def test_clients_do_not_retry_internally(self):
+        from ai_services.evaluators.answer_evaluator import AnswerEvaluator
+
+        with patch('ai_services.base.ChatAnthropic') as chat:
+            AnswerEvaluator()
+        self.assertEqual(chat.call_args.kwargs['max_retries'], 0)
+        self.assertEqual(chat.call_args.kwargs['timeout'], 15)
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:55
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_review_counters(apps, schema_editor):
+    """Populate counters from existing review history."""
+    Content = apps.get_model('content', 'Content')
+    ReviewHistory = apps.get_model('review', 'ReviewHistory')
+
+    history = ReviewHistory.objects.filter(content=OuterRef('pk')).order_by()
+    counts = history.values('content').annotate(
+        total=Count('id'),
+        remembered=Count('id', filter=Q(result='remembered')),
+    )
+    latest = history.order_by('-review_date', '-id')
+
+    Content.objects.filter(pk__in=ReviewHistory.objects.values('content_id')).update(
+        total_reviews=Coalesce(Subquery(counts.values('total')[:1], output_field=IntegerField()), Value(0)),
+        remembered_reviews=Coalesce(Subquery(counts.values('remembered')[:1], output_field=IntegerField()), Value(0)),
+        last_reviewed_at=Subquery(latest.values('review_date')[:1]),
+        last_review_result=Coalesce(Subquery(latest.values('result')[:1]), Value('')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_alter_content_ai_validated_at_and_more'),
+        ('review', '0004_reviewhistory_selected_choice_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='last_review_result',
+            field=models.CharField(blank=True, help_text='Denormalized result of the latest review history', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='last_reviewed_at',
+            field=models.DateTimeField(blank=True, help_text='Denormalized review_date of the latest review history', null=True),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='remembered_reviews',
+            field=models.PositiveIntegerField(default=0, help_text='Denormalized count of review histories with result "remembered"'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='total_reviews',
+            field=models.PositiveIntegerField(default=0, help_text='Denormalized count of all review histories'),
+        ),
+        migrations.RunPython(backfill_review_counters, migrations.RunPython.noop),
+    ]
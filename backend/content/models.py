@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import DEFERRED
 from django.utils.text import slugify
 
 from resee.models import TimestampMixin
@@ -71,8 +72,9 @@ class Content(TimestampMixin):
         """Store original values to detect changes without additional DB query"""
         super().__init__(*args, **kwargs)
         # Store original values for change detection
-        self._original_title = self.title
-        self._original_content = self.content
+        # Deferred fields stay unloaded so .only()/.defer() querysets don't recurse
+        self._original_title = self.__dict__.get('title', DEFERRED)
+        self._original_content = self.__dict__.get('content', DEFERRED)
 
     # AI 검증 관련 필드
     is_ai_validated = models.BooleanField(
@@ -102,6 +104,26 @@ class Content(TimestampMixin):
         help_text='Multiple choice options (AI generated): {"choices": [...], "correct_answer": "..."}'
     )
 
+    # 복습 기록 비정규화 카운터 (ReviewHistory 생성 시 F() 로 갱신)
+    total_reviews = models.PositiveIntegerField(
+        default=0,
+        help_text='Denormalized count of all review histories'
+    )
+    remembered_reviews = models.PositiveIntegerField(
+        default=0,
+        help_text='Denormalized count of review histories with result "remembered"'
+    )
+    last_reviewed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='Denormalized review_date of the latest review history'
+    )
+    last_review_result = models.CharField(
+        max_length=20,
+        blank=True,
+        help_text='Denormalized result of the latest review history'
+    )
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
@@ -137,10 +159,17 @@ class Content(TimestampMixin):
                     'content': f'AI 평가 모드는 정확한 판단을 위해 콘텐츠가 최소 200자 이상이어야 합니다. (현재: {content_length}자)'
                 })
 
+    def _has_text_changes(self):
+        """Whether title or content differs from the loaded value (fields deferred at load are skipped)"""
+        return any(
+            original is not DEFERRED and original != getattr(self, field)
+            for field, original in (('title', self._original_title), ('content', self._original_content))
+        )
+
     def save(self, *args, **kwargs):
         """Override save to run validation and handle AI validation reset"""
         # Check if title or content changed (no DB query needed)
-        if self.pk and (self._original_content != self.content or self._original_title != self.title):
+        if self.pk and self._has_text_changes():
             # Content changed, reset AI validation
             self.is_ai_validated = False
             self.ai_validation_score = None
@@ -46,10 +46,12 @@ class ContentSerializer(serializers.ModelSerializer):
                   'created_at', 'updated_at', 'review_count',
                   'next_review_date', 'review_mode', 'mc_choices',
                   'is_ai_validated', 'ai_validation_score',
-                  'ai_validation_result', 'ai_validated_at')
+                  'ai_validation_result', 'ai_validated_at',
+                  'total_reviews', 'last_reviewed_at', 'last_review_result')
         read_only_fields = ('id', 'author', 'created_at', 'updated_at',
                             'is_ai_validated', 'ai_validation_score',
-                            'ai_validation_result', 'ai_validated_at', 'mc_choices')
+                            'ai_validation_result', 'ai_validated_at', 'mc_choices',
+                            'total_reviews', 'last_reviewed_at', 'last_review_result')
 
     def to_representation(self, instance):
         """Custom representation for category"""
@@ -102,7 +104,9 @@ class ContentSerializer(serializers.ModelSerializer):
         # Generate multiple choice options for MC mode
         if content.review_mode == 'multiple_choice':
             from ai_services import generate_multiple_choice_options
-            mc_options = generate_multiple_choice_options(content.title, content.content)
+            from ai_services.base import ai_budget_user
+            with ai_budget_user(content.author):
+                mc_options = generate_multiple_choice_options(content.title, content.content)
             if mc_options:
                 content.mc_choices = mc_options
                 content.save(update_fields=['mc_choices'])
@@ -133,7 +137,9 @@ class ContentSerializer(serializers.ModelSerializer):
         # Regenerate MC options if content changed and mode is MC
         if content.review_mode == 'multiple_choice' and (title_changed or content_changed):
             from ai_services import generate_multiple_choice_options
-            mc_options = generate_multiple_choice_options(content.title, content.content)
+            from ai_services.base import ai_budget_user
+            with ai_budget_user(content.author):
+                mc_options = generate_multiple_choice_options(content.title, content.content)
             if mc_options:
                 content.mc_choices = mc_options
                 content.save(update_fields=['mc_choices'])
@@ -143,12 +149,12 @@ class ContentSerializer(serializers.ModelSerializer):
         return content
 
     def get_review_count(self, obj):
-        """Get the number of completed reviews for this content"""
-        # Use annotated value if available (from optimized queryset)
+        """Get the number of successful (remembered) reviews for this content"""
+        # Use annotated value if available (e.g., custom querysets)
         if hasattr(obj, 'review_count_annotated'):
             return obj.review_count_annotated
-        # Fallback to direct count (e.g., during tests or direct serialization)
-        return obj.review_history.count()
+        # Denormalized counter maintained by review.signals (no extra query)
+        return obj.remembered_reviews
 
     def get_next_review_date(self, obj):
         """Get next review date"""
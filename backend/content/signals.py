@@ -36,11 +36,13 @@ def generate_mc_choices_for_multiple_choice(sender, instance, created, **kwargs)
     if created and instance.review_mode == 'multiple_choice' and not instance.mc_choices:
         # Import here to avoid circular imports
         from ai_services import generate_multiple_choice_options
+        from ai_services.base import ai_budget_user
 
         logger.info(f"Generating MC choices for content {instance.id}: {instance.title}")
 
         try:
-            mc_options = generate_multiple_choice_options(instance.title, instance.content)
+            with ai_budget_user(instance.author):
+                mc_options = generate_multiple_choice_options(instance.title, instance.content)
             if mc_options:
                 instance.mc_choices = mc_options
                 instance.save(update_fields=['mc_choices'])
@@ -281,6 +281,16 @@ class ContentModelTest(TestCase):
         self.assertTrue(content.is_ai_validated)
         self.assertEqual(content.ai_validation_score, original_score)
 
+    def test_content_deferred_fields_load(self):
+        """Test instances loaded with only() don't load deferred text fields."""
+        Content.objects.create(title='Title', content='x' * 250, author=self.user)
+
+        with self.assertNumQueries(1):
+            content = Content.objects.only('id', 'title').get(title='Title')
+            self.assertEqual(content.title, 'Title')
+
+        self.assertFalse(content._has_text_changes())
+
     def test_content_original_values_tracking(self):
         """Test __init__ stores original values."""
         content = Content.objects.create(
@@ -1,7 +1,6 @@
 import logging
 
-from django.db import models
-from django.db.models import Count, Prefetch
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -11,6 +10,7 @@ from rest_framework.response import Response
 
 from accounts.subscription.services import PermissionService
 from ai_services import validate_content
+from ai_services.base import ai_budget_user
 from resee.mixins import AuthorViewSetMixin, UserOwnershipMixin
 from resee.pagination import ContentPagination
 
@@ -112,12 +112,6 @@ class ContentViewSet(AuthorViewSetMixin, viewsets.ModelViewSet):
         # Optimize queries with select_related and prefetch_related
         queryset = queryset.select_related('category', 'author')
 
-        # Annotate review count to avoid N+1 queries (성공한 복습만 카운트)
-        queryset = queryset.annotate(
-            review_count_annotated=Count('review_history', filter=models.Q(
-                review_history__result='remembered'), distinct=True)
-        )
-
         # Prefetch review schedules filtered by current user
         user_schedules = ReviewSchedule.objects.filter(user=self.request.user)
         queryset = queryset.prefetch_related(
@@ -263,7 +257,8 @@ class ContentViewSet(AuthorViewSetMixin, viewsets.ModelViewSet):
             )
 
         try:
-            result = validate_content(title, content)
+            with ai_budget_user(request.user):
+                result = validate_content(title, content)
             return Response(result)
         except Exception as e:
             logger.error(f"Content validation failed: {str(e)}", exc_info=True)
@@ -319,7 +314,8 @@ class ContentViewSet(AuthorViewSetMixin, viewsets.ModelViewSet):
 
         try:
             # AI 검증 실행
-            result = validate_content(content_obj.title, content_obj.content)
+            with ai_budget_user(request.user):
+                result = validate_content(content_obj.title, content_obj.content)
 
             # 검증 결과 저장
             if result.get('is_valid', False):
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import WeeklyTest, WeeklyTestAnswer, WeeklyTestQuestion
+from .models import QuestionBankEntry, WeeklyTest, WeeklyTestAnswer, WeeklyTestQuestion
 
 
 @admin.register(WeeklyTest)
@@ -42,3 +42,16 @@ class WeeklyTestAnswerAdmin(admin.ModelAdmin):
     def question_short(self, obj):
         return obj.question.question_text[:30] + '...' if len(obj.question.question_text) > 30 else obj.question.question_text
     question_short.short_description = '문제'
+
+
+@admin.register(QuestionBankEntry)
+class QuestionBankEntryAdmin(admin.ModelAdmin):
+    list_display = ['question_text_short', 'content', 'question_type', 'difficulty', 'source', 'created_at']
+    list_filter = ['question_type', 'difficulty', 'source']
+    search_fields = ['question_text', 'content__title']
+    readonly_fields = ['content_hash', 'created_at']
+    ordering = ['-created_at']
+
+    def question_text_short(self, obj):
+        return obj.question_text[:50] + '...' if len(obj.question_text) > 50 else obj.question_text
+    question_text_short.short_description = '문제'
@@ -0,0 +1,405 @@
+"""
+Exam assembly engine
+
+Single code path that turns a preparing WeeklyTest into questions, used by
+the generate_exam_questions task. Safe under duplicate task deliveries and
+Celery retries:
+
+- A per-test lock (PostgreSQL advisory lock, cache lock elsewhere) lets one
+  worker assemble a test at a time; others return without doing LLM work.
+- The chosen contents are stored once as WeeklyTest.generation_plan, so a
+  retry resumes the same plan instead of re-running the balance graph.
+- (weekly_test, order) is the idempotency key of a question: existing
+  orders are skipped before any LLM call and inserts use get_or_create.
+- preparing -> pending is a conditional UPDATE, so a test the user already
+  started is never moved back.
+- Questions are only added while the test is not started. Starting takes
+  the same row lock as saving a question, so the question set and
+  total_questions are frozen at the questions the user is served.
+"""
+import logging
+import random
+import zlib
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+
+from content.models import Content
+
+from .models import WeeklyTest, WeeklyTestQuestion
+from .text_processing import meaningful_sentences, wrap_code_elements
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_lock(namespace, test_id) 의 네임스페이스 (다른 advisory lock 과 구분)
+LOCK_NAMESPACE = zlib.crc32(b'exams.assembly') & 0x7FFFFFFF
+
+# 캐시 락 만료 시간 (워커가 죽어도 락이 영구히 남지 않도록)
+CACHE_LOCK_TIMEOUT = 60 * 30
+
+# 문제를 추가할 수 있는 (사용자가 아직 시작하지 않은) 시험 상태
+OPEN_STATUSES = ('preparing', 'pending')
+
+# AI 토큰 예산 소진 시 문제 생성 호출이 대기할 수 있는 최대 시간
+AI_BUDGET_MAX_WAIT_SECONDS = 60
+
+
+@contextmanager
+def assembly_lock(test_id):
+    """
+    시험별 구성 락 (비차단)
+
+    PostgreSQL 에서는 세션 advisory lock 을 사용하므로 워커가 죽어 연결이 끊기면
+    자동으로 해제됩니다. 그 외 DB 에서는 cache.add 로 대체합니다.
+
+    Yields:
+        bool: 락 획득 여부
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_try_advisory_lock(%s, %s)', [LOCK_NAMESPACE, test_id])
+            acquired = cursor.fetchone()[0]
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT pg_advisory_unlock(%s, %s)', [LOCK_NAMESPACE, test_id])
+    else:
+        key = f'exams:assembly-lock:{test_id}'
+        acquired = cache.add(key, True, timeout=CACHE_LOCK_TIMEOUT)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                cache.delete(key)
+
+
+def assemble_questions(test_id, content_ids=None):
+    """
+    시험 문제 구성
+
+    Args:
+        test_id: WeeklyTest ID
+        content_ids: 선택된 콘텐츠 ID 리스트 (None이면 자동 밸런싱)
+
+    Returns:
+        bool: 이번 호출에서 구성을 진행했는지 여부
+              (다른 워커가 진행 중이거나 이미 끝난 경우 False)
+    """
+    from ai_services.base import ai_budget_user
+    from ai_services.generators.question_generator import ai_question_generator
+
+    with assembly_lock(test_id) as acquired:
+        if not acquired:
+            logger.info(f"[Assembly] Test {test_id} is being assembled by another worker, skipping")
+            return False
+
+        weekly_test = WeeklyTest.objects.get(id=test_id)
+
+        if weekly_test.status not in OPEN_STATUSES or _is_assembled(weekly_test):
+            logger.info(f"[Assembly] Test {test_id} already assembled, skipping")
+            finish_preparation(weekly_test)
+            return False
+
+        # 재시도 시에도 최초 시작 시각 유지 (ETA 계산용)
+        WeeklyTest.objects.filter(
+            pk=test_id, generation_started_at__isnull=True
+        ).update(generation_started_at=timezone.now())
+
+        ai_available = ai_question_generator.is_available()
+
+        try:
+            # 백그라운드 작업이므로 토큰 예산 소진 시 다음 윈도우까지 대기 가능
+            with ai_budget_user(weekly_test.user, max_wait=AI_BUDGET_MAX_WAIT_SECONDS):
+                contents = _load_plan(weekly_test, content_ids, ai_available)
+                _generate_questions(weekly_test, contents, ai_available)
+        finally:
+            # 실패해도 이미 커밋된 문제로 시험을 시작할 수 있도록 상태 동기화
+            finish_preparation(weekly_test)
+
+        logger.info(f"[Assembly] Test {test_id} assembled with {weekly_test.total_questions} questions")
+        return True
+
+
+def finish_preparation(weekly_test):
+    """
+    문제 수 동기화 후 preparing → pending 전환
+
+    조건부 UPDATE 로 전환하므로 생성 도중 사용자가 시작한 시험(in_progress)의
+    상태/시작 시각과 시작 시 고정된 문제 수를 덮어쓰지 않습니다.
+    """
+    count = weekly_test.questions.count()
+    WeeklyTest.objects.filter(pk=weekly_test.pk, status__in=OPEN_STATUSES).update(
+        total_questions=count,
+        generated_questions=count,
+        updated_at=timezone.now()
+    )
+    WeeklyTest.objects.filter(pk=weekly_test.pk, status='preparing').update(status='pending')
+    weekly_test.refresh_from_db()
+
+
+def start_test_session(test_id):
+    """
+    시험 시작: 문제 세트를 고정하고 in_progress 로 전환
+
+    _save_question 과 같은 행 락 아래에서 전환하므로 시작 이후에는 문제가 추가되지 않고,
+    total_questions 는 사용자에게 제공되는 문제 수로 고정됩니다.
+
+    Returns:
+        bool: 이번 호출에서 시작했는지 여부 (이미 진행 중이면 False)
+    """
+    with transaction.atomic():
+        weekly_test = WeeklyTest.objects.select_for_update().get(pk=test_id)
+        if weekly_test.status not in OPEN_STATUSES:
+            return False
+
+        weekly_test.status = 'in_progress'
+        weekly_test.started_at = timezone.now()
+        weekly_test.total_questions = weekly_test.questions.count()
+        weekly_test.save(update_fields=['status', 'started_at', 'total_questions', 'updated_at'])
+        return True
+
+
+def _is_assembled(weekly_test):
+    """계획된 문제가 모두 생성되었는지 여부"""
+    plan = weekly_test.generation_plan
+    return bool(plan) and weekly_test.questions.count() >= len(plan)
+
+
+def _load_plan(weekly_test, content_ids, ai_available):
+    """
+    문제를 만들 콘텐츠 순서 결정 (최초 1회만 저장, 재시도 시 재사용)
+
+    Returns:
+        list: order 순서의 Content 목록
+    """
+    plan = weekly_test.generation_plan
+    if not plan:
+        if content_ids:
+            plan = _plan_from_ids(weekly_test, content_ids)
+        else:
+            plan = _plan_balanced(weekly_test, ai_available)
+
+        # 동시에 저장된 계획이 있으면 그것을 따름
+        WeeklyTest.objects.filter(pk=weekly_test.pk, generation_plan__isnull=True).update(
+            generation_plan=plan,
+            expected_questions=len(plan)
+        )
+        weekly_test.refresh_from_db()
+        plan = weekly_test.generation_plan or []
+
+    content_dict = {c.id: c for c in Content.objects.filter(id__in=plan)}
+    return [content_dict[cid] for cid in plan if cid in content_dict]
+
+
+def _plan_from_ids(weekly_test, content_ids):
+    """전달받은 콘텐츠 ID 순서 그대로 (모두 AI 검증된 본인 콘텐츠여야 함)"""
+    valid_count = Content.objects.filter(
+        id__in=content_ids,
+        author=weekly_test.user,
+        is_ai_validated=True
+    ).count()
+
+    # 존재하지 않거나 검증되지 않은 콘텐츠가 있으면 생성하지 않음
+    if valid_count != len(content_ids):
+        logger.warning(f"[Assembly] Some contents not found or not validated for test {weekly_test.id}")
+        return []
+
+    return list(content_ids)
+
+
+def _plan_balanced(weekly_test, ai_available):
+    """
+    난이도 균형 맞춰 자동으로 콘텐츠 선택
+
+    LangGraph Balance Graph를 사용하여 30% Easy, 50% Medium, 20% Hard 비율로
+    콘텐츠를 자동 선택합니다. 실패 시 최신 콘텐츠로 대체합니다.
+    """
+    from ai_services.graphs import select_balanced_contents_for_test
+
+    contents = list(
+        Content.objects.filter(author=weekly_test.user, is_ai_validated=True)
+        .order_by('-created_at')
+        .only('id', 'title', 'content')
+    )
+    if not contents:
+        logger.warning(f"[Assembly] No AI-validated contents for user {weekly_test.user_id}")
+        return []
+
+    # 목표 문제 수 (7-10개, 콘텐츠 수에 따라 조정)
+    target_count = min(10, max(7, len(contents)))
+
+    try:
+        balance_result = select_balanced_contents_for_test(
+            contents=[{'id': c.id, 'title': c.title, 'content': c.content} for c in contents],
+            target_count=target_count
+        )
+        balance_info = balance_result['balance']
+        logger.info(
+            f"[Assembly] Selected {len(balance_result['selected_content_ids'])} contents - "
+            f"Easy: {balance_info.get('easy', 0)}, "
+            f"Medium: {balance_info.get('medium', 0)}, "
+            f"Hard: {balance_info.get('hard', 0)}"
+        )
+        return list(balance_result['selected_content_ids'])
+    except Exception as e:
+        logger.error(f"[Assembly] Failed to balance contents: {e}", exc_info=True)
+        # Fallback: 최신 콘텐츠 순
+        return [c.id for c in contents[:target_count]]
+
+
+def _record_question_progress(weekly_test):
+    """
+    문제 하나가 커밋될 때마다 진행 상황 갱신
+
+    카운터를 실제 문제 수로 다시 맞추므로 재시도/중복 실행에도 정확합니다.
+    """
+    count = weekly_test.questions.count()
+    WeeklyTest.objects.filter(pk=weekly_test.pk, status__in=OPEN_STATUSES).update(
+        generated_questions=count,
+        total_questions=count,
+        updated_at=timezone.now()
+    )
+    return count
+
+
+def _generate_questions(weekly_test, contents, ai_available):
+    """
+    콘텐츠 순서대로 문제를 하나씩 생성하여 즉시 커밋
+
+    문제 단위로 커밋되므로 최소 문제 수가 준비되면 생성 도중에도 시험을 시작할 수 있습니다.
+    사용자가 시험을 시작하면 문제 세트가 고정되므로 남은 생성을 중단합니다.
+    """
+    existing_orders = set(weekly_test.questions.values_list('order', flat=True))
+
+    for order, content in enumerate(contents, start=1):
+        # 재시도/중복 실행 시 이미 커밋된 문제는 LLM 호출 없이 건너뜀
+        if order in existing_orders:
+            continue
+
+        if not WeeklyTest.objects.filter(pk=weekly_test.pk, status__in=OPEN_STATUSES).exists():
+            logger.info(f"[Assembly] Test {weekly_test.id} already started, stopping generation")
+            break
+
+        data, _ = build_question(content, ai_available)
+        if _save_question(weekly_test, content, order, data) is None:
+            logger.info(f"[Assembly] Test {weekly_test.id} started during generation, discarding question")
+            break
+
+        generated = _record_question_progress(weekly_test)
+        logger.info(f"[Assembly] Test {weekly_test.id}: {generated}/{len(contents)} questions ready")
+
+
+def _save_question(weekly_test, content, order, data):
+    """
+    (weekly_test, order) 를 키로 문제 저장 (이미 있으면 기존 문제 유지)
+
+    시험 행을 잠근 뒤 저장하므로 start_test_session 과 직렬화됩니다.
+
+    Returns:
+        WeeklyTestQuestion | None: 시험이 이미 시작되었으면 저장하지 않고 None
+    """
+    with transaction.atomic():
+        if not WeeklyTest.objects.select_for_update().filter(
+            pk=weekly_test.pk, status__in=OPEN_STATUSES
+        ).exists():
+            return None
+
+        question, created = WeeklyTestQuestion.objects.get_or_create(
+            weekly_test=weekly_test,
+            order=order,
+            defaults={'content': content, 'points': 10, **data}
+        )
+    if not created:
+        logger.info(f"[Assembly] Question at order {order} already exists, keeping it")
+    return question
+
+
+def build_question(content, ai_available):
+    """
+    콘텐츠 하나의 문제 데이터 생성 (저장하지 않음)
+
+    AI 사용 가능하면 LangGraph 기반 고품질 Distractor 생성 시스템을 사용하고,
+    실패하거나 사용할 수 없으면 규칙 기반 O/X 문제로 대체합니다.
+
+    Returns:
+        tuple: (문제 데이터 dict, 출처 'ai' | 'simple')
+    """
+    from ai_services.generators.question_generator import ai_question_generator
+
+    if ai_available:
+        try:
+            question_data = ai_question_generator.generate_question(content)
+        except Exception as e:
+            logger.error(f"[Assembly] AI generation error for content {content.id}: {e}", exc_info=True)
+            question_data = None
+
+        if question_data:
+            logger.info(
+                f"[Assembly] AI question generated (quality: "
+                f"{question_data.get('metadata', {}).get('quality_score', 0):.1f})"
+            )
+            return {
+                'question_type': question_data['question_type'],
+                'question_text': question_data['question_text'],
+                'choices': question_data.get('choices'),
+                'correct_answer': question_data['correct_answer'],
+                'explanation': question_data.get('explanation', ''),
+            }, 'ai'
+
+    return build_simple_question(content), 'simple'
+
+
+def build_simple_question(content):
+    """콘텐츠 문장으로 O/X 문제 데이터 생성 (저장하지 않음)"""
+    # 콘텐츠에서 의미있는 문장 추출
+    sentences = meaningful_sentences(content.content)
+
+    if not sentences:
+        # 문장 추출 실패 시 전체 내용 사용
+        sentences = [content.content[:200]]
+
+    # 첫 번째 의미있는 문장을 문제로 사용
+    selected_sentence = sentences[0] if sentences else content.content[:200]
+
+    # 코드 요소를 백틱으로 감싸기
+    selected_sentence = wrap_code_elements(selected_sentence)
+
+    # O/X 문제 생성 (50% 확률로 O 또는 X)
+    is_correct_statement = random.choice([True, False])
+
+    if is_correct_statement:
+        # 실제 내용을 그대로 사용 (정답: O)
+        question_text = f"'{content.title}'에 대한 다음 설명이 맞습니까? (O/X)\n\n{selected_sentence}"
+        correct_answer = "O"
+        explanation = "O - 학습 내용에 정확히 포함된 내용입니다."
+    else:
+        # 내용을 살짝 변형하여 오답 생성 (정답: X)
+        modified_sentence = _create_modified_statement(content.title, selected_sentence)
+        modified_sentence = wrap_code_elements(modified_sentence)
+        question_text = f"'{content.title}'에 대한 다음 설명이 맞습니까? (O/X)\n\n{modified_sentence}"
+        correct_answer = "X"
+        explanation = f"X - 학습 내용과 다릅니다. 정확한 내용: {selected_sentence[:100]}..."
+
+    return {
+        'question_type': 'true_false',
+        'question_text': question_text,
+        'choices': None,
+        'correct_answer': correct_answer,
+        'explanation': explanation,
+    }
+
+
+def _create_modified_statement(title, original_sentence):
+    """문장을 살짝 변형하여 오답 생성"""
+    # 간단한 부정 또는 수정을 통해 오답 만들기
+    modifications = [
+        f"{original_sentence.replace('입니다', '가 아닙니다').replace('합니다', '하지 않습니다')}",
+        f"{title}은(는) 다른 개념과 관련이 없습니다.",
+        f"{original_sentence[:50]}... 는 잘못된 설명입니다.",
+    ]
+
+    return random.choice(modifications)
@@ -0,0 +1,91 @@
+"""
+Batch answer grading for test sessions
+
+Grades a whole set of answers against questions loaded once, upserts them
+in a single statement and refreshes the test score in the same transaction.
+Replaces one get_or_create + save (and a lazy question load) per answer.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .models import WeeklyTestAnswer
+
+UPSERT_FIELDS = ['user_answer', 'is_correct', 'points_earned']
+
+
+def grade_answers(user, answer_pairs):
+    """
+    미리 로드한 문제로 답변 채점 (메모리 내, 쿼리 없음)
+
+    Args:
+        user: 답변한 사용자
+        answer_pairs: (question, user_answer) 목록
+
+    Returns:
+        list: 저장되지 않은 WeeklyTestAnswer 목록
+    """
+    answers = []
+    for question, user_answer in answer_pairs:
+        answer = WeeklyTestAnswer(question=question, user=user, user_answer=user_answer)
+        answer.grade(question)
+        answers.append(answer)
+    return answers
+
+
+def submit_answers(weekly_test, user, answer_pairs):
+    """
+    답변 일괄 저장 및 시험 점수 갱신
+
+    기존 답변은 (question, user) 유니크 제약으로 덮어씁니다. 점수는 이번 요청에
+    포함되지 않은 이전 답변까지 반영하도록 저장 후 한 번 집계합니다.
+
+    Args:
+        weekly_test: 답변이 속한 WeeklyTest
+        user: 답변한 사용자
+        answer_pairs: (question, user_answer) 목록. 문제는 weekly_test 소속이어야 함
+
+    Returns:
+        list: 채점된 WeeklyTestAnswer 목록
+    """
+    answers = grade_answers(user, answer_pairs)
+
+    with transaction.atomic():
+        WeeklyTestAnswer.objects.bulk_create(
+            answers,
+            update_conflicts=True,
+            unique_fields=['question', 'user'],
+            update_fields=UPSERT_FIELDS
+        )
+
+        weekly_test.correct_answers = WeeklyTestAnswer.objects.filter(
+            question__weekly_test=weekly_test,
+            user=user,
+            is_correct=True
+        ).count()
+        weekly_test.calculate_score(update_fields=['correct_answers', 'score_percentage', 'updated_at'])
+
+    return answers
+
+
+def complete_test_session(weekly_test, user):
+    """
+    시험 완료 처리 및 최종 점수 계산
+
+    점수는 시작 시 고정된 total_questions(사용자에게 제공된 문제 수) 기준이며,
+    생성 태스크가 갱신하는 카운터를 덮어쓰지 않도록 변경 필드만 저장합니다.
+    """
+    weekly_test.status = 'completed'
+    weekly_test.completed_at = timezone.now()
+
+    # 소요 시간 계산
+    if weekly_test.started_at:
+        weekly_test.time_spent = weekly_test.completed_at - weekly_test.started_at
+
+    weekly_test.correct_answers = WeeklyTestAnswer.objects.filter(
+        question__weekly_test=weekly_test,
+        user=user,
+        is_correct=True
+    ).count()
+    weekly_test.calculate_score(update_fields=[
+        'status', 'completed_at', 'time_spent', 'correct_answers', 'score_percentage', 'updated_at'
+    ])
@@ -0,0 +1,69 @@
+"""
+Measure LangGraph build overhead on the per-question generation path
+
+Compares rebuilding the workflows and prompt templates on every question
+(the previous behaviour) with the compile-once accessors. No LLM calls
+are made.
+
+Usage:
+    python manage.py benchmark_graph_build
+    python manage.py benchmark_graph_build --questions 200
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from langchain_core.prompts import ChatPromptTemplate
+
+from ai_services.graphs import (
+    create_distractor_generation_graph, create_weekly_test_balance_graph,
+    get_distractor_generation_graph, get_weekly_test_balance_graph,
+)
+from ai_services.graphs import distractor_generation_graph as distractor_module
+
+
+def _time_per_call(func, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - started) * 1000 / calls
+
+
+class Command(BaseCommand):
+    help = 'Benchmark graph compile and prompt parse overhead per exam question'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--questions', type=int, default=50, help='Simulated questions')
+
+    def handle(self, *args, **options):
+        questions = options['questions']
+        templates = [
+            prompt.messages[0].prompt.template for prompt in (
+                distractor_module.EXTRACT_PROMPT,
+                distractor_module.GENERATE_PROMPT,
+                distractor_module.VALIDATE_PROMPT,
+            )
+        ]
+
+        def parse_prompts():
+            for template in templates:
+                ChatPromptTemplate.from_template(template)
+
+        # Warm imports/caches so the first-call cost is not attributed to either side
+        get_distractor_generation_graph()
+        get_weekly_test_balance_graph()
+
+        rows = [
+            ('distractor graph compile', _time_per_call(create_distractor_generation_graph, questions),
+             _time_per_call(get_distractor_generation_graph, questions)),
+            ('node prompt parsing', _time_per_call(parse_prompts, questions), 0.0),
+            ('balance graph compile', _time_per_call(create_weekly_test_balance_graph, questions),
+             _time_per_call(get_weekly_test_balance_graph, questions)),
+        ]
+
+        for name, rebuilt, cached in rows:
+            self.stdout.write(f'{name}: {rebuilt:.3f}ms -> {cached:.4f}ms per question')
+
+        total = sum(rebuilt for _, rebuilt, _ in rows[:2])
+        self.stdout.write(self.style.SUCCESS(
+            f'Removed ~{total:.2f}ms of build overhead per generated question ({questions} samples)'
+        ))
@@ -0,0 +1,118 @@
+"""
+Measure rule-based (O/X) question text processing over real content bodies
+
+Compares the previous implementation (regexes compiled per call, one
+re.sub per code token class, no caching) with exams.text_processing, both
+cold and with the per-content sentence cache warm. Falls back to a small
+built-in corpus when there are no contents in the database.
+
+Usage:
+    python manage.py benchmark_text_processing
+    python manage.py benchmark_text_processing --limit 500 --repeat 5
+"""
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from content.models import Content
+from exams.text_processing import clear_sentence_cache, meaningful_sentences, wrap_code_elements
+
+SAMPLE_CORPUS = [
+    "# 파이썬 클래스\n\n클래스는 __init__() 메서드로 인스턴스를 초기화하며 self 는 생성된 인스턴스 자신을 가리킵니다. "
+    "클래스 메서드는 cls 를 첫 번째 인자로 받고 @classmethod 데코레이터로 정의합니다.\n\n"
+    "```python\nclass User:\n    def __init__(self, name):\n        self.name = name\n```\n\n"
+    "- 인스턴스 변수는 self.user_name 처럼 인스턴스마다 따로 저장되는 값입니다. 클래스 변수는 모든 인스턴스가 공유합니다.\n"
+    "- __str__ 메서드를 정의하면 print() 로 출력할 때 사용되는 문자열 표현을 직접 지정할 수 있습니다.",
+    "## 리스트 컴프리헨션\n\n리스트 컴프리헨션은 for 와 if 를 한 줄에 써서 새로운 list 를 만드는 문법으로 가독성이 좋습니다. "
+    "딕셔너리 컴프리헨션도 같은 방식으로 dict 를 만들 수 있으며 키와 값을 함께 지정합니다!\n\n"
+    "> 중첩된 컴프리헨션은 읽기 어려우므로 두 단계를 넘으면 일반 for 문으로 풀어 쓰는 편이 좋습니다.",
+    "### 비동기 프로그래밍\n\nasync def 로 정의한 코루틴은 await 로 다른 코루틴의 결과를 기다리며 이벤트 루프가 실행을 관리합니다. "
+    "asyncio.gather() 를 사용하면 여러 코루틴을 동시에 실행하고 모든 결과를 순서대로 받을 수 있습니다? "
+    "`asyncio.run()` 은 최상위 진입점에서 한 번만 호출하는 것이 권장되며 [공식 문서](https://docs.python.org) 에 예시가 있습니다.",
+]
+
+
+def _legacy_sentences(text):
+    text = re.sub(r'#+\s+', '', text)
+    text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
+    text = re.sub(r'`[^`]+`', '', text)
+    sentences = re.split(r'[.!?]\s+', text)
+    return [s.strip() for s in sentences if 50 <= len(s.strip()) <= 300][:3]
+
+
+def _legacy_wrap(text):
+    if '`' in text:
+        return text
+    patterns = [
+        (r'(__[a-zA-Z_]+__)\s*\(', r'`\1`('),
+        (r'(?<![a-zA-Z0-9_])(__[a-zA-Z_]+__)(?![a-zA-Z0-9_])', r'`\1`'),
+        (r'(?<![a-zA-Z0-9_])(self|cls)(?![a-zA-Z0-9_])', r'`\1`'),
+        (r'(?<![a-zA-Z0-9_])(?!__)([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', r'`\1`('),
+        (r'(?<![a-zA-Z0-9_])(def|class|import|from|return|if|else|elif|for|while|try|except|with|as|'
+         r'lambda|yield|async|await)(?![a-zA-Z0-9_])', r'`\1`'),
+        (r'(?<![a-zA-Z0-9_])(int|str|float|bool|list|dict|tuple|set|None|True|False)(?![a-zA-Z0-9_])', r'`\1`'),
+        (r'(?<![a-zA-Z0-9_])([a-z][a-z0-9_]*_[a-z0-9_]+)(?![a-zA-Z0-9_])', r'`\1`'),
+    ]
+    result = text
+    for pattern, replacement in patterns:
+        result = re.sub(pattern, replacement, result)
+    return re.sub(r'`+', '`', result)
+
+
+def _legacy_pipeline(text):
+    return [_legacy_wrap(sentence) for sentence in _legacy_sentences(text)]
+
+
+def _pipeline(text):
+    return [wrap_code_elements(sentence) for sentence in meaningful_sentences(text)]
+
+
+def _time_corpus(func, corpus, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            func(text)
+    return (time.perf_counter() - started) * 1000 / (repeat * len(corpus))
+
+
+class Command(BaseCommand):
+    help = 'Benchmark O/X question text processing (sentence extraction + code markup)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=200, help='Content bodies to load')
+        parser.add_argument('--repeat', type=int, default=3, help='Passes over the corpus')
+
+    def handle(self, *args, **options):
+        repeat = max(options['repeat'], 1)
+        corpus = [
+            text for text in Content.objects.order_by('id').values_list('content', flat=True)[:options['limit']]
+            if text
+        ]
+        source = 'database'
+        if not corpus:
+            corpus = SAMPLE_CORPUS
+            source = 'built-in sample'
+
+        legacy = _time_corpus(_legacy_pipeline, corpus, repeat)
+
+        # cold: 매 본문마다 캐시를 비워 분리 비용까지 측정
+        def cold(text):
+            clear_sentence_cache()
+            return _pipeline(text)
+
+        cold_ms = _time_corpus(cold, corpus, repeat)
+
+        clear_sentence_cache()
+        for text in corpus:
+            _pipeline(text)
+        warm_ms = _time_corpus(_pipeline, corpus, repeat)
+        clear_sentence_cache()
+
+        self.stdout.write(f'corpus: {len(corpus)} contents ({source}), {repeat} passes')
+        self.stdout.write(f'legacy pipeline: {legacy:.4f}ms per content')
+        self.stdout.write(f'single-pass (cold cache): {cold_ms:.4f}ms per content')
+        self.stdout.write(f'single-pass (warm cache): {warm_ms:.4f}ms per content')
+        self.stdout.write(self.style.SUCCESS(
+            f'Cold {legacy / cold_ms if cold_ms else 0:.1f}x, warm {legacy / warm_ms if warm_ms else 0:.1f}x faster'
+        ))
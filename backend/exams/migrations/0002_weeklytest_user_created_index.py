@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-18 21:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='weeklytest',
+            index=models.Index(fields=['user', '-created_at'], name='weekly_test_user_created'),
+        ),
+    ]
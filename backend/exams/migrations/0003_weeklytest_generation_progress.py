@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-18 21:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0002_weeklytest_user_created_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='weeklytest',
+            name='expected_questions',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='weeklytest',
+            name='generated_questions',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='weeklytest',
+            name='generation_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.16 on 2026-10-18 21:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0007_content_review_counters'),
+        ('exams', '0003_weeklytest_generation_progress'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionBankEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64)),
+                ('question_type', models.CharField(choices=[('multiple_choice', '객관식'), ('true_false', 'O/X')], max_length=20)),
+                ('question_text', models.TextField()),
+                ('choices', models.JSONField(blank=True, null=True)),
+                ('correct_answer', models.TextField()),
+                ('explanation', models.TextField(blank=True)),
+                ('points', models.PositiveIntegerField(default=10)),
+                ('difficulty', models.CharField(choices=[('Easy', '쉬움'), ('Medium', '보통'), ('Hard', '어려움')], default='Medium', max_length=10)),
+                ('difficulty_score', models.PositiveSmallIntegerField(default=60)),
+                ('source', models.CharField(choices=[('ai', 'AI 생성'), ('simple', '규칙 기반')], default='ai', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bank_questions', to='content.content')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['content', 'content_hash'], name='question_bank_content_hash')],
+            },
+        ),
+    ]
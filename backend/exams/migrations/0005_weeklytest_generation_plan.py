@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-18 21:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0004_question_bank'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='weeklytest',
+            name='generation_plan',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -1,5 +1,7 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 
 from content.models import Content
 
@@ -32,6 +34,13 @@ class WeeklyTest(models.Model):
     correct_answers = models.PositiveIntegerField(default=0)
     score_percentage = models.FloatField(null=True, blank=True)
 
+    # 문제 생성 진행 상황 (preparing 동안 문제 하나가 커밋될 때마다 갱신)
+    expected_questions = models.PositiveIntegerField(default=0)
+    generated_questions = models.PositiveIntegerField(default=0)
+    generation_started_at = models.DateTimeField(null=True, blank=True)
+    # 문제를 만들 콘텐츠 ID (order 순). 최초 1회 저장 후 재시도/중복 실행에서 재사용
+    generation_plan = models.JSONField(null=True, blank=True)
+
     # 시간 추적
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
@@ -44,17 +53,37 @@ class WeeklyTest(models.Model):
         db_table = 'weekly_test_weeklytest'  # Keep database table name
         ordering = ['-created_at']
         unique_together = ['user', 'start_date', 'end_date']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='weekly_test_user_created'),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.title} ({self.start_date} ~ {self.end_date})"
 
-    def calculate_score(self):
+    @property
+    def is_startable(self):
+        """시작 가능 여부 (준비 중이면 최소 문제 수가 생성되어야 함)"""
+        if self.status == 'preparing':
+            return self.generated_questions >= settings.EXAM_SETTINGS['MIN_READY_QUESTIONS']
+        return self.status in ('pending', 'in_progress')
+
+    @property
+    def generation_eta_seconds(self):
+        """남은 문제 생성 예상 시간 (초, 지금까지의 문제당 평균 생성 시간 기준)"""
+        if self.status != 'preparing' or not self.generation_started_at or not self.generated_questions:
+            return None
+
+        remaining = max(self.expected_questions - self.generated_questions, 0)
+        elapsed = (timezone.now() - self.generation_started_at).total_seconds()
+        return round(elapsed / self.generated_questions * remaining)
+
+    def calculate_score(self, update_fields=None):
         """점수 계산"""
         if self.total_questions > 0:
             self.score_percentage = (self.correct_answers / self.total_questions) * 100
         else:
             self.score_percentage = 0
-        self.save()
+        self.save(update_fields=update_fields)
         return self.score_percentage
 
 
@@ -91,6 +120,51 @@ class WeeklyTestQuestion(models.Model):
         return f"{self.weekly_test.title} - Q{self.order}: {self.question_text[:50]}"
 
 
+class QuestionBankEntry(models.Model):
+    """
+    미리 생성해 둔 시험 문제 후보 (문제 은행)
+
+    야간 배치가 AI 검증된 콘텐츠마다 후보 문제를 만들어 두고, 시험 생성 시에는
+    여기서 골라 WeeklyTestQuestion 으로 복사합니다. content_hash 가 현재 콘텐츠의
+    해시와 다르면 낡은 후보로 간주합니다.
+    """
+
+    DIFFICULTY_CHOICES = [
+        ('Easy', '쉬움'),
+        ('Medium', '보통'),
+        ('Hard', '어려움'),
+    ]
+
+    SOURCE_CHOICES = [
+        ('ai', 'AI 생성'),
+        ('simple', '규칙 기반'),
+    ]
+
+    content = models.ForeignKey(Content, on_delete=models.CASCADE, related_name='bank_questions')
+    content_hash = models.CharField(max_length=64)
+
+    question_type = models.CharField(max_length=20, choices=WeeklyTestQuestion.QUESTION_TYPES)
+    question_text = models.TextField()
+    choices = models.JSONField(null=True, blank=True)
+    correct_answer = models.TextField()
+    explanation = models.TextField(blank=True)
+    points = models.PositiveIntegerField(default=10)
+
+    difficulty = models.CharField(max_length=10, choices=DIFFICULTY_CHOICES, default='Medium')
+    difficulty_score = models.PositiveSmallIntegerField(default=60)
+    source = models.CharField(max_length=10, choices=SOURCE_CHOICES, default='ai')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['content', 'content_hash'], name='question_bank_content_hash'),
+        ]
+
+    def __str__(self):
+        return f"{self.content_id} [{self.difficulty}] {self.question_text[:50]}"
+
+
 class WeeklyTestAnswer(models.Model):
     """사용자 답변"""
 
@@ -114,15 +188,25 @@ class WeeklyTestAnswer(models.Model):
     def __str__(self):
         return f"{self.user.email} - {self.question.question_text[:30]} - {'✓' if self.is_correct else '✗'}"
 
-    def save(self, *args, **kwargs):
-        """답변 저장 시 정답 여부 확인"""
+    def grade(self, question=None):
+        """
+        정답 여부와 획득 점수 계산 (저장하지 않음)
+
+        Args:
+            question: 미리 로드한 문제 (optional). 없으면 self.question 사용
+        """
+        question = question or self.question
+
         # 객관식/O/X만 지원
-        self.is_correct = self.user_answer.strip().lower() == self.question.correct_answer.strip().lower()
+        self.is_correct = self.user_answer.strip().lower() == question.correct_answer.strip().lower()
 
         # 점수 계산
         if self.is_correct:
-            self.points_earned = self.question.points
+            self.points_earned = question.points
         else:
             self.points_earned = 0
 
+    def save(self, *args, **kwargs):
+        """답변 저장 시 정답 여부 확인"""
+        self.grade()
         super().save(*args, **kwargs)
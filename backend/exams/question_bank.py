@@ -0,0 +1,232 @@
+"""
+Question bank: exam questions pre-generated off-peak
+
+The nightly build_question_bank task generates candidate questions (and a
+difficulty rating) for AI-validated contents that have no AI-generated
+candidates yet. Rule-based fallbacks from a night without AI are not stored,
+so those contents are picked up again once AI is back. Entries are
+keyed by a hash of the content title and body, so edited contents stop
+matching and get rebuilt. Exam creation assembles a test from the bank with
+the stored difficulty and the usual 30/50/20 balance, without LLM calls.
+"""
+import hashlib
+import logging
+import random
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from content.models import Content
+
+from .models import QuestionBankEntry, WeeklyTest, WeeklyTestQuestion
+
+logger = logging.getLogger(__name__)
+
+DIFFICULTIES = {value for value, _ in QuestionBankEntry.DIFFICULTY_CHOICES}
+
+DEFAULT_DIFFICULTY = {'difficulty': 'Medium', 'score': 60}
+
+
+def content_hash(content):
+    """제목과 본문의 SHA-256 (문제 은행 키)"""
+    digest = hashlib.sha256(content.title.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(content.content.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def current_bank_entries(contents):
+    """
+    현재 콘텐츠 해시와 일치하는 후보 문제 조회
+
+    Args:
+        contents: 본문이 로드된 Content 목록
+
+    Returns:
+        dict: content_id -> [QuestionBankEntry, ...]
+    """
+    hashes = {content.id: content_hash(content) for content in contents}
+    entries = {}
+    for entry in QuestionBankEntry.objects.filter(content_id__in=hashes):
+        if entry.content_hash == hashes[entry.content_id]:
+            entries.setdefault(entry.content_id, []).append(entry)
+    return entries
+
+
+def build_bank_entries(content, difficulty=None, candidates=None, ai_available=False):
+    """
+    콘텐츠 하나의 후보 문제 생성 후 기존 후보 교체
+
+    Args:
+        content: AI 검증된 Content
+        difficulty: {'difficulty': str, 'score': int} (optional)
+        candidates: 생성할 후보 수 (optional). 기본값은 EXAM_SETTINGS
+        ai_available: AI 문제 생성 사용 여부. 사용하면 AI 호출이 실패해 규칙 기반으로
+            대체된 후보는 저장하지 않습니다
+
+    Returns:
+        list: 저장된 QuestionBankEntry 목록 (AI 후보가 하나도 없으면 빈 목록, 기존 후보 유지)
+    """
+    from .assembly import build_question
+
+    candidates = candidates or settings.EXAM_SETTINGS['QUESTION_BANK_CANDIDATES']
+    difficulty = difficulty or DEFAULT_DIFFICULTY
+    level = str(difficulty.get('difficulty', '')).capitalize()
+    if level not in DIFFICULTIES:
+        level = DEFAULT_DIFFICULTY['difficulty']
+
+    key = content_hash(content)
+    entries = []
+    for _ in range(candidates):
+        data, source = build_question(content, ai_available)
+        entries.append(QuestionBankEntry(
+            content=content,
+            content_hash=key,
+            difficulty=level,
+            difficulty_score=difficulty.get('score', DEFAULT_DIFFICULTY['score']),
+            source=source,
+            **data
+        ))
+
+    if ai_available:
+        entries = [entry for entry in entries if entry.source == 'ai']
+        if not entries:
+            logger.warning(f"[Bank] No AI candidates for content {content.id}, keeping existing entries")
+            return []
+
+    with transaction.atomic():
+        QuestionBankEntry.objects.filter(content=content).delete()
+        QuestionBankEntry.objects.bulk_create(entries)
+
+    return entries
+
+
+def refresh_question_bank(batch_size=None, candidates=None):
+    """
+    AI 후보 문제가 없는 AI 검증 콘텐츠의 문제 은행 채우기
+
+    콘텐츠 변경 시 낡은 후보는 시그널로 삭제되므로, AI 후보가 없는 콘텐츠만
+    대상으로 하면 변경된 콘텐츠도 다시 생성됩니다. AI 를 사용할 수 없거나
+    (토큰 예산, 서킷 브레이커) 난이도 평가 또는 문제 생성이 실패한 콘텐츠는
+    규칙 기반 후보나 기본 난이도로 채우지 않고 다음 배치에서 다시 시도합니다.
+
+    Args:
+        batch_size: 한 번에 처리할 최대 콘텐츠 수 (optional)
+        candidates: 콘텐츠당 후보 수 (optional)
+
+    Returns:
+        int: 후보를 생성한 콘텐츠 수
+    """
+    from ai_services.generators.question_generator import ai_question_generator
+    from ai_services.graphs import analyze_contents_difficulty
+
+    batch_size = batch_size or settings.EXAM_SETTINGS['QUESTION_BANK_BATCH_SIZE']
+    contents = list(
+        Content.objects.filter(is_ai_validated=True)
+        .filter(~Exists(QuestionBankEntry.objects.filter(content=OuterRef('pk'), source='ai')))
+        .order_by('id')[:batch_size]
+    )
+    if not contents:
+        return 0
+
+    if not ai_question_generator.is_available():
+        logger.warning(f"[Bank] AI unavailable, skipping {len(contents)} contents until the next run")
+        return 0
+
+    difficulty_scores = analyze_contents_difficulty([
+        {'id': content.id, 'title': content.title, 'content': content.content}
+        for content in contents
+    ])
+
+    built = 0
+    for content in contents:
+        if content.id not in difficulty_scores:
+            continue
+        try:
+            if build_bank_entries(
+                content,
+                difficulty=difficulty_scores[content.id],
+                candidates=candidates,
+                ai_available=True
+            ):
+                built += 1
+        except Exception as e:
+            logger.error(f"[Bank] Failed to build questions for content {content.id}: {e}", exc_info=True)
+
+    logger.info(f"[Bank] Built question candidates for {built}/{len(contents)} contents")
+    return built
+
+
+def assemble_from_bank(weekly_test, content_ids=None):
+    """
+    문제 은행에서 시험 문제 즉시 구성
+
+    수동 선택이면 선택된 콘텐츠 모두, 자동 밸런싱이면 목표 문제 수만큼의 콘텐츠에
+    현재 후보가 있어야 합니다. 부족하면 아무것도 만들지 않고 False 를 반환하므로
+    호출 측은 기존 비동기 생성으로 대체하면 됩니다.
+
+    Args:
+        weekly_test: preparing 상태의 WeeklyTest
+        content_ids: 수동 선택 콘텐츠 ID 목록 (optional, 없으면 자동 밸런싱)
+
+    Returns:
+        bool: 문제 은행으로 시험을 구성했는지 여부
+    """
+    from ai_services.graphs import select_balanced_from_scores
+
+    contents = Content.objects.filter(
+        author=weekly_test.user,
+        is_ai_validated=True
+    ).only('id', 'title', 'content')
+    if content_ids:
+        contents = contents.filter(id__in=content_ids)
+    contents = list(contents)
+    if not contents:
+        return False
+
+    entries = current_bank_entries(contents)
+
+    if content_ids:
+        if any(content_id not in entries for content_id in content_ids):
+            return False
+        selected_ids = list(content_ids)
+    else:
+        # 비동기 생성과 같은 목표 문제 수 (7-10개, 콘텐츠 수에 따라 조정)
+        target_count = min(10, max(7, len(contents)))
+        if len(entries) < min(target_count, len(contents)):
+            return False
+        difficulty_scores = {
+            content_id: {'difficulty': candidates[0].difficulty, 'score': candidates[0].difficulty_score}
+            for content_id, candidates in entries.items()
+        }
+        selected_ids = select_balanced_from_scores(difficulty_scores, target_count)['selected_content_ids']
+
+    questions = []
+    for order, content_id in enumerate(selected_ids, start=1):
+        entry = random.choice(entries[content_id])
+        questions.append(WeeklyTestQuestion(
+            weekly_test=weekly_test,
+            content_id=content_id,
+            question_type=entry.question_type,
+            question_text=entry.question_text,
+            choices=entry.choices,
+            correct_answer=entry.correct_answer,
+            explanation=entry.explanation,
+            order=order,
+            points=entry.points
+        ))
+
+    with transaction.atomic():
+        WeeklyTestQuestion.objects.bulk_create(questions)
+        WeeklyTest.objects.filter(pk=weekly_test.pk).update(
+            total_questions=len(questions),
+            expected_questions=len(questions),
+            generated_questions=len(questions),
+            generation_plan=list(selected_ids)
+        )
+        WeeklyTest.objects.filter(pk=weekly_test.pk, status='preparing').update(status='pending')
+
+    weekly_test.refresh_from_db()
+    logger.info(f"[Bank] Assembled test {weekly_test.id} with {len(questions)} questions from the bank")
+    return True
@@ -1,15 +1,59 @@
+from django.db.models import Prefetch
 from django.utils import timezone
 from rest_framework import serializers
 
-from content.serializers import ContentSerializer
+from content.models import Content
 
 from .models import WeeklyTest, WeeklyTestAnswer, WeeklyTestQuestion
 
+# 시험 화면에 필요한 문제 컬럼 (정답/해설 제외)
+EXAM_QUESTION_COLUMNS = [
+    'id', 'weekly_test', 'question_type', 'question_text', 'choices',
+    'order', 'points', 'created_at', 'content__id', 'content__title',
+]
+
+
+def questions_prefetch(include_answers=False):
+    """
+    시험 문제 prefetch (콘텐츠는 id/title 만 조인)
+
+    Args:
+        include_answers: 정답/해설 컬럼도 로드할지 여부 (결과 화면용)
+    """
+    columns = EXAM_QUESTION_COLUMNS + (['correct_answer', 'explanation'] if include_answers else [])
+    return Prefetch(
+        'questions',
+        queryset=WeeklyTestQuestion.objects.select_related('content').only(*columns)
+    )
+
+
+class ContentSummarySerializer(serializers.ModelSerializer):
+    """시험 문제에 포함되는 콘텐츠 요약 (본문/복습 정보 제외)"""
+
+    class Meta:
+        model = Content
+        fields = ['id', 'title']
+        read_only_fields = fields
+
+
+class ExamQuestionSerializer(serializers.ModelSerializer):
+    """시험 진행용 문제 시리얼라이저 (정답/해설 미포함)"""
+
+    content = ContentSummarySerializer(read_only=True)
+
+    class Meta:
+        model = WeeklyTestQuestion
+        fields = [
+            'id', 'question_type', 'question_text', 'choices',
+            'order', 'points', 'content', 'created_at'
+        ]
+        read_only_fields = fields
+
 
 class WeeklyTestQuestionSerializer(serializers.ModelSerializer):
-    """주간 시험 문제 시리얼라이저"""
+    """주간 시험 문제 시리얼라이저 (결과 조회용, 정답/해설 포함)"""
 
-    content = ContentSerializer(read_only=True)
+    content = ContentSummarySerializer(read_only=True)
 
     class Meta:
         model = WeeklyTestQuestion
@@ -36,9 +80,9 @@ class WeeklyTestAnswerSerializer(serializers.ModelSerializer):
 
 
 class WeeklyTestSerializer(serializers.ModelSerializer):
-    """주간 시험 시리얼라이저"""
+    """주간 시험 시리얼라이저 (시험 진행용 문제 포함)"""
 
-    questions = WeeklyTestQuestionSerializer(many=True, read_only=True)
+    questions = ExamQuestionSerializer(many=True, read_only=True)
     user_answers = WeeklyTestAnswerSerializer(source='questions__answers', many=True, read_only=True)
     content_ids = serializers.ListField(
         child=serializers.IntegerField(),
@@ -54,11 +98,13 @@ class WeeklyTestSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'start_date', 'end_date',
             'status', 'total_questions', 'correct_answers', 'score_percentage',
+            'expected_questions', 'generated_questions',
             'started_at', 'completed_at', 'time_spent', 'created_at', 'updated_at',
             'questions', 'user_answers', 'content_ids'
         ]
         read_only_fields = [
             'id', 'total_questions', 'correct_answers', 'score_percentage',
+            'expected_questions', 'generated_questions',
             'started_at', 'completed_at', 'time_spent', 'created_at', 'updated_at'
         ]
 
@@ -112,19 +158,68 @@ class WeeklyTestSerializer(serializers.ModelSerializer):
         return weekly_test
 
 
+class WeeklyTestResultSerializer(WeeklyTestSerializer):
+    """완료된 시험 결과용 시리얼라이저 (정답/해설 포함)"""
+
+    questions = WeeklyTestQuestionSerializer(many=True, read_only=True)
+
+
+class TestResultQuestionSerializer(serializers.ModelSerializer):
+    """결과 답변 항목의 문제 요약"""
+
+    content_title = serializers.CharField(source='content.title', read_only=True)
+
+    class Meta:
+        model = WeeklyTestQuestion
+        fields = ['id', 'question_text', 'question_type', 'correct_answer', 'explanation', 'content_title']
+        read_only_fields = fields
+
+
+class TestResultAnswerSerializer(serializers.ModelSerializer):
+    """결과 조회용 답변 시리얼라이저"""
+
+    question = TestResultQuestionSerializer(read_only=True)
+
+    class Meta:
+        model = WeeklyTestAnswer
+        fields = ['question', 'user_answer', 'is_correct', 'points_earned', 'ai_score', 'ai_feedback']
+        read_only_fields = fields
+
+
 class WeeklyTestListSerializer(serializers.ModelSerializer):
     """주간 시험 목록용 간소화 시리얼라이저"""
 
+    ready = serializers.BooleanField(source='is_startable', read_only=True)
+
     class Meta:
         model = WeeklyTest
         fields = [
             'id', 'title', 'start_date', 'end_date', 'status',
             'total_questions', 'correct_answers', 'score_percentage',
+            'expected_questions', 'generated_questions', 'ready',
             'created_at', 'completed_at'
         ]
         read_only_fields = ['id', 'created_at']
 
 
+class WeeklyTestProgressSerializer(serializers.ModelSerializer):
+    """문제 생성 진행 상황용 경량 시리얼라이저 (문제 목록 없음)"""
+
+    generated = serializers.IntegerField(source='generated_questions', read_only=True)
+    total = serializers.SerializerMethodField()
+    eta_seconds = serializers.IntegerField(source='generation_eta_seconds', read_only=True)
+    ready = serializers.BooleanField(source='is_startable', read_only=True)
+
+    class Meta:
+        model = WeeklyTest
+        fields = ['id', 'status', 'generated', 'total', 'eta_seconds', 'ready']
+        read_only_fields = fields
+
+    def get_total(self, obj):
+        # 목표 수가 정해지기 전에는 생성된 수를 그대로 사용
+        return max(obj.expected_questions, obj.generated_questions)
+
+
 class SubmitAnswerSerializer(serializers.Serializer):
     """답변 제출용 시리얼라이저"""
 
@@ -144,6 +239,52 @@ class SubmitAnswerSerializer(serializers.Serializer):
             raise serializers.ValidationError("존재하지 않는 문제입니다.")
 
 
+class AnswerItemSerializer(serializers.Serializer):
+    """일괄 제출 답변 항목"""
+
+    question_id = serializers.IntegerField()
+    user_answer = serializers.CharField()
+
+
+class BulkSubmitAnswersSerializer(serializers.Serializer):
+    """
+    답변 일괄 제출용 시리얼라이저
+
+    context['weekly_test'] 의 문제를 한 번에 조회하여 검증하고,
+    validated_data['pairs'] 에 (question, user_answer) 목록을 담습니다.
+    """
+
+    answers = AnswerItemSerializer(many=True, allow_empty=False)
+
+    def validate_answers(self, value):
+        """중복 문제 확인"""
+        question_ids = [item['question_id'] for item in value]
+        if len(set(question_ids)) != len(question_ids):
+            raise serializers.ValidationError("같은 문제에 대한 답변이 중복되었습니다.")
+        return value
+
+    def validate(self, attrs):
+        """문제가 해당 시험 소속인지 확인"""
+        weekly_test = self.context['weekly_test']
+        question_ids = [item['question_id'] for item in attrs['answers']]
+        questions = {
+            question.id: question
+            for question in weekly_test.questions.filter(id__in=question_ids).only(
+                'id', 'weekly_test_id', 'correct_answer', 'points'
+            )
+        }
+
+        missing = [question_id for question_id in question_ids if question_id not in questions]
+        if missing:
+            raise serializers.ValidationError({'answers': f"존재하지 않는 문제입니다: {missing}"})
+
+        attrs['pairs'] = [
+            (questions[item['question_id']], item['user_answer'])
+            for item in attrs['answers']
+        ]
+        return attrs
+
+
 class StartTestSerializer(serializers.Serializer):
     """시험 시작용 시리얼라이저"""
 
@@ -159,7 +300,10 @@ class StartTestSerializer(serializers.Serializer):
                 raise serializers.ValidationError("접근 권한이 없습니다.")
 
             # pending 또는 in_progress 상태만 허용 (계속하기 기능 지원)
-            if test.status not in ['pending', 'in_progress']:
+            # preparing 상태는 최소 문제 수가 생성된 경우에만 시작 가능
+            if test.status == 'preparing' and not test.is_startable:
+                raise serializers.ValidationError("문제를 준비 중입니다. 잠시 후 다시 시도해주세요.")
+            if not test.is_startable:
                 raise serializers.ValidationError("이미 완료된 시험입니다.")
 
             return value
@@ -0,0 +1,22 @@
+"""
+Signals for exams app
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from content.models import Content
+
+from .models import QuestionBankEntry
+
+
+@receiver(post_save, sender=Content)
+def invalidate_question_bank(sender, instance, created, update_fields=None, **kwargs):
+    """콘텐츠 제목/본문이 바뀌면 해시가 다른 문제 은행 후보 삭제 (야간 배치가 재생성)"""
+    if created:
+        return
+    if update_fields is not None and not {'title', 'content'} & set(update_fields):
+        return
+
+    from .question_bank import content_hash
+
+    QuestionBankEntry.objects.filter(content=instance).exclude(content_hash=content_hash(instance)).delete()
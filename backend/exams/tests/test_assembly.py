@@ -0,0 +1,132 @@
+"""
+Tests for the exam assembly engine.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from content.models import Category, Content
+from exams.assembly import assemble_questions, assembly_lock
+from exams.models import WeeklyTest, WeeklyTestQuestion
+
+User = get_user_model()
+
+AI_AVAILABLE = 'ai_services.generators.question_generator.ai_question_generator.is_available'
+GENERATE = 'ai_services.generators.question_generator.ai_question_generator.generate_question'
+
+
+def fake_question(content):
+    return {
+        'question_type': 'multiple_choice',
+        'question_text': f'Q about {content.title}',
+        'choices': ['A', 'B', 'C', 'D'],
+        'correct_answer': 'A',
+        'explanation': 'A is right',
+    }
+
+
+@patch(AI_AVAILABLE, return_value=True)
+class ExamAssemblyTest(TestCase):
+    """Test assembly is idempotent across retries and duplicate deliveries."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        category = Category.objects.create(name='Test', user=self.user)
+        self.contents = [
+            Content.objects.create(
+                title=f'Content {i}',
+                content='x' * 300,
+                author=self.user,
+                category=category,
+                is_ai_validated=True
+            )
+            for i in range(7)
+        ]
+        self.content_ids = [c.id for c in self.contents]
+        self.weekly_test = WeeklyTest.objects.create(user=self.user, title='Test', status='preparing')
+
+    @patch(GENERATE, side_effect=fake_question)
+    def test_assemble_from_ids(self, mock_generate, mock_available):
+        """Test questions follow the given content order and the test becomes pending."""
+        self.assertTrue(assemble_questions(self.weekly_test.id, self.content_ids))
+
+        self.weekly_test.refresh_from_db()
+        self.assertEqual(self.weekly_test.status, 'pending')
+        self.assertEqual(self.weekly_test.generation_plan, self.content_ids)
+        self.assertEqual(
+            list(self.weekly_test.questions.values_list('content_id', flat=True)),
+            self.content_ids
+        )
+        self.assertEqual(mock_generate.call_count, 7)
+
+    @patch(GENERATE, side_effect=fake_question)
+    def test_duplicate_delivery_does_no_llm_work(self, mock_generate, mock_available):
+        """Test a second delivery after completion makes no LLM calls."""
+        assemble_questions(self.weekly_test.id, self.content_ids)
+        mock_generate.reset_mock()
+
+        self.assertFalse(assemble_questions(self.weekly_test.id, self.content_ids))
+        mock_generate.assert_not_called()
+        self.assertEqual(self.weekly_test.questions.count(), 7)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    @patch(GENERATE, side_effect=fake_question)
+    def test_concurrent_delivery_skips_while_locked(self, mock_generate, mock_available):
+        """Test a delivery that cannot take the per-test lock returns immediately."""
+        with assembly_lock(self.weekly_test.id) as acquired:
+            self.assertTrue(acquired)
+            self.assertFalse(assemble_questions(self.weekly_test.id, self.content_ids))
+
+        mock_generate.assert_not_called()
+        self.assertFalse(self.weekly_test.questions.exists())
+
+    def test_retry_resumes_plan(self, mock_available):
+        """Test a retry after a partial run only generates the missing orders."""
+        with patch(GENERATE, side_effect=fake_question), \
+                patch('exams.assembly._record_question_progress', side_effect=[1, 2, RuntimeError('worker lost')]):
+            with self.assertRaises(RuntimeError):
+                assemble_questions(self.weekly_test.id, self.content_ids)
+
+        self.assertEqual(self.weekly_test.questions.count(), 3)
+
+        with patch(GENERATE, side_effect=fake_question) as mock_generate:
+            self.assertTrue(assemble_questions(self.weekly_test.id, self.content_ids))
+
+        self.assertEqual(mock_generate.call_count, 4)
+        self.assertEqual(self.weekly_test.questions.count(), 7)
+
+    @patch(GENERATE, side_effect=fake_question)
+    @patch('ai_services.graphs.select_balanced_contents_for_test')
+    def test_balanced_plan_selected_once(self, mock_balance, mock_generate, mock_available):
+        """Test the balance graph runs once and retries reuse the stored plan."""
+        mock_balance.return_value = {
+            'selected_content_ids': self.content_ids[::-1],
+            'balance': {'easy': 2, 'medium': 4, 'hard': 1},
+        }
+        assemble_questions(self.weekly_test.id)
+        WeeklyTestQuestion.objects.filter(weekly_test=self.weekly_test, order=7).delete()
+
+        assemble_questions(self.weekly_test.id)
+
+        mock_balance.assert_called_once()
+        self.assertEqual(
+            self.weekly_test.questions.get(order=7).content_id,
+            self.content_ids[0]
+        )
+
+    def test_invalid_content_ids_create_nothing(self, mock_available):
+        """Test unvalidated contents leave the test empty and pending."""
+        Content.objects.filter(pk=self.content_ids[0]).update(is_ai_validated=False)
+
+        with patch(GENERATE) as mock_generate:
+            assemble_questions(self.weekly_test.id, self.content_ids)
+
+        mock_generate.assert_not_called()
+        self.weekly_test.refresh_from_db()
+        self.assertEqual(self.weekly_test.status, 'pending')
+        self.assertFalse(self.weekly_test.questions.exists())
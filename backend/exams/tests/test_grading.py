@@ -0,0 +1,131 @@
+"""
+Tests for batch answer submission and grading.
+"""
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from content.models import Category, Content
+from exams.grading import submit_answers
+from exams.models import WeeklyTest, WeeklyTestAnswer, WeeklyTestQuestion
+
+User = get_user_model()
+
+
+class BulkAnswerSubmissionTest(TestCase):
+    """Test batch answers endpoint and in-memory grading."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.client.force_authenticate(user=self.user)
+        category = Category.objects.create(name='Test', user=self.user)
+        content = Content.objects.create(title='Content', content='x' * 300, author=self.user, category=category)
+        self.weekly_test = WeeklyTest.objects.create(
+            user=self.user,
+            title='Test',
+            status='in_progress',
+            total_questions=10
+        )
+        self.questions = [
+            WeeklyTestQuestion.objects.create(
+                weekly_test=self.weekly_test,
+                content=content,
+                question_type='multiple_choice',
+                question_text=f'Question {i}',
+                choices=['A', 'B', 'C', 'D'],
+                correct_answer='A',
+                order=i
+            )
+            for i in range(1, 11)
+        ]
+        self.url = f'/api/exams/test-sessions/{self.weekly_test.id}/answers/bulk/'
+
+    def payload(self, answers):
+        return {'answers': [
+            {'question_id': question.id, 'user_answer': answer}
+            for question, answer in answers
+        ]}
+
+    def test_bulk_submit_grades_and_scores(self):
+        """Test answers are graded and the score is updated."""
+        answers = [(question, 'a' if i < 7 else 'B') for i, question in enumerate(self.questions)]
+
+        response = self.client.post(self.url, self.payload(answers), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['correct_answers'], 7)
+        self.assertEqual(response.data['score_percentage'], 70.0)
+        self.assertEqual(WeeklyTestAnswer.objects.filter(user=self.user).count(), 10)
+        self.weekly_test.refresh_from_db()
+        self.assertEqual(self.weekly_test.correct_answers, 7)
+
+    def test_bulk_submit_overwrites_previous_answers(self):
+        """Test resubmitting updates existing answers instead of duplicating them."""
+        WeeklyTestAnswer.objects.create(question=self.questions[0], user=self.user, user_answer='B')
+        WeeklyTestAnswer.objects.create(question=self.questions[1], user=self.user, user_answer='A')
+
+        response = self.client.post(self.url, self.payload([(self.questions[0], 'A')]), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        answer = WeeklyTestAnswer.objects.get(question=self.questions[0], user=self.user)
+        self.assertTrue(answer.is_correct)
+        self.assertEqual(answer.points_earned, self.questions[0].points)
+        # 이전에 제출한 정답도 점수에 포함
+        self.assertEqual(response.data['correct_answers'], 2)
+        self.assertEqual(WeeklyTestAnswer.objects.filter(user=self.user).count(), 2)
+
+    def test_bulk_submit_query_count(self):
+        """Test a full exam is submitted in a constant number of queries."""
+        answers = [(question, 'A') for question in self.questions]
+
+        # test, questions, savepoint, upsert, count, score update, release
+        with self.assertNumQueries(7):
+            response = self.client.post(self.url, self.payload(answers), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_bulk_submit_rejects_foreign_question(self):
+        """Test questions from another test are rejected."""
+        other_test = WeeklyTest.objects.create(user=self.user, title='Other')
+        foreign = WeeklyTestQuestion.objects.create(
+            weekly_test=other_test,
+            content=self.questions[0].content,
+            question_type='true_false',
+            question_text='Other',
+            correct_answer='O',
+            order=1
+        )
+
+        response = self.client.post(self.url, self.payload([(foreign, 'O')]), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(WeeklyTestAnswer.objects.exists())
+
+    def test_bulk_submit_rejects_duplicates(self):
+        """Test the same question twice in one batch is rejected."""
+        answers = [(self.questions[0], 'A'), (self.questions[0], 'B')]
+
+        response = self.client.post(self.url, self.payload(answers), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_submit_completed_test(self):
+        """Test answers cannot be submitted to a completed test."""
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(status='completed')
+
+        response = self.client.post(self.url, self.payload([(self.questions[0], 'A')]), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_submit_answers_matches_save_grading(self):
+        """Test in-memory grading matches WeeklyTestAnswer.save grading."""
+        answers = submit_answers(self.weekly_test, self.user, [(self.questions[0], '  a ')])
+
+        self.assertTrue(answers[0].is_correct)
+        self.assertEqual(answers[0].points_earned, self.questions[0].points)
@@ -0,0 +1,92 @@
+"""
+Tests for in-exam and results payload projections.
+"""
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from content.models import Category, Content
+from exams.models import WeeklyTest, WeeklyTestAnswer, WeeklyTestQuestion
+
+User = get_user_model()
+
+
+class ExamPayloadTest(TestCase):
+    """Test exam responses expose lean question payloads without N+1 queries."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.category = Category.objects.create(name='Test', user=self.user)
+        self.weekly_test = WeeklyTest.objects.create(user=self.user, title='Test', status='pending')
+
+    def add_questions(self, count):
+        start = self.weekly_test.questions.count()
+        for order in range(start + 1, start + count + 1):
+            content = Content.objects.create(
+                title=f'Content {order}',
+                content='본문 ' * 500,
+                author=self.user,
+                category=self.category
+            )
+            WeeklyTestQuestion.objects.create(
+                weekly_test=self.weekly_test,
+                content=content,
+                question_text=f'Question {order}',
+                choices=['A', 'B', 'C', 'D'],
+                correct_answer='A',
+                explanation='Because A',
+                order=order
+            )
+
+    def test_in_exam_question_hides_answers(self):
+        """Test questions served during the exam omit answers and content bodies."""
+        self.add_questions(2)
+
+        response = self.client.get(f'/api/exams/{self.weekly_test.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        question = response.data['questions'][0]
+        self.assertNotIn('correct_answer', question)
+        self.assertNotIn('explanation', question)
+        self.assertEqual(question['content'], {'id': question['content']['id'], 'title': 'Content 1'})
+
+    def test_start_query_count_is_constant(self):
+        """Test starting a test does not issue queries per question."""
+        self.add_questions(2)
+        with CaptureQueriesContext(connection) as small:
+            self.client.post('/api/exams/start/', {'test_id': self.weekly_test.id}, format='json')
+
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(status='pending')
+        self.add_questions(8)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post('/api/exams/start/', {'test_id': self.weekly_test.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['test']['questions']), 10)
+        self.assertEqual(len(large), len(small))
+
+    def test_results_include_answers(self):
+        """Test the results projection includes answers and content titles."""
+        self.add_questions(3)
+        for question in self.weekly_test.questions.all():
+            WeeklyTestAnswer.objects.create(question=question, user=self.user, user_answer='A')
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(status='completed')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/exams/test-sessions/{self.weekly_test.id}/results/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['test']['questions'][0]['correct_answer'], 'A')
+        self.assertEqual(response.data['answers'][0]['question']['content_title'], 'Content 1')
+        self.assertTrue(response.data['answers'][0]['is_correct'])
+        # test, questions, answers
+        self.assertEqual(len(queries), 3)
@@ -0,0 +1,222 @@
+"""
+Tests for exam preparation progress and early start.
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from content.models import Category, Content
+from exams.models import WeeklyTest, WeeklyTestQuestion
+from exams.assembly import _generate_questions, _save_question, assemble_questions, finish_preparation
+
+User = get_user_model()
+
+EXAM_SETTINGS = {'MIN_READY_QUESTIONS': 2}
+
+AI_AVAILABLE = 'ai_services.generators.question_generator.ai_question_generator.is_available'
+
+
+def create_question(weekly_test, content, order):
+    return WeeklyTestQuestion.objects.create(
+        weekly_test=weekly_test,
+        content=content,
+        question_type='multiple_choice',
+        question_text=f'Question {order}',
+        choices=['A', 'B', 'C', 'D'],
+        correct_answer='A',
+        order=order
+    )
+
+
+@override_settings(EXAM_SETTINGS=EXAM_SETTINGS)
+class WeeklyTestProgressTest(TestCase):
+    """Test progress tracking and startable rules while questions are generated."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.category = Category.objects.create(name='Test', user=self.user)
+        self.contents = [
+            Content.objects.create(
+                title=f'Content {i}',
+                content='이것은 테스트용 콘텐츠 문장입니다. ' * 10,
+                author=self.user,
+                category=self.category,
+                is_ai_validated=True
+            )
+            for i in range(4)
+        ]
+        self.weekly_test = WeeklyTest.objects.create(
+            user=self.user,
+            title='Test',
+            status='preparing',
+            expected_questions=4
+        )
+
+    def test_progress_endpoint(self):
+        """Test progress reports generated/total without serializing questions."""
+        create_question(self.weekly_test, self.contents[0], 1)
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(
+            generated_questions=1,
+            generation_started_at=timezone.now() - timedelta(seconds=10)
+        )
+
+        response = self.client.get(f'/api/exams/{self.weekly_test.id}/progress/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['generated'], 1)
+        self.assertEqual(response.data['total'], 4)
+        self.assertFalse(response.data['ready'])
+        self.assertAlmostEqual(response.data['eta_seconds'], 30, delta=2)
+        self.assertNotIn('questions', response.data)
+
+    def test_progress_other_user_not_found(self):
+        """Test progress of another user's test returns 404."""
+        other = User.objects.create_user(email='other@example.com', password='testpass123')
+        other_test = WeeklyTest.objects.create(user=other, title='Other')
+
+        response = self.client.get(f'/api/exams/{other_test.id}/progress/')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_progress_ready_at_min_ready(self):
+        """Test progress reports ready once K questions exist, while still preparing."""
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(generated_questions=2)
+
+        response = self.client.get(f'/api/exams/{self.weekly_test.id}/progress/')
+
+        self.assertEqual(response.data['status'], 'preparing')
+        self.assertTrue(response.data['ready'])
+        self.assertEqual(response.data['min_ready_questions'], 2)
+
+    def test_list_reports_ready(self):
+        """Test the exam list tells the client a preparing test can already be started."""
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(generated_questions=2)
+
+        response = self.client.get('/api/exams/')
+
+        self.assertTrue(response.data['results'][0]['ready'])
+
+    def test_is_startable_after_min_ready(self):
+        """Test a preparing test becomes startable once K questions are ready."""
+        self.assertFalse(self.weekly_test.is_startable)
+
+        self.weekly_test.generated_questions = 2
+        self.assertTrue(self.weekly_test.is_startable)
+
+        self.weekly_test.status = 'completed'
+        self.assertFalse(self.weekly_test.is_startable)
+
+    def test_start_refused_below_min_ready(self):
+        """Test starting a preparing test with too few questions is refused."""
+        response = self.client.post('/api/exams/start/', {'test_id': self.weekly_test.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_start_while_preparing(self):
+        """Test starting after K questions moves the test to in_progress."""
+        create_question(self.weekly_test, self.contents[0], 1)
+        create_question(self.weekly_test, self.contents[1], 2)
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(generated_questions=2)
+
+        response = self.client.post('/api/exams/start/', {'test_id': self.weekly_test.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.weekly_test.refresh_from_db()
+        self.assertEqual(self.weekly_test.status, 'in_progress')
+        self.assertIsNotNone(self.weekly_test.started_at)
+        self.assertEqual(self.weekly_test.total_questions, 2)
+        self.assertEqual(len(response.data['test']['questions']), 2)
+
+    def test_score_counts_only_served_questions(self):
+        """Test generation after an early start neither adds questions nor lowers the score."""
+        questions = [create_question(self.weekly_test, content, order)
+                     for order, content in enumerate(self.contents[:2], start=1)]
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(generated_questions=2)
+        self.client.post('/api/exams/start/', {'test_id': self.weekly_test.id}, format='json')
+
+        with patch(AI_AVAILABLE, return_value=False):
+            assemble_questions(self.weekly_test.id, [c.id for c in self.contents])
+        for question in questions:
+            self.client.post('/api/exams/submit-answer/', {
+                'question_id': question.id, 'user_answer': 'A'
+            }, format='json')
+        response = self.client.post('/api/exams/complete/', {'test_id': self.weekly_test.id}, format='json')
+
+        self.assertEqual(response.data['total_questions'], 2)
+        self.assertEqual(response.data['score_percentage'], 100)
+        self.assertEqual(self.weekly_test.questions.count(), 2)
+
+        # A late resync must not change the counters the score was computed from
+        finish_preparation(self.weekly_test)
+        self.assertEqual(self.weekly_test.total_questions, 2)
+        self.assertEqual(self.weekly_test.score_percentage, 100)
+
+    def test_question_discarded_after_start(self):
+        """Test a question generated while the user started the test is not saved."""
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(status='in_progress')
+
+        question = _save_question(self.weekly_test, self.contents[0], 1, {
+            'question_type': 'true_false', 'question_text': 'Q', 'correct_answer': 'O',
+        })
+
+        self.assertIsNone(question)
+        self.assertEqual(self.weekly_test.questions.count(), 0)
+
+    def test_generation_records_progress_per_question(self):
+        """Test each generated question is committed and counted."""
+        seen = []
+
+        def record(weekly_test):
+            seen.append(weekly_test.questions.count())
+            return seen[-1]
+
+        with patch('exams.assembly._record_question_progress', side_effect=record):
+            _generate_questions(self.weekly_test, self.contents, ai_available=False)
+
+        self.assertEqual(seen, [1, 2, 3, 4])
+
+    def test_generation_does_not_clobber_started_test(self):
+        """Test generation stops for a started test and keeps its status and frozen question set."""
+        create_question(self.weekly_test, self.contents[0], 1)
+        started_at = timezone.now()
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(
+            status='in_progress', started_at=started_at, generated_questions=1, total_questions=1
+        )
+
+        with patch(AI_AVAILABLE, return_value=False):
+            assemble_questions(self.weekly_test.id, [c.id for c in self.contents])
+
+        self.weekly_test.refresh_from_db()
+        self.assertEqual(self.weekly_test.status, 'in_progress')
+        self.assertEqual(self.weekly_test.started_at, started_at)
+        self.assertEqual(self.weekly_test.questions.count(), 1)
+        self.assertEqual(self.weekly_test.total_questions, 1)
+
+    def test_generation_finishes_as_pending(self):
+        """Test a test nobody started moves to pending when generation ends."""
+        with patch(AI_AVAILABLE, return_value=False):
+            assemble_questions(self.weekly_test.id, [c.id for c in self.contents])
+
+        self.weekly_test.refresh_from_db()
+        self.assertEqual(self.weekly_test.status, 'pending')
+        self.assertEqual(self.weekly_test.generated_questions, 4)
+
+    def test_generation_stops_when_completed(self):
+        """Test generation stops once the user completed the test."""
+        create_question(self.weekly_test, self.contents[0], 1)
+        WeeklyTest.objects.filter(pk=self.weekly_test.pk).update(status='completed')
+
+        _generate_questions(self.weekly_test, self.contents, ai_available=False)
+
+        self.assertEqual(self.weekly_test.questions.count(), 1)
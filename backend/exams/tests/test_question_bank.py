@@ -0,0 +1,180 @@
+"""
+Tests for the pre-generated question bank.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from content.models import Category, Content
+from exams.models import QuestionBankEntry, WeeklyTest
+from exams.question_bank import (
+    assemble_from_bank, build_bank_entries, content_hash, refresh_question_bank,
+)
+
+User = get_user_model()
+
+BODY = '이 문장은 문제 은행 테스트를 위해 충분히 길게 작성된 학습 콘텐츠의 설명 문장입니다. ' * 5
+
+GENERATE_QUESTION = 'ai_services.generators.question_generator.ai_question_generator.generate_question'
+ANALYZE_DIFFICULTY = 'ai_services.graphs.analyze_contents_difficulty'
+
+AI_QUESTION = {
+    'question_type': 'multiple_choice',
+    'question_text': 'AI question',
+    'choices': ['A', 'B', 'C', 'D'],
+    'correct_answer': 'A',
+    'explanation': '',
+}
+
+
+@patch('ai_services.generators.question_generator.ai_question_generator.is_available', return_value=False)
+class QuestionBankTest(TestCase):
+    """Test question bank build, invalidation and exam assembly."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.category = Category.objects.create(name='Test', user=self.user)
+        self.contents = [
+            Content.objects.create(
+                title=f'Content {i}',
+                content=BODY,
+                author=self.user,
+                category=self.category,
+                is_ai_validated=True
+            )
+            for i in range(10)
+        ]
+
+    def _scores(self, contents):
+        return {content.id: {'difficulty': 'Hard', 'score': 80} for content in contents}
+
+    @patch(GENERATE_QUESTION, return_value=AI_QUESTION)
+    def test_refresh_builds_missing_contents_only(self, mock_generate, mock_available):
+        """Test the nightly build fills contents without candidates once."""
+        mock_available.return_value = True
+        unvalidated = Content.objects.create(title='Draft', content=BODY, author=self.user)
+
+        with patch(ANALYZE_DIFFICULTY, return_value=self._scores(self.contents)):
+            self.assertEqual(refresh_question_bank(candidates=2), 10)
+            self.assertEqual(refresh_question_bank(candidates=2), 0)
+
+        self.assertEqual(QuestionBankEntry.objects.count(), 20)
+        self.assertFalse(QuestionBankEntry.objects.filter(content=unvalidated).exists())
+        entry = QuestionBankEntry.objects.filter(content=self.contents[0]).first()
+        self.assertEqual(entry.content_hash, content_hash(self.contents[0]))
+        self.assertEqual(entry.source, 'ai')
+        self.assertEqual(entry.difficulty, 'Hard')
+
+    def test_refresh_skips_without_ai(self, mock_available):
+        """Test a night without AI stores no rule-based candidates."""
+        self.assertEqual(refresh_question_bank(candidates=2), 0)
+
+        self.assertFalse(QuestionBankEntry.objects.exists())
+
+    def test_refresh_retries_fallback_contents(self, mock_available):
+        """Test failed AI calls are not stored and rule-based entries are rebuilt once AI works."""
+        mock_available.return_value = True
+        failed, unrated, simple = self.contents[:3]
+        build_bank_entries(simple, candidates=1)
+
+        def generate(content):
+            return None if content.id == failed.id else AI_QUESTION
+
+        rated = [content for content in self.contents if content != unrated]
+        with patch(GENERATE_QUESTION, side_effect=generate), \
+                patch(ANALYZE_DIFFICULTY, return_value=self._scores(rated)):
+            self.assertEqual(refresh_question_bank(candidates=1), 8)
+
+        self.assertFalse(QuestionBankEntry.objects.filter(content__in=[failed, unrated]).exists())
+        self.assertEqual(list(QuestionBankEntry.objects.filter(content=simple).values_list('source', flat=True)),
+                         ['ai'])
+
+        with patch(GENERATE_QUESTION, return_value=AI_QUESTION), \
+                patch(ANALYZE_DIFFICULTY, return_value=self._scores(self.contents)):
+            self.assertEqual(refresh_question_bank(candidates=1), 2)
+
+    def test_content_change_invalidates_entries(self, mock_available):
+        """Test editing a content drops its stale candidates."""
+        content = self.contents[0]
+        build_bank_entries(content, candidates=1)
+
+        content.content = BODY + ' 수정된 내용입니다.'
+        content.save()
+
+        self.assertFalse(QuestionBankEntry.objects.filter(content=content).exists())
+
+    def test_unrelated_update_keeps_entries(self, mock_available):
+        """Test saving other fields keeps candidates."""
+        content = self.contents[0]
+        build_bank_entries(content, candidates=1)
+
+        content.save(update_fields=['category'])
+
+        self.assertTrue(QuestionBankEntry.objects.filter(content=content).exists())
+
+    def test_assemble_balanced_from_bank(self, mock_available):
+        """Test auto-balanced tests are assembled from stored difficulty."""
+        for content, level in zip(self.contents, ['Easy'] * 3 + ['Medium'] * 5 + ['Hard'] * 2):
+            build_bank_entries(content, difficulty={'difficulty': level, 'score': 60}, candidates=1)
+        weekly_test = WeeklyTest.objects.create(user=self.user, title='Bank', status='preparing')
+
+        with patch('ai_services.graphs.weekly_test_balance_graph.ChatAnthropic') as mock_llm:
+            self.assertTrue(assemble_from_bank(weekly_test))
+            mock_llm.assert_not_called()
+
+        self.assertEqual(weekly_test.status, 'pending')
+        self.assertEqual(weekly_test.total_questions, 10)
+        self.assertEqual(weekly_test.questions.count(), 10)
+
+    def test_assemble_requires_coverage(self, mock_available):
+        """Test assembly declines when selected contents lack candidates."""
+        build_bank_entries(self.contents[0], candidates=1)
+        weekly_test = WeeklyTest.objects.create(user=self.user, title='Bank', status='preparing')
+
+        self.assertFalse(assemble_from_bank(weekly_test, [c.id for c in self.contents[:7]]))
+        self.assertFalse(weekly_test.questions.exists())
+
+    def test_assemble_ignores_stale_hash(self, mock_available):
+        """Test candidates built from older text are not used."""
+        for content in self.contents[:7]:
+            build_bank_entries(content, candidates=1)
+        Content.objects.filter(pk=self.contents[0].pk).update(content=BODY + ' 변경')
+        weekly_test = WeeklyTest.objects.create(user=self.user, title='Bank', status='preparing')
+
+        self.assertFalse(assemble_from_bank(weekly_test, [c.id for c in self.contents[:7]]))
+
+    @patch('exams.tasks.generate_exam_questions.delay')
+    def test_create_uses_bank(self, mock_delay, mock_available):
+        """Test creating a test with bank coverage skips the generation task."""
+        for content in self.contents[:7]:
+            build_bank_entries(content, candidates=1)
+
+        response = self.client.post('/api/exams/', {
+            'title': 'Bank Test',
+            'content_ids': [c.id for c in self.contents[:7]]
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['status'], 'pending')
+        self.assertEqual(len(response.data['questions']), 7)
+        mock_delay.assert_not_called()
+
+    @patch('exams.tasks.generate_exam_questions.delay')
+    def test_create_falls_back_to_task(self, mock_delay, mock_available):
+        """Test creating a test without bank coverage queues generation."""
+        response = self.client.post('/api/exams/', {
+            'title': 'Task Test',
+            'content_ids': [c.id for c in self.contents[:7]]
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        mock_delay.assert_called_once()
@@ -0,0 +1,106 @@
+"""
+Tests for O/X question text processing.
+"""
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from exams.management.commands.benchmark_text_processing import _legacy_wrap
+from exams.text_processing import (
+    clear_sentence_cache, meaningful_sentences, segment_sentences, wrap_code_elements,
+)
+
+
+class WrapCodeElementsTest(SimpleTestCase):
+    """단일 패스 코드 마크업 (기존 순차 치환과 같은 결과)"""
+
+    CASES = [
+        '__init__() 메서드는 self 를 첫 인자로 받습니다',
+        'cls (인자) 와 self (인스턴스) 는 다릅니다',
+        'print(user_name) 은 None 을 반환합니다',
+        'async def 로 정의하고 await 로 기다립니다',
+        'list 와 dict 는 내장 타입이며 True/False 는 bool 입니다',
+        '__str__ 은 문자열 표현을 반환합니다',
+        'self.user_name 속성과 get_value ( ) 호출',
+    ]
+
+    def test_matches_legacy_markup(self):
+        for text in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(wrap_code_elements(text), _legacy_wrap(text))
+
+    def test_wraps_calls_and_identifiers(self):
+        self.assertEqual(
+            wrap_code_elements('__init__() 에서 self 와 user_name 설정'),
+            '`__init__`() 에서 `self` 와 `user_name` 설정'
+        )
+
+    def test_keeps_existing_backticks(self):
+        text = '이미 `self` 가 감싸진 문장의 user_name'
+        self.assertEqual(wrap_code_elements(text), text)
+
+
+class SegmentSentencesTest(SimpleTestCase):
+    """마크다운 인식 문장 분리"""
+
+    def test_removes_code_and_markup(self):
+        text = (
+            '# 제목\n\n'
+            '첫 번째 문장입니다. **두 번째** 문장입니다!\n\n'
+            '```python\nx = 1. y = 2\n```\n'
+            '- 목록 항목은 [링크](https://example.com) 를 포함합니다\n'
+            '- 다음 항목 `code` 입니다'
+        )
+        self.assertEqual(segment_sentences(text), [
+            '제목',
+            '첫 번째 문장입니다',
+            '두 번째 문장입니다',
+            '목록 항목은 링크 를 포함합니다',
+            '다음 항목 입니다',
+        ])
+
+    def test_list_items_are_separate_sentences(self):
+        text = '- 항목 하나\n- 항목 둘'
+        self.assertEqual(segment_sentences(text), ['항목 하나', '항목 둘'])
+
+    def test_hash_inside_sentence_is_kept(self):
+        self.assertEqual(segment_sentences('C# 은 언어입니다'), ['C# 은 언어입니다'])
+
+
+class MeaningfulSentencesTest(SimpleTestCase):
+    """길이 필터와 콘텐츠 해시별 캐시"""
+
+    LONG = '파이썬의 클래스는 인스턴스를 만들기 위한 설계도이며 속성과 메서드를 함께 정의할 수 있습니다'
+
+    def setUp(self):
+        clear_sentence_cache()
+
+    def tearDown(self):
+        clear_sentence_cache()
+
+    def test_filters_by_length_and_limit(self):
+        text = '짧은 문장. ' + '. '.join([self.LONG] * 5) + '.'
+        sentences = meaningful_sentences(text)
+        self.assertEqual(sentences, [self.LONG] * 3)
+        self.assertEqual(meaningful_sentences(text, limit=1), [self.LONG])
+
+    def test_segments_each_body_once(self):
+        with patch('exams.text_processing.segment_sentences', return_value=[self.LONG]) as segment:
+            meaningful_sentences('본문')
+            meaningful_sentences('본문')
+            meaningful_sentences('다른 본문')
+        self.assertEqual(segment.call_count, 2)
+
+
+class BenchmarkTextProcessingCommandTest(TestCase):
+    """벤치마크 커맨드 (DB 가 비어 있으면 내장 샘플 사용)"""
+
+    def test_runs_on_sample_corpus(self):
+        out = StringIO()
+        call_command('benchmark_text_processing', '--repeat', '1', stdout=out)
+        output = out.getvalue()
+        self.assertIn('built-in sample', output)
+        self.assertIn('legacy pipeline', output)
+        self.assertIn('warm cache', output)
@@ -66,9 +66,8 @@ class WeeklyTestListCreateViewTest(TestCase):
         response = self.client.get('/api/exams/')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
-    @patch('exams.views.WeeklyTestListCreateView._is_ai_available')
-    @patch('exams.views.WeeklyTestListCreateView._create_simple_question')
-    def test_create_weekly_test_with_content_ids(self, mock_simple, mock_ai_available):
+    @patch('ai_services.generators.question_generator.ai_question_generator.is_available')
+    def test_create_weekly_test_with_content_ids(self, mock_ai_available):
         """Test creating weekly test with manual content selection."""
         mock_ai_available.return_value = False
 
@@ -86,10 +85,9 @@ class WeeklyTestListCreateViewTest(TestCase):
         test = WeeklyTest.objects.get(id=response.data['id'])
         self.assertEqual(test.user, self.user)
 
-    @patch('exams.views.WeeklyTestListCreateView._is_ai_available')
+    @patch('ai_services.generators.question_generator.ai_question_generator.is_available')
     @patch('ai_services.graphs.select_balanced_contents_for_test')
-    @patch('exams.views.WeeklyTestListCreateView._create_simple_question')
-    def test_create_weekly_test_auto_balance(self, mock_simple, mock_balance, mock_ai_available):
+    def test_create_weekly_test_auto_balance(self, mock_balance, mock_ai_available):
         """Test creating weekly test with auto-balancing."""
         mock_ai_available.return_value = False
         mock_balance.return_value = [c.id for c in self.contents[:7]]
@@ -101,7 +99,7 @@ class WeeklyTestListCreateViewTest(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-    @patch('exams.views.WeeklyTestListCreateView._is_ai_available')
+    @patch('ai_services.generators.question_generator.ai_question_generator.is_available')
     def test_create_weekly_test_ai_unavailable(self, mock_ai_available):
         """Test creating test when AI is unavailable."""
         mock_ai_available.return_value = False
@@ -0,0 +1,144 @@
+"""
+Text processing for rule-based (O/X) question generation
+
+All patterns are compiled once at import. Code markup is applied in a single
+pass with one combined pattern instead of one re.sub per token class, and
+sentence segmentation results are cached per content hash, so regenerating
+questions for the same content (retries, question bank candidates) does not
+re-parse the body.
+
+Used by exams.assembly.build_simple_question, which is the hot path whenever
+AI generation is unavailable.
+"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+# 문장 길이 범위 (이 범위의 문장만 문제로 사용)
+MIN_SENTENCE_LENGTH = 50
+MAX_SENTENCE_LENGTH = 300
+
+# 콘텐츠 해시별 문장 분리 결과 캐시 크기
+SENTENCE_CACHE_SIZE = 2048
+
+# 코드 블록/인라인 코드 (문제 문장에서 제외)
+_CODE = re.compile(r'```.*?```|`[^`]+`', re.DOTALL)
+
+# 마크다운 마크업 (단일 패스): 빈 줄, 줄 앞 헤더/목록/인용 기호 → 블록 경계,
+# 강조 → 제거, 링크/이미지 → 텍스트
+_MARKUP = re.compile(
+    # 앞쪽 전방탐색: 마크업이 시작될 수 없는 위치는 대안을 시도하지 않고 건너뜀
+    r'(?=[\n*!\[ \t#>+\-0-9])'
+    r'(?:\n\s*\n|^[ \t]{0,3}(?:#{1,6}|[-*+]|\d+[.)]|>)[ \t]+|\*\*|!?\[([^\]]*)\]\([^)]*\))',
+    re.MULTILINE
+)
+
+_BLOCK_SEPARATOR = '\x00'
+
+# 문장 경계: 블록 경계, . ! ? 뒤 공백 또는 본문 끝 (구두점은 문장에서 제외)
+_SENTENCE_BREAK = re.compile(r'[.!?]?' + _BLOCK_SEPARATOR + r'|[.!?](?: |$)')
+
+_KEYWORDS = (
+    'def|class|import|from|return|if|else|elif|for|while|try|except|with|as|lambda|yield|async|await'
+)
+_TYPES = 'int|str|float|bool|list|dict|tuple|set|None|True|False'
+
+# 코드 요소 (우선순위 순): 함수/던더 호출(self/cls 제외), 던더, self/cls, 키워드, 타입, snake_case 변수
+_CODE_ELEMENT = re.compile(
+    r'(?<![a-zA-Z0-9_])(?:'
+    r'(?P<call>__[a-zA-Z_]+__|(?!__|(?:self|cls)(?![a-zA-Z0-9_]))[a-zA-Z_][a-zA-Z0-9_]*)\s*\('
+    r'|(?P<word>__[a-zA-Z_]+__|self|cls|' + _KEYWORDS + '|' + _TYPES + r'|[a-z][a-z0-9_]*_[a-z0-9_]+)'
+    r'(?![a-zA-Z0-9_])'
+    r')'
+)
+
+_REPEATED_BACKTICKS = re.compile(r'`{2,}')
+
+_sentence_cache = OrderedDict()
+_sentence_cache_lock = threading.Lock()
+
+
+def _markup_replacement(match):
+    call = match.group('call')
+    if call is not None:
+        return f'`{call}`('
+    return f"`{match.group('word')}`"
+
+
+def wrap_code_elements(text):
+    """코드 요소를 백틱으로 감싸서 마크다운 형식으로 변환 (단일 패스)"""
+    # 이미 백틱으로 감싸진 부분은 보존
+    if '`' in text:
+        return text
+
+    result = _CODE_ELEMENT.sub(_markup_replacement, text)
+    return _REPEATED_BACKTICKS.sub('`', result)
+
+
+def _markup_sub(match):
+    if match.group(1) is not None:
+        return match.group(1)
+    if match.group(0) == '**':
+        return ''
+    return _BLOCK_SEPARATOR
+
+
+def segment_sentences(text):
+    """
+    마크다운 본문을 문장 단위로 분리
+
+    코드 블록과 인라인 코드를 제외하고, 빈 줄/헤더/목록 항목을 블록 경계로,
+    블록 안에서는 . ! ? 뒤 공백을 문장 경계로 사용합니다.
+
+    Returns:
+        list: 공백이 정리된 문장 목록 (끝 구두점 제외)
+    """
+    text = _CODE.sub('', text)
+    text = _MARKUP.sub(_markup_sub, text)
+    text = ' '.join(text.split())
+    sentences = (sentence.strip() for sentence in _SENTENCE_BREAK.split(text))
+    return [sentence for sentence in sentences if sentence]
+
+
+def text_hash(text):
+    """본문 캐시 키"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def cached_sentences(text):
+    """
+    문장 분리 결과 (콘텐츠 해시별 LRU 캐시)
+
+    Returns:
+        tuple: segment_sentences 결과 (캐시 공유용 불변 타입)
+    """
+    key = text_hash(text)
+    with _sentence_cache_lock:
+        sentences = _sentence_cache.get(key)
+        if sentences is not None:
+            _sentence_cache.move_to_end(key)
+            return sentences
+
+    sentences = tuple(segment_sentences(text))
+
+    with _sentence_cache_lock:
+        _sentence_cache[key] = sentences
+        if len(_sentence_cache) > SENTENCE_CACHE_SIZE:
+            _sentence_cache.popitem(last=False)
+    return sentences
+
+
+def meaningful_sentences(text, limit=3):
+    """텍스트에서 문제로 쓸 만한 길이(50-300자)의 문장 추출"""
+    meaningful = [
+        sentence for sentence in cached_sentences(text)
+        if MIN_SENTENCE_LENGTH <= len(sentence) <= MAX_SENTENCE_LENGTH
+    ]
+    return meaningful[:limit]
+
+
+def clear_sentence_cache():
+    """문장 분리 캐시 비우기 (테스트/벤치마크용)"""
+    with _sentence_cache_lock:
+        _sentence_cache.clear()
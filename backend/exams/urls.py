@@ -13,6 +13,7 @@ urlpatterns = [
     # 주간 시험 CRUD (기존)
     path('', views.WeeklyTestListCreateView.as_view(), name='test-list-create'),
     path('<int:pk>/', views.WeeklyTestDetailView.as_view(), name='test-detail'),
+    path('<int:pk>/progress/', views.WeeklyTestProgressView.as_view(), name='test-progress'),
 
     # RESTful test session endpoints
     path('test-sessions/', include(router.urls)),
@@ -1,18 +1,20 @@
+from .assembly import start_test_session
+from .grading import complete_test_session, submit_answers
+from .question_bank import assemble_from_bank
 from .serializers import (
-    CompleteTestSerializer, StartTestSerializer, SubmitAnswerSerializer,
-    WeeklyTestListSerializer, WeeklyTestSerializer,
+    BulkSubmitAnswersSerializer, CompleteTestSerializer, StartTestSerializer, SubmitAnswerSerializer,
+    TestResultAnswerSerializer, WeeklyTestListSerializer, WeeklyTestProgressSerializer,
+    WeeklyTestResultSerializer, WeeklyTestSerializer, questions_prefetch,
 )
 from resee.mixins import UserOwnershipMixin
-from content.models import Content
 import logging
-import random
 
-from django.db import transaction
-from django.utils import timezone
+from django.conf import settings
 from rest_framework import generics, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from .models import WeeklyTest, WeeklyTestAnswer, WeeklyTestQuestion
 
@@ -42,11 +44,8 @@ class WeeklyTestListCreateView(UserOwnershipMixin, generics.ListCreateAPIView):
         # 시험 생성 (preparing 상태)
         weekly_test = serializer.save(user=self.request.user, status='preparing')
 
-        # 이미 문제가 생성되어 있으면 추가 생성하지 않음
-        if weekly_test.questions.exists():
-            logger.info(f"Test {weekly_test.id} already has questions, skipping generation")
-            weekly_test.status = 'pending'
-            weekly_test.save()
+        # 문제 은행에 후보가 충분하면 즉시 구성 (LLM 호출 없음)
+        if assemble_from_bank(weekly_test, content_ids or None):
             return
 
         # Celery task로 비동기 문제 생성
@@ -57,7 +56,6 @@ class WeeklyTestListCreateView(UserOwnershipMixin, generics.ListCreateAPIView):
         """Create 메서드 오버라이드로 주간 제한 확인"""
         from datetime import timedelta
 
-        from django.conf import settings
         from django.utils import timezone
         from rest_framework.exceptions import ValidationError
 
@@ -65,14 +63,16 @@ class WeeklyTestListCreateView(UserOwnershipMixin, generics.ListCreateAPIView):
 
         # 주간 시험 생성 제한 확인 (모든 티어에서 주당 1회)
         # 이번 주에 생성된 시험 개수 확인 (월요일 기준)
-        today = timezone.now().date()
-        week_start = today - timedelta(days=today.weekday())
-        week_end = week_start + timedelta(days=6)
+        from review.utils import local_day_bounds
+
+        today = timezone.localdate()
+        week_start, _ = local_day_bounds(today - timedelta(days=today.weekday()))
+        week_end = week_start + timedelta(days=7)
 
         tests_this_week = WeeklyTest.objects.filter(
             user=user,
-            created_at__date__gte=week_start,
-            created_at__date__lte=week_end
+            created_at__gte=week_start,
+            created_at__lt=week_end
         ).count()
 
         # 구독 설정에서 주간 제한 확인
@@ -88,339 +88,62 @@ class WeeklyTestListCreateView(UserOwnershipMixin, generics.ListCreateAPIView):
 
         return super().create(request, *args, **kwargs)
 
-    def _generate_questions_from_ids(self, weekly_test, content_ids):
-        """전달받은 콘텐츠 ID로 순서대로 문제 생성"""
-        try:
-            with transaction.atomic():
-                # 콘텐츠 조회 (AI 검증된 콘텐츠만)
-                contents = Content.objects.filter(
-                    id__in=content_ids,
-                    author=self.request.user,
-                    is_ai_validated=True
-                )
-
-                # 존재하지 않거나 검증되지 않은 콘텐츠가 있으면 에러
-                if contents.count() != len(content_ids):
-                    return
-
-                # 순서 유지를 위해 딕셔너리 생성 후 재정렬
-                content_dict = {c.id: c for c in contents}
-                ordered_contents = [content_dict[cid] for cid in content_ids]
-
-                # 각 콘텐츠당 1개 문제 생성 (7-10개)
-                for order, content in enumerate(ordered_contents, start=1):
-                    if self._is_ai_available():
-                        success = self._create_ai_question(weekly_test, content, order)
-                        if not success:
-                            self._create_simple_question(weekly_test, content, order)
-                    else:
-                        self._create_simple_question(weekly_test, content, order)
-
-                # 문제 수 업데이트
-                weekly_test.total_questions = weekly_test.questions.count()
-
-                # 문제 생성 완료 후 preparing 상태를 pending으로 변경
-                if weekly_test.status == 'preparing':
-                    weekly_test.status = 'pending'
-
-                weekly_test.save()
-        except Exception as e:
-            logger.error(f"Failed to generate questions from IDs: {e}", exc_info=True)
-            weekly_test.status = 'pending'
-            weekly_test.save()
-            raise
-
-    def _generate_balanced_questions(self, weekly_test):
-        """
-        난이도 균형 맞춰 자동으로 콘텐츠 선택 및 문제 생성
-
-        LangGraph Balance Graph를 사용하여 30% Easy, 50% Medium, 20% Hard 비율로
-        콘텐츠를 자동 선택합니다.
-        """
-        from ai_services.graphs import select_balanced_contents_for_test
-
-        logger.info(f"[Balance] Starting balanced question generation for test {weekly_test.id}")
-
-        # 이미 문제가 생성되어 있으면 스킵
-        if weekly_test.questions.exists():
-            logger.info(f"[Balance] Test {weekly_test.id} already has questions, skipping generation")
-            return
-
-        # 사용자의 AI 검증된 콘텐츠 조회
-        contents = Content.objects.filter(
-            author=self.request.user,
-            is_ai_validated=True
-        ).order_by('-created_at')
-
-        if not contents.exists():
-            logger.warning(f"[Balance] No AI-validated contents for user {self.request.user.id}")
-            weekly_test.status = 'pending'
-            weekly_test.save()
-            return
 
-        # Balance Graph용 데이터 준비
-        content_data = [
-            {
-                'id': content.id,
-                'title': content.title,
-                'content': content.content
-            }
-            for content in contents
-        ]
-
-        # 목표 문제 수 (7-10개, 콘텐츠 수에 따라 조정)
-        target_count = min(10, max(7, len(content_data)))
-
-        logger.info(
-            f"[Balance] Analyzing {len(content_data)} contents "
-            f"for {target_count} balanced questions"
-        )
-
-        try:
-            # LangGraph Balance Graph 실행
-            balance_result = select_balanced_contents_for_test(
-                contents=content_data,
-                target_count=target_count
-            )
-
-            selected_ids = balance_result['selected_content_ids']
-            balance_info = balance_result['balance']
-            difficulty_scores = balance_result['difficulty_scores']
+class WeeklyTestDetailView(UserOwnershipMixin, generics.RetrieveUpdateDestroyAPIView):
+    """주간 시험 상세 조회/수정/삭제"""
 
-            logger.info(
-                f"[Balance] Selected {len(selected_ids)} contents - "
-                f"Easy: {balance_info.get('easy', 0)}, "
-                f"Medium: {balance_info.get('medium', 0)}, "
-                f"Hard: {balance_info.get('hard', 0)}"
-            )
+    serializer_class = WeeklyTestSerializer
+    permission_classes = [IsAuthenticated]
 
-            # 선택된 콘텐츠로 문제 생성 (트랜잭션으로 보호)
-            with transaction.atomic():
-                selected_contents = Content.objects.filter(id__in=selected_ids)
-                content_dict = {c.id: c for c in selected_contents}
-                ordered_contents = [content_dict[cid] for cid in selected_ids]
-
-                # 각 콘텐츠당 1개 문제 생성
-                for order, content in enumerate(ordered_contents, start=1):
-                    if self._is_ai_available():
-                        success = self._create_ai_question(weekly_test, content, order)
-                        if not success:
-                            self._create_simple_question(weekly_test, content, order)
-                    else:
-                        self._create_simple_question(weekly_test, content, order)
-
-                # 밸런스 정보 저장 (메타데이터로)
-                weekly_test.total_questions = weekly_test.questions.count()
-                weekly_test.metadata = {
-                    'balance': balance_info,
-                    'difficulty_scores': {
-                        str(cid): score for cid, score in difficulty_scores.items()
-                    },
-                    'auto_balanced': True
-                }
-
-                # 문제 생성 완료 후 preparing 상태를 pending으로 변경
-                if weekly_test.status == 'preparing':
-                    weekly_test.status = 'pending'
-
-                weekly_test.save()
-
-            logger.info(
-                f"[Balance] Successfully generated {weekly_test.total_questions} "
-                f"balanced questions for test {weekly_test.id}"
-            )
+    def get_queryset(self):
+        return WeeklyTest.objects.filter(user=self.request.user).prefetch_related(questions_prefetch())
 
-        except Exception as e:
-            logger.error(
-                f"[Balance] Failed to generate balanced questions: {e}",
-                exc_info=True
-            )
-            # Fallback: 무작위 선택 (트랜잭션으로 보호)
-            with transaction.atomic():
-                fallback_contents = list(contents[:target_count])
-                for order, content in enumerate(fallback_contents, start=1):
-                    if self._is_ai_available():
-                        self._create_ai_question(weekly_test, content, order)
-                    else:
-                        self._create_simple_question(weekly_test, content, order)
-
-                weekly_test.total_questions = weekly_test.questions.count()
-                weekly_test.status = 'pending'
-                weekly_test.save()
-
-    def _is_ai_available(self):
-        """AI API 사용 가능 여부 확인"""
-        from ai_services.generators.question_generator import (
-            ai_question_generator,
-        )
-        return ai_question_generator.is_available()
 
-    def _create_ai_question(self, weekly_test, content, order):
-        """
-        AI를 사용한 고급 문제 생성
+class WeeklyTestProgressView(APIView):
+    """
+    시험 문제 생성 진행 상황 조회 (generated, total, eta, ready)
 
-        LangGraph 기반 고품질 Distractor 생성 시스템 사용
-        """
-        from ai_services.generators.question_generator import (
-            ai_question_generator,
-        )
+    상세 조회와 달리 문제 목록을 직렬화하지 않는 경량 상태 조회로, 요청 스레드를
+    붙잡지 않도록 대기 없이 즉시 응답합니다. 클라이언트는 ready 가 true 가 되거나
+    preparing 상태가 끝날 때까지 몇 초 간격으로 조회합니다.
+    """
 
-        # 중복 체크: 이미 해당 order에 문제가 있으면 스킵
-        if WeeklyTestQuestion.objects.filter(weekly_test=weekly_test, order=order).exists():
-            logger.info(f"Question at order {order} already exists, skipping")
-            return True
+    permission_classes = [IsAuthenticated]
+    progress_fields = [
+        'id', 'status', 'expected_questions', 'generated_questions', 'generation_started_at',
+    ]
 
-        try:
-            question_data = ai_question_generator.generate_question(content)
-
-            if question_data:
-                WeeklyTestQuestion.objects.create(
-                    weekly_test=weekly_test,
-                    content=content,
-                    question_type=question_data['question_type'],
-                    question_text=question_data['question_text'],
-                    choices=question_data.get('choices'),
-                    correct_answer=question_data['correct_answer'],
-                    explanation=question_data['explanation'],
-                    order=order,
-                    points=10
-                )
-                logger.info(
-                    f"AI question generated (quality: "
-                    f"{question_data.get('metadata', {}).get('quality_score', 0):.1f})"
-                )
-                return True
-            else:
-                self._create_simple_question(weekly_test, content, order)
-                return False
-
-        except Exception as e:
-            logger.error(f"AI generation error: {e}", exc_info=True)
-            self._create_simple_question(weekly_test, content, order)
-            return False
-
-    def _create_simple_question(self, weekly_test, content, order):
-        """간단한 문제 생성 (AI 없이) - 개선된 버전"""
-
-        # 중복 체크: 이미 해당 order에 문제가 있으면 스킵
-        if WeeklyTestQuestion.objects.filter(weekly_test=weekly_test, order=order).exists():
-            logger.info(f"Question at order {order} already exists, skipping simple question creation")
-            return
+    def get(self, request, pk):
+        weekly_test = WeeklyTest.objects.filter(
+            user=request.user, pk=pk
+        ).only(*self.progress_fields).first()
+        if weekly_test is None:
+            return Response({'error': '존재하지 않는 시험입니다.'}, status=status.HTTP_404_NOT_FOUND)
 
-        # 콘텐츠에서 의미있는 문장 추출
-        sentences = self._extract_meaningful_sentences(content.content)
-
-        if not sentences:
-            # 문장 추출 실패 시 전체 내용 사용
-            sentences = [content.content[:200]]
-
-        # 첫 번째 의미있는 문장을 문제로 사용
-        selected_sentence = sentences[0] if sentences else content.content[:200]
-
-        # 코드 요소를 백틱으로 감싸기
-        selected_sentence = self._wrap_code_elements(selected_sentence)
-
-        # O/X 문제 생성 (50% 확률로 O 또는 X)
-        is_correct_statement = random.choice([True, False])
-
-        if is_correct_statement:
-            # 실제 내용을 그대로 사용 (정답: O)
-            question_text = f"'{content.title}'에 대한 다음 설명이 맞습니까? (O/X)\n\n{selected_sentence}"
-            correct_answer = "O"
-            explanation = f"O - 학습 내용에 정확히 포함된 내용입니다."
-        else:
-            # 내용을 살짝 변형하여 오답 생성 (정답: X)
-            modified_sentence = self._create_modified_statement(content.title, selected_sentence)
-            modified_sentence = self._wrap_code_elements(modified_sentence)
-            question_text = f"'{content.title}'에 대한 다음 설명이 맞습니까? (O/X)\n\n{modified_sentence}"
-            correct_answer = "X"
-            explanation = f"X - 학습 내용과 다릅니다. 정확한 내용: {selected_sentence[:100]}..."
-
-        WeeklyTestQuestion.objects.create(
-            weekly_test=weekly_test,
-            content=content,
-            question_type='true_false',
-            question_text=question_text,
-            choices=None,
-            correct_answer=correct_answer,
-            explanation=explanation,
-            order=order,
-            points=10
-        )
+        data = WeeklyTestProgressSerializer(weekly_test).data
+        data['min_ready_questions'] = settings.EXAM_SETTINGS['MIN_READY_QUESTIONS']
+        return Response(data, status=status.HTTP_200_OK)
 
-    def _extract_meaningful_sentences(self, text):
-        """텍스트에서 의미있는 문장 추출"""
-        import re
-
-        # 마크다운 헤더, 코드 블록 등 제거
-        text = re.sub(r'#+\s+', '', text)  # 헤더 제거
-        text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)  # 코드 블록 제거
-        text = re.sub(r'`[^`]+`', '', text)  # 인라인 코드 제거
-
-        # 문장 분리 (. ! ? 기준)
-        sentences = re.split(r'[.!?]\s+', text)
-
-        # 의미있는 길이의 문장만 필터링 (50-300자)
-        meaningful = [s.strip() for s in sentences if 50 <= len(s.strip()) <= 300]
-
-        return meaningful[:3]  # 최대 3개 반환
-
-    def _create_modified_statement(self, title, original_sentence):
-        """문장을 살짝 변형하여 오답 생성"""
-        # 간단한 부정 또는 수정을 통해 오답 만들기
-        modifications = [
-            f"{original_sentence.replace('입니다', '가 아닙니다').replace('합니다', '하지 않습니다')}",
-            f"{title}은(는) 다른 개념과 관련이 없습니다.",
-            f"{original_sentence[:50]}... 는 잘못된 설명입니다.",
-        ]
-
-        return random.choice(modifications)
-
-    def _wrap_code_elements(self, text):
-        """코드 요소를 백틱으로 감싸서 마크다운 형식으로 변환"""
-        import re
-
-        # 이미 백틱으로 감싸진 부분은 보존
-        if '`' in text:
-            return text
-
-        # 코드 패턴들 정의
-        # 한글과 함께 사용되므로 \b 대신 (?<![a-zA-Z0-9_])와 (?![a-zA-Z0-9_]) 사용
-        patterns = [
-            # 던더 메서드 (__init__, __str__ 등) - 괄호 포함
-            (r'(__[a-zA-Z_]+__)\s*\(', r'`\1`('),
-            # 던더 메서드 (__init__, __str__ 등) - 괄호 없음
-            (r'(?<![a-zA-Z0-9_])(__[a-zA-Z_]+__)(?![a-zA-Z0-9_])', r'`\1`'),
-            # self, cls 같은 특수 키워드 (한글 앞뒤 허용)
-            (r'(?<![a-zA-Z0-9_])(self|cls)(?![a-zA-Z0-9_])', r'`\1`'),
-            # 함수/메서드 호출 (괄호 포함, 던더 메서드 제외)
-            (r'(?<![a-zA-Z0-9_])(?!__)([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', r'`\1`('),
-            # 파이썬 키워드들
-            (r'(?<![a-zA-Z0-9_])(def|class|import|from|return|if|else|elif|for|while|try|except|with|as|lambda|yield|async|await)(?![a-zA-Z0-9_])', r'`\1`'),
-            # 타입 힌트나 타입 이름
-            (r'(?<![a-zA-Z0-9_])(int|str|float|bool|list|dict|tuple|set|None|True|False)(?![a-zA-Z0-9_])', r'`\1`'),
-            # 변수명 패턴 (언더스코어 포함)
-            (r'(?<![a-zA-Z0-9_])([a-z][a-z0-9_]*_[a-z0-9_]+)(?![a-zA-Z0-9_])', r'`\1`'),
-        ]
-
-        result = text
-        for pattern, replacement in patterns:
-            result = re.sub(pattern, replacement, result)
-
-        # 중복 백틱 제거 (예: ``code``)
-        result = re.sub(r'`+', '`', result)
-
-        return result
 
+def build_test_results(weekly_test, user):
+    """
+    시험 결과 응답 생성
 
-class WeeklyTestDetailView(UserOwnershipMixin, generics.RetrieveUpdateDestroyAPIView):
-    """주간 시험 상세 조회/수정/삭제"""
+    문제와 답변을 각각 한 번의 쿼리로 로드하며, 콘텐츠는 제목만 조인합니다.
+    """
+    answers = WeeklyTestAnswer.objects.filter(
+        question__weekly_test=weekly_test,
+        user=user
+    ).select_related('question', 'question__content').only(
+        'user_answer', 'is_correct', 'points_earned', 'ai_score', 'ai_feedback',
+        'question__id', 'question__question_text', 'question__question_type',
+        'question__correct_answer', 'question__explanation', 'question__content__title'
+    ).order_by('question__order')
 
-    serializer_class = WeeklyTestSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        return WeeklyTest.objects.filter(user=self.request.user)
+    return {
+        'test': WeeklyTestResultSerializer(weekly_test).data,
+        'answers': TestResultAnswerSerializer(answers, many=True).data
+    }
 
 
 @api_view(['POST'])
@@ -431,16 +154,12 @@ def start_test(request):
 
     if serializer.is_valid():
         test_id = serializer.validated_data['test_id']
-        weekly_test = WeeklyTest.objects.get(id=test_id)
 
-        # 시험 상태 업데이트 (pending인 경우에만)
-        if weekly_test.status == 'pending':
-            weekly_test.status = 'in_progress'
-            weekly_test.started_at = timezone.now()
-            weekly_test.save()
-            message = '시험이 시작되었습니다.'
-        else:
-            message = '시험을 계속합니다.'
+        # 시험 상태 업데이트 (pending 또는 일부 문제가 준비된 preparing 인 경우)
+        # 문제 세트가 고정된 뒤에 문제를 로드하므로 응답의 문제가 채점 대상 전체와 일치
+        started = start_test_session(test_id)
+        weekly_test = WeeklyTest.objects.prefetch_related(questions_prefetch()).get(id=test_id)
+        message = '시험이 시작되었습니다.' if started else '시험을 계속합니다.'
 
         # 시험 정보 반환
         test_serializer = WeeklyTestSerializer(weekly_test)
@@ -495,22 +214,8 @@ def complete_test(request):
         test_id = serializer.validated_data['test_id']
         weekly_test = WeeklyTest.objects.get(id=test_id)
 
-        # 시험 완료 처리
-        weekly_test.status = 'completed'
-        weekly_test.completed_at = timezone.now()
-
-        # 소요 시간 계산
-        if weekly_test.started_at:
-            weekly_test.time_spent = weekly_test.completed_at - weekly_test.started_at
-
-        # 점수 계산
-        answered_questions = WeeklyTestAnswer.objects.filter(
-            question__weekly_test=weekly_test,
-            user=request.user
-        )
-
-        weekly_test.correct_answers = answered_questions.filter(is_correct=True).count()
-        weekly_test.calculate_score()
+        # 시험 완료 처리 및 점수 계산
+        complete_test_session(weekly_test, request.user)
 
         return Response({
             'message': '시험이 완료되었습니다.',
@@ -528,42 +233,16 @@ def complete_test(request):
 def test_results(request, test_id):
     """시험 결과 조회"""
     try:
-        weekly_test = WeeklyTest.objects.get(id=test_id, user=request.user)
+        weekly_test = WeeklyTest.objects.prefetch_related(
+            questions_prefetch(include_answers=True)
+        ).get(id=test_id, user=request.user)
 
         if weekly_test.status != 'completed':
             return Response({
                 'error': '완료된 시험이 아닙니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # 답변 내역 조회
-        answers = WeeklyTestAnswer.objects.filter(
-            question__weekly_test=weekly_test,
-            user=request.user
-        ).select_related('question', 'question__content')
-
-        result_data = {
-            'test': WeeklyTestSerializer(weekly_test).data,
-            'answers': []
-        }
-
-        for answer in answers:
-            result_data['answers'].append({
-                'question': {
-                    'id': answer.question.id,
-                    'question_text': answer.question.question_text,
-                    'question_type': answer.question.question_type,
-                    'correct_answer': answer.question.correct_answer,
-                    'explanation': answer.question.explanation,
-                    'content_title': answer.question.content.title
-                },
-                'user_answer': answer.user_answer,
-                'is_correct': answer.is_correct,
-                'points_earned': answer.points_earned,
-                'ai_score': answer.ai_score,
-                'ai_feedback': answer.ai_feedback
-            })
-
-        return Response(result_data, status=status.HTTP_200_OK)
+        return Response(build_test_results(weekly_test, request.user), status=status.HTTP_200_OK)
 
     except WeeklyTest.DoesNotExist:
         return Response({
@@ -578,6 +257,7 @@ class TestSessionViewSet(viewsets.GenericViewSet):
     Endpoints:
     - POST /test-sessions/ - Start test session
     - POST /test-sessions/{id}/answers/ - Submit answer to session
+    - POST /test-sessions/{id}/answers/bulk/ - Submit several answers and update score
     - PATCH /test-sessions/{id}/ - Complete test session
     - GET /test-sessions/{id}/results/ - Get test results
     """
@@ -603,16 +283,11 @@ class TestSessionViewSet(viewsets.GenericViewSet):
 
         if serializer.is_valid():
             test_id = serializer.validated_data['test_id']
-            weekly_test = WeeklyTest.objects.get(id=test_id)
 
-            # 시험 상태 업데이트 (pending인 경우에만)
-            if weekly_test.status == 'pending':
-                weekly_test.status = 'in_progress'
-                weekly_test.started_at = timezone.now()
-                weekly_test.save()
-                message = '시험이 시작되었습니다.'
-            else:
-                message = '시험을 계속합니다.'
+            # 시험 상태 업데이트 (pending 또는 일부 문제가 준비된 preparing 인 경우)
+            started = start_test_session(test_id)
+            weekly_test = WeeklyTest.objects.prefetch_related(questions_prefetch()).get(id=test_id)
+            message = '시험이 시작되었습니다.' if started else '시험을 계속합니다.'
 
             # 시험 정보 반환
             test_serializer = WeeklyTestSerializer(weekly_test)
@@ -676,6 +351,60 @@ class TestSessionViewSet(viewsets.GenericViewSet):
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=True, methods=['post'], url_path='answers/bulk')
+    def submit_answers_bulk(self, request, pk=None):
+        """
+        POST /test-sessions/{id}/answers/bulk/
+        Submit several answers at once and update the test score
+
+        Questions are loaded in one query, answers are graded in memory and
+        upserted in one statement together with the score update.
+
+        Request body:
+            - answers (required): [{question_id, user_answer}, ...]
+
+        Response:
+            - message: Success message
+            - answers: [{question_id, is_correct, points_earned}, ...]
+            - correct_answers: Correct answers so far
+            - score_percentage: Score so far
+        """
+        try:
+            test_session = self.get_queryset().get(pk=pk)
+        except WeeklyTest.DoesNotExist:
+            return Response({
+                'error': '존재하지 않는 시험입니다.'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        if test_session.status == 'completed':
+            return Response({
+                'error': '이미 완료된 시험입니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = BulkSubmitAnswersSerializer(
+            data=request.data,
+            context={'request': request, 'weekly_test': test_session}
+        )
+
+        if serializer.is_valid():
+            answers = submit_answers(test_session, request.user, serializer.validated_data['pairs'])
+
+            return Response({
+                'message': f'{len(answers)}개의 답변이 저장되었습니다.',
+                'answers': [
+                    {
+                        'question_id': answer.question_id,
+                        'is_correct': answer.is_correct,
+                        'points_earned': answer.points_earned
+                    }
+                    for answer in answers
+                ],
+                'correct_answers': test_session.correct_answers,
+                'score_percentage': test_session.score_percentage
+            }, status=status.HTTP_201_CREATED)
+
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
     def partial_update(self, request, pk=None):
         """
         PATCH /test-sessions/{id}/
@@ -705,22 +434,8 @@ class TestSessionViewSet(viewsets.GenericViewSet):
                 'error': '진행 중인 시험이 아닙니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Complete test - implement logic directly
-        weekly_test.status = 'completed'
-        weekly_test.completed_at = timezone.now()
-
-        # Calculate time spent
-        if weekly_test.started_at:
-            weekly_test.time_spent = weekly_test.completed_at - weekly_test.started_at
-
-        # Calculate score
-        answered_questions = WeeklyTestAnswer.objects.filter(
-            question__weekly_test=weekly_test,
-            user=request.user
-        )
-
-        weekly_test.correct_answers = answered_questions.filter(is_correct=True).count()
-        weekly_test.calculate_score()
+        # Complete test and calculate score
+        complete_test_session(weekly_test, request.user)
 
         return Response({
             'message': '시험이 완료되었습니다.',
@@ -741,42 +456,16 @@ class TestSessionViewSet(viewsets.GenericViewSet):
             - answers: List of all answers with questions
         """
         try:
-            weekly_test = self.get_queryset().get(pk=pk)
+            weekly_test = self.get_queryset().prefetch_related(
+                questions_prefetch(include_answers=True)
+            ).get(pk=pk)
 
             if weekly_test.status != 'completed':
                 return Response({
                     'error': '완료된 시험이 아닙니다.'
                 }, status=status.HTTP_400_BAD_REQUEST)
 
-            # 답변 내역 조회
-            answers = WeeklyTestAnswer.objects.filter(
-                question__weekly_test=weekly_test,
-                user=request.user
-            ).select_related('question', 'question__content')
-
-            result_data = {
-                'test': WeeklyTestSerializer(weekly_test).data,
-                'answers': []
-            }
-
-            for answer in answers:
-                result_data['answers'].append({
-                    'question': {
-                        'id': answer.question.id,
-                        'question_text': answer.question.question_text,
-                        'question_type': answer.question.question_type,
-                        'correct_answer': answer.question.correct_answer,
-                        'explanation': answer.question.explanation,
-                        'content_title': answer.question.content.title
-                    },
-                    'user_answer': answer.user_answer,
-                    'is_correct': answer.is_correct,
-                    'points_earned': answer.points_earned,
-                    'ai_score': answer.ai_score,
-                    'ai_feedback': answer.ai_feedback
-                })
-
-            return Response(result_data, status=status.HTTP_200_OK)
+            return Response(build_test_results(weekly_test, request.user), status=status.HTTP_200_OK)
 
         except WeeklyTest.DoesNotExist:
             return Response({
@@ -0,0 +1,55 @@
+"""
+Per-process background workers.
+
+Threads do not survive fork, so a background thread started at import time
+is missing in gunicorn/Celery worker processes. ProcessLocal creates its
+value (typically a queue with the thread consuming it) lazily on first use
+in each process instead.
+"""
+import os
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class ProcessLocal(Generic[T]):
+    """
+    Value created by `factory` once per process, on first `get()`
+
+    Arguments of `get()` are passed to the factory when the value is created.
+
+    Usage:
+        sender = ProcessLocal(start_sender)  # start_sender() -> queue.Queue
+        sender.get().put_nowait(item)
+    """
+
+    def __init__(self, factory: Callable[..., T]):
+        self.factory = factory
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._value: Optional[T] = None
+
+    def get(self, *args) -> T:
+        """Value of the current process, created if needed"""
+        pid = os.getpid()
+        if self._pid == pid:
+            return self._value
+
+        with self._lock:
+            if self._pid != pid:
+                self._value = self.factory(*args)
+                self._pid = pid
+            return self._value
+
+    def peek(self) -> Optional[T]:
+        """Value of the current process without creating it (None if not started here)"""
+        return self._value if self._pid == os.getpid() else None
+
+    def clear(self) -> Optional[T]:
+        """Forget the value so the next `get()` creates a new one; returns the current process' value"""
+        with self._lock:
+            value = self.peek()
+            self._pid = None
+            self._value = None
+            return value
@@ -19,16 +19,37 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
 # Explicitly import tasks from subdirectories
-app.autodiscover_tasks(['accounts.email'])
+app.autodiscover_tasks(['accounts.email', 'resee'])
 
 # Note: Using DatabaseScheduler (django-celery-beat) for dynamic task scheduling
 # All periodic tasks are managed through Django admin or PeriodicTask model
 
 # Static beat schedule for critical tasks
 app.conf.beat_schedule = {
-    'hourly-review-notifications': {
-        'task': 'review.tasks.send_hourly_notifications',
-        'schedule': crontab(minute=0, hour='*'),
+    'due-review-reminders': {
+        'task': 'review.tasks.send_due_review_reminders',
+        'schedule': crontab(minute='*/5'),  # Reminders go out within 5 minutes of the user's local time
+    },
+    'nightly-review-stats-compaction': {
+        'task': 'review.tasks.compact_daily_review_stats',
+        'schedule': crontab(minute=10, hour=3),
+    },
+    'nightly-reminder-delivery-prune': {
+        'task': 'review.tasks.prune_reminder_deliveries',
+        'schedule': crontab(minute=20, hour=3),
+    },
+    'nightly-question-bank-build': {
+        'task': 'exams.tasks.build_question_bank',
+        'schedule': crontab(minute=30, hour=2),
+    },
+    'resume-account-deletions': {
+        'task': 'accounts.tasks.resume_account_deletions',
+        'schedule': crontab(minute='*/10'),
+    },
+    'refresh-health-snapshot': {
+        'task': 'resee.tasks.refresh_health_snapshot',
+        'schedule': 30.0,
+        'options': {'expires': 30},  # Skip runs that would only pile up while workers are down
     },
 }
 
@@ -0,0 +1,181 @@
+"""
+Health snapshot for infrastructure monitoring.
+
+The refresh_health_snapshot beat task probes the database, Redis and the
+Celery workers on a fixed cadence and stores the result in the shared
+cache. detailed_health_check serves that snapshot with its age instead of
+probing on every request, so orchestrator probes cost one cache read (or a
+process-local memo hit) and never wait on the broker.
+"""
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = 'health:snapshot'
+
+# Process-local copy of the last snapshot read from the cache
+_local_snapshot: Dict[str, Any] = {'snapshot': None, 'fetched_at': 0.0}
+
+
+def _health_settings() -> Dict[str, Any]:
+    return settings.HEALTH_CHECK_SETTINGS
+
+
+def _snapshot_cache():
+    return caches[_health_settings()['CACHE_ALIAS']]
+
+
+def probe_database() -> Dict[str, Any]:
+    """Database connectivity"""
+    connection.ensure_connection()
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    return {'status': 'ok'}
+
+
+def probe_redis() -> Dict[str, Any]:
+    """Redis connectivity (throttle cache)"""
+    cache = caches['throttle']
+    cache.set('health_check', 'ok', 10)
+    if cache.get('health_check') != 'ok':
+        raise Exception("Cache set/get mismatch")
+    cache.delete('health_check')
+    return {'status': 'ok'}
+
+
+def probe_celery() -> Dict[str, Any]:
+    """Celery workers, via the project app (no new app or inspect broadcast per probe)"""
+    from resee.celery import app
+
+    replies = app.control.ping(timeout=_health_settings()['CELERY_PING_TIMEOUT'])
+    if replies:
+        return {'status': 'ok', 'workers': len(replies)}
+    # No workers found but broker might be ok
+    return {'status': 'degraded', 'warning': 'No active workers found'}
+
+
+PROBES = (
+    ('database', probe_database),
+    ('redis', probe_redis),
+    ('celery', probe_celery),
+)
+
+
+def run_probes() -> Dict[str, Any]:
+    """
+    Probe every component once.
+
+    Returns:
+        dict: snapshot with 'status' ('ok' or 'degraded'), 'services' and 'checked_at' (epoch seconds)
+    """
+    started = time.monotonic()
+    services = {}
+    for name, probe in PROBES:
+        try:
+            services[name] = probe()
+        except Exception as e:
+            services[name] = {'status': 'error', 'error': str(e)}
+            logger.error(f"{name} health check failed: {e}")
+
+    healthy = all(service['status'] != 'error' for service in services.values())
+    return {
+        'status': 'ok' if healthy else 'degraded',
+        'services': services,
+        'checked_at': time.time(),
+        'probe_duration_ms': round((time.monotonic() - started) * 1000, 2),
+    }
+
+
+def _alert_transitions(previous: Optional[Dict[str, Any]], snapshot: Dict[str, Any]) -> None:
+    """Slack alerts only when a component goes down or recovers, not on every probe"""
+    from utils.slack_notifications import slack_notifier
+
+    previous_services = (previous or {}).get('services', {})
+    for name, service in snapshot['services'].items():
+        was_down = previous_services.get(name, {}).get('status') == 'error'
+        is_down = service['status'] == 'error'
+        if is_down and not was_down:
+            slack_notifier.send_health_alert(service=name, status='down', details=service.get('error'))
+        elif was_down and not is_down:
+            slack_notifier.send_health_alert(service=name, status='recovered')
+
+
+def refresh_snapshot() -> Dict[str, Any]:
+    """
+    Probe all components and publish the snapshot to the shared cache.
+
+    Returns:
+        dict: the new snapshot
+    """
+    snapshot = run_probes()
+    cache = _snapshot_cache()
+
+    try:
+        previous = cache.get(SNAPSHOT_KEY)
+    except Exception:
+        previous = None
+    _alert_transitions(previous, snapshot)
+
+    try:
+        cache.set(SNAPSHOT_KEY, snapshot, _health_settings()['STALE_AFTER_SECONDS'] * 10)
+    except Exception as e:
+        logger.error(f"Failed to store health snapshot: {e}")
+    return snapshot
+
+
+def get_snapshot() -> Optional[Dict[str, Any]]:
+    """
+    Latest snapshot, memoized per process for LOCAL_TTL_SECONDS.
+
+    Raises:
+        Exception: the shared cache could not be read
+    """
+    now = time.monotonic()
+    if _local_snapshot['snapshot'] is not None and \
+            now - _local_snapshot['fetched_at'] < _health_settings()['LOCAL_TTL_SECONDS']:
+        return _local_snapshot['snapshot']
+
+    snapshot = _snapshot_cache().get(SNAPSHOT_KEY)
+    _local_snapshot.update(snapshot=snapshot, fetched_at=now)
+    return snapshot
+
+
+def clear_local_snapshot() -> None:
+    """Drop the process-local copy (tests)"""
+    _local_snapshot.update(snapshot=None, fetched_at=0.0)
+
+
+def health_report() -> tuple:
+    """
+    Snapshot with staleness metadata for the detailed health endpoint.
+
+    Returns:
+        tuple: (report dict, healthy bool). Missing, unreadable or stale
+               snapshots are reported as unhealthy.
+    """
+    try:
+        snapshot = get_snapshot()
+    except Exception as e:
+        logger.error(f"Health snapshot unavailable: {e}")
+        return {'status': 'unknown', 'error': f'Health snapshot unavailable: {e}', 'services': {}}, False
+
+    if snapshot is None:
+        return {'status': 'unknown', 'error': 'No health snapshot yet', 'services': {}}, False
+
+    age = max(time.time() - snapshot['checked_at'], 0.0)
+    stale = age > _health_settings()['STALE_AFTER_SECONDS']
+    report = {
+        'status': 'stale' if stale else snapshot['status'],
+        'timestamp': datetime.fromtimestamp(snapshot['checked_at'], tz=timezone.utc).isoformat(),
+        'age_seconds': round(age, 1),
+        'stale': stale,
+        'services': snapshot['services'],
+    }
+    return report, snapshot['status'] == 'ok' and not stale
@@ -1,13 +1,64 @@
 """
 Structured JSON logging configuration for Resee application.
 
-This module provides JSON-formatted logging for better log aggregation and analysis.
+This module provides JSON-formatted logging for better log aggregation and analysis,
+plus an asynchronous handler so request threads never wait on log I/O:
+
+- AsyncHandler enqueues records; one background listener thread per process
+  runs the real (file/console) handlers.
+- JSONFormatter serializes each record once, with a cached extra-key
+  whitelist and orjson when it is installed.
+- SamplingFilter keeps a fraction of high-volume INFO/DEBUG records.
 """
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
+import queue
+import random
+import time
 import traceback
-from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from .background import ProcessLocal
+
+
+# Standard LogRecord attributes (never emitted as extra fields)
+RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord('', logging.INFO, '', 0, '', (), None))
+) | {'message', 'asctime'}
+
+# Contextual extra fields, emitted first (record attribute -> JSON key)
+CONTEXT_FIELDS = {
+    'user_id': 'user_id',
+    'request_id': 'request_id',
+    'ip_address': 'ip_address',
+    'endpoint': 'endpoint',
+    'method': 'method',
+    'status_code': 'status_code',
+    'duration': 'duration_ms',
+}
+
+# Distinct record attribute layouts kept in the extra-key cache
+KEY_CACHE_SIZE = 512
+
+
+def _type_name(value: Any) -> str:
+    """Non-serializable values (WSGIRequest, etc.) are logged as their type name"""
+    return type(value).__name__
+
+
+if orjson is not None:
+    def _dumps(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data, default=_type_name, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    _dumps = json.JSONEncoder(default=_type_name).encode
 
 
 class JSONFormatter(logging.Formatter):
@@ -15,8 +66,35 @@ class JSONFormatter(logging.Formatter):
     Custom JSON formatter for structured logging.
 
     Outputs logs in JSON format for easy parsing by log aggregation tools.
+    The extra keys of a record are computed once per attribute layout and
+    the record is serialized in a single pass.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._key_cache: Dict[Tuple[str, ...], Tuple[Tuple[str, str], ...]] = {}
+
+    def _extra_keys(self, record: logging.LogRecord) -> Tuple[Tuple[str, str], ...]:
+        """
+        (record attribute, JSON key) pairs for the extra fields of a record.
+
+        Records from the same call site share an attribute layout, so the
+        whitelist is cached by the tuple of attribute names.
+        """
+        layout = tuple(record.__dict__)
+        keys = self._key_cache.get(layout)
+        if keys is None:
+            context = [(key, CONTEXT_FIELDS[key]) for key in CONTEXT_FIELDS if key in record.__dict__]
+            others = [
+                (key, key) for key in layout
+                if key not in RESERVED_ATTRS and key not in CONTEXT_FIELDS and not key.startswith('_')
+            ]
+            keys = tuple(context + others)
+            if len(self._key_cache) >= KEY_CACHE_SIZE:
+                self._key_cache.clear()
+            self._key_cache[layout] = keys
+        return keys
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format the log record as JSON.
@@ -27,8 +105,10 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
+        # record.created: formatting may run later on the listener thread
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created))
         log_data: Dict[str, Any] = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': f'{timestamp}.{int(record.msecs):03d}Z',
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -45,40 +125,166 @@ class JSONFormatter(logging.Formatter):
                 'traceback': traceback.format_exception(*record.exc_info)
             }
 
-        # Add custom fields from extra parameter
-        if hasattr(record, 'user_id'):
-            log_data['user_id'] = record.user_id
-        if hasattr(record, 'request_id'):
-            log_data['request_id'] = record.request_id
-        if hasattr(record, 'ip_address'):
-            log_data['ip_address'] = record.ip_address
-        if hasattr(record, 'endpoint'):
-            log_data['endpoint'] = record.endpoint
-        if hasattr(record, 'method'):
-            log_data['method'] = record.method
-        if hasattr(record, 'status_code'):
-            log_data['status_code'] = record.status_code
-        if hasattr(record, 'duration'):
-            log_data['duration_ms'] = record.duration
-
-        # Add any other extra fields
-        for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'created', 'filename', 'funcName',
-                          'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                          'message', 'pathname', 'process', 'processName',
-                          'relativeCreated', 'thread', 'threadName', 'exc_info',
-                          'exc_text', 'stack_info', 'user_id', 'request_id',
-                          'ip_address', 'endpoint', 'method', 'status_code', 'duration']:
-                if not key.startswith('_'):
-                    # Only add JSON serializable values
-                    try:
-                        json.dumps(value)
-                        log_data[key] = value
-                    except (TypeError, ValueError):
-                        # Skip non-serializable objects (WSGIRequest, etc.)
-                        log_data[key] = str(type(value).__name__)
-
-        return json.dumps(log_data)
+        # Add contextual and other extra fields
+        attributes = record.__dict__
+        for key, name in self._extra_keys(record):
+            log_data[name] = attributes[key]
+
+        try:
+            return _dumps(log_data)
+        except (TypeError, ValueError, OverflowError):
+            # Circular or out-of-range values: fall back to checking field by field
+            return json.dumps(self._sanitize(log_data))
+
+    @staticmethod
+    def _sanitize(log_data: Dict[str, Any]) -> Dict[str, Any]:
+        sanitized = {}
+        for key, value in log_data.items():
+            try:
+                json.dumps(value)
+                sanitized[key] = value
+            except (TypeError, ValueError, OverflowError):
+                sanitized[key] = _type_name(value)
+        return sanitized
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of high-volume low-level records.
+
+    Records above `level` (WARNING and up by default) always pass. Kept
+    records carry `sample_rate` so aggregators can re-weight counts.
+
+    Args:
+        rate: Fraction of records to keep (0.0-1.0, 1.0 disables sampling)
+        loggers: Logger name prefixes to sample (optional, default all)
+        level: Highest level that is sampled
+    """
+
+    def __init__(self, rate: float = 1.0, loggers: Optional[Iterable[str]] = None,
+                 level: int = logging.INFO):
+        super().__init__()
+        self.rate = max(0.0, min(float(rate), 1.0))
+        self.prefixes = tuple(loggers or ())
+        self.level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+        self._sampled_names: Dict[str, bool] = {}
+
+    def _is_sampled(self, name: str) -> bool:
+        sampled = self._sampled_names.get(name)
+        if sampled is None:
+            sampled = not self.prefixes or any(
+                name == prefix or name.startswith(prefix + '.') for prefix in self.prefixes
+            )
+            self._sampled_names[name] = sampled
+        return sampled
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or record.levelno > self.level or not self._is_sampled(record.name):
+            return True
+        if random.random() < self.rate:
+            record.sample_rate = self.rate
+            return True
+        return False
+
+
+class _Dispatcher(logging.handlers.QueueListener):
+    """Listener thread shared by all AsyncHandlers: each item names its target handlers"""
+
+    def handle(self, item):
+        owner, record = item
+        for handler in owner.targets():
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def enqueue_sentinel(self):
+        # Wait for room instead of failing when the queue is full at shutdown
+        self.queue.put(self._sentinel)
+
+
+def _start_listener(maxsize: int) -> _Dispatcher:
+    listener = _Dispatcher(queue.Queue(maxsize))
+    listener.start()
+    return listener
+
+
+_listener: ProcessLocal[_Dispatcher] = ProcessLocal(_start_listener)
+
+
+def _get_queue(maxsize: int) -> queue.Queue:
+    """Queue of the running listener, started lazily once per process"""
+    return _listener.get(maxsize).queue
+
+
+def stop_async_logging() -> None:
+    """Flush queued records and stop the listener thread (registered with atexit)"""
+    listener = _listener.clear()
+    if listener is not None and listener._thread:
+        listener.stop()
+
+
+# Runs before logging.shutdown (atexit is LIFO), so targets are still open
+atexit.register(stop_async_logging)
+
+
+def _handler_by_name(name: str) -> Optional[logging.Handler]:
+    get_handler = getattr(logging, 'getHandlerByName', None)  # Python 3.12+
+    if get_handler is not None:
+        return get_handler(name)
+    return logging._handlers.get(name)
+
+
+class AsyncHandler(logging.handlers.QueueHandler):
+    """
+    Non-blocking handler that forwards records to other configured handlers.
+
+    The calling thread only copies the record and enqueues it; the target
+    handlers (file, console, ...) run on a background listener thread.
+    When the queue is full the record is dropped rather than blocking the
+    request, and counted in `dropped`.
+
+    Usage (dictConfig):
+        'async_app': {
+            '()': 'resee.logging_config.AsyncHandler',
+            'handlers': ['console', 'file'],
+        }
+
+    Args:
+        handlers: Names of configured handlers to run on the listener thread
+        maxsize: Queue capacity shared by all AsyncHandlers in the process
+    """
+
+    def __init__(self, handlers: List[str], maxsize: int = 10000):
+        super().__init__(None)
+        self.handler_names = list(handlers)
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._targets: Optional[List[logging.Handler]] = None
+
+    def targets(self) -> List[logging.Handler]:
+        """Target handlers, resolved by name after logging configuration finished"""
+        if self._targets is None:
+            self._targets = [
+                handler for handler in map(_handler_by_name, self.handler_names)
+                if handler is not None
+            ]
+        return self._targets
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge args into the message on the calling thread (args may be mutated
+        later), but leave exception formatting to the listener thread.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            _get_queue(self.maxsize).put_nowait((self, record))
+        except queue.Full:
+            self.dropped += 1
 
 
 class StructuredLogger:
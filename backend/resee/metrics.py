@@ -134,6 +134,33 @@ def business_metrics(request):
     return Response(metrics, status=status.HTTP_200_OK)
 
 
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def ai_usage_metrics(request):
+    """
+    Get AI token usage against the token budgets.
+
+    Returns tokens used in the current minute window and today's per-model
+    call and token counters, plus calls queued or rejected by the budgets,
+    and the circuit breaker state of each model in this process.
+
+    **Requires:** Admin authentication
+    """
+    from ai_services.base import token_governor
+    from ai_services.resilience import breaker_states
+
+    try:
+        usage = token_governor.usage()
+    except Exception as e:
+        return Response({'error': f'AI usage unavailable: {e}'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    return Response({
+        'timestamp': timezone.now().isoformat(),
+        'usage': usage,
+        'circuit_breakers': breaker_states(),
+    }, status=status.HTTP_200_OK)
+
+
 def _get_system_metrics() -> Dict[str, Any]:
     """Get system resource metrics"""
     try:
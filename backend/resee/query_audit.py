@@ -0,0 +1,310 @@
+"""
+Query plan audit for hot queries
+
+Seeds synthetic review volume and runs EXPLAIN on the queries that sit on
+request and task hot paths, flagging plans that full-scan the queried
+table. Used by the audit_query_plans management command and the tests.
+
+Supports SQLite and PostgreSQL plan output.
+"""
+import logging
+import random
+import re
+import statistics
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+logger = logging.getLogger(__name__)
+
+HotQuery = namedtuple('HotQuery', ['name', 'model', 'build'])
+
+AuditResult = namedtuple('AuditResult', ['name', 'table', 'plan', 'full_scan', 'indexes'])
+
+# SQLite: "SCAN review_reviewschedule" (no USING INDEX) is a table scan
+_SQLITE_SCAN = re.compile(r'\bSCAN (?:TABLE )?(\w+)(?! USING)(?:\s*$|\s+\()', re.MULTILINE)
+_SQLITE_INDEX = re.compile(r'USING (?:COVERING )?INDEX (\w+)')
+# PostgreSQL: "Seq Scan on review_reviewschedule"
+_POSTGRES_SCAN = re.compile(r'Seq Scan on (\w+)')
+_POSTGRES_INDEX = re.compile(r'(?:Index|Index Only|Bitmap Index) Scan (?:Backward )?(?:using|on) (\w+)')
+
+
+def get_hot_queries():
+    """
+    Hot queries mirroring the view/task code paths
+
+    Each builder takes the audited user and returns an unevaluated queryset.
+    """
+    from accounts.models import NotificationPreference
+    from accounts.subscription.services import SubscriptionService
+    from content.models import Content
+    from exams.models import WeeklyTest
+    from review.models import DailyReviewStats, ReviewHistory, ReviewSchedule
+    from review.utils import local_day_bounds
+
+    today_start, tomorrow_start = local_day_bounds()
+    today = timezone.localdate()
+
+    def today_reviews(user):
+        cutoff = timezone.now() - timedelta(days=SubscriptionService(user).get_max_review_interval() or 7)
+        return ReviewSchedule.objects.filter(user=user, is_active=True).filter(
+            Q(initial_review_completed=False)
+            | Q(initial_review_completed=True, next_review_date__lt=tomorrow_start, next_review_date__gte=cutoff)
+        ).order_by('next_review_date')
+
+    def week_start():
+        start, _ = local_day_bounds(today - timedelta(days=today.weekday()))
+        return start
+
+    return [
+        HotQuery('today_reviews', ReviewSchedule, today_reviews),
+        HotQuery('pending_reviews_count', ReviewSchedule, lambda user: ReviewSchedule.objects.filter(
+            user=user, is_active=True, next_review_date__lt=today_start
+        )),
+        HotQuery('category_today_reviews', ReviewSchedule, lambda user: ReviewSchedule.objects.filter(
+            user=user, is_active=True, next_review_date__gte=today_start, next_review_date__lt=tomorrow_start
+        ).values('content__category').annotate(today_count=Count('id'))),
+        HotQuery('due_daily_reminders', NotificationPreference, lambda user: NotificationPreference.objects.filter(
+            next_daily_reminder_at__lte=timezone.now()
+        ).order_by('next_daily_reminder_at')[:1000]),
+        HotQuery('daily_reminder_schedules', ReviewSchedule, lambda user: ReviewSchedule.objects.filter(
+            user_id__in=[user.pk], is_active=True,
+            next_review_date__gte=today_start, next_review_date__lt=tomorrow_start
+        ).values_list('user_id', 'id')),
+        HotQuery('review_history_list', ReviewHistory, lambda user: ReviewHistory.objects.filter(
+            user=user
+        ).order_by('-review_date')[:25]),
+        HotQuery('content_list', Content, lambda user: Content.objects.filter(
+            author=user
+        ).order_by('-created_at')[:15]),
+        HotQuery('stats_window', DailyReviewStats, lambda user: DailyReviewStats.objects.filter(
+            user=user, date__gte=today - timedelta(days=30)
+        )),
+        HotQuery('weekly_tests_this_week', WeeklyTest, lambda user: WeeklyTest.objects.filter(
+            user=user, created_at__gte=week_start(), created_at__lt=week_start() + timedelta(days=7)
+        )),
+    ]
+
+
+def analyze_plan(plan, table):
+    """
+    Inspect EXPLAIN output for a table
+
+    Returns:
+        tuple: (full_scan, index_names)
+    """
+    if connection.vendor == 'postgresql':
+        full_scan = table in _POSTGRES_SCAN.findall(plan)
+        indexes = _POSTGRES_INDEX.findall(plan)
+    else:
+        full_scan = table in _SQLITE_SCAN.findall(plan)
+        indexes = _SQLITE_INDEX.findall(plan)
+    return full_scan, sorted(set(indexes))
+
+
+def audit_hot_queries(user, queries=None):
+    """
+    EXPLAIN every hot query for a user
+
+    Args:
+        user: User whose queries are audited (should own representative data)
+        queries: Iterable of HotQuery (optional). Defaults to get_hot_queries().
+
+    Returns:
+        list: AuditResult per query
+    """
+    results = []
+    for query in queries or get_hot_queries():
+        table = query.model._meta.db_table
+        plan = query.build(user).explain()
+        full_scan, indexes = analyze_plan(plan, table)
+        results.append(AuditResult(query.name, table, plan, full_scan, indexes))
+    return results
+
+
+def benchmark_hot_queries(user_ids, queries=None, repeat=5):
+    """
+    Time hot queries across users
+
+    Each query is evaluated once per user per round, so results reflect a
+    spread of data shapes rather than one warm user.
+
+    Args:
+        user_ids: IDs of users to run the queries for
+        queries: Iterable of HotQuery (optional). Defaults to get_hot_queries().
+        repeat: Rounds over user_ids
+
+    Returns:
+        dict: query name -> {'median_ms', 'p95_ms'}
+    """
+    from accounts.models import User
+
+    users = list(User.objects.filter(pk__in=user_ids))
+    timings = {}
+    for query in queries or get_hot_queries():
+        samples = []
+        for _ in range(repeat):
+            for user in users:
+                queryset = query.build(user)
+                started = time.perf_counter()
+                list(queryset)
+                samples.append((time.perf_counter() - started) * 1000)
+        samples.sort()
+        timings[query.name] = {
+            'median_ms': round(statistics.median(samples), 3),
+            'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        }
+    return timings
+
+
+@contextmanager
+def explicit_timestamps(*fields):
+    """Temporarily disable auto_now/auto_now_add so seeded rows keep given timestamps"""
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    try:
+        for field, _, _ in saved:
+            field.auto_now = field.auto_now_add = False
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def seed_review_volume(users=100, contents_per_user=100, histories_per_content=10,
+                       batch_size=5000, seed=None, progress=None):
+    """
+    Bulk insert synthetic users, contents, schedules, histories and rollups
+
+    Bypasses model save()/signals for speed. Realistic audit volumes are
+    e.g. 10k users x 100 contents x 10 histories (1M schedules, 10M histories).
+
+    Args:
+        users: Number of users to create
+        contents_per_user: Contents (and schedules) per user
+        histories_per_content: Review histories per content
+        batch_size: Rows per bulk_create call
+        seed: Random seed (optional) for reproducible data
+        progress: Callable receiving progress messages (optional)
+
+    Returns:
+        list: IDs of the created users
+    """
+    from accounts.models import NotificationPreference, User
+    from content.models import Category, Content
+    from exams.models import WeeklyTest
+    from review.models import DailyReviewStats, ReviewHistory, ReviewSchedule
+
+    rng = random.Random(seed)
+    now = timezone.now()
+    today = timezone.localdate()
+    report = progress or (lambda message: None)
+    results = list(ReviewHistory.RESULT_CHOICES)
+    run_id = get_random_string(8).lower()
+
+    user_objs = User.objects.bulk_create(
+        [User(email=f'audit-{run_id}-{i}@example.com', password='!', is_email_verified=True)
+         for i in range(users)],
+        batch_size=batch_size
+    )
+    user_ids = [user.pk for user in user_objs]
+    preferences = [NotificationPreference(
+        user_id=user_id,
+        daily_reminder_time=f'{rng.randint(6, 22):02d}:00',
+        unsubscribe_token=get_random_string(64),
+    ) for user_id in user_ids]
+    for preference in preferences:
+        preference.next_daily_reminder_at = preference.next_daily_reminder(after=now)
+    NotificationPreference.objects.bulk_create(preferences, batch_size=batch_size)
+    categories = Category.objects.bulk_create(
+        [Category(name=f'Audit {n}', slug=f'audit-{run_id}-{n}', user_id=user_id)
+         for user_id in user_ids for n in range(3)],
+        batch_size=batch_size
+    )
+    category_ids = {}
+    for category in categories:
+        category_ids.setdefault(category.user_id, []).append(category.pk)
+    report(f'Seeded {users} users')
+
+    schedule_fields = (ReviewSchedule._meta.get_field('created_at'),)
+    history_fields = (ReviewHistory._meta.get_field('review_date'), ReviewHistory._meta.get_field('created_at'))
+    test_fields = (WeeklyTest._meta.get_field('created_at'),)
+
+    for user_id in user_ids:
+        contents = Content.objects.bulk_create(
+            [Content(
+                title=f'Audit content {n}',
+                content='Synthetic content body for query plan audit.',
+                author_id=user_id,
+                category_id=rng.choice(category_ids[user_id]),
+            ) for n in range(contents_per_user)],
+            batch_size=batch_size
+        )
+
+        with explicit_timestamps(*schedule_fields):
+            ReviewSchedule.objects.bulk_create(
+                [ReviewSchedule(
+                    content_id=content.pk,
+                    user_id=user_id,
+                    created_at=now - timedelta(days=200),
+                    next_review_date=now + timedelta(days=rng.randint(-30, 150), hours=rng.randint(0, 23)),
+                    interval_index=rng.randint(0, 7),
+                    is_active=rng.random() > 0.05,
+                    initial_review_completed=rng.random() > 0.02,
+                ) for content in contents],
+                batch_size=batch_size
+            )
+
+        histories = []
+        for content in contents:
+            for _ in range(histories_per_content):
+                reviewed_at = now - timedelta(days=rng.randint(0, 365), minutes=rng.randint(0, 1439))
+                histories.append(ReviewHistory(
+                    content_id=content.pk,
+                    user_id=user_id,
+                    review_date=reviewed_at,
+                    created_at=reviewed_at,
+                    result=rng.choice(results)[0],
+                    time_spent=rng.randint(5, 300),
+                ))
+            if len(histories) >= batch_size:
+                with explicit_timestamps(*history_fields):
+                    ReviewHistory.objects.bulk_create(histories, batch_size=batch_size)
+                histories = []
+        if histories:
+            with explicit_timestamps(*history_fields):
+                ReviewHistory.objects.bulk_create(histories, batch_size=batch_size)
+
+        DailyReviewStats.objects.bulk_create(
+            [DailyReviewStats(
+                user_id=user_id,
+                category_id=category_id,
+                date=today - timedelta(days=offset),
+                remembered_count=rng.randint(0, 5),
+                partial_count=rng.randint(0, 2),
+                forgot_count=rng.randint(0, 2),
+            ) for offset in range(60) for category_id in category_ids[user_id]],
+            batch_size=batch_size
+        )
+
+        with explicit_timestamps(*test_fields):
+            WeeklyTest.objects.bulk_create(
+                [WeeklyTest(user_id=user_id, created_at=now - timedelta(weeks=week)) for week in range(8)],
+                batch_size=batch_size
+            )
+
+    report(
+        f'Seeded {users * contents_per_user} schedules and '
+        f'{users * contents_per_user * histories_per_content} histories'
+    )
+
+    # Refresh planner statistics so plans reflect the seeded volume
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+    return user_ids
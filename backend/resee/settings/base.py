@@ -7,6 +7,8 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from kombu import Queue
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -129,7 +131,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.auth.authentication.CachedUserJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -194,6 +196,14 @@ SIMPLE_JWT = {
 }
 
 
+# Authenticated-user snapshot cache (accounts.auth.user_cache)
+AUTH_USER_CACHE = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'throttle',  # Shared (Redis) cache: invalidation must reach every process
+    'TIMEOUT': 300,
+}
+
+
 # Email Configuration (base settings)
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@localhost')
@@ -216,13 +226,65 @@ SUBSCRIPTION_ADMIN_PASSWORD = os.environ.get('SUBSCRIPTION_ADMIN_PASSWORD')
 SLACK_WEBHOOK_URL = os.environ.get('SLACK_WEBHOOK_URL')
 SLACK_DEFAULT_CHANNEL = os.environ.get('SLACK_DEFAULT_CHANNEL', '#alerts')
 SLACK_BOT_NAME = os.environ.get('SLACK_BOT_NAME', 'Resee Alert Bot')
+SLACK_ALERT_SETTINGS = {
+    'COALESCE_WINDOW_SECONDS': 300,  # Identical alerts within the window are sent once with a repeat count
+    'RATE_LIMIT_COUNT': 5,  # Alerts per alert key within RATE_LIMIT_WINDOW_SECONDS
+    'RATE_LIMIT_WINDOW_SECONDS': 300,
+    'QUEUE_SIZE': 1000,  # Pending alerts; further alerts are dropped
+    'TIMEOUT_SECONDS': 5,  # Webhook request timeout (background sender)
+}
 ALERT_SUMMARY_RECIPIENTS = os.environ.get('ALERT_SUMMARY_RECIPIENTS', '').split(
     ',') if os.environ.get('ALERT_SUMMARY_RECIPIENTS') else []
 
+# Health snapshot (refreshed every 30s by the refresh-health-snapshot beat task)
+HEALTH_CHECK_SETTINGS = {
+    'CACHE_ALIAS': 'throttle',  # Shared (Redis) cache the snapshot is published to
+    'STALE_AFTER_SECONDS': 90,  # Snapshot older than this is reported as stale (503)
+    'LOCAL_TTL_SECONDS': 2,  # Per-process memo of the snapshot
+    'CELERY_PING_TIMEOUT': 2,
+}
+
+ACCOUNT_DELETION_SETTINGS = {
+    'BATCH_SIZE': 1000,  # Rows deleted per statement (one short transaction each)
+    'MAX_BATCHES_PER_RUN': 200,  # Batches per task run before re-enqueueing the rest
+    'STALE_AFTER_MINUTES': 15,  # Unfinished jobs without progress for this long are resumed
+}
+
+REMINDER_SETTINGS = {
+    'BATCH_SIZE': 1000,  # Due preferences read per index range query
+    'MAX_LATENESS_MINUTES': 180,  # Reminders overdue by more than this (workers down) are skipped
+    'DELIVERY_RETENTION_DAYS': 30,  # ReminderDelivery ledger rows kept (pruned nightly)
+}
+
 
 # AI Services Configuration
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
 
+AI_TOKEN_BUDGET_SETTINGS = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'throttle',  # Shared (Redis) cache: budgets span every web and worker process
+    'GLOBAL_TOKENS_PER_MINUTE': 300000,  # Kept below the provider's organization limit
+    'TIER_TOKENS_PER_MINUTE': {  # Per user, by subscription tier
+        'free': 5000,
+        'basic': 20000,
+        'pro': 50000,
+    },
+    'MAX_WAIT_SECONDS': 5,  # Request-time calls queue at most this long for the next window
+    'CHARS_PER_TOKEN': 2,  # Prompt size estimate before the call (Korean text is token-dense)
+}
+
+AI_RESILIENCE_SETTINGS = {
+    'MAX_ATTEMPTS': 3,  # Per LLM call, including the first
+    'BACKOFF_BASE_SECONDS': 0.5,  # Full-jitter exponential backoff when there is no retry-after
+    'BACKOFF_MAX_SECONDS': 8,
+    'RETRY_DEADLINE_SECONDS': 20,  # Give up instead of waiting past this per call
+    'BREAKER_FAILURE_THRESHOLD': 5,  # Consecutive provider failures (5xx, timeouts) that open a model's breaker
+    'BREAKER_COOLDOWN_SECONDS': 30,  # Open breakers fail fast this long, then let one probe through
+    'REQUEST_TIMEOUT_SECONDS': 15,  # Client timeout of a single request (SDK default is 10 minutes)
+    'HEDGE_AFTER_SECONDS': 4,  # Latency-critical evaluators send a backup request after this
+    'HEDGE_MAX_WORKERS': 8,  # Backup requests in flight per process; none are sent while all are busy
+}
+
 
 # Toss Payments Configuration
 TOSS_CLIENT_KEY = os.environ.get('TOSS_CLIENT_KEY')
@@ -401,6 +463,14 @@ FEATURE_FLAGS = {
 }
 
 
+# Exam Configuration
+EXAM_SETTINGS = {
+    'MIN_READY_QUESTIONS': 3,  # 준비 중이라도 이 개수만큼 생성되면 시험 시작 가능
+    'QUESTION_BANK_CANDIDATES': 2,  # 콘텐츠당 미리 생성할 후보 문제 수
+    'QUESTION_BANK_BATCH_SIZE': 500,  # 야간 배치 1회에 처리할 최대 콘텐츠 수
+}
+
+
 # Subscription Configuration
 SUBSCRIPTION_SETTINGS = {
     'FREE_TIER_LIMITS': {
@@ -490,9 +560,64 @@ CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 # Task retry configuration
 CELERY_TASK_ALWAYS_EAGER = False  # Set to True for testing
 CELERY_TASK_EAGER_PROPAGATES = False
+
+# Queue topology: long LLM tasks never share workers with time-sensitive emails.
+#   email       - verification / password reset / review reminder emails (seconds)
+#   default     - beat fan-outs and short bookkeeping (schedule adjustments, health)
+#   ai          - exam generation and question bank builds (minutes, I/O bound)
+#   maintenance - bulk DB work: stats compaction, account deletion (CPU / DB bound)
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_QUEUES = (
+    Queue('email'),
+    Queue('default'),
+    Queue('ai'),
+    Queue('maintenance'),
+)
 CELERY_TASK_ROUTES = {
-    'review.tasks.*': {'queue': 'review_queue'},
-    'accounts.tasks.*': {'queue': 'email_queue'},
+    'accounts.email.tasks.*': {'queue': 'email'},
+    'review.tasks.send_individual_review_reminder': {'queue': 'email'},
+    'exams.tasks.*': {'queue': 'ai'},
+    'review.tasks.compact_daily_review_stats': {'queue': 'maintenance'},
+    'review.tasks.prune_reminder_deliveries': {'queue': 'maintenance'},
+    'accounts.tasks.run_account_deletion': {'queue': 'maintenance'},
+    # Everything else (send_due_review_reminders, adjust_review_schedules_on_subscription_change,
+    # resume_account_deletions, refresh_health_snapshot) goes to the default queue
+}
+
+# Unacknowledged messages (acks_late AI tasks, countdown retries) are redelivered by
+# Redis after this long, so it must exceed the longest AI task time limit.
+CELERY_BROKER_TRANSPORT_OPTIONS = {'visibility_timeout': 3600}
+CELERY_RESULT_EXPIRES = 86400
+
+# Worker start profiles (python manage.py run_worker <profile>)
+CELERY_WORKER_PROFILES = {
+    'realtime': {  # Short I/O tasks: keep a few prefetched per process
+        'queues': ['email', 'default'],
+        'pool': 'prefork',
+        'concurrency': 4,
+        'prefetch_multiplier': 4,
+    },
+    # LLM calls wait on the network, so run more processes than cores, one task reserved at a time.
+    # Prefork, not threads: only the prefork pool enforces time limits and reject_on_worker_lost.
+    'ai': {
+        'queues': ['ai'],
+        'pool': 'prefork',
+        'concurrency': 8,
+        'prefetch_multiplier': 1,
+    },
+    'maintenance': {  # CPU / DB bound aggregation: one process per core, recycled
+        'queues': ['maintenance'],
+        'pool': 'prefork',
+        'concurrency': 2,
+        'prefetch_multiplier': 1,
+        'max_tasks_per_child': 50,
+    },
+    'all': {  # Single worker for local development
+        'queues': ['email', 'default', 'ai', 'maintenance'],
+        'pool': 'prefork',
+        'concurrency': 4,
+        'prefetch_multiplier': 1,
+    },
 }
 
 # Email task configuration
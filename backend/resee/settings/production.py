@@ -227,6 +227,14 @@ LOGGING = {
             '()': 'resee.logging_config.JSONFormatter',
         },
     },
+    'filters': {
+        # High-volume INFO logs on the review/AI paths (1.0 = keep all)
+        'info_sampling': {
+            '()': 'resee.logging_config.SamplingFilter',
+            'rate': float(os.environ.get('LOG_INFO_SAMPLE_RATE', '1.0')),
+            'loggers': ['review', 'ai_services', 'resee.ai'],
+        },
+    },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
@@ -247,44 +255,65 @@ LOGGING = {
             'formatter': 'json',
             'level': 'ERROR',
         },
+        # Loggers use the async_* handlers: the request thread only enqueues,
+        # a background listener runs the console/file handlers above
+        'async_console': {
+            '()': 'resee.logging_config.AsyncHandler',
+            'handlers': ['console'],
+            'filters': ['info_sampling'],
+        },
+        'async_all': {
+            '()': 'resee.logging_config.AsyncHandler',
+            'handlers': ['console', 'file', 'error_file'],
+            'filters': ['info_sampling'],
+        },
+        'async_errors': {
+            '()': 'resee.logging_config.AsyncHandler',
+            'handlers': ['console', 'error_file'],
+        },
+        'async_app': {
+            '()': 'resee.logging_config.AsyncHandler',
+            'handlers': ['console', 'file'],
+            'filters': ['info_sampling'],
+        },
     },
     'root': {
-        'handlers': ['console'],
+        'handlers': ['async_console'],
         'level': os.environ.get('LOG_LEVEL', 'INFO'),
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file', 'error_file'],
+            'handlers': ['async_all'],
             'level': os.environ.get('LOG_LEVEL', 'INFO'),
             'propagate': False,
         },
         'django.request': {
-            'handlers': ['console', 'error_file'],
+            'handlers': ['async_errors'],
             'level': 'ERROR',
             'propagate': False,
         },
         'resee': {
-            'handlers': ['console', 'file', 'error_file'],
+            'handlers': ['async_all'],
             'level': 'INFO',
             'propagate': False,
         },
         'accounts': {
-            'handlers': ['console', 'file'],
+            'handlers': ['async_app'],
             'level': 'INFO',
             'propagate': False,
         },
         'content': {
-            'handlers': ['console', 'file'],
+            'handlers': ['async_app'],
             'level': 'INFO',
             'propagate': False,
         },
         'review': {
-            'handlers': ['console', 'file'],
+            'handlers': ['async_app'],
             'level': 'INFO',
             'propagate': False,
         },
         'exams': {
-            'handlers': ['console', 'file'],
+            'handlers': ['async_app'],
             'level': 'INFO',
             'propagate': False,
         },
@@ -32,10 +32,19 @@ DATABASES = {
     }
 }
 
+# Covering indexes (INCLUDE) only apply on PostgreSQL; SQLite builds them without the extra columns
+SILENCED_SYSTEM_CHECKS = ['models.W040']
+
 # JWT Settings for testing
 SIMPLE_JWT['SIGNING_KEY'] = SECRET_KEY
 SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'] = timedelta(minutes=30)  # Longer for tests
 
+# User ids are reused across rolled-back test transactions; never serve cached snapshots
+AUTH_USER_CACHE = {**AUTH_USER_CACHE, 'ENABLED': False}
+
+# No shared cache for token budgets in tests
+AI_TOKEN_BUDGET_SETTINGS = {**AI_TOKEN_BUDGET_SETTINGS, 'ENABLED': False}
+
 # Disable CORS restrictions in tests
 CORS_ALLOW_ALL_ORIGINS = True
 
@@ -0,0 +1,12 @@
+"""
+Project-level periodic tasks
+"""
+from celery import shared_task
+
+from . import health
+
+
+@shared_task(ignore_result=True)
+def refresh_health_snapshot():
+    """Refresh the component health snapshot served by the detailed health check"""
+    return health.refresh_snapshot()['status']
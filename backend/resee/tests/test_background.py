@@ -0,0 +1,33 @@
+"""
+Tests for per-process background values.
+"""
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+
+from resee.background import ProcessLocal
+
+
+class ProcessLocalTest(SimpleTestCase):
+    def test_created_once_per_process(self):
+        factory = Mock(side_effect=lambda size: object())
+        local = ProcessLocal(factory)
+
+        first = local.get(10)
+        self.assertIs(local.get(10), first)
+        factory.assert_called_once_with(10)
+
+        # A forked child sees the parent's value but gets its own
+        with patch('resee.background.os.getpid', return_value=-1):
+            self.assertIsNone(local.peek())
+            self.assertIsNot(local.get(10), first)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_clear_returns_value_and_recreates(self):
+        local = ProcessLocal(object)
+
+        self.assertIsNone(local.peek())
+        first = local.get()
+        self.assertIs(local.clear(), first)
+        self.assertIsNone(local.peek())
+        self.assertIsNot(local.get(), first)
@@ -0,0 +1,105 @@
+"""
+Tests for the cached health snapshot.
+"""
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from resee import health
+from resee.tasks import refresh_health_snapshot
+
+HEALTH_SETTINGS = {
+    'CACHE_ALIAS': 'default',
+    'STALE_AFTER_SECONDS': 90,
+    'LOCAL_TTL_SECONDS': 0,
+    'CELERY_PING_TIMEOUT': 1,
+}
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'health-tests'}}
+
+
+def ok_probe():
+    return {'status': 'ok'}
+
+
+def failing_probe():
+    raise Exception('connection refused')
+
+
+@override_settings(CACHES=LOCMEM, HEALTH_CHECK_SETTINGS=HEALTH_SETTINGS)
+class HealthSnapshotTest(SimpleTestCase):
+    """Test the prober publishes and the endpoint serves the snapshot."""
+
+    def setUp(self):
+        health._snapshot_cache().clear()
+        health.clear_local_snapshot()
+
+    def tearDown(self):
+        health.clear_local_snapshot()
+
+    def refresh(self, *probes):
+        with patch.object(health, 'PROBES', probes), \
+                patch('utils.slack_notifications.slack_notifier.send_health_alert') as alert:
+            refresh_health_snapshot()
+        return alert
+
+    def test_endpoint_serves_snapshot_without_probing(self):
+        self.refresh(('database', ok_probe), ('redis', ok_probe))
+
+        with patch.object(health, 'run_probes') as run_probes:
+            response = self.client.get('/api/health/detailed/')
+
+        run_probes.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['status'], 'ok')
+        self.assertFalse(data['stale'])
+        self.assertEqual(data['services']['database'], {'status': 'ok'})
+        self.assertIn('age_seconds', data)
+
+    def test_failed_component_returns_503(self):
+        self.refresh(('database', ok_probe), ('redis', failing_probe))
+
+        response = self.client.get('/api/health/detailed/')
+
+        self.assertEqual(response.status_code, 503)
+        data = response.json()
+        self.assertEqual(data['status'], 'degraded')
+        self.assertEqual(data['services']['redis']['error'], 'connection refused')
+
+    def test_missing_snapshot_returns_503(self):
+        response = self.client.get('/api/health/detailed/')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['status'], 'unknown')
+
+    def test_stale_snapshot_returns_503(self):
+        self.refresh(('database', ok_probe))
+
+        with patch('resee.health.time.time', return_value=time.time() + 120):
+            response = self.client.get('/api/health/detailed/')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['status'], 'stale')
+        self.assertTrue(response.json()['stale'])
+
+    def test_alerts_only_on_transitions(self):
+        alert = self.refresh(('database', failing_probe))
+        alert.assert_called_once_with(service='database', status='down', details='connection refused')
+
+        alert = self.refresh(('database', failing_probe))
+        alert.assert_not_called()
+
+        alert = self.refresh(('database', ok_probe))
+        alert.assert_called_once_with(service='database', status='recovered')
+
+    def test_local_memo_avoids_cache_reads(self):
+        self.refresh(('database', ok_probe))
+
+        with override_settings(HEALTH_CHECK_SETTINGS={**HEALTH_SETTINGS, 'LOCAL_TTL_SECONDS': 60}):
+            health.get_snapshot()
+            with patch.object(health, '_snapshot_cache') as snapshot_cache:
+                snapshot = health.get_snapshot()
+
+        snapshot_cache.assert_not_called()
+        self.assertEqual(snapshot['status'], 'ok')
@@ -0,0 +1,154 @@
+"""
+Tests for structured JSON logging and the async logging pipeline.
+"""
+import json
+import logging
+import queue
+import sys
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from resee.logging_config import AsyncHandler, JSONFormatter, SamplingFilter, stop_async_logging
+
+
+def make_record(name='review.views', level=logging.INFO, msg='hello %s', args=('world',), **extra):
+    record = logging.LogRecord(name, level, __file__, 10, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class CollectingHandler(logging.Handler):
+    """Records handled records and the thread that handled them"""
+
+    def __init__(self, name):
+        super().__init__()
+        self.set_name(name)
+        self.records = []
+        self.threads = []
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.append(threading.current_thread())
+
+
+class JSONFormatterTest(SimpleTestCase):
+    """Test single-pass JSON formatting."""
+
+    def setUp(self):
+        self.formatter = JSONFormatter()
+
+    def test_formats_context_and_extra_fields(self):
+        record = make_record(user_id=7, duration=12.5, content_id=3, _private='x')
+        data = json.loads(self.formatter.format(record))
+
+        self.assertEqual(data['message'], 'hello world')
+        self.assertEqual(data['level'], 'INFO')
+        self.assertEqual(data['user_id'], 7)
+        self.assertEqual(data['duration_ms'], 12.5)
+        self.assertEqual(data['content_id'], 3)
+        self.assertNotIn('duration', data)
+        self.assertNotIn('_private', data)
+        self.assertNotIn('args', data)
+        self.assertTrue(data['timestamp'].endswith('Z'))
+
+    def test_non_serializable_values_use_type_name(self):
+        data = json.loads(self.formatter.format(make_record(request=object())))
+        self.assertEqual(data['request'], 'object')
+
+    def test_circular_value_falls_back_per_field(self):
+        circular = []
+        circular.append(circular)
+        data = json.loads(self.formatter.format(make_record(payload=circular, user_id=1)))
+        self.assertEqual(data['payload'], 'list')
+        self.assertEqual(data['user_id'], 1)
+
+    def test_exception_info(self):
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            record = make_record(level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        data = json.loads(self.formatter.format(record))
+        self.assertEqual(data['exception']['type'], 'ValueError')
+        self.assertEqual(data['exception']['value'], 'boom')
+
+    def test_extra_keys_cached_per_layout(self):
+        self.formatter.format(make_record(user_id=1))
+        self.formatter.format(make_record(user_id=2))
+        self.assertEqual(len(self.formatter._key_cache), 1)
+
+        self.formatter.format(make_record(content_id=1))
+        self.assertEqual(len(self.formatter._key_cache), 2)
+
+
+class SamplingFilterTest(SimpleTestCase):
+    """Test sampling of high-volume low-level records."""
+
+    def test_drops_sampled_info_records(self):
+        sampling = SamplingFilter(rate=0.0, loggers=['review'])
+
+        self.assertFalse(sampling.filter(make_record('review.views')))
+        self.assertTrue(sampling.filter(make_record('review.views', level=logging.WARNING)))
+        self.assertTrue(sampling.filter(make_record('reviewer')))
+        self.assertTrue(sampling.filter(make_record('accounts.views')))
+
+    def test_kept_records_carry_sample_rate(self):
+        sampling = SamplingFilter(rate=0.25)
+        record = make_record()
+
+        with patch('resee.logging_config.random.random', return_value=0.1):
+            self.assertTrue(sampling.filter(record))
+        self.assertEqual(record.sample_rate, 0.25)
+
+        with patch('resee.logging_config.random.random', return_value=0.9):
+            self.assertFalse(sampling.filter(make_record()))
+
+    def test_full_rate_keeps_everything(self):
+        sampling = SamplingFilter(rate=1.0, level='DEBUG')
+        record = make_record(level=logging.DEBUG)
+        self.assertTrue(sampling.filter(record))
+        self.assertFalse(hasattr(record, 'sample_rate'))
+
+
+class AsyncHandlerTest(SimpleTestCase):
+    """Test records are handled on the listener thread."""
+
+    def setUp(self):
+        self.target = CollectingHandler('test_async_target')
+        self.errors = CollectingHandler('test_async_errors')
+        self.errors.setLevel(logging.ERROR)
+
+    def tearDown(self):
+        stop_async_logging()
+        self.target.close()
+        self.errors.close()
+
+    def test_forwards_records_to_named_handlers(self):
+        handler = AsyncHandler(['test_async_target', 'test_async_errors', 'missing'])
+        args = ['world']
+        record = make_record(msg='hello %s', args=(args,))
+
+        handler.handle(record)
+        handler.handle(make_record(level=logging.ERROR, msg='failed', args=()))
+        args.append('later')
+        stop_async_logging()
+
+        self.assertEqual([r.getMessage() for r in self.target.records], ["hello ['world']", 'failed'])
+        self.assertEqual([r.getMessage() for r in self.errors.records], ['failed'])
+        self.assertNotIn(threading.current_thread(), self.target.threads)
+        # The caller's record is left untouched
+        self.assertEqual(record.args, (args,))
+
+    def test_drops_records_when_queue_is_full(self):
+        handler = AsyncHandler(['test_async_target'])
+        full = queue.Queue(1)
+        full.put_nowait(None)
+
+        with patch('resee.logging_config._get_queue', return_value=full):
+            handler.handle(make_record())
+
+        self.assertEqual(handler.dropped, 1)
+        self.assertEqual(self.target.records, [])
@@ -0,0 +1,164 @@
+"""
+Tests for non-blocking Slack alert dispatch.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from resee.views import health_check
+from utils.slack_notifications import AlertDispatcher, SlackNotifier
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class StubWebhook:
+    """Local HTTP server standing in for the Slack webhook"""
+
+    def __init__(self, delay=0):
+        self.payloads = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers['Content-Length'])
+                stub.payloads.append(json.loads(self.rfile.read(length)))
+                time.sleep(delay)
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(b'ok')
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_port}/hook'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def payload(text='down'):
+    return {'text': 'alert', 'attachments': [{'text': text, 'ts': time.time()}]}
+
+
+class AlertDispatcherTest(SimpleTestCase):
+    """Test coalescing, rate limiting and queueing."""
+
+    def setUp(self):
+        self.sent = []
+        self.clock = FakeClock()
+        self.dispatcher = AlertDispatcher(
+            lambda item: self.sent.append(item) or True,
+            coalesce_window=60, rate_limit=2, rate_window=60, clock=self.clock
+        )
+
+    def test_coalesces_identical_alerts(self):
+        self.assertTrue(self.dispatcher.submit('health:database:down', payload()))
+        self.assertTrue(self.dispatcher.submit('health:database:down', payload()))
+        self.assertTrue(self.dispatcher.submit('health:database:down', payload()))
+        self.dispatcher.flush(timeout=5)
+        self.assertEqual(len(self.sent), 1)
+
+        # Next identical alert after the window carries the repeat count
+        self.clock.now += 61
+        self.dispatcher.submit('health:database:down', payload())
+        self.dispatcher.flush(timeout=5)
+        self.assertEqual(len(self.sent), 2)
+        self.assertIn('repeated 2 more time(s)', self.sent[1]['attachments'][0]['text'])
+
+    def test_reports_expired_window_without_new_alert(self):
+        self.dispatcher.submit('key', payload())
+        self.dispatcher.submit('key', payload())
+        self.dispatcher.flush(timeout=5)
+
+        self.clock.now += 61
+        self.dispatcher._report_expired()
+        self.dispatcher.flush(timeout=5)
+
+        self.assertEqual(len(self.sent), 2)
+        self.assertIn('repeated 1 more time(s)', self.sent[1]['attachments'][0]['text'])
+
+    def test_rate_limits_per_alert_key(self):
+        self.assertTrue(self.dispatcher.submit('health:redis:down', payload('a')))
+        self.assertTrue(self.dispatcher.submit('health:redis:down', payload('b')))
+        self.assertFalse(self.dispatcher.submit('health:redis:down', payload('c')))
+        self.assertTrue(self.dispatcher.submit('health:celery:down', payload('c')))
+
+        self.clock.now += 61
+        self.assertTrue(self.dispatcher.submit('health:redis:down', payload('d')))
+        self.dispatcher.flush(timeout=5)
+
+        self.assertEqual(len(self.sent), 4)
+        self.assertIn('1 similar alert(s) suppressed', self.sent[3]['attachments'][0]['text'])
+
+    def test_drops_alerts_when_queue_is_full(self):
+        release = threading.Event()
+        dispatcher = AlertDispatcher(lambda item: release.wait(5), maxsize=1, clock=self.clock)
+
+        results = [dispatcher.submit(f'key{i}', payload(str(i))) for i in range(3)]
+        release.set()
+        dispatcher.flush(timeout=5)
+
+        self.assertFalse(all(results))
+
+
+class SlackNotifierTest(SimpleTestCase):
+    """Test delivery to a local stub webhook."""
+
+    def setUp(self):
+        self.webhook = StubWebhook()
+
+    def tearDown(self):
+        self.webhook.close()
+
+    def test_delivers_queued_alert(self):
+        with override_settings(SLACK_WEBHOOK_URL=self.webhook.url):
+            notifier = SlackNotifier()
+
+        self.assertTrue(notifier.send_health_alert('database', 'down', 'timeout'))
+        self.assertTrue(notifier.send_health_alert('database', 'down', 'timeout'))
+        notifier.dispatcher.flush(timeout=5)
+
+        self.assertEqual(len(self.webhook.payloads), 1)
+        self.assertEqual(self.webhook.payloads[0]['text'], '🔴 Health Check Alert: database')
+
+    def test_blocking_alert_posts_immediately(self):
+        with override_settings(SLACK_WEBHOOK_URL=self.webhook.url):
+            notifier = SlackNotifier()
+
+        self.assertTrue(notifier.send_alert('hello', level='info', blocking=True))
+        self.assertEqual(len(self.webhook.payloads), 1)
+
+
+class HealthCheckAlertTest(SimpleTestCase):
+    """Test health probes do not wait on Slack."""
+
+    def test_failed_probe_does_not_block_on_webhook(self):
+        webhook = StubWebhook(delay=2)
+        self.addCleanup(webhook.close)
+        with override_settings(SLACK_WEBHOOK_URL=webhook.url):
+            notifier = SlackNotifier()
+
+        request = RequestFactory().get('/api/health/')
+        with patch('resee.views.slack_notifier', notifier), \
+                patch('resee.views.connection.ensure_connection', side_effect=Exception('db down')):
+            started = time.monotonic()
+            response = health_check(request)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(response.status_code, 503)
+        self.assertLess(elapsed, 1)
+        notifier.dispatcher.flush(timeout=5)
+        self.assertEqual(len(webhook.payloads), 1)
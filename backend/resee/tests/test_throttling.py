@@ -0,0 +1,124 @@
+"""
+Tests for the GCRA throttles.
+"""
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import SimpleRateThrottle
+
+from resee import throttling
+
+LOCMEM = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'throttle-tests-default'},
+    'throttle': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'throttle-tests'},
+}
+RATES = {
+    'anon': '100/hour',
+    'user': '1000/hour',
+    'login': '3/min',
+    'api_pro': '5/min',
+}
+
+
+def anon_request(address='203.0.113.10'):
+    return Request(APIRequestFactory().post('/', REMOTE_ADDR=address))
+
+
+def user_request(tier=None, pk=1):
+    request = anon_request()
+    subscription = SimpleNamespace(tier=tier) if tier else None
+    request.user = SimpleNamespace(pk=pk, is_authenticated=True, subscription=subscription)
+    return request
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@override_settings(CACHES=LOCMEM)
+class GCRAThrottleTest(SimpleTestCase):
+    """Test burst, spacing and fallback behaviour."""
+
+    def setUp(self):
+        caches['throttle'].clear()
+        throttling.reset_limiters()
+        self.clock = Clock()
+        rates = patch.object(SimpleRateThrottle, 'THROTTLE_RATES', RATES)
+        rates.start()
+        self.addCleanup(rates.stop)
+        self.addCleanup(throttling.reset_limiters)
+
+    def throttle(self, throttle_class=throttling.LoginRateThrottle):
+        throttle = throttle_class()
+        throttle.timer = self.clock
+        return throttle
+
+    def test_allows_burst_then_spaces_requests(self):
+        request = anon_request()
+        self.assertEqual([self.throttle().allow_request(request, None) for _ in range(4)],
+                         [True, True, True, False])
+
+        throttle = self.throttle()
+        self.assertFalse(throttle.allow_request(request, None))
+        self.assertAlmostEqual(throttle.wait(), 20.0)
+
+        # 3/min: 한 요청 간격(20초) 뒤 다시 허용
+        self.clock.now += 20
+        self.assertTrue(self.throttle().allow_request(request, None))
+        self.assertFalse(self.throttle().allow_request(request, None))
+
+    def test_clients_are_limited_separately(self):
+        for _ in range(3):
+            self.throttle().allow_request(anon_request('203.0.113.10'), None)
+        self.assertFalse(self.throttle().allow_request(anon_request('203.0.113.10'), None))
+        self.assertTrue(self.throttle().allow_request(anon_request('203.0.113.11'), None))
+
+    def test_rejections_do_not_extend_the_wait(self):
+        request = anon_request()
+        for _ in range(10):
+            self.throttle().allow_request(request, None)
+        self.clock.now += 20
+        self.assertTrue(self.throttle().allow_request(request, None))
+
+    def test_subscription_throttle_uses_tier_rate_without_mutating_scope(self):
+        throttle = self.throttle(throttling.APIRateThrottle)
+        results = [throttle.allow_request(user_request('pro'), None) for _ in range(6)]
+
+        self.assertEqual(results, [True] * 5 + [False])
+        self.assertEqual(throttle.scope, 'user')
+        self.assertEqual(throttle.key, 'throttle_api_pro_1')
+
+    def test_subscription_throttle_falls_back_to_user_rate(self):
+        throttle = self.throttle(throttling.APIRateThrottle)
+        self.assertTrue(all(throttle.allow_request(user_request('basic'), None) for _ in range(20)))
+        self.assertEqual(throttle.key, 'throttle_api_basic_1')
+
+    def test_falls_back_to_process_limiter_when_cache_fails(self):
+        broken = SimpleNamespace(hit=lambda *args: (_ for _ in ()).throw(ConnectionError('redis down')))
+        request = anon_request()
+        with patch.object(throttling, 'get_limiter', return_value=broken):
+            results = [self.throttle().allow_request(request, None) for _ in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+
+
+@override_settings(CACHES=LOCMEM)
+class BenchmarkThrottleCommandTest(SimpleTestCase):
+    """Test the benchmark command runs against the throttle cache."""
+
+    def test_benchmark_reports_both_backends(self):
+        throttling.reset_limiters()
+        out = StringIO()
+        call_command('benchmark_throttle', '--requests', '20', stdout=out)
+
+        self.assertIn('legacy (history list get/trim/set)', out.getvalue())
+        self.assertIn('GCRA (single atomic update)', out.getvalue())
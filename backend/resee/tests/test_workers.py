@@ -0,0 +1,89 @@
+"""
+Tests for Celery queue routing and worker profiles.
+"""
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from resee.celery import app
+from resee.workers import get_profile, task_queue, worker_argv
+
+
+def project_tasks():
+    app.loader.import_default_modules()
+    return sorted(name for name in app.tasks if not name.startswith(('celery.', 'benchmark.')))
+
+
+class TaskRoutingTest(SimpleTestCase):
+    def test_tasks_are_routed_by_class_of_work(self):
+        self.assertEqual(task_queue('review.tasks.send_individual_review_reminder'), 'email')
+        self.assertEqual(task_queue('accounts.email.tasks.send_verification_email_async'), 'email')
+        self.assertEqual(task_queue('exams.tasks.generate_exam_questions'), 'ai')
+        self.assertEqual(task_queue('exams.tasks.build_question_bank'), 'ai')
+        self.assertEqual(task_queue('review.tasks.compact_daily_review_stats'), 'maintenance')
+        self.assertEqual(task_queue('accounts.tasks.run_account_deletion'), 'maintenance')
+        self.assertEqual(task_queue('review.tasks.send_hourly_notifications'), 'default')
+
+    def test_every_task_queue_is_consumed_by_a_deployed_profile(self):
+        consumed = {
+            queue
+            for name, profile in settings.CELERY_WORKER_PROFILES.items() if name != 'all'
+            for queue in profile['queues']
+        }
+        declared = {queue.name for queue in settings.CELERY_TASK_QUEUES}
+        self.assertEqual(set(settings.CELERY_WORKER_PROFILES['all']['queues']), declared)
+
+        for name in project_tasks():
+            with self.subTest(task=name):
+                self.assertIn(task_queue(name), declared)
+                self.assertIn(task_queue(name), consumed)
+
+    def test_ai_tasks_are_acked_late_within_the_visibility_timeout(self):
+        visibility_timeout = settings.CELERY_BROKER_TRANSPORT_OPTIONS['visibility_timeout']
+        for name in project_tasks():
+            if task_queue(name) != 'ai':
+                continue
+            task = app.tasks[name]
+            with self.subTest(task=name):
+                self.assertTrue(task.acks_late)
+                self.assertTrue(task.reject_on_worker_lost)
+                self.assertLess(task.soft_time_limit, task.time_limit)
+                self.assertLess(task.time_limit + (task.default_retry_delay or 0), visibility_timeout)
+
+    def test_ai_queue_workers_enforce_time_limits(self):
+        # The threads pool ignores soft/hard time limits, so an acks_late task could outlive
+        # the visibility timeout and be redelivered while still running
+        for name, profile in settings.CELERY_WORKER_PROFILES.items():
+            if 'ai' in profile['queues']:
+                with self.subTest(profile=name):
+                    self.assertEqual(profile['pool'], 'prefork')
+
+    def test_emails_are_acked_on_receipt(self):
+        self.assertFalse(app.tasks['review.tasks.send_individual_review_reminder'].acks_late)
+
+
+class WorkerProfileTest(SimpleTestCase):
+    def test_worker_argv(self):
+        argv = worker_argv('ai')
+
+        self.assertEqual(argv[0], 'worker')
+        self.assertIn('--queues=ai', argv)
+        self.assertIn('--pool=prefork', argv)
+        self.assertIn('--prefetch-multiplier=1', argv)
+        self.assertIn('--hostname=ai@%h', argv)
+
+    def test_max_tasks_per_child_only_when_configured(self):
+        self.assertIn('--max-tasks-per-child=50', worker_argv('maintenance'))
+        self.assertFalse(any(arg.startswith('--max-tasks-per-child') for arg in worker_argv('realtime')))
+
+    def test_unknown_profile(self):
+        with self.assertRaisesMessage(ValueError, "Unknown worker profile 'gpu'"):
+            get_profile('gpu')
+
+    def test_run_worker_print(self):
+        out = StringIO()
+        call_command('run_worker', 'realtime', '--print', stdout=out)
+
+        self.assertIn('celery -A resee worker --loglevel=info --queues=email,default', out.getvalue())
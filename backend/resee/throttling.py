@@ -1,12 +1,121 @@
 """
 Custom throttling classes for Resee platform using Redis cache.
+
+DRF's SimpleRateThrottle keeps a list of request timestamps per client and
+does a get, an O(history) trim and a set on every request: two Redis round
+trips, and concurrent workers overwrite each other's history. The throttles
+here use GCRA (generic cell rate algorithm) instead: a single "theoretical
+arrival time" per key, updated by one Lua script (EVALSHA) in one round trip
+and atomically on the Redis server, using the server clock. GCRA allows the
+configured number of requests as a burst and then spaces requests evenly
+over the window.
+
+Caches that are not Redis (locmem in tests and development) use the same
+algorithm in-process under a lock. If Redis is unreachable, requests are
+limited per process by a local fallback instead of failing.
 """
+import logging
+import math
+import threading
+
 from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
 from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
 
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = throttle key, ARGV[1] = emission interval (us), ARGV[2] = window (us)
+# Returns 0 when the request is allowed, otherwise the wait in microseconds.
+GCRA_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000000 + tonumber(clock[2])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if now < allow_at then
+    return math.ceil(allow_at - now)
+end
+redis.call('SET', KEYS[1], string.format('%.0f', new_tat), 'PX', math.ceil((new_tat - now) / 1000))
+return 0
+"""
+
+MICROSECONDS = 1000000
+
+
+class CacheGCRA:
+    """GCRA limiter on a Django cache; atomic within the process only."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.lock = threading.Lock()
+
+    def hit(self, key, num_requests, duration, now):
+        """
+        Record one request for `key` if the rate allows it.
+
+        Returns:
+            float: 0 when allowed, otherwise seconds until the next request is allowed
+        """
+        interval = duration / num_requests
+        with self.lock:
+            tat = max(self.cache.get(key) or now, now)
+            new_tat = tat + interval
+            allow_at = new_tat - duration
+            if now < allow_at:
+                return allow_at - now
+            self.cache.set(key, new_tat, math.ceil(new_tat - now))
+        return 0.0
+
+
+class RedisGCRA:
+    """GCRA limiter evaluated atomically on the Redis server."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.script = cache.client.get_client(write=True).register_script(GCRA_SCRIPT)
+
+    def hit(self, key, num_requests, duration, now):
+        period = duration * MICROSECONDS
+        interval = max(period // num_requests, 1)
+        wait = self.script(keys=[self.cache.make_key(key)], args=[interval, period])
+        return int(wait) / MICROSECONDS
+
+
+# Per-process limiter used while Redis is unreachable
+_fallback_limiter = CacheGCRA(LocMemCache('resee-throttle-fallback', {'OPTIONS': {'MAX_ENTRIES': 10000}}))
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(cache_name):
+    """Limiter for a cache alias (Lua script on django-redis, in-process GCRA otherwise)."""
+    limiter = _limiters.get(cache_name)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(cache_name)
+            if limiter is None:
+                cache = caches[cache_name]
+                limiter = RedisGCRA(cache) if hasattr(cache, 'client') else CacheGCRA(cache)
+                _limiters[cache_name] = limiter
+    return limiter
+
+
+def reset_limiters():
+    """Drop cached limiters (tests that swap cache settings)."""
+    with _limiters_lock:
+        _limiters.clear()
+    _fallback_limiter.cache.clear()
+
 
 class RedisThrottleMixin:
-    """Mixin to use Redis cache for throttling."""
+    """Mixin to throttle with atomic GCRA on the Redis throttle cache."""
 
     cache_name = 'throttle'
 
@@ -14,6 +123,34 @@ class RedisThrottleMixin:
         """Get the Redis throttle cache."""
         return caches[self.cache_name]
 
+    def get_request_rate(self, request):
+        """(num_requests, duration) for this request; tier-aware throttles override."""
+        return self.num_requests, self.duration
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        num_requests, duration = self.get_request_rate(request)
+        now = self.timer()
+        try:
+            self.wait_seconds = get_limiter(self.cache_name).hit(self.key, num_requests, duration, now)
+        except Exception as e:
+            logger.warning(f"Throttle cache unavailable, limiting per process: {e}")
+            self.wait_seconds = _fallback_limiter.hit(self.key, num_requests, duration, now)
+
+        if self.wait_seconds > 0:
+            return self.throttle_failure()
+        return True
+
+    def wait(self):
+        """Seconds until the next request is allowed (Retry-After)."""
+        return getattr(self, 'wait_seconds', None) or None
+
 
 class RedisAnonRateThrottle(RedisThrottleMixin, AnonRateThrottle):
     """
@@ -66,26 +203,41 @@ class LoginRateThrottle(RedisThrottleMixin, AnonRateThrottle):
 
 
 class SubscriptionBasedThrottle(RedisThrottleMixin, UserRateThrottle):
-    """Base throttle that considers user subscription tier using Redis"""
-    cache = property(RedisThrottleMixin.get_cache)
+    """
+    Base throttle that considers user subscription tier using Redis
 
-    def allow_request(self, request, view):
-        if not request.user.is_authenticated:
-            return super().allow_request(request, view)
+    Authenticated users are limited under '<base_scope>_<tier>' (e.g. 'api_pro');
+    tiers without a configured rate fall back to the 'user' rate. The scope is
+    resolved per request and never stored on the (shared) throttle instance.
+    """
+    cache = property(RedisThrottleMixin.get_cache)
 
-        # Get user's subscription tier
+    def get_tier_scope(self, request):
         subscription = getattr(request.user, 'subscription', None)
         if not subscription:
-            self.scope = 'free'
+            return f"{self.base_scope}_free"
+        # Handle both string and object tier types
+        if hasattr(subscription.tier, 'name'):
+            tier = subscription.tier.name.lower()
         else:
-            # Handle both string and object tier types
-            if hasattr(subscription.tier, 'name'):
-                tier = subscription.tier.name.lower()
-            else:
-                tier = str(subscription.tier).lower()
-            self.scope = f"{self.base_scope}_{tier}"
-
-        return super().allow_request(request, view)
+            tier = str(subscription.tier).lower()
+        return f"{self.base_scope}_{tier}"
+
+    def get_request_rate(self, request):
+        if not request.user.is_authenticated:
+            return super().get_request_rate(request)
+        rate = self.THROTTLE_RATES.get(self.get_tier_scope(request))
+        if rate is None:
+            return super().get_request_rate(request)
+        return self.parse_rate(rate)
+
+    def get_cache_key(self, request, view):
+        if not request.user.is_authenticated:
+            return super().get_cache_key(request, view)
+        return self.cache_format % {
+            'scope': self.get_tier_scope(request),
+            'ident': request.user.pk
+        }
 
 
 class APIRateThrottle(SubscriptionBasedThrottle):
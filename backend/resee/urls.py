@@ -15,7 +15,7 @@ from accounts.auth.views import (
 )
 
 from .views import health_check, detailed_health_check, test_slack_notification
-from .metrics import system_metrics, performance_metrics, business_metrics
+from .metrics import ai_usage_metrics, system_metrics, performance_metrics, business_metrics
 
 # API documentation schema
 schema_view = get_schema_view(
@@ -44,6 +44,7 @@ urlpatterns = [
     path('api/metrics/system/', system_metrics, name='system-metrics'),
     path('api/metrics/performance/', performance_metrics, name='performance-metrics'),
     path('api/metrics/business/', business_metrics, name='business-metrics'),
+    path('api/metrics/ai-usage/', ai_usage_metrics, name='ai-usage-metrics'),
 
     # API Documentation
     re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
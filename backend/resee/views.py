@@ -4,7 +4,6 @@ Health check views for infrastructure monitoring with Slack notifications.
 import logging
 from django.db import connection
 from django.http import JsonResponse
-from django.core.cache import caches
 from django.conf import settings
 from utils.slack_notifications import slack_notifier
 
@@ -39,117 +38,21 @@ def health_check(request):
 
 def detailed_health_check(request):
     """
-    Detailed health check for all system components with Slack notifications.
+    Detailed health check for all system components.
 
-    Checks:
-    - Database connectivity
-    - Redis connectivity (throttle cache)
-    - Celery broker connectivity
+    Serves the snapshot refreshed by the refresh_health_snapshot beat task
+    (database, Redis, Celery workers) with its age, so the probe itself
+    never touches the database or the broker.
 
     Returns:
-        200 OK if all services are healthy
-        503 Service Unavailable if any service is down
+        200 OK if all services are healthy and the snapshot is fresh
+        503 Service Unavailable if any service is down, or the snapshot
+            is missing or stale (the prober is not running)
     """
-    health_status = {
-        'status': 'ok',
-        'timestamp': None,
-        'services': {}
-    }
+    from .health import health_report
 
-    all_healthy = True
-
-    # Check Database
-    try:
-        connection.ensure_connection()
-        with connection.cursor() as cursor:
-            cursor.execute('SELECT 1')
-        health_status['services']['database'] = {'status': 'ok'}
-        logger.debug("Database health check passed")
-    except Exception as e:
-        all_healthy = False
-        health_status['services']['database'] = {
-            'status': 'error',
-            'error': str(e)
-        }
-        # Send Slack alert
-        slack_notifier.send_health_alert(
-            service='database',
-            status='down',
-            details=str(e)
-        )
-        logger.error(f"Database health check failed: {e}")
-
-    # Check Redis (throttle cache)
-    try:
-        cache = caches['throttle']
-        cache.set('health_check', 'ok', 10)
-        result = cache.get('health_check')
-        if result != 'ok':
-            raise Exception("Cache set/get mismatch")
-        cache.delete('health_check')
-        health_status['services']['redis'] = {'status': 'ok'}
-        logger.debug("Redis health check passed")
-    except Exception as e:
-        all_healthy = False
-        health_status['services']['redis'] = {
-            'status': 'error',
-            'error': str(e)
-        }
-        # Send Slack alert
-        slack_notifier.send_health_alert(
-            service='redis',
-            status='down',
-            details=str(e)
-        )
-        logger.error(f"Redis health check failed: {e}")
-
-    # Check Celery broker (Redis-based)
-    try:
-        from celery import Celery
-        app = Celery()
-        app.config_from_object('django.conf:settings', namespace='CELERY')
-
-        # Try to inspect Celery workers
-        inspect = app.control.inspect(timeout=5)
-        stats = inspect.stats()
-
-        if stats:
-            health_status['services']['celery'] = {
-                'status': 'ok',
-                'workers': len(stats)
-            }
-            logger.debug(f"Celery health check passed - {len(stats)} workers active")
-        else:
-            # No workers found but broker might be ok
-            health_status['services']['celery'] = {
-                'status': 'degraded',
-                'warning': 'No active workers found'
-            }
-            logger.warning("Celery health check: No active workers found")
-    except Exception as e:
-        all_healthy = False
-        health_status['services']['celery'] = {
-            'status': 'error',
-            'error': str(e)
-        }
-        # Send Slack alert
-        slack_notifier.send_health_alert(
-            service='celery',
-            status='down',
-            details=str(e)
-        )
-        logger.error(f"Celery health check failed: {e}")
-
-    # Set overall status
-    if not all_healthy:
-        health_status['status'] = 'degraded'
-
-    # Add timestamp
-    from datetime import datetime
-    health_status['timestamp'] = datetime.now().isoformat()
-
-    status_code = 200 if all_healthy else 503
-    return JsonResponse(health_status, status=status_code)
+    report, healthy = health_report()
+    return JsonResponse(report, status=200 if healthy else 503)
 
 
 def test_slack_notification(request):
@@ -191,7 +94,8 @@ def test_slack_notification(request):
         fields={
             'Triggered by': str(request.user),
             'Environment': settings.DEBUG and 'Development' or 'Production',
-        }
+        },
+        blocking=True
     )
 
     if result:
@@ -0,0 +1,52 @@
+"""
+Celery worker start profiles and queue lookup.
+
+Tasks are routed by class of work (CELERY_TASK_ROUTES): emails, short
+scheduling work, long LLM calls and bulk DB maintenance each have a queue.
+A profile (CELERY_WORKER_PROFILES) pins a worker to some of those queues
+with a pool, concurrency and prefetch suited to its tasks, so a burst of
+multi-minute exam generations only occupies the AI workers while reminder
+and verification emails keep being picked up within seconds.
+
+Usage:
+    python manage.py run_worker realtime
+    python manage.py run_worker ai
+"""
+from django.conf import settings
+
+
+def get_profile(name):
+    """Worker profile settings by name."""
+    profiles = settings.CELERY_WORKER_PROFILES
+    if name not in profiles:
+        raise ValueError(f"Unknown worker profile '{name}' (available: {', '.join(sorted(profiles))})")
+    return profiles[name]
+
+
+def worker_argv(name, loglevel='info'):
+    """
+    Celery worker command line for a profile.
+
+    Returns:
+        list: arguments for app.worker_main (['worker', '--queues=...', ...])
+    """
+    profile = get_profile(name)
+    argv = [
+        'worker',
+        f'--loglevel={loglevel}',
+        f"--queues={','.join(profile['queues'])}",
+        f"--pool={profile['pool']}",
+        f"--concurrency={profile['concurrency']}",
+        f"--prefetch-multiplier={profile['prefetch_multiplier']}",
+        f'--hostname={name}@%h',
+    ]
+    if profile.get('max_tasks_per_child'):
+        argv.append(f"--max-tasks-per-child={profile['max_tasks_per_child']}")
+    return argv
+
+
+def task_queue(task_name):
+    """Name of the queue a task is routed to."""
+    from .celery import app
+
+    return app.amqp.router.route({}, task_name)['queue'].name
@@ -1,6 +1,9 @@
 from django.contrib import admin
 
-from .models import ReviewHistory, ReviewSchedule
+from .models import (
+    DailyReviewStats, IntervalRetentionStats, ReminderDelivery, ReviewHistory,
+    ReviewSchedule,
+)
 
 
 @admin.register(ReviewSchedule)
@@ -15,3 +18,24 @@ class ReviewHistoryAdmin(admin.ModelAdmin):
     list_display = ('content', 'user', 'review_date', 'result', 'time_spent')
     list_filter = ('result', 'review_date')
     search_fields = ('content__title', 'user__username')
+
+
+@admin.register(DailyReviewStats)
+class DailyReviewStatsAdmin(admin.ModelAdmin):
+    list_display = ('user', 'category_id', 'date', 'remembered_count', 'partial_count', 'forgot_count')
+    list_filter = ('date',)
+    search_fields = ('user__email',)
+
+
+@admin.register(IntervalRetentionStats)
+class IntervalRetentionStatsAdmin(admin.ModelAdmin):
+    list_display = ('user', 'interval_index', 'remembered_count', 'partial_count', 'forgot_count')
+    search_fields = ('user__email',)
+
+
+@admin.register(ReminderDelivery)
+class ReminderDeliveryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'reminder_type', 'date', 'status', 'attempts', 'sent_at')
+    list_filter = ('reminder_type', 'status', 'date')
+    search_fields = ('user__email',)
+    readonly_fields = ('created_at', 'updated_at')
@@ -0,0 +1,155 @@
+"""
+Learning analytics series built from pre-bucketed rollups
+
+Series are column-oriented: one compact integer array per metric, indexed
+by bucket offset from the series start. Nothing here loads ReviewHistory
+rows; day buckets come from DailyReviewStats and retention curves from
+IntervalRetentionStats.
+"""
+from array import array
+from collections import namedtuple
+from datetime import date, timedelta
+
+from django.db.models import Sum
+from django.utils import timezone
+
+from .models import DailyReviewStats, IntervalRetentionStats
+
+BUCKET_DAYS = {
+    'day': 1,
+    'week': 7,
+}
+
+RESULTS = tuple(DailyReviewStats.RESULT_FIELDS)
+
+SeriesPoint = namedtuple('SeriesPoint', ('date',) + RESULTS + ('total',))
+
+
+class ReviewSeries:
+    """
+    Review outcome counts bucketed by day or ISO week (Monday start)
+
+    Args:
+        start: First day covered by the series
+        end: Last day covered by the series (inclusive)
+        bucket: 'day' or 'week'
+    """
+
+    def __init__(self, start, end, bucket='day'):
+        self.bucket = bucket
+        self.bucket_days = BUCKET_DAYS[bucket]
+        self.end = end
+        # Week buckets are aligned to Monday so they are stable across ranges
+        self.start = start - timedelta(days=start.weekday()) if bucket == 'week' else start
+        size = (end - self.start).days // self.bucket_days + 1
+        self.counts = {result: array('I', [0]) * size for result in RESULTS}
+
+    def __len__(self):
+        return len(self.counts[RESULTS[0]])
+
+    @classmethod
+    def load(cls, user, start, end, bucket='day', category=None):
+        """Build a series from DailyReviewStats in one grouped query"""
+        series = cls(start, end, bucket)
+
+        rows = DailyReviewStats.objects.filter(user=user, date__gte=series.start, date__lte=end)
+        if category is not None:
+            rows = rows.filter(category=category)
+        rows = rows.order_by().values('date').annotate(
+            **{result: Sum(field) for result, field in DailyReviewStats.RESULT_FIELDS.items()}
+        ).values_list('date', *RESULTS)
+
+        for day, *values in rows:
+            series.add(day, values)
+        return series
+
+    def add(self, day, values):
+        """Add per-result counts (ordered as RESULTS) of a day to its bucket"""
+        index = (day - self.start).days // self.bucket_days
+        for result, value in zip(RESULTS, values):
+            self.counts[result][index] += value or 0
+
+    @property
+    def totals(self):
+        return array('I', map(sum, zip(*self.counts.values())))
+
+    def bucket_date(self, index):
+        return self.start + timedelta(days=index * self.bucket_days)
+
+    def points(self):
+        """Materialize row-shaped points (used for pagination)"""
+        totals = self.totals
+        return [
+            SeriesPoint(self.bucket_date(i), *(self.counts[r][i] for r in RESULTS), totals[i])
+            for i in range(len(self))
+        ]
+
+    def to_dict(self):
+        """Compact column-oriented representation"""
+        data = {
+            'bucket': self.bucket,
+            'start': self.start,
+            'end': self.end,
+            'total': self.totals.tolist(),
+        }
+        data.update({result: values.tolist() for result, values in self.counts.items()})
+        return data
+
+
+def get_review_streaks(user, today=None):
+    """
+    Compute review streaks from the days that have rollup rows
+
+    Returns:
+        dict: current_streak, longest_streak, last_review_date, active_days
+    """
+    today = today or timezone.localdate()
+
+    active_dates = DailyReviewStats.objects.filter(user=user).order_by('date').values_list(
+        'date', flat=True
+    ).distinct()
+    days = array('l', (day.toordinal() for day in active_dates))
+
+    longest = run = 0
+    previous = None
+    for ordinal in days:
+        run = run + 1 if previous is not None and ordinal == previous + 1 else 1
+        longest = max(longest, run)
+        previous = ordinal
+
+    # A streak is still alive if the last review was today or yesterday
+    current = run if previous is not None and today.toordinal() - previous <= 1 else 0
+
+    return {
+        'current_streak': current,
+        'longest_streak': longest,
+        'last_review_date': date.fromordinal(previous) if previous is not None else None,
+        'active_days': len(days),
+    }
+
+
+def get_retention_curve(user):
+    """
+    Retention per interval_index as parallel arrays
+
+    Returns:
+        dict: interval_index, remembered, partial, forgot, total and
+              retention_rate (% remembered) arrays of equal length
+    """
+    rows = IntervalRetentionStats.objects.filter(user=user).order_by('interval_index').values_list(
+        'interval_index', *(DailyReviewStats.RESULT_FIELDS[result] for result in RESULTS)
+    )
+
+    curve = {key: array('I') for key in ('interval_index',) + RESULTS + ('total',)}
+    retention_rate = []
+    for interval_index, *values in rows:
+        total = sum(values)
+        curve['interval_index'].append(interval_index)
+        for result, value in zip(RESULTS, values):
+            curve[result].append(value)
+        curve['total'].append(total)
+        retention_rate.append(round(values[0] / total * 100, 1) if total else 0.0)
+
+    data = {key: values.tolist() for key, values in curve.items()}
+    data['retention_rate'] = retention_rate
+    return data
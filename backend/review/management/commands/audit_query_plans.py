@@ -0,0 +1,75 @@
+"""
+EXPLAIN hot review/content/exam queries and flag full table scans
+
+Usage:
+    python manage.py audit_query_plans --user-id 42
+    python manage.py audit_query_plans --seed --users 10000 --contents-per-user 100 --histories-per-content 10
+    python manage.py audit_query_plans --seed --users 50 --explain
+    python manage.py audit_query_plans --user-id 42 --benchmark 5 --sample-users 50
+"""
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from resee.query_audit import audit_hot_queries, benchmark_hot_queries, seed_review_volume
+from review.models import ReviewSchedule
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Run EXPLAIN on hot queries and fail if any of them full-scans its table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', type=int, help='Audit queries of this user')
+        parser.add_argument('--seed', action='store_true', help='Seed synthetic volume before auditing')
+        parser.add_argument('--users', type=int, default=100, help='Users to seed')
+        parser.add_argument('--contents-per-user', type=int, default=100, help='Contents/schedules per user')
+        parser.add_argument('--histories-per-content', type=int, default=10, help='Review histories per content')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk insert')
+        parser.add_argument('--explain', action='store_true', help='Print full query plans')
+        parser.add_argument('--benchmark', type=int, default=0, metavar='ROUNDS',
+                            help='Also time each query for ROUNDS rounds over sampled users')
+        parser.add_argument('--sample-users', type=int, default=20, help='Users sampled for --benchmark')
+
+    def handle(self, *args, **options):
+        if options['seed']:
+            user_ids = seed_review_volume(
+                users=options['users'],
+                contents_per_user=options['contents_per_user'],
+                histories_per_content=options['histories_per_content'],
+                batch_size=options['batch_size'],
+                progress=self.stdout.write,
+            )
+            user_id = options['user_id'] or user_ids[len(user_ids) // 2]
+        else:
+            user_id = options['user_id']
+            if not user_id:
+                raise CommandError('Pass --user-id or --seed')
+
+        try:
+            user = User.objects.get(pk=user_id)
+        except User.DoesNotExist:
+            raise CommandError(f'User {user_id} does not exist')
+
+        failures = []
+        for result in audit_hot_queries(user):
+            indexes = ', '.join(result.indexes) or '-'
+            if result.full_scan:
+                failures.append(result.name)
+                self.stdout.write(self.style.ERROR(f'FAIL {result.name}: full scan on {result.table}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'PASS {result.name}: {indexes}'))
+            if options['explain']:
+                self.stdout.write(result.plan)
+
+        if options['benchmark']:
+            user_ids = list(
+                ReviewSchedule.objects.values_list('user_id', flat=True)
+                .distinct().order_by('?')[:options['sample_users']]
+            )
+            timings = benchmark_hot_queries(user_ids, repeat=options['benchmark'])
+            for name, timing in timings.items():
+                self.stdout.write(f"{name}: median {timing['median_ms']}ms, p95 {timing['p95_ms']}ms")
+
+        if failures:
+            raise CommandError(f"Full table scans in: {', '.join(failures)}")
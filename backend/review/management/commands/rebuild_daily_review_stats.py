@@ -0,0 +1,41 @@
+"""
+Backfill / repair daily review stats rollups from ReviewHistory
+
+Usage:
+    python manage.py rebuild_daily_review_stats --days 365
+    python manage.py rebuild_daily_review_stats --days 30 --user-id 42
+"""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from review.utils import rebuild_daily_review_stats
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Rebuild DailyReviewStats rows for the last N days (including today)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30, help='Number of past days to rebuild')
+        parser.add_argument('--user-id', type=int, help='Only rebuild rollups of this user')
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user_id']:
+            try:
+                user = User.objects.get(pk=options['user_id'])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user_id']} does not exist")
+
+        today = timezone.localdate()
+        written = 0
+        for offset in range(options['days'] + 1):
+            written += rebuild_daily_review_stats(today - timedelta(days=offset), user=user)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt daily review stats for {options['days'] + 1} days ({written} rows)"
+        ))
@@ -0,0 +1,34 @@
+"""
+Backfill / repair denormalized review counters on Content
+
+Usage:
+    python manage.py rebuild_review_counters
+    python manage.py rebuild_review_counters --user-id 42 --batch-size 500
+"""
+from django.core.management.base import BaseCommand
+
+from content.models import Content
+from review.utils import refresh_content_review_counters
+
+
+class Command(BaseCommand):
+    help = 'Recompute Content review counters (total, remembered, last review) from ReviewHistory'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', type=int, help='Only repair contents of this user')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Contents updated per statement')
+
+    def handle(self, *args, **options):
+        batch_size = max(options['batch_size'], 1)
+
+        content_ids = Content.objects.order_by('pk')
+        if options['user_id']:
+            content_ids = content_ids.filter(author_id=options['user_id'])
+        content_ids = list(content_ids.values_list('pk', flat=True))
+
+        updated = 0
+        for start in range(0, len(content_ids), batch_size):
+            batch = content_ids[start:start + batch_size]
+            updated += refresh_content_review_counters(Content.objects.filter(pk__in=batch))
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt review counters for {updated} contents'))
@@ -0,0 +1,91 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:59
+
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+import django.db.models.deletion
+
+RESULT_FIELDS = {
+    'remembered': 'remembered_count',
+    'partial': 'partial_count',
+    'forgot': 'forgot_count',
+}
+
+
+def backfill_daily_review_stats(apps, schema_editor):
+    """Populate rollups from existing review history (same grouping as review.utils.rebuild_daily_review_stats)."""
+    DailyReviewStats = apps.get_model('review', 'DailyReviewStats')
+    ReviewHistory = apps.get_model('review', 'ReviewHistory')
+
+    aggregates = {
+        field: Count('id', filter=Q(result=result))
+        for result, field in RESULT_FIELDS.items()
+    }
+    aggregates.update(
+        total_time_spent=Coalesce(Sum('time_spent'), 0),
+        ai_score_sum=Coalesce(Sum('ai_score'), 0.0),
+        ai_score_count=Count('ai_score'),
+    )
+    grouped = (
+        ReviewHistory.objects.order_by()
+        .annotate(day=TruncDate('review_date', tzinfo=ZoneInfo(settings.TIME_ZONE)))
+        .values('user_id', 'content__category_id', 'day')
+        .annotate(**aggregates)
+    )
+
+    rows = (
+        DailyReviewStats(
+            user_id=item.pop('user_id'),
+            category_id=item.pop('content__category_id'),
+            date=item.pop('day'),
+            **item
+        )
+        for item in grouped.iterator()
+    )
+    DailyReviewStats.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0007_content_review_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('review', '0004_reviewhistory_selected_choice_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyReviewStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('date', models.DateField(help_text='Review date in settings.TIME_ZONE')),
+                ('remembered_count', models.PositiveIntegerField(default=0)),
+                ('partial_count', models.PositiveIntegerField(default=0)),
+                ('forgot_count', models.PositiveIntegerField(default=0)),
+                ('total_time_spent', models.PositiveIntegerField(default=0, help_text='Sum of time spent in seconds')),
+                ('ai_score_sum', models.FloatField(default=0)),
+                ('ai_score_count', models.PositiveIntegerField(default=0)),
+                ('category', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='content.category')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Daily review stats',
+                'ordering': ['-date'],
+                'indexes': [models.Index(fields=['user', 'date'], name='daily_stats_user_date')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyreviewstats',
+            constraint=models.UniqueConstraint(condition=models.Q(('category__isnull', False)), fields=('user', 'category', 'date'), name='daily_stats_unique_user_category_date'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyreviewstats',
+            constraint=models.UniqueConstraint(condition=models.Q(('category__isnull', True)), fields=('user', 'date'), name='daily_stats_unique_user_uncategorized_date'),
+        ),
+        migrations.RunPython(backfill_daily_review_stats, migrations.RunPython.noop),
+    ]
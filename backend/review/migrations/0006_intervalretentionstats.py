@@ -0,0 +1,42 @@
+# Generated by Django 4.2.16 on 2026-10-18 21:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('review', '0005_dailyreviewstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewhistory',
+            name='interval_index',
+            field=models.IntegerField(blank=True, help_text='Schedule interval_index at review time', null=True),
+        ),
+        migrations.CreateModel(
+            name='IntervalRetentionStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('interval_index', models.IntegerField(help_text='Schedule interval_index at review time')),
+                ('remembered_count', models.PositiveIntegerField(default=0)),
+                ('partial_count', models.PositiveIntegerField(default=0)),
+                ('forgot_count', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Interval retention stats',
+                'ordering': ['interval_index'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='intervalretentionstats',
+            constraint=models.UniqueConstraint(fields=('user', 'interval_index'), name='retention_stats_unique_user_interval'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.16 on 2026-10-18 21:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('review', '0006_intervalretentionstats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reviewschedule',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'next_review_date'], include=('content', 'interval_index'), name='review_sched_active_due'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewschedule',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['next_review_date'], name='review_sched_active_date'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewschedule',
+            index=models.Index(condition=models.Q(('initial_review_completed', False), ('is_active', True)), fields=['user'], name='review_sched_pending_initial'),
+        ),
+        migrations.RemoveIndex(
+            model_name='reviewschedule',
+            name='review_sched_user_active',
+        ),
+        migrations.RemoveIndex(
+            model_name='reviewschedule',
+            name='review_schedule_next_date',
+        ),
+    ]
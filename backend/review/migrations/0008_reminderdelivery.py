@@ -0,0 +1,40 @@
+# Generated by Django 4.2.16 on 2026-10-18 22:19
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('review', '0007_schedule_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('reminder_type', models.CharField(choices=[('daily', 'Daily review reminder')], default='daily', max_length=20)),
+                ('date', models.DateField(help_text='Reminder date in settings.TIME_ZONE')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('skipped', 'Skipped'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Reminder deliveries',
+                'ordering': ['-date'],
+                'indexes': [models.Index(fields=['date', 'reminder_type', 'status'], name='reminder_delivery_date_status')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reminderdelivery',
+            constraint=models.UniqueConstraint(fields=('user', 'date', 'reminder_type'), name='reminder_delivery_unique_user_date_type'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.16 on 2026-10-18 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('review', '0008_reminderdelivery'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='reviewschedule',
+            name='review_sched_active_date',
+        ),
+        migrations.AlterField(
+            model_name='reminderdelivery',
+            name='date',
+            field=models.DateField(help_text="Reminder date in the user's time zone"),
+        ),
+    ]
@@ -3,6 +3,7 @@ from datetime import timedelta
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import DEFERRED
 from django.utils import timezone
 
 from accounts.subscription.services import SubscriptionService
@@ -34,8 +35,20 @@ class ReviewSchedule(TimestampMixin, UserOwnedMixin):
         unique_together = ['content', 'user']
         ordering = ['next_review_date']
         indexes = [
-            models.Index(fields=['user', 'next_review_date', 'is_active'], name='review_sched_user_active'),
-            models.Index(fields=['next_review_date'], name='review_schedule_next_date'),
+            # Every schedule query filters is_active=True, so due-date indexes are partial.
+            # INCLUDE lets Postgres answer due lists with index-only scans.
+            models.Index(
+                fields=['user', 'next_review_date'],
+                include=['content', 'interval_index'],
+                condition=models.Q(is_active=True),
+                name='review_sched_active_due',
+            ),
+            # Initial reviews are shown regardless of due date (OR branch of today's query)
+            models.Index(
+                fields=['user'],
+                condition=models.Q(is_active=True, initial_review_completed=False),
+                name='review_sched_pending_initial',
+            ),
             models.Index(fields=['user', 'is_active'], name='review_schedule_user_active'),
         ]
         constraints = [
@@ -182,6 +195,13 @@ class ReviewHistory(TimestampMixin, UserOwnedMixin):
         help_text='User guessed title for subjective mode'
     )
 
+    # 복습 시점의 스케줄 간격 (retention curve 집계용)
+    interval_index = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text='Schedule interval_index at review time'
+    )
+
     class Meta:
         ordering = ['-review_date']
         verbose_name_plural = 'Review histories'
@@ -198,6 +218,12 @@ class ReviewHistory(TimestampMixin, UserOwnedMixin):
             ),
         ]
 
+    def __init__(self, *args, **kwargs):
+        """Store the loaded review day so edits can repair the day's rollup too"""
+        super().__init__(*args, **kwargs)
+        # Deferred fields stay unloaded so .only()/.defer() querysets don't recurse
+        self._original_review_date = self.__dict__.get('review_date', DEFERRED)
+
     def clean(self):
         """Validate model data"""
         super().clean()
@@ -218,6 +244,145 @@ class ReviewHistory(TimestampMixin, UserOwnedMixin):
         """Override save to run validation"""
         self.full_clean()
         super().save(*args, **kwargs)
+        self._original_review_date = self.review_date
 
     def __str__(self):
         return f"{self.content.title} - {self.result}"
+
+
+class DailyReviewStats(TimestampMixin, UserOwnedMixin):
+    """
+    Daily per-(user, category) rollup of ReviewHistory
+
+    Incremented when a review is recorded, rebuilt for the day when a history
+    is edited or deleted, and rebuilt nightly from raw history, so stats
+    windows sum at most one row per day and category.
+    """
+    RESULT_FIELDS = {
+        'remembered': 'remembered_count',
+        'partial': 'partial_count',
+        'forgot': 'forgot_count',
+    }
+
+    # No FK constraint: rollups outlive deleted categories so totals stay intact
+    category = models.ForeignKey(
+        'content.Category',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+    date = models.DateField(help_text='Review date in settings.TIME_ZONE')
+    remembered_count = models.PositiveIntegerField(default=0)
+    partial_count = models.PositiveIntegerField(default=0)
+    forgot_count = models.PositiveIntegerField(default=0)
+    total_time_spent = models.PositiveIntegerField(default=0, help_text='Sum of time spent in seconds')
+    ai_score_sum = models.FloatField(default=0)
+    ai_score_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-date']
+        verbose_name_plural = 'Daily review stats'
+        indexes = [
+            models.Index(fields=['user', 'date'], name='daily_stats_user_date'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'category', 'date'],
+                condition=models.Q(category__isnull=False),
+                name='daily_stats_unique_user_category_date'
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'date'],
+                condition=models.Q(category__isnull=True),
+                name='daily_stats_unique_user_uncategorized_date'
+            ),
+        ]
+
+    @property
+    def total_count(self):
+        return self.remembered_count + self.partial_count + self.forgot_count
+
+    @property
+    def average_ai_score(self):
+        if not self.ai_score_count:
+            return None
+        return round(self.ai_score_sum / self.ai_score_count, 1)
+
+    def __str__(self):
+        return f"{self.user_id} - {self.category_id} ({self.date}): {self.total_count}"
+
+
+class IntervalRetentionStats(TimestampMixin, UserOwnedMixin):
+    """
+    Lifetime review outcome counters per (user, interval_index)
+
+    Feeds retention curves without scanning ReviewHistory.
+    """
+    interval_index = models.IntegerField(help_text='Schedule interval_index at review time')
+    remembered_count = models.PositiveIntegerField(default=0)
+    partial_count = models.PositiveIntegerField(default=0)
+    forgot_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['interval_index']
+        verbose_name_plural = 'Interval retention stats'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'interval_index'],
+                name='retention_stats_unique_user_interval'
+            ),
+        ]
+
+    @property
+    def total_count(self):
+        return self.remembered_count + self.partial_count + self.forgot_count
+
+    def __str__(self):
+        return f"{self.user_id} - interval {self.interval_index}: {self.remembered_count}/{self.total_count}"
+
+
+class ReminderDelivery(TimestampMixin, UserOwnedMixin):
+    """
+    Delivery ledger of reminder emails: one row per (user, date, reminder type)
+
+    The reminder fan-out records a pending row per user before queueing the
+    email task, and skips users whose row is already past pending, so a retried
+    or overlapping run only redoes unfinished users. The email task claims the
+    row (pending -> sending) with a single conditional UPDATE before sending and
+    marks it sent afterwards, so task retries never send the same reminder twice.
+    """
+
+    class ReminderType(models.TextChoices):
+        DAILY = 'daily', 'Daily review reminder'
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'  # Queued by the fan-out, not claimed yet
+        SENDING = 'sending', 'Sending'  # Claimed by a task; never reclaimed (at most once)
+        SENT = 'sent', 'Sent'
+        SKIPPED = 'skipped', 'Skipped'  # Nothing left to review when the task ran
+        FAILED = 'failed', 'Failed'  # Retries exhausted
+
+    reminder_type = models.CharField(max_length=20, choices=ReminderType.choices, default=ReminderType.DAILY)
+    date = models.DateField(help_text="Reminder date in the user's time zone")
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['-date']
+        verbose_name_plural = 'Reminder deliveries'
+        indexes = [
+            models.Index(fields=['date', 'reminder_type', 'status'], name='reminder_delivery_date_status'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'date', 'reminder_type'],
+                name='reminder_delivery_unique_user_date_type'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.reminder_type} ({self.date}): {self.status}"
@@ -0,0 +1,81 @@
+"""
+Signals for review app
+"""
+from django.db.models import DEFERRED, F, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import ReviewHistory
+from .utils import (
+    record_daily_review_stats, record_interval_retention, refresh_content_review_counters,
+    refresh_daily_review_stats,
+)
+
+# Fields that feed the Content review counters
+COUNTER_FIELDS = {'result', 'review_date', 'content'}
+
+# Fields that feed the daily (user, category) rollups
+STATS_FIELDS = COUNTER_FIELDS | {'time_spent', 'ai_score'}
+
+
+def _deleted_directly(origin):
+    """Whether a post_delete comes from deleting ReviewHistory itself, not a cascade"""
+    deleted_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return deleted_model is ReviewHistory
+
+
+@receiver(post_save, sender=ReviewHistory)
+def update_content_review_counters(sender, instance, created, update_fields=None, **kwargs):
+    """Bump denormalized review counters on Content when a review is recorded"""
+    # Import here to avoid circular imports
+    from content.models import Content
+
+    if not created:
+        # An edited result can't be applied incrementally (it may be the latest review)
+        if update_fields is None or COUNTER_FIELDS & set(update_fields):
+            refresh_content_review_counters(Content.objects.filter(pk=instance.content_id))
+        return
+
+    counters = {
+        'total_reviews': F('total_reviews') + 1,
+        'last_reviewed_at': instance.review_date,
+        'last_review_result': instance.result,
+    }
+    if instance.result == 'remembered':
+        counters['remembered_reviews'] = F('remembered_reviews') + 1
+
+    Content.objects.filter(pk=instance.content_id).update(**counters)
+
+
+@receiver(post_delete, sender=ReviewHistory)
+def refresh_counters_after_history_delete(sender, instance, origin=None, **kwargs):
+    """Recompute the content's counters when one of its review histories is deleted"""
+    # Cascades from Content/User deletion remove the content too; nothing to refresh
+    if not _deleted_directly(origin):
+        return
+
+    from content.models import Content
+
+    refresh_content_review_counters(Content.objects.filter(pk=instance.content_id))
+
+
+@receiver(post_save, sender=ReviewHistory)
+def update_daily_review_stats(sender, instance, created, update_fields=None, **kwargs):
+    """Add the new review to its daily (user, category) rollup and retention counter"""
+    if created:
+        record_daily_review_stats(instance)
+        record_interval_retention(instance)
+        return
+
+    # An edit may move the review to another day or category; rebuild instead of adjusting
+    if update_fields is None or STATS_FIELDS & set(update_fields):
+        previous = instance._original_review_date
+        refresh_daily_review_stats(instance, None if previous is DEFERRED else previous)
+
+
+@receiver(post_delete, sender=ReviewHistory)
+def refresh_daily_stats_after_history_delete(sender, instance, origin=None, **kwargs):
+    """Rebuild the day's rollups when a review history is deleted"""
+    # Rollups outlive deleted contents and users so past totals stay intact
+    if _deleted_directly(origin):
+        refresh_daily_review_stats(instance)
@@ -11,101 +11,213 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 from accounts.email.email_service import EmailService
-from review.models import ReviewSchedule
+from review.models import ReminderDelivery, ReviewSchedule
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def send_hourly_notifications(self):
+def send_due_review_reminders(self):
     """
-    매시간 0분에 실행되는 알림 태스크
-    현재 시간에 맞춰 사용자별 설정된 시간에 알림 발송
+    5분마다 실행되는 알림 태스크
+    사용자 시간대 기준으로 설정된 알림 시각이 지난 사용자에게 알림 발송
     """
     try:
-        current_time = timezone.now()
-        current_hour = current_time.hour
-
-        logger.info(f"일일 알림 처리 시작 - 현재 시간: {current_hour}시")
-
-        # 일일 복습 알림 처리
-        daily_count = send_daily_reminders_for_hour(current_hour)
+        daily_count = send_due_daily_reminders()
 
         result_message = f"일일 알림 완료 - 발송: {daily_count}건"
         logger.info(result_message)
         return result_message
 
     except Exception as exc:
-        logger.error(f"Error in send_hourly_notifications: {str(exc)}")
+        logger.error(f"Error in send_due_review_reminders: {str(exc)}")
         raise self.retry(exc=exc)
 
 
-def send_daily_reminders_for_hour(hour: int):
-    """지정된 시간에 일일 복습 알림을 받을 사용자들에게 발송"""
-    try:
-        today = timezone.now().date()
+@shared_task
+def send_hourly_notifications():
+    """이전 매시간 알림 태스크 (이미 등록된 주기 작업 호환용): send_due_review_reminders 와 동일"""
+    return send_due_review_reminders()
+
+
+def send_due_daily_reminders(now=None):
+    """
+    일일 알림 발송 시각이 지난 사용자들에게 알림 발송
+
+    NotificationPreference.next_daily_reminder_at (UTC, 부분 인덱스) 범위 조회로 발송할
+    사용자만 읽고, 처리한 사용자의 발송 시각은 다음 날로 옮깁니다. 전체 스케줄/알림 설정
+    조인 없이 BATCH_SIZE 명씩 처리합니다.
+
+    Args:
+        now: 기준 시각 (기본값: 현재)
+
+    Returns:
+        int: 알림 작업을 큐에 넣은 사용자 수
+
+    Raises:
+        RuntimeError: 일부 사용자의 작업을 큐에 넣지 못한 경우 (발송 시각을 옮기지 않으므로
+            재시도나 다음 실행에서 이어서 처리)
+    """
+    from accounts.models import NotificationPreference
+
+    now = now or timezone.now()
+    batch_size = settings.REMINDER_SETTINGS['BATCH_SIZE']
+    queued_count = 0
+
+    while True:
+        preferences = list(
+            NotificationPreference.objects
+            .filter(next_daily_reminder_at__lte=now)
+            .order_by('next_daily_reminder_at')
+            .only('user_id', 'email_notifications_enabled', 'daily_reminder_enabled',
+                  'daily_reminder_time', 'time_zone', 'next_daily_reminder_at')[:batch_size]
+        )
+        if not preferences:
+            break
+
+        queued, failed_user_ids = queue_daily_reminders(preferences, now)
+        queued_count += queued
+
+        # 다음 발송 시각으로 이동 (알림이 꺼진 사용자는 NULL 이 되어 인덱스에서 빠짐)
+        advanced = [preference for preference in preferences if preference.user_id not in failed_user_ids]
+        for preference in advanced:
+            preference.next_daily_reminder_at = preference.next_daily_reminder(after=now)
+        NotificationPreference.objects.bulk_update(advanced, ['next_daily_reminder_at'])
+
+        if failed_user_ids:
+            raise RuntimeError(f"일일 알림 {len(failed_user_ids)}개 큐잉 실패")
+        if len(preferences) < batch_size:
+            break
+
+    if queued_count > 0:
+        logger.info(f"일일 알림 {queued_count}개 큐잉 완료")
+    return queued_count
+
 
-        # 해당 시간에 일일 알림을 받을 사용자들 조회
-        schedules_today = ReviewSchedule.objects.filter(
-            next_review_date__date=today,
+def queue_daily_reminders(preferences, now):
+    """
+    발송 시각이 된 사용자들의 오늘 복습 스케줄을 모아 알림 작업을 큐에 넣기
+
+    '오늘'은 사용자 시간대 기준이며, 같은 날짜/시간대의 사용자는 스케줄을 한 번에
+    조회합니다. 큐에 넣기 전에 사용자별 ReminderDelivery(pending) 를 기록하고, 오늘 이미
+    선점/발송된 사용자는 건너뜁니다 (중복으로 큐에 들어가도 발송은 한 번만 선점됩니다).
+    MAX_LATENESS_MINUTES 보다 늦은 발송 시각(워커 중단 등)은 보내지 않고 넘깁니다.
+
+    Args:
+        preferences: 발송 시각이 지난 NotificationPreference 목록
+        now: 기준 시각
+
+    Returns:
+        tuple: (큐에 넣은 사용자 수, 큐에 넣지 못한 사용자 ID 집합)
+    """
+    from zoneinfo import ZoneInfo
+
+    from review.utils import local_day_bounds
+
+    max_lateness = timedelta(minutes=settings.REMINDER_SETTINGS['MAX_LATENESS_MINUTES'])
+
+    # 사용자 시간대 기준 알림 날짜별로 그룹화
+    groups = {}
+    for preference in preferences:
+        if not (preference.email_notifications_enabled and preference.daily_reminder_enabled):
+            continue
+        if now - preference.next_daily_reminder_at > max_lateness:
+            logger.warning(f"Skipping daily reminder for user {preference.user_id} due at "
+                           f"{preference.next_daily_reminder_at.isoformat()}")
+            continue
+        local_date = preference.next_daily_reminder_at.astimezone(ZoneInfo(preference.time_zone)).date()
+        groups.setdefault((local_date, preference.time_zone), []).append(preference.user_id)
+
+    # (사용자 ID, 알림 날짜) 별 오늘 스케줄
+    user_schedules = {}
+    for (local_date, time_zone), user_ids in groups.items():
+        day_start, day_end = local_day_bounds(local_date, ZoneInfo(time_zone))
+        handled = ReminderDelivery.objects.filter(
+            user_id__in=user_ids,
+            date=local_date,
+            reminder_type=ReminderDelivery.ReminderType.DAILY,
+        ).exclude(status=ReminderDelivery.Status.PENDING).values('user_id')
+        schedules = ReviewSchedule.objects.filter(
+            user_id__in=user_ids,
             is_active=True,
-            user__notification_preference__email_notifications_enabled=True,
-            user__notification_preference__daily_reminder_enabled=True,
-            user__notification_preference__daily_reminder_time__hour=hour
-        ).select_related(
-            'user', 'content', 'user__notification_preference'
-        ).prefetch_related('content__category')
-
-        # 사용자별로 그룹화
-        user_schedules = {}
-        for schedule in schedules_today:
-            user_id = schedule.user.id
-            if user_id not in user_schedules:
-                user_schedules[user_id] = {
-                    'user': schedule.user,
-                    'schedules': []
-                }
-            user_schedules[user_id]['schedules'].append(schedule)
-
-        sent_count = 0
-        # 각 사용자에게 개별 이메일 발송
-        for user_data in user_schedules.values():
-            try:
-                send_individual_review_reminder.delay(
-                    user_data['user'].id,
-                    [s.id for s in user_data['schedules']]
-                )
-                sent_count += 1
-            except Exception as e:
-                logger.error(f"Failed to queue daily reminder for user {user_data['user'].email}: {str(e)}")
-
-        if sent_count > 0:
-            logger.info(f"일일 알림 {sent_count}개 큐잉 완료 - {hour}시")
-        return sent_count
-
-    except Exception as e:
-        logger.error(f"Error in send_daily_reminders_for_hour({hour}): {str(e)}")
-        return 0
+            next_review_date__gte=day_start,
+            next_review_date__lt=day_end,
+        ).exclude(user_id__in=handled).values_list('user_id', 'id')
+        for user_id, schedule_id in schedules:
+            user_schedules.setdefault((user_id, local_date), []).append(schedule_id)
+
+    ReminderDelivery.objects.bulk_create(
+        [ReminderDelivery(user_id=user_id, date=local_date) for user_id, local_date in user_schedules],
+        ignore_conflicts=True
+    )
+
+    queued_count = 0
+    failed_user_ids = set()
+    # 각 사용자에게 개별 이메일 발송
+    for (user_id, local_date), schedule_ids in user_schedules.items():
+        try:
+            send_individual_review_reminder.delay(user_id, schedule_ids, local_date.isoformat())
+            queued_count += 1
+        except Exception as e:
+            failed_user_ids.add(user_id)
+            logger.error(f"Failed to queue daily reminder for user {user_id}: {str(e)}")
+
+    return queued_count, failed_user_ids
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def send_individual_review_reminder(self, user_id: int, schedule_ids: List[int]):
+def send_individual_review_reminder(self, user_id: int, schedule_ids: List[int], reminder_date: str = None):
     """
     개별 사용자에게 복습 알림 이메일 발송
 
+    발송 전에 ReminderDelivery 를 pending -> sending 으로 선점하고 발송 후 sent 로
+    기록합니다. 선점하지 못하면 (이미 발송 중/완료) 아무것도 하지 않으므로, 재시도나
+    중복 전달에도 같은 알림은 한 번만 발송됩니다. 발송 전에 실패하면 선점을 되돌리고
+    재시도합니다.
+
     Args:
         user_id: 사용자 ID
         schedule_ids: 복습 스케줄 ID 목록
+        reminder_date: 사용자 시간대 기준 알림 날짜 (ISO 형식, 기본값: 오늘)
     """
+    from datetime import date
+
+    from django.db.models import F
+
+    day = date.fromisoformat(reminder_date) if reminder_date else timezone.localdate()
+
     try:
-        user = User.objects.get(id=user_id)
-        schedules = ReviewSchedule.objects.filter(
+        user = User.objects.select_related('notification_preference').get(id=user_id)
+    except User.DoesNotExist:
+        logger.error(f"User with id {user_id} does not exist")
+        return f"User with id {user_id} does not exist"
+
+    delivery, _ = ReminderDelivery.objects.get_or_create(
+        user=user, date=day, reminder_type=ReminderDelivery.ReminderType.DAILY
+    )
+    claimed = ReminderDelivery.objects.filter(
+        pk=delivery.pk, status=ReminderDelivery.Status.PENDING
+    ).update(
+        status=ReminderDelivery.Status.SENDING,
+        attempts=F('attempts') + 1,
+        updated_at=timezone.now()
+    )
+    if not claimed:
+        delivery.refresh_from_db(fields=['status'])
+        logger.info(f"Daily reminder for user {user_id} on {day} already {delivery.status}")
+        return f"Daily reminder for user {user_id} already {delivery.status}"
+
+    try:
+        schedules = list(ReviewSchedule.objects.filter(
             id__in=schedule_ids,
-            user=user
-        ).select_related('content').prefetch_related('content__category')
+            user=user,
+            is_active=True
+        ).select_related('content').prefetch_related('content__category'))
 
-        if not schedules.exists():
+        if not schedules:
+            delivery.status = ReminderDelivery.Status.SKIPPED
+            delivery.save(update_fields=['status', 'updated_at'])
             logger.warning(f"No schedules found for user {user.email}")
             return f"No schedules found for user {user.email}"
 
@@ -113,7 +225,7 @@ def send_individual_review_reminder(self, user_id: int, schedule_ids: List[int])
         context = {
             'user': user,
             'schedules': schedules,
-            'total_reviews': schedules.count(),
+            'total_reviews': len(schedules),
             'review_url': f"{settings.FRONTEND_URL}/review",
             'unsubscribe_url': user.notification_preference.generate_unsubscribe_url(),
             'company_name': getattr(settings, 'COMPANY_NAME', 'Resee'),
@@ -121,12 +233,12 @@ def send_individual_review_reminder(self, user_id: int, schedule_ids: List[int])
         }
 
         # 이메일 제목
-        if schedules.count() == 1:
+        if len(schedules) == 1:
             subject = f"[{context['company_name']}] 오늘 복습할 콘텐츠가 1개 있습니다"
         else:
-            subject = f"[{context['company_name']}] 오늘 복습할 콘텐츠가 {schedules.count()}개 있습니다"
+            subject = f"[{context['company_name']}] 오늘 복습할 콘텐츠가 {len(schedules)}개 있습니다"
 
-        # 이메일 발송
+        # 이메일 발송 (실패 시 False: 발송되지 않았으므로 재시도해도 안전)
         email_service = EmailService()
         success = email_service.send_template_email(
             template_name='daily_review_notification',
@@ -134,21 +246,31 @@ def send_individual_review_reminder(self, user_id: int, schedule_ids: List[int])
             subject=subject,
             recipient_email=user.email
         )
-
-        if success:
-            result_message = f"Review reminder sent to {user.email} for {schedules.count()} items"
-            logger.info(result_message)
-            return result_message
-        else:
+        if not success:
             raise Exception("Email sending failed")
 
-    except User.DoesNotExist:
-        logger.error(f"User with id {user_id} does not exist")
-        return f"User with id {user_id} does not exist"
     except Exception as exc:
         logger.error(f"Error sending reminder to user {user_id}: {str(exc)}")
+        exhausted = self.request.retries >= self.max_retries
+        ReminderDelivery.objects.filter(pk=delivery.pk).update(
+            status=ReminderDelivery.Status.FAILED if exhausted else ReminderDelivery.Status.PENDING,
+            last_error=str(exc),
+            updated_at=timezone.now()
+        )
+        if exhausted:
+            raise
         raise self.retry(exc=exc)
 
+    ReminderDelivery.objects.filter(pk=delivery.pk).update(
+        status=ReminderDelivery.Status.SENT,
+        sent_at=timezone.now(),
+        last_error='',
+        updated_at=timezone.now()
+    )
+    result_message = f"Review reminder sent to {user.email} for {len(schedules)} items"
+    logger.info(result_message)
+    return result_message
+
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def adjust_review_schedules_on_subscription_change(self, subscription_id: int):
@@ -239,3 +361,50 @@ def adjust_review_schedules_on_subscription_change(self, subscription_id: int):
     except Exception as exc:
         logger.error(f"Error adjusting review schedules for subscription {subscription_id}: {str(exc)}")
         raise self.retry(exc=exc)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def compact_daily_review_stats(self, days: int = 2):
+    """
+    매일 새벽 실행: 최근 일별 복습 통계 롤업을 원본 ReviewHistory 기준으로 재계산
+
+    Incremental updates on review completion keep today's rows current;
+    this pass reconciles the last `days` closed days (missed increments,
+    category changes) so the rollups stay authoritative.
+
+    Args:
+        days: Number of past days (excluding today) to rebuild
+    """
+    from review.utils import rebuild_daily_review_stats
+
+    try:
+        today = timezone.localdate()
+        written = 0
+        for offset in range(1, days + 1):
+            written += rebuild_daily_review_stats(today - timedelta(days=offset))
+
+        result_message = f"Compacted daily review stats for {days} days ({written} rows)"
+        logger.info(result_message)
+        return result_message
+
+    except Exception as exc:
+        logger.error(f"Error compacting daily review stats: {str(exc)}")
+        raise self.retry(exc=exc)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def prune_reminder_deliveries(self):
+    """
+    매일 새벽 실행: 보관 기간(DELIVERY_RETENTION_DAYS)이 지난 알림 발송 기록 삭제
+    """
+    try:
+        cutoff = timezone.localdate() - timedelta(days=settings.REMINDER_SETTINGS['DELIVERY_RETENTION_DAYS'])
+        deleted, _ = ReminderDelivery.objects.filter(date__lt=cutoff).delete()
+
+        result_message = f"Pruned {deleted} reminder deliveries before {cutoff}"
+        logger.info(result_message)
+        return result_message
+
+    except Exception as exc:
+        logger.error(f"Error pruning reminder deliveries: {str(exc)}")
+        raise self.retry(exc=exc)
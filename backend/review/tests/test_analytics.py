@@ -0,0 +1,171 @@
+"""
+Tests for learning analytics series and endpoints.
+"""
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from content.models import Category, Content
+from review.analytics import ReviewSeries, get_retention_curve, get_review_streaks
+from review.models import DailyReviewStats, IntervalRetentionStats, ReviewHistory
+
+User = get_user_model()
+
+
+class AnalyticsTestMixin:
+    """Shared fixtures for analytics tests."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.category = Category.objects.create(name='Test', user=self.user)
+        self.content = Content.objects.create(
+            title='Test Content',
+            content='Test body',
+            author=self.user,
+            category=self.category
+        )
+        self.today = timezone.localdate()
+
+    def _stats(self, days_ago, remembered=0, partial=0, forgot=0, category=None):
+        return DailyReviewStats.objects.create(
+            user=self.user,
+            category=category,
+            date=self.today - timedelta(days=days_ago),
+            remembered_count=remembered,
+            partial_count=partial,
+            forgot_count=forgot,
+        )
+
+
+class ReviewSeriesTest(AnalyticsTestMixin, TestCase):
+    """Test array-backed review series."""
+
+    def test_day_series_sums_categories(self):
+        """Test a day bucket sums rollups of every category."""
+        self._stats(0, remembered=2, category=self.category)
+        self._stats(0, forgot=1)
+        self._stats(2, partial=3)
+
+        series = ReviewSeries.load(self.user, self.today - timedelta(days=2), self.today)
+
+        self.assertEqual(len(series), 3)
+        self.assertEqual(series.totals.tolist(), [3, 0, 3])
+        self.assertEqual(series.counts['remembered'].tolist(), [0, 0, 2])
+        self.assertEqual(series.to_dict()['forgot'], [0, 0, 1])
+
+    def test_week_series_aligned_to_monday(self):
+        """Test week buckets start on Monday and fold seven days."""
+        series = ReviewSeries(date(2025, 7, 16), date(2025, 7, 28), bucket='week')
+        series.add(date(2025, 7, 14), (1, 0, 0))
+        series.add(date(2025, 7, 20), (1, 1, 0))
+        series.add(date(2025, 7, 21), (0, 0, 4))
+
+        self.assertEqual(series.start, date(2025, 7, 14))
+        self.assertEqual(len(series), 3)
+        self.assertEqual(series.totals.tolist(), [3, 4, 0])
+        self.assertEqual(series.points()[1].date, date(2025, 7, 21))
+
+    def test_streaks(self):
+        """Test current and longest streaks from active days."""
+        for days_ago in (0, 1, 2, 5, 6, 7, 8):
+            self._stats(days_ago, remembered=1)
+
+        streaks = get_review_streaks(self.user)
+
+        self.assertEqual(streaks['current_streak'], 3)
+        self.assertEqual(streaks['longest_streak'], 4)
+        self.assertEqual(streaks['last_review_date'], self.today)
+        self.assertEqual(streaks['active_days'], 7)
+
+    def test_streak_broken(self):
+        """Test the current streak resets when yesterday was skipped."""
+        self._stats(2, remembered=1)
+
+        self.assertEqual(get_review_streaks(self.user)['current_streak'], 0)
+
+    def test_retention_curve_from_history(self):
+        """Test retention counters are fed by review histories with interval_index."""
+        for result, interval_index in [('remembered', 0), ('forgot', 0), ('remembered', 1), ('partial', None)]:
+            ReviewHistory.objects.create(
+                content=self.content,
+                user=self.user,
+                result=result,
+                interval_index=interval_index,
+            )
+
+        curve = get_retention_curve(self.user)
+
+        self.assertEqual(IntervalRetentionStats.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(curve['interval_index'], [0, 1])
+        self.assertEqual(curve['total'], [2, 1])
+        self.assertEqual(curve['retention_rate'], [50.0, 100.0])
+
+
+class ReviewAnalyticsViewTest(AnalyticsTestMixin, TestCase):
+    """Test analytics endpoints."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_series_paginated(self):
+        """Test series endpoint uses AnalyticsPagination."""
+        self._stats(1, remembered=2)
+        start = (self.today - timedelta(days=9)).isoformat()
+
+        response = self.client.get('/api/review/analytics/series/', {'start': start, 'page_size': 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 10)
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertEqual(response.data['analytics_meta']['aggregation_level'], 'day')
+        self.assertIn('private', response['Cache-Control'])
+
+    def test_series_invalid_params(self):
+        """Test invalid range and bucket parameters."""
+        response = self.client.get('/api/review/analytics/series/', {'start': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get('/api/review/analytics/series/', {'bucket': 'month'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get('/api/review/analytics/series/', {'start': '2000-01-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_heatmap(self):
+        """Test heatmap returns compact day arrays."""
+        self._stats(0, remembered=1, forgot=1)
+
+        response = self.client.get('/api/review/analytics/heatmap/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['total']), 365)
+        self.assertEqual(response.data['total'][-1], 2)
+
+    def test_streaks_and_retention(self):
+        """Test streak and retention endpoints."""
+        self._stats(0, remembered=1)
+
+        response = self.client.get('/api/review/analytics/streaks/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['current_streak'], 1)
+
+        response = self.client.get('/api/review/analytics/retention/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['interval_index'], [])
+
+    def test_analytics_unauthenticated(self):
+        """Test analytics endpoints require authentication."""
+        self.client.logout()
+
+        response = self.client.get('/api/review/analytics/heatmap/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
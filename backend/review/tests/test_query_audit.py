@@ -0,0 +1,67 @@
+"""
+Tests for the hot query plan audit.
+"""
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from resee.query_audit import analyze_plan, audit_hot_queries, benchmark_hot_queries, seed_review_volume
+from review.models import ReviewHistory, ReviewSchedule
+
+User = get_user_model()
+
+
+class QueryPlanAuditTest(TestCase):
+    """Test hot queries avoid full table scans on seeded volume."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user_ids = seed_review_volume(users=8, contents_per_user=20, histories_per_content=3, seed=1)
+
+    def test_seed_creates_expected_volume(self):
+        """Test seeding creates schedules and histories per user."""
+        self.assertEqual(ReviewSchedule.objects.filter(user_id__in=self.user_ids).count(), 160)
+        self.assertEqual(ReviewHistory.objects.filter(user_id__in=self.user_ids).count(), 480)
+
+    def test_hot_queries_use_indexes(self):
+        """Test no hot query full-scans its target table."""
+        user = User.objects.get(pk=self.user_ids[0])
+
+        results = audit_hot_queries(user)
+
+        scans = [result.name for result in results if result.full_scan]
+        self.assertEqual(scans, [])
+
+    def test_schedule_queries_use_partial_indexes(self):
+        """Test active-schedule queries are served by the is_active partial indexes."""
+        user = User.objects.get(pk=self.user_ids[0])
+
+        results = {result.name: result for result in audit_hot_queries(user)}
+
+        self.assertIn('review_sched_active_due', results['pending_reviews_count'].indexes)
+        self.assertIn('review_sched_active_due', results['daily_reminder_schedules'].indexes)
+        self.assertIn('notif_pref_next_daily', results['due_daily_reminders'].indexes)
+
+    def test_benchmark_reports_timings(self):
+        """Test the benchmark times every hot query."""
+        timings = benchmark_hot_queries(self.user_ids[:2], repeat=1)
+
+        self.assertIn('today_reviews', timings)
+        self.assertGreaterEqual(timings['today_reviews']['p95_ms'], timings['today_reviews']['median_ms'])
+
+    def test_analyze_plan_detects_scan(self):
+        """Test plan parsing distinguishes table scans from index scans."""
+        self.assertEqual(analyze_plan('SCAN review_reviewschedule', 'review_reviewschedule'), (True, []))
+        self.assertEqual(
+            analyze_plan('SEARCH review_reviewschedule USING INDEX review_sched_active_due (user_id=?)',
+                         'review_reviewschedule'),
+            (False, ['review_sched_active_due'])
+        )
+
+    def test_command_reports_pass(self):
+        """Test the audit command prints a verdict per query."""
+        out = StringIO()
+        call_command('audit_query_plans', user_id=self.user_ids[0], stdout=out)
+        self.assertIn('PASS today_reviews', out.getvalue())
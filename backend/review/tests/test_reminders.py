@@ -0,0 +1,179 @@
+"""
+Tests for daily reminder fan-out and the delivery ledger.
+"""
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from celery.exceptions import Retry
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from accounts.models import NotificationPreference
+from content.models import Content
+from review.models import ReminderDelivery, ReviewSchedule
+from review.tasks import (
+    prune_reminder_deliveries, send_due_daily_reminders, send_individual_review_reminder,
+)
+
+User = get_user_model()
+
+SEND_EMAIL = 'review.tasks.EmailService.send_template_email'
+
+
+@override_settings(FRONTEND_URL='http://localhost:3000')
+class ReminderDeliveryTest(TestCase):
+    """Test reminders are queued at the user's local time, once per day, and sent at most once."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.content = Content.objects.create(title='Test Content', content='Test body', author=self.user)
+        self.preference = self.user.notification_preference
+        self.preference.daily_reminder_time = time(9)
+        self.preference.time_zone = 'Asia/Seoul'
+        self.preference.save()
+
+        # A tick right after the next fire time, with a schedule due on that local day
+        self.fire_at = self.preference.next_daily_reminder_at
+        self.now = self.fire_at + timedelta(minutes=1)
+        self.today = self.fire_at.astimezone(ZoneInfo('Asia/Seoul')).date()
+        self.schedule = ReviewSchedule.objects.get(content=self.content, user=self.user)
+        self.schedule.next_review_date = self.fire_at
+        self.schedule.save()
+
+    def _delivery(self):
+        return ReminderDelivery.objects.get(user=self.user, date=self.today)
+
+    def _send(self):
+        return send_individual_review_reminder.run(self.user.id, [self.schedule.id], self.today.isoformat())
+
+    @patch('review.tasks.send_individual_review_reminder.delay')
+    def test_due_reminder_queued_and_rescheduled(self, delay):
+        queued = send_due_daily_reminders(now=self.now)
+
+        self.assertEqual(queued, 1)
+        delay.assert_called_once_with(self.user.id, [self.schedule.id], self.today.isoformat())
+        self.assertEqual(self._delivery().status, ReminderDelivery.Status.PENDING)
+        self.preference.refresh_from_db()
+        self.assertEqual(self.preference.next_daily_reminder_at, self.fire_at + timedelta(days=1))
+
+    @patch('review.tasks.send_individual_review_reminder.delay')
+    def test_reminder_not_due_yet(self, delay):
+        self.assertEqual(send_due_daily_reminders(now=self.fire_at - timedelta(minutes=1)), 0)
+
+        delay.assert_not_called()
+        self.preference.refresh_from_db()
+        self.assertEqual(self.preference.next_daily_reminder_at, self.fire_at)
+
+    @patch('review.tasks.send_individual_review_reminder.delay')
+    def test_fan_out_skips_handled_users_and_resumes_pending(self, delay):
+        ReminderDelivery.objects.create(user=self.user, date=self.today)
+        self.assertEqual(send_due_daily_reminders(now=self.now), 1)
+
+        ReminderDelivery.objects.update(status=ReminderDelivery.Status.SENT)
+        NotificationPreference.objects.update(next_daily_reminder_at=self.fire_at)
+        self.assertEqual(send_due_daily_reminders(now=self.now), 0)
+        self.assertEqual(delay.call_count, 1)
+
+    @patch('review.tasks.send_individual_review_reminder.delay', side_effect=ConnectionError('broker down'))
+    def test_fan_out_raises_when_queueing_fails(self, delay):
+        with self.assertRaises(RuntimeError):
+            send_due_daily_reminders(now=self.now)
+
+        self.assertEqual(self._delivery().status, ReminderDelivery.Status.PENDING)
+        self.preference.refresh_from_db()
+        self.assertEqual(self.preference.next_daily_reminder_at, self.fire_at)
+
+    @patch('review.tasks.send_individual_review_reminder.delay')
+    def test_overdue_reminder_skipped(self, delay):
+        send_due_daily_reminders(now=self.fire_at + timedelta(hours=12))
+
+        delay.assert_not_called()
+        self.preference.refresh_from_db()
+        self.assertEqual(self.preference.next_daily_reminder_at, self.fire_at + timedelta(days=1))
+
+    @patch('review.tasks.send_individual_review_reminder.delay')
+    def test_disabled_reminder_leaves_schedule(self, delay):
+        NotificationPreference.objects.update(daily_reminder_enabled=False)
+
+        send_due_daily_reminders(now=self.now)
+
+        delay.assert_not_called()
+        self.preference.refresh_from_db()
+        self.assertIsNone(self.preference.next_daily_reminder_at)
+
+    def test_next_reminder_in_user_time_zone(self):
+        self.preference.time_zone = 'America/New_York'
+        after = datetime(2026, 1, 15, 12, 0, tzinfo=dt_timezone.utc)  # 07:00 in New York
+
+        self.assertEqual(self.preference.next_daily_reminder(after=after),
+                         datetime(2026, 1, 15, 14, 0, tzinfo=dt_timezone.utc))
+        self.assertEqual(self.preference.next_daily_reminder(after=after + timedelta(hours=3)),
+                         datetime(2026, 1, 16, 14, 0, tzinfo=dt_timezone.utc))
+
+    def test_saving_preferences_reschedules(self):
+        self.preference.email_notifications_enabled = False
+        self.preference.save(update_fields=['email_notifications_enabled'])
+
+        self.preference.refresh_from_db()
+        self.assertIsNone(self.preference.next_daily_reminder_at)
+
+    @patch(SEND_EMAIL, return_value=True)
+    def test_reminder_sent_once(self, send_email):
+        self._send()
+        self._send()
+
+        send_email.assert_called_once()
+        delivery = self._delivery()
+        self.assertEqual(delivery.status, ReminderDelivery.Status.SENT)
+        self.assertEqual(delivery.attempts, 1)
+        self.assertIsNotNone(delivery.sent_at)
+
+    @patch(SEND_EMAIL, return_value=True)
+    def test_claimed_delivery_is_not_sent_again(self, send_email):
+        ReminderDelivery.objects.create(user=self.user, date=self.today, status=ReminderDelivery.Status.SENDING)
+
+        self._send()
+
+        send_email.assert_not_called()
+
+    @patch(SEND_EMAIL, return_value=False)
+    def test_failed_send_releases_claim_for_retry(self, send_email):
+        with patch.object(send_individual_review_reminder, 'retry', side_effect=Retry()):
+            with self.assertRaises(Retry):
+                self._send()
+
+        delivery = self._delivery()
+        self.assertEqual(delivery.status, ReminderDelivery.Status.PENDING)
+        self.assertEqual(delivery.last_error, 'Email sending failed')
+
+    @patch(SEND_EMAIL, return_value=False)
+    def test_exhausted_retries_mark_failed(self, send_email):
+        send_individual_review_reminder.apply(
+            args=(self.user.id, [self.schedule.id], self.today.isoformat()),
+            retries=send_individual_review_reminder.max_retries
+        )
+
+        self.assertEqual(self._delivery().status, ReminderDelivery.Status.FAILED)
+
+    @patch(SEND_EMAIL, return_value=True)
+    def test_inactive_schedules_are_skipped(self, send_email):
+        ReviewSchedule.objects.filter(pk=self.schedule.pk).update(is_active=False)
+
+        self._send()
+
+        send_email.assert_not_called()
+        self.assertEqual(self._delivery().status, ReminderDelivery.Status.SKIPPED)
+
+    def test_prune_old_deliveries(self):
+        ReminderDelivery.objects.create(user=self.user, date=self.today - timedelta(days=31))
+        ReminderDelivery.objects.create(user=self.user, date=self.today)
+
+        prune_reminder_deliveries()
+
+        self.assertEqual(list(ReminderDelivery.objects.values_list('date', flat=True)), [self.today])
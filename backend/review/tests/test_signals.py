@@ -0,0 +1,115 @@
+"""
+Tests for review signals and denormalized content counters.
+"""
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from content.models import Content
+from review.models import ReviewHistory
+
+User = get_user_model()
+
+
+class ContentReviewCounterTest(TestCase):
+    """Test Content review counters maintained from ReviewHistory."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.content = Content.objects.create(
+            title='Test Content',
+            content='Test body',
+            author=self.user
+        )
+
+    def test_counters_updated_on_history_creation(self):
+        """Test counters are bumped when review histories are created."""
+        ReviewHistory.objects.create(content=self.content, user=self.user, result='remembered')
+        ReviewHistory.objects.create(content=self.content, user=self.user, result='forgot')
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 2)
+        self.assertEqual(self.content.remembered_reviews, 1)
+        self.assertEqual(self.content.last_review_result, 'forgot')
+        self.assertIsNotNone(self.content.last_reviewed_at)
+
+    def test_counters_not_bumped_on_history_update(self):
+        """Test saving an existing history does not double count."""
+        history = ReviewHistory.objects.create(content=self.content, user=self.user, result='remembered')
+        history.notes = 'updated'
+        history.save()
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 1)
+        self.assertEqual(self.content.remembered_reviews, 1)
+
+    def test_counters_follow_result_edit(self):
+        """Test editing a history's result recomputes the counters."""
+        ReviewHistory.objects.create(content=self.content, user=self.user, result='forgot')
+        history = ReviewHistory.objects.create(content=self.content, user=self.user, result='remembered')
+
+        history.result = 'partial'
+        history.save(update_fields=['result'])
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 2)
+        self.assertEqual(self.content.remembered_reviews, 0)
+        self.assertEqual(self.content.last_review_result, 'partial')
+
+    def test_counters_refreshed_on_history_delete(self):
+        """Test deleting the latest history rolls the counters back to the previous review."""
+        ReviewHistory.objects.create(content=self.content, user=self.user, result='forgot')
+        latest = ReviewHistory.objects.create(content=self.content, user=self.user, result='remembered')
+
+        latest.delete()
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 1)
+        self.assertEqual(self.content.remembered_reviews, 0)
+        self.assertEqual(self.content.last_review_result, 'forgot')
+
+    def test_content_delete_skips_counter_refresh(self):
+        """Test histories deleted by a content cascade do not refresh the deleted content."""
+        ReviewHistory.objects.create(content=self.content, user=self.user, result='remembered')
+
+        with patch('review.signals.refresh_content_review_counters') as refresh:
+            self.content.delete()
+
+        refresh.assert_not_called()
+        self.assertFalse(ReviewHistory.objects.exists())
+
+    def test_rebuild_review_counters_command(self):
+        """Test the repair command recomputes drifted counters."""
+        ReviewHistory.objects.create(content=self.content, user=self.user, result='remembered')
+        ReviewHistory.objects.create(content=self.content, user=self.user, result='partial')
+        Content.objects.filter(pk=self.content.pk).update(
+            total_reviews=10, remembered_reviews=10, last_review_result='', last_reviewed_at=None
+        )
+
+        out = StringIO()
+        call_command('rebuild_review_counters', stdout=out)
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 2)
+        self.assertEqual(self.content.remembered_reviews, 1)
+        self.assertEqual(self.content.last_review_result, 'partial')
+        self.assertIsNotNone(self.content.last_reviewed_at)
+        self.assertIn('1 contents', out.getvalue())
+
+    def test_rebuild_resets_content_without_history(self):
+        """Test contents without history are reset to zero."""
+        Content.objects.filter(pk=self.content.pk).update(total_reviews=3, remembered_reviews=2)
+
+        call_command('rebuild_review_counters', stdout=StringIO())
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 0)
+        self.assertEqual(self.content.remembered_reviews, 0)
+        self.assertIsNone(self.content.last_reviewed_at)
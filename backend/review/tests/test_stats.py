@@ -0,0 +1,190 @@
+"""
+Tests for daily review stats rollups.
+"""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from content.models import Category, Content
+from review.models import DailyReviewStats, ReviewHistory
+from review.tasks import compact_daily_review_stats
+from review.utils import (
+    calculate_success_rate, get_review_stats_totals, rebuild_daily_review_stats,
+)
+
+User = get_user_model()
+
+
+class DailyReviewStatsTest(TestCase):
+    """Test DailyReviewStats maintenance and reads."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.category = Category.objects.create(name='Test', user=self.user)
+        self.content = Content.objects.create(
+            title='Test Content',
+            content='Test body',
+            author=self.user,
+            category=self.category
+        )
+        self.uncategorized = Content.objects.create(
+            title='Other Content',
+            content='Other body',
+            author=self.user
+        )
+
+    def _review(self, content, result, time_spent=10, ai_score=None):
+        return ReviewHistory.objects.create(
+            content=content,
+            user=self.user,
+            result=result,
+            time_spent=time_spent,
+            ai_score=ai_score,
+        )
+
+    def test_rollup_incremented_on_history_creation(self):
+        """Test a daily row per category is updated on review completion."""
+        self._review(self.content, 'remembered', ai_score=90.0)
+        self._review(self.content, 'partial', ai_score=60.0)
+        self._review(self.uncategorized, 'forgot', time_spent=None)
+
+        row = DailyReviewStats.objects.get(user=self.user, category=self.category)
+        self.assertEqual(row.date, timezone.localdate())
+        self.assertEqual(row.remembered_count, 1)
+        self.assertEqual(row.partial_count, 1)
+        self.assertEqual(row.total_time_spent, 20)
+        self.assertEqual(row.average_ai_score, 75.0)
+
+        uncategorized = DailyReviewStats.objects.get(user=self.user, category__isnull=True)
+        self.assertEqual(uncategorized.forgot_count, 1)
+        self.assertEqual(uncategorized.total_time_spent, 0)
+        self.assertIsNone(uncategorized.average_ai_score)
+
+    def test_rebuild_is_idempotent(self):
+        """Test rebuilding a day reproduces the incremental rollup."""
+        self._review(self.content, 'remembered')
+        self._review(self.uncategorized, 'forgot')
+        DailyReviewStats.objects.update(remembered_count=99)
+
+        rebuild_daily_review_stats(timezone.localdate())
+        rebuild_daily_review_stats(timezone.localdate())
+
+        self.assertEqual(DailyReviewStats.objects.count(), 2)
+        row = DailyReviewStats.objects.get(category=self.category)
+        self.assertEqual(row.remembered_count, 1)
+
+    def test_rebuild_removes_rows_of_empty_day(self):
+        """Test rebuilding a day without history drops stale rows."""
+        yesterday = timezone.localdate() - timedelta(days=1)
+        DailyReviewStats.objects.create(user=self.user, date=yesterday, remembered_count=3)
+
+        written = rebuild_daily_review_stats(yesterday)
+
+        self.assertEqual(written, 0)
+        self.assertFalse(DailyReviewStats.objects.filter(date=yesterday).exists())
+
+    def test_totals_respect_window(self):
+        """Test totals only sum rows inside the requested window."""
+        self._review(self.content, 'remembered')
+        DailyReviewStats.objects.create(
+            user=self.user,
+            category=self.category,
+            date=timezone.localdate() - timedelta(days=45),
+            forgot_count=5,
+        )
+
+        self.assertEqual(get_review_stats_totals(self.user, days=30)['total'], 1)
+        self.assertEqual(get_review_stats_totals(self.user, days=60)['total'], 6)
+
+        by_category = get_review_stats_totals(self.user, days=30, by_category=True)
+        self.assertEqual(by_category[self.category.id]['remembered'], 1)
+
+    def test_calculate_success_rate_from_rollups(self):
+        """Test success rate and breakdown read from rollups."""
+        self._review(self.content, 'remembered')
+        self._review(self.content, 'remembered')
+        self._review(self.content, 'forgot')
+        self._review(self.uncategorized, 'partial')
+
+        success_rate, total, details = calculate_success_rate(self.user, days=30)
+        self.assertEqual(total, 4)
+        self.assertEqual(success_rate, 50.0)
+        self.assertEqual(details, {'remembered': 2, 'partial': 1, 'forgot': 1})
+
+        success_rate, total, _ = calculate_success_rate(self.user, category=self.category)
+        self.assertEqual(total, 3)
+        self.assertEqual(success_rate, 66.7)
+
+    def test_compact_task_rebuilds_closed_days(self):
+        """Test the nightly task reconciles past days only."""
+        yesterday = timezone.localdate() - timedelta(days=1)
+        DailyReviewStats.objects.create(user=self.user, date=yesterday, forgot_count=2)
+        self._review(self.content, 'remembered')
+
+        compact_daily_review_stats.apply(kwargs={'days': 2})
+
+        self.assertFalse(DailyReviewStats.objects.filter(date=yesterday).exists())
+        self.assertTrue(DailyReviewStats.objects.filter(date=timezone.localdate()).exists())
+
+    def _row(self, category=None, date=None):
+        return DailyReviewStats.objects.get(
+            user=self.user, category=category, date=date or timezone.localdate()
+        )
+
+    def test_rollup_follows_result_edit(self):
+        """Test editing a history's result rebuilds its day."""
+        history = self._review(self.content, 'remembered')
+
+        history.result = 'forgot'
+        history.save()
+
+        row = self._row(self.category)
+        self.assertEqual(row.remembered_count, 0)
+        self.assertEqual(row.forgot_count, 1)
+
+    def test_rollup_follows_moved_history(self):
+        """Test moving a history to another day and category fixes both days."""
+        history = self._review(self.content, 'remembered')
+        older = timezone.now() - timedelta(days=10)
+
+        history.review_date = older
+        history.content = self.uncategorized
+        history.save()
+
+        self.assertFalse(DailyReviewStats.objects.filter(date=timezone.localdate()).exists())
+        self.assertEqual(self._row(date=timezone.localdate(older)).remembered_count, 1)
+
+    def test_rollup_skips_unrelated_update(self):
+        """Test saving fields outside the rollup leaves it alone."""
+        history = self._review(self.content, 'remembered')
+        DailyReviewStats.objects.update(remembered_count=5)
+
+        history.notes = 'note'
+        history.save(update_fields=['notes'])
+
+        self.assertEqual(self._row(self.category).remembered_count, 5)
+
+    def test_rollup_refreshed_on_history_delete(self):
+        """Test deleting a history removes it from its day's rollup."""
+        self._review(self.content, 'remembered')
+        history = self._review(self.content, 'forgot')
+
+        history.delete()
+
+        row = self._row(self.category)
+        self.assertEqual(row.remembered_count, 1)
+        self.assertEqual(row.forgot_count, 0)
+
+    def test_content_delete_keeps_rollup(self):
+        """Test cascaded history deletes keep past totals."""
+        self._review(self.content, 'remembered')
+
+        self.content.delete()
+
+        self.assertEqual(self._row(self.category).remembered_count, 1)
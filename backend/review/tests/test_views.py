@@ -325,6 +325,47 @@ class CompleteReviewMultipleChoiceTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+class CompleteReviewDescriptiveTest(TestCase):
+    """Test CompleteReviewView for descriptive mode."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            is_email_verified=True
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            content='x' * 250,  # Need sufficient length for Content validation
+            author=self.user,
+            review_mode='descriptive'
+        )
+        self.schedule = ReviewSchedule.objects.get(content=self.content, user=self.user)
+
+    @patch('ai_services.evaluators.ai_answer_evaluator.evaluate_answer')
+    def test_evaluation_does_not_wait_for_token_budget(self, mock_evaluate):
+        """Test the AI evaluation under the schedule row lock never queues for token budget."""
+        from ai_services.base import _budget_context
+
+        budgets = []
+
+        def evaluate(**kwargs):
+            budgets.append(_budget_context.get())
+            return {'score': 90.0, 'feedback': 'Good'}
+        mock_evaluate.side_effect = evaluate
+
+        response = self.client.post(f'/api/review/schedules/{self.schedule.id}/completions/', {
+            'descriptive_answer': 'My answer'
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['final_result'], 'remembered')
+        self.assertEqual(budgets[0].max_wait, 0)
+
+
 class ReviewHistoryViewSetTest(TestCase):
     """Test ReviewHistoryViewSet."""
 
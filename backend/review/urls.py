@@ -2,8 +2,9 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
-    CategoryReviewStatsView, DashboardStatsView, ReviewHistoryViewSet,
-    ReviewScheduleViewSet,
+    CategoryReviewStatsView, DashboardStatsView, RetentionCurveView,
+    ReviewHeatmapView, ReviewHistoryViewSet, ReviewScheduleViewSet,
+    ReviewSeriesView, ReviewStreakView,
 )
 
 app_name = 'review'
@@ -16,4 +17,8 @@ urlpatterns = [
     path('', include(router.urls)),
     path('category-stats/', CategoryReviewStatsView.as_view(), name='category-stats'),
     path('dashboard/', DashboardStatsView.as_view(), name='dashboard-stats'),
+    path('analytics/series/', ReviewSeriesView.as_view(), name='analytics-series'),
+    path('analytics/heatmap/', ReviewHeatmapView.as_view(), name='analytics-heatmap'),
+    path('analytics/streaks/', ReviewStreakView.as_view(), name='analytics-streaks'),
+    path('analytics/retention/', RetentionCurveView.as_view(), name='analytics-retention'),
 ]
@@ -87,6 +87,9 @@ def calculate_success_rate(user, category=None, days=30):
     """
     Calculate success rate for a user within specified days
 
+    Reads DailyReviewStats rollups, so the cost is bounded by the window
+    size rather than the user's review history.
+
     Args:
         user: User instance
         category: Category instance (optional)
@@ -97,28 +100,18 @@ def calculate_success_rate(user, category=None, days=30):
     """
     from .models import ReviewHistory
 
-    start_date = timezone.now().date() - timedelta(days=days)
+    totals = get_review_stats_totals(user, days=days, category=category)
 
-    # Base queryset
-    reviews = ReviewHistory.objects.filter(
-        user=user,
-        review_date__date__gte=start_date
-    )
-
-    # Filter by category if provided
-    if category:
-        reviews = reviews.filter(content__category=category)
-
-    total_reviews = reviews.count()
-    successful_reviews = reviews.filter(result='remembered').count()
+    total_reviews = totals['total']
+    successful_reviews = totals['remembered']
 
     success_rate = (successful_reviews / total_reviews * 100) if total_reviews > 0 else 0
 
     # Create details dict with breakdown by result
-    details = {}
-    for result_choice, _ in ReviewHistory.RESULT_CHOICES:
-        count = reviews.filter(result=result_choice).count()
-        details[result_choice] = count
+    details = {
+        result_choice: totals[result_choice]
+        for result_choice, _ in ReviewHistory.RESULT_CHOICES
+    }
 
     return round(success_rate, 1), total_reviews, details
 
@@ -143,7 +136,7 @@ def get_today_reviews_count(user, category=None):
 
     from .models import ReviewSchedule
 
-    today = timezone.now().date()
+    _, tomorrow_start = local_day_bounds()
 
     # Get user's subscription tier and determine overdue limit (same as TodayReviewView)
     max_overdue_days = SubscriptionService(user).get_max_review_interval()
@@ -158,7 +151,7 @@ def get_today_reviews_count(user, category=None):
         is_active=True
     ).filter(
         # Same logic as TodayReviewView: due today/overdue OR initial review not completed
-        Q(next_review_date__date__lte=today, next_review_date__gte=cutoff_date) |
+        Q(next_review_date__lt=tomorrow_start, next_review_date__gte=cutoff_date) |
         Q(initial_review_completed=False)
     )
 
@@ -181,14 +174,246 @@ def get_pending_reviews_count(user, category=None):
     """
     from .models import ReviewSchedule
 
-    today = timezone.now().date()
+    today_start, _ = local_day_bounds()
     schedules = ReviewSchedule.objects.filter(
         user=user,
         is_active=True,
-        next_review_date__date__lt=today
+        next_review_date__lt=today_start
     )
 
     if category:
         schedules = schedules.filter(content__category=category)
 
     return schedules.count()
+
+
+def refresh_content_review_counters(content_queryset):
+    """
+    Recompute denormalized review counters on Content from ReviewHistory
+
+    Used by the rebuild_review_counters command and after a history is edited
+    or deleted, where incremental F() updates cannot be applied.
+
+    Args:
+        content_queryset: Content queryset to repair
+
+    Returns:
+        int: Number of updated content rows
+    """
+    from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+    from django.db.models.functions import Coalesce
+
+    from .models import ReviewHistory
+
+    history = ReviewHistory.objects.filter(content=OuterRef('pk')).order_by()
+    counts = history.values('content').annotate(
+        total=Count('id'),
+        remembered=Count('id', filter=Q(result='remembered')),
+    )
+    latest = history.order_by('-review_date', '-id')
+
+    return content_queryset.update(
+        total_reviews=Coalesce(
+            Subquery(counts.values('total')[:1], output_field=IntegerField()), Value(0)
+        ),
+        remembered_reviews=Coalesce(
+            Subquery(counts.values('remembered')[:1], output_field=IntegerField()), Value(0)
+        ),
+        last_reviewed_at=Subquery(latest.values('review_date')[:1]),
+        last_review_result=Coalesce(Subquery(latest.values('result')[:1]), Value('')),
+    )
+
+
+def local_day_bounds(day=None, tz=None):
+    """
+    Return aware [start, end) datetimes of a calendar day in a time zone
+
+    Filtering with `field__gte=start, field__lt=end` keeps predicates sargable,
+    unlike `field__date=day` which casts every row and defeats index range scans.
+
+    Args:
+        day: date (optional). Defaults to today in the time zone.
+        tz: tzinfo (optional). Defaults to settings.TIME_ZONE.
+
+    Returns:
+        tuple: (start, end) aware datetimes
+    """
+    from datetime import datetime, time
+
+    day = day or timezone.localdate(timezone=tz)
+    start = timezone.make_aware(datetime.combine(day, time.min), tz)
+    end = timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min), tz)
+    return start, end
+
+
+def record_daily_review_stats(history):
+    """
+    Add a newly created ReviewHistory to its daily rollup row
+
+    Args:
+        history: ReviewHistory instance (just created)
+    """
+    from django.db.models import F
+
+    from .models import DailyReviewStats
+
+    row, _ = DailyReviewStats.objects.get_or_create(
+        user_id=history.user_id,
+        category_id=history.content.category_id,
+        date=timezone.localdate(history.review_date),
+    )
+
+    increments = {
+        DailyReviewStats.RESULT_FIELDS[history.result]: F(DailyReviewStats.RESULT_FIELDS[history.result]) + 1,
+        'total_time_spent': F('total_time_spent') + (history.time_spent or 0),
+        'updated_at': timezone.now(),
+    }
+    if history.ai_score is not None:
+        increments['ai_score_sum'] = F('ai_score_sum') + history.ai_score
+        increments['ai_score_count'] = F('ai_score_count') + 1
+
+    DailyReviewStats.objects.filter(pk=row.pk).update(**increments)
+
+
+def record_interval_retention(history):
+    """
+    Add a newly created ReviewHistory to its interval retention counter
+
+    Args:
+        history: ReviewHistory instance (just created)
+    """
+    from django.db.models import F
+
+    from .models import DailyReviewStats, IntervalRetentionStats
+
+    if history.interval_index is None:
+        return
+
+    field = DailyReviewStats.RESULT_FIELDS[history.result]
+    row, _ = IntervalRetentionStats.objects.get_or_create(
+        user_id=history.user_id,
+        interval_index=history.interval_index,
+    )
+    IntervalRetentionStats.objects.filter(pk=row.pk).update(
+        **{field: F(field) + 1, 'updated_at': timezone.now()}
+    )
+
+
+def rebuild_daily_review_stats(day, user=None):
+    """
+    Rebuild daily rollup rows of a day from raw ReviewHistory
+
+    Reconciles increments that were missed (or double applied) and picks up
+    category changes made after the review. Idempotent.
+
+    Args:
+        day: date in settings.TIME_ZONE
+        user: User instance (optional). Rebuilds all users if not provided.
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    from django.db import transaction
+    from django.db.models import Count, Q, Sum
+    from django.db.models.functions import Coalesce
+
+    from .models import DailyReviewStats, ReviewHistory
+
+    start, end = local_day_bounds(day)
+
+    histories = ReviewHistory.objects.filter(review_date__gte=start, review_date__lt=end)
+    existing = DailyReviewStats.objects.filter(date=day)
+    if user is not None:
+        histories = histories.filter(user=user)
+        existing = existing.filter(user=user)
+
+    aggregates = {
+        field: Count('id', filter=Q(result=result))
+        for result, field in DailyReviewStats.RESULT_FIELDS.items()
+    }
+    aggregates.update(
+        total_time_spent=Coalesce(Sum('time_spent'), 0),
+        ai_score_sum=Coalesce(Sum('ai_score'), 0.0),
+        ai_score_count=Count('ai_score'),
+    )
+    grouped = histories.order_by().values('user_id', 'content__category_id').annotate(**aggregates)
+
+    rows = [
+        DailyReviewStats(
+            user_id=item.pop('user_id'),
+            category_id=item.pop('content__category_id'),
+            date=day,
+            **item
+        )
+        for item in grouped
+    ]
+
+    with transaction.atomic():
+        existing.delete()
+        DailyReviewStats.objects.bulk_create(rows)
+
+    return len(rows)
+
+
+def refresh_daily_review_stats(history, previous_review_date=None):
+    """
+    Rebuild the rollups of the day(s) an edited or deleted ReviewHistory counts in
+
+    The whole (user, day) is rebuilt, so a history moved to another content
+    (and category) is fixed on both rows.
+
+    Args:
+        history: ReviewHistory instance (edited or deleted)
+        previous_review_date: review_date before the edit (optional)
+    """
+    days = {timezone.localdate(history.review_date)}
+    if previous_review_date is not None:
+        days.add(timezone.localdate(previous_review_date))
+
+    for day in days:
+        rebuild_daily_review_stats(day, user=history.user_id)
+
+
+def get_review_stats_totals(user, days=30, category=None, by_category=False):
+    """
+    Sum daily rollups over the last `days` days (plus today)
+
+    Args:
+        user: User instance
+        days: Number of days to look back (default: 30)
+        category: Category instance (optional)
+        by_category: Return {category_id: totals} instead of a single totals dict
+
+    Returns:
+        dict: remembered/partial/forgot counts, total, total_time_spent,
+              ai_score_sum and ai_score_count
+    """
+    from django.db.models import Sum
+    from django.db.models.functions import Coalesce
+
+    from .models import DailyReviewStats
+
+    start_date = timezone.localdate() - timedelta(days=days)
+    rows = DailyReviewStats.objects.filter(user=user, date__gte=start_date)
+    if category:
+        rows = rows.filter(category=category)
+
+    sums = {
+        result: Coalesce(Sum(field), 0)
+        for result, field in DailyReviewStats.RESULT_FIELDS.items()
+    }
+    sums.update(
+        total_time_spent=Coalesce(Sum('total_time_spent'), 0),
+        ai_score_sum=Coalesce(Sum('ai_score_sum'), 0.0),
+        ai_score_count=Coalesce(Sum('ai_score_count'), 0),
+    )
+
+    def with_total(item):
+        item['total'] = sum(item[result] for result in DailyReviewStats.RESULT_FIELDS)
+        return item
+
+    if by_category:
+        grouped = rows.order_by().values('category_id').annotate(**sums)
+        return {item.pop('category_id'): with_total(item) for item in grouped}
+
+    return with_total(rows.aggregate(**sums))
@@ -19,7 +19,7 @@ from .models import ReviewHistory, ReviewSchedule
 from .serializers import ReviewHistorySerializer, ReviewScheduleSerializer
 from .utils import (
     calculate_success_rate, get_pending_reviews_count, get_review_intervals,
-    get_today_reviews_count,
+    get_review_stats_totals, get_today_reviews_count, local_day_bounds,
 )
 
 logger = logging.getLogger(__name__)
@@ -168,7 +168,7 @@ class TodayReviewView(APIView):
         """Get review items due today or overdue (within subscription limits)"""
         # Use timezone-aware date calculation (respects TIME_ZONE setting)
         now = timezone.now()
-        today = now.date()
+        _, tomorrow_start = local_day_bounds()
 
         # Get user's subscription tier and determine overdue limit
         max_overdue_days = SubscriptionService(request.user).get_max_review_interval()
@@ -188,7 +188,7 @@ class TodayReviewView(APIView):
             # Completed reviews shown if due today/overdue (within subscription range)
             Q(
                 initial_review_completed=True,
-                next_review_date__date__lte=today,
+                next_review_date__lt=tomorrow_start,
                 next_review_date__gte=cutoff_date
             )
         )
@@ -400,14 +400,17 @@ class CompleteReviewView(APIView):
                         )
 
                     # AI evaluation for descriptive answer
+                    from ai_services.base import ai_budget_user
                     from ai_services.evaluators import ai_answer_evaluator
 
                     try:
-                        evaluation = ai_answer_evaluator.evaluate_answer(
-                            content_title=schedule.content.title,
-                            content_body=schedule.content.content,
-                            user_answer=descriptive_answer
-                        )
+                        # 스케줄 행 잠금을 잡고 있으므로 토큰 예산을 기다리지 않고 바로 수동 입력으로 대체
+                        with ai_budget_user(request.user, max_wait=0):
+                            evaluation = ai_answer_evaluator.evaluate_answer(
+                                content_title=schedule.content.title,
+                                content_body=schedule.content.content,
+                                user_answer=descriptive_answer
+                            )
 
                         ai_score = evaluation.get('score', 0.0)
                         ai_feedback = evaluation.get('feedback', '')
@@ -461,6 +464,7 @@ class CompleteReviewView(APIView):
                     selected_choice=selected_choice,
                     ai_score=float(ai_score) if ai_score is not None else None,
                     ai_feedback=ai_feedback,
+                    interval_index=schedule.interval_index,
                 )
 
                 # Update schedule based on result with subscription limits
@@ -584,10 +588,7 @@ class CategoryReviewStatsView(APIView):
         result = {}
 
         # Import additional Django aggregation functions
-        from datetime import timedelta
-
-        from django.db.models import Avg, Case, Count, IntegerField, When
-        from django.utils import timezone
+        from django.db.models import Count
 
         # Get user-accessible categories with content count in one query
         categories = categories.annotate(
@@ -598,11 +599,12 @@ class CategoryReviewStatsView(APIView):
         )
 
         # Get today's reviews aggregated by category
-        today = timezone.now().date()
+        today_start, tomorrow_start = local_day_bounds()
         today_reviews_by_category = ReviewSchedule.objects.filter(
             user=request.user,
             is_active=True,
-            next_review_date__date=today
+            next_review_date__gte=today_start,
+            next_review_date__lt=tomorrow_start
         ).values('content__category').annotate(
             today_count=Count('id')
         )
@@ -611,29 +613,18 @@ class CategoryReviewStatsView(APIView):
             for item in today_reviews_by_category
         }
 
-        # Get 30-day review history aggregated by category
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        reviews_30_days = ReviewHistory.objects.filter(
-            user=request.user,
-            review_date__gte=thirty_days_ago
-        ).values('content__category').annotate(
-            total_reviews=Count('id'),
-            success_rate=Avg(
-                Case(
-                    When(result='remembered', then=100),
-                    When(result='partial', then=50),
-                    When(result='forgot', then=0),
-                    output_field=IntegerField()
-                )
-            )
-        )
-
+        # Get 30-day review totals by category from daily rollups
         reviews_30_days_dict = {}
-        for item in reviews_30_days:
-            category_id = item['content__category']
+        for category_id, totals in get_review_stats_totals(request.user, days=30, by_category=True).items():
+            total_reviews = totals['total']
+            # Weighted success rate: remembered=100, partial=50, forgot=0
+            success_rate = (
+                (totals['remembered'] * 100 + totals['partial'] * 50) / total_reviews
+                if total_reviews else 0
+            )
             reviews_30_days_dict[category_id] = {
-                'total_reviews': item['total_reviews'],
-                'success_rate': round(item['success_rate'] or 0, 1)
+                'total_reviews': total_reviews,
+                'success_rate': round(success_rate, 1)
             }
 
         # Build optimized result
@@ -711,3 +702,206 @@ class DashboardStatsView(APIView):
             'success_rate': success_rate,
             'total_reviews_30_days': total_reviews_30_days,
         })
+
+
+class ReviewAnalyticsView(APIView):
+    """
+    학습 분석 공통 베이스
+
+    일별 롤업(DailyReviewStats) 기반 범위 조회의 파라미터 파싱과 캐싱을 담당합니다.
+    과거 범위(end < 오늘)는 야간 재계산 전까지 변하지 않으므로 서버/클라이언트 캐시를 허용합니다.
+    """
+    default_range_days = 90
+    max_range_days = 731
+    past_range_max_age = 3600
+    live_range_max_age = 60
+
+    def get_date_range(self, request):
+        """Parse ?start=&end= (YYYY-MM-DD). Returns (start, end, error_response)"""
+        from datetime import date
+
+        today = timezone.localdate()
+        try:
+            end = date.fromisoformat(request.query_params['end']) if 'end' in request.query_params else today
+            start = (
+                date.fromisoformat(request.query_params['start'])
+                if 'start' in request.query_params
+                else end - timedelta(days=self.default_range_days - 1)
+            )
+        except ValueError:
+            return None, None, Response(
+                {'error': 'start and end must be dates in YYYY-MM-DD format'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        end = min(end, today)
+        if start > end:
+            return None, None, Response(
+                {'error': 'start must not be after end'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if (end - start).days >= self.max_range_days:
+            return None, None, Response(
+                {'error': f'date range cannot exceed {self.max_range_days} days'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return start, end, None
+
+    def cached_response(self, request, end, build_data):
+        """Serve past ranges from cache; always mark responses as privately cacheable"""
+        from django.utils.cache import patch_cache_control
+
+        from resee.cache_utils import CacheManager
+
+        is_past_range = end is not None and end < timezone.localdate()
+        max_age = self.past_range_max_age if is_past_range else self.live_range_max_age
+
+        if is_past_range:
+            cache_key = CacheManager.get_cache_key(
+                f'review:analytics:{self.__class__.__name__}',
+                request.user.id,
+                sorted(request.query_params.items())
+            )
+            data = CacheManager.get_cache(cache_key)
+            if data is None:
+                data = build_data()
+                CacheManager.set_cache(cache_key, data, max_age)
+        else:
+            data = build_data()
+
+        response = Response(data)
+        patch_cache_control(response, private=True, max_age=max_age)
+        return response
+
+
+class ReviewSeriesView(ReviewAnalyticsView):
+    """
+    복습 시계열
+
+    일/주 단위로 버킷된 복습 결과 시계열을 페이지네이션하여 제공합니다.
+    """
+
+    @swagger_auto_schema(
+        operation_summary="복습 시계열 조회",
+        operation_description="일별 롤업 기반 일/주 단위 복습 결과 시계열 (AnalyticsPagination)",
+        manual_parameters=[
+            openapi.Parameter('start', openapi.IN_QUERY, description="시작일 (YYYY-MM-DD)", type=openapi.TYPE_STRING),
+            openapi.Parameter('end', openapi.IN_QUERY, description="종료일 (YYYY-MM-DD)", type=openapi.TYPE_STRING),
+            openapi.Parameter('bucket', openapi.IN_QUERY, description="day 또는 week", type=openapi.TYPE_STRING),
+            openapi.Parameter('category', openapi.IN_QUERY, description="카테고리 ID", type=openapi.TYPE_INTEGER),
+        ],
+    )
+    def get(self, request):
+        from resee.pagination import AnalyticsPagination
+
+        from .analytics import BUCKET_DAYS, ReviewSeries
+
+        start, end, error_response = self.get_date_range(request)
+        if error_response:
+            return error_response
+
+        bucket = request.query_params.get('bucket', 'day')
+        if bucket not in BUCKET_DAYS:
+            return Response(
+                {'error': f'bucket must be one of: {", ".join(BUCKET_DAYS)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        category = request.query_params.get('category')
+        if category is not None:
+            try:
+                category = int(category)
+            except (ValueError, TypeError):
+                return Response(
+                    {'error': 'category must be a valid integer'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        def build_data():
+            series = ReviewSeries.load(request.user, start, end, bucket=bucket, category=category)
+            paginator = AnalyticsPagination()
+            paginator.aggregation_level = bucket
+            page = paginator.paginate_queryset(series.points(), request, view=self)
+            return paginator.get_paginated_response([point._asdict() for point in page]).data
+
+        return self.cached_response(request, end, build_data)
+
+
+class ReviewHeatmapView(ReviewAnalyticsView):
+    """
+    복습 히트맵
+
+    일별 복습 수를 압축된 배열 형태로 제공합니다.
+    """
+    default_range_days = 365
+
+    @swagger_auto_schema(
+        operation_summary="일별 복습 히트맵 조회",
+        operation_description="start부터 하루 단위로 정렬된 배열(total/remembered/partial/forgot)을 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter('start', openapi.IN_QUERY, description="시작일 (YYYY-MM-DD)", type=openapi.TYPE_STRING),
+            openapi.Parameter('end', openapi.IN_QUERY, description="종료일 (YYYY-MM-DD)", type=openapi.TYPE_STRING),
+        ],
+    )
+    def get(self, request):
+        from .analytics import ReviewSeries
+
+        start, end, error_response = self.get_date_range(request)
+        if error_response:
+            return error_response
+
+        return self.cached_response(
+            request, end, lambda: ReviewSeries.load(request.user, start, end).to_dict()
+        )
+
+
+class ReviewStreakView(ReviewAnalyticsView):
+    """
+    복습 연속 기록
+
+    현재/최장 연속 복습 일수를 제공합니다.
+    """
+
+    @swagger_auto_schema(
+        operation_summary="복습 연속 기록 조회",
+        responses={200: openapi.Response(
+            description="연속 복습 일수",
+            examples={
+                "application/json": {
+                    "current_streak": 4,
+                    "longest_streak": 12,
+                    "last_review_date": "2025-07-20",
+                    "active_days": 57
+                }
+            }
+        )}
+    )
+    def get(self, request):
+        from .analytics import get_review_streaks
+
+        return self.cached_response(request, None, lambda: get_review_streaks(request.user))
+
+
+class RetentionCurveView(ReviewAnalyticsView):
+    """
+    복습 간격별 기억 유지율
+
+    interval_index별 누적 결과 카운터로 망각곡선 유지율을 제공합니다.
+    """
+
+    @swagger_auto_schema(
+        operation_summary="간격별 기억 유지율 조회",
+        operation_description="interval_index 순으로 정렬된 병렬 배열을 반환합니다.",
+    )
+    def get(self, request):
+        from .analytics import get_retention_curve
+
+        def build_data():
+            data = get_retention_curve(request.user)
+            intervals = get_review_intervals(request.user)
+            data['interval_days'] = [
+                intervals[min(index, len(intervals) - 1)] for index in data['interval_index']
+            ]
+            return data
+
+        return self.cached_response(request, None, build_data)
@@ -1,15 +1,232 @@
 """
 Slack notification utility for Resee
 Sends alerts to Slack for critical system events
+
+Alerts are handed to an in-process AlertDispatcher and posted by a
+background sender thread, so callers on the request path (health checks,
+the DRF exception handler) never wait on Slack. Identical alerts within the
+coalescing window are sent once with a repeat count, and each alert key is
+rate limited.
 """
+import hashlib
+import json
 import logging
-from typing import Any, Dict, Optional
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from resee.background import ProcessLocal
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ALERT_SETTINGS = {
+    'COALESCE_WINDOW_SECONDS': 300,
+    'RATE_LIMIT_COUNT': 5,
+    'RATE_LIMIT_WINDOW_SECONDS': 300,
+    'QUEUE_SIZE': 1000,
+    'TIMEOUT_SECONDS': 5,
+}
+
+
+class _Window:
+    """Coalescing state of one alert fingerprint"""
+
+    __slots__ = ('started', 'suppressed', 'payload')
+
+    def __init__(self, started: float, payload: Dict[str, Any]):
+        self.started = started
+        self.suppressed = 0
+        self.payload = payload
+
+
+class AlertDispatcher:
+    """
+    Non-blocking alert queue with a background sender
+
+    - Coalescing: an alert identical (same fingerprint) to one sent within
+      `coalesce_window` seconds is only counted. The count is reported on the
+      next identical alert, or by the sender once the window has passed.
+    - Rate limiting: at most `rate_limit` alerts per alert key within
+      `rate_window` seconds. Rejected alerts are counted and reported on the
+      next alert sent for that key.
+    - The sender thread starts lazily once per process (resee.background.ProcessLocal).
+
+    Args:
+        send: Callable posting one payload, returns bool. Runs on the sender thread
+        coalesce_window: Seconds identical alerts are coalesced
+        rate_limit: Alerts allowed per alert key within rate_window
+        rate_window: Rate limit window in seconds
+        maxsize: Queue capacity (alerts beyond it are dropped)
+        clock: Monotonic clock (for tests)
+    """
+
+    # Sender wakes up at least this often to report expired coalescing windows
+    IDLE_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        send: Callable[[Dict[str, Any]], bool],
+        coalesce_window: float = 300,
+        rate_limit: int = 5,
+        rate_window: float = 300,
+        maxsize: int = 1000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.send = send
+        self.coalesce_window = coalesce_window
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.maxsize = maxsize
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._windows: Dict[str, _Window] = {}
+        self._sent: Dict[str, deque] = {}
+        self._rate_limited: Dict[str, int] = {}
+        self._sender: ProcessLocal[queue.Queue] = ProcessLocal(self._start_sender)
+
+    def submit(self, alert_key: str, payload: Dict[str, Any], fingerprint: Optional[str] = None) -> bool:
+        """
+        Queue an alert without waiting for delivery
+
+        Args:
+            alert_key: Rate limit key (e.g. 'health:database:down')
+            payload: Slack webhook payload
+            fingerprint: Identity for coalescing (optional, default payload hash)
+
+        Returns:
+            bool: True if the alert was queued or coalesced into a recent identical
+                  alert, False if it was rate limited or the queue is full
+        """
+        fingerprint = fingerprint or alert_fingerprint(payload)
+        now = self.clock()
+
+        with self._lock:
+            window = self._windows.get(fingerprint)
+            if window is not None and now - window.started < self.coalesce_window:
+                window.suppressed += 1
+                return True
+
+            sent = self._sent.setdefault(alert_key, deque())
+            while sent and now - sent[0] >= self.rate_window:
+                sent.popleft()
+            if len(sent) >= self.rate_limit:
+                self._rate_limited[alert_key] = self._rate_limited.get(alert_key, 0) + 1
+                return False
+
+            notes = []
+            if window is not None and window.suppressed:
+                notes.append(f"repeated {window.suppressed} more time(s) in the last window")
+            rate_limited = self._rate_limited.pop(alert_key, 0)
+            if rate_limited:
+                notes.append(f"{rate_limited} similar alert(s) suppressed by rate limit")
+
+            sent.append(now)
+            self._windows[fingerprint] = _Window(now, payload)
+
+        return self._enqueue(_with_notes(payload, notes))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until queued alerts are delivered (tests, shutdown)
+
+        Returns:
+            bool: True if the queue drained within timeout
+        """
+        alert_queue = self._sender.peek()
+        if alert_queue is None:
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with alert_queue.all_tasks_done:
+            while alert_queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                alert_queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _enqueue(self, payload: Dict[str, Any]) -> bool:
+        try:
+            self._sender.get().put_nowait(payload)
+            return True
+        except queue.Full:
+            logger.warning("Slack alert queue is full, dropping alert")
+            return False
+
+    def _start_sender(self) -> queue.Queue:
+        alert_queue = queue.Queue(self.maxsize)
+        threading.Thread(
+            target=self._run, args=(alert_queue,), name='slack-alert-sender', daemon=True
+        ).start()
+        return alert_queue
+
+    def _run(self, alert_queue: queue.Queue) -> None:
+        while True:
+            try:
+                payload = alert_queue.get(timeout=self.IDLE_INTERVAL)
+            except queue.Empty:
+                self._report_expired()
+                continue
+
+            try:
+                self.send(payload)
+            except Exception as e:
+                logger.error(f"Unexpected error sending Slack alert: {e}")
+            finally:
+                alert_queue.task_done()
+
+    def _report_expired(self) -> None:
+        """Send repeat counts of coalescing windows that ended, and forget old windows"""
+        now = self.clock()
+        summaries = []
+        with self._lock:
+            for fingerprint, window in list(self._windows.items()):
+                if now - window.started < self.coalesce_window:
+                    continue
+                del self._windows[fingerprint]
+                if window.suppressed:
+                    summaries.append(_with_notes(
+                        window.payload,
+                        [f"repeated {window.suppressed} more time(s) in the last window"]
+                    ))
+
+            for alert_key, sent in list(self._sent.items()):
+                while sent and now - sent[0] >= self.rate_window:
+                    sent.popleft()
+                if not sent and not self._rate_limited.get(alert_key):
+                    del self._sent[alert_key]
+
+        for payload in summaries:
+            self._enqueue(payload)
+
+
+def alert_fingerprint(payload: Dict[str, Any]) -> str:
+    """Identity of an alert for coalescing (payload without the timestamp)"""
+    attachments = [
+        {key: value for key, value in attachment.items() if key != 'ts'}
+        for attachment in payload.get('attachments', [])
+    ]
+    identity = dict(payload, attachments=attachments)
+    return hashlib.sha1(json.dumps(identity, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _with_notes(payload: Dict[str, Any], notes) -> Dict[str, Any]:
+    """Copy of payload with notes appended to the attachment text"""
+    if not notes:
+        return payload
+    attachments = [dict(attachment) for attachment in payload.get('attachments', [])]
+    note = '\n'.join(f"_({note})_" for note in notes)
+    if attachments:
+        attachments[0]['text'] = f"{attachments[0].get('text', '')}\n{note}"
+    return dict(payload, attachments=attachments)
+
 
 class SlackNotifier:
     """
@@ -22,26 +239,70 @@ class SlackNotifier:
         self.bot_name = getattr(settings, 'SLACK_BOT_NAME', 'Resee Alert Bot')
         self.enabled = bool(self.webhook_url)
 
+        alert_settings = {**DEFAULT_ALERT_SETTINGS, **getattr(settings, 'SLACK_ALERT_SETTINGS', {})}
+        self.timeout = alert_settings['TIMEOUT_SECONDS']
+        self.dispatcher = AlertDispatcher(
+            self._post,
+            coalesce_window=alert_settings['COALESCE_WINDOW_SECONDS'],
+            rate_limit=alert_settings['RATE_LIMIT_COUNT'],
+            rate_window=alert_settings['RATE_LIMIT_WINDOW_SECONDS'],
+            maxsize=alert_settings['QUEUE_SIZE']
+        )
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session reused for every webhook call"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def _post(self, payload: Dict[str, Any]) -> bool:
+        """Post one payload to the webhook"""
+        try:
+            response = self.session.post(self.webhook_url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            logger.info(f"Slack alert sent successfully: {payload.get('text', '')[:50]}")
+            return True
+        except requests.RequestException as e:
+            logger.error(f"Failed to send Slack alert: {e}")
+            return False
+
     def send_alert(
         self,
         message: str,
         level: str = 'error',
         title: Optional[str] = None,
         fields: Optional[Dict[str, Any]] = None,
-        channel: Optional[str] = None
+        channel: Optional[str] = None,
+        alert_key: Optional[str] = None,
+        blocking: bool = False
     ) -> bool:
         """
         Send an alert to Slack
 
+        Queued for the background sender by default; identical alerts are
+        coalesced and each alert key is rate limited.
+
         Args:
             message: Main alert message
             level: Alert level ('error', 'warning', 'info', 'success')
             title: Optional title for the alert
             fields: Optional dictionary of additional fields
             channel: Optional channel override
+            alert_key: Optional rate limit key (default: level and title)
+            blocking: Post immediately and wait for Slack, bypassing coalescing
+                      and rate limiting (e.g. the staff test endpoint)
 
         Returns:
-            bool: True if alert was sent successfully
+            bool: True if alert was queued (or sent, when blocking) successfully
         """
         if not self.enabled:
             logger.debug("Slack notifications are disabled (no webhook URL configured)")
@@ -86,20 +347,11 @@ class SlackNotifier:
                     for key, value in fields.items()
                 ]
 
-            # Send to Slack
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
+            if blocking:
+                return self._post(payload)
 
-            logger.info(f"Slack alert sent successfully: {title or message[:50]}")
-            return True
+            return self.dispatcher.submit(alert_key or f"{level}:{title or 'System Alert'}", payload)
 
-        except requests.RequestException as e:
-            logger.error(f"Failed to send Slack alert: {e}")
-            return False
         except Exception as e:
             logger.error(f"Unexpected error sending Slack alert: {e}")
             return False
@@ -158,7 +410,8 @@ class SlackNotifier:
         return self.send_alert(
             message=message,
             level=level,
-            title=f'Health Check Alert: {service}'
+            title=f'Health Check Alert: {service}',
+            alert_key=f'health:{service}:{status}'
         )
 
     def send_payment_alert(
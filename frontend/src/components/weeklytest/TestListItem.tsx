@@ -127,7 +127,7 @@ const TestListItem: React.FC<TestListItemProps> = ({
         </div>
 
         <div className="flex space-x-2 ml-4">
-          {test.status === 'preparing' && (
+          {test.status === 'preparing' && !test.ready && (
             <div className="flex items-center gap-2 bg-indigo-100 dark:bg-indigo-900/30 text-indigo-800 dark:text-indigo-300 px-4 py-2 rounded-lg">
               <svg className="w-4 h-4 animate-spin" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                 <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M4 4v5h.582m15.356 2A8.001 8.001 0 004.582 9m0 0H9m11 11v-5h-.581m0 0a8.003 8.003 0 01-15.357-2m15.357 2H15" />
@@ -136,7 +136,7 @@ const TestListItem: React.FC<TestListItemProps> = ({
             </div>
           )}
 
-          {test.status === 'pending' && (
+          {(test.status === 'pending' || (test.status === 'preparing' && test.ready)) && (
             <button
               onClick={() => onStart(test.id)}
               disabled={isLoading}
@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import { useNavigate, useParams } from 'react-router-dom';
-import { weeklyTestAPI, WeeklyTest } from '../utils/api/exams';
+import { weeklyTestAPI, WeeklyTest, ExamProgress } from '../utils/api/exams';
 import { contentAPI } from '../utils/api/content';
 import { Content } from '../types';
 import TestResultsView from '../components/weeklytest/TestResultsView';
@@ -101,12 +101,16 @@ const ExamsPage: React.FC = () => {
       setShowContentSelector(false);
       setSelectedContentIds([]);
 
-      // 문제 생성 완료까지 폴링
+      // 시작 가능한 문제 수가 준비될 때까지 폴링
       setCreatingTestMessage('AI가 문제를 생성하고 있습니다... (최대 1분 소요)');
-      await pollTestStatus(createdTest.id);
+      const progress = await pollTestStatus(createdTest.id);
 
       // 완료 후 목록 새로고침
-      setCreatingTestMessage('시험 생성이 완료되었습니다!');
+      setCreatingTestMessage(
+        progress?.status === 'preparing'
+          ? '시험을 시작할 수 있습니다! 나머지 문제는 계속 생성됩니다.'
+          : '시험 생성이 완료되었습니다!'
+      );
       await loadTests();
 
       // 2초 후 메시지 제거
@@ -138,29 +142,34 @@ const ExamsPage: React.FC = () => {
     }
   };
 
-  const pollTestStatus = async (testId: number) => {
-    const maxAttempts = 60; // 최대 60초 대기
-    const pollInterval = 1000; // 1초마다 확인
+  const pollTestStatus = async (testId: number): Promise<ExamProgress | null> => {
+    const maxAttempts = 30; // 최대 60초 대기
+    const pollInterval = 2000; // 2초마다 확인
 
     for (let i = 0; i < maxAttempts; i++) {
       try {
-        const test = await weeklyTestAPI.getExam(testId);
+        // 문제 목록 없이 진행 상황만 조회
+        const progress = await weeklyTestAPI.getExamProgress(testId);
 
-        // preparing 상태가 아니면 완료
-        if (test.status !== 'preparing') {
-          return;
+        // 시작 가능한 문제 수가 준비되었거나 preparing 상태가 끝나면 완료
+        if (progress.ready || progress.status !== 'preparing') {
+          return progress;
         }
 
-        // 1초 대기
-        await new Promise(resolve => setTimeout(resolve, pollInterval));
+        setCreatingTestMessage(
+          `AI가 문제를 생성하고 있습니다... (${progress.generated}/${progress.total})`
+        );
       } catch (error) {
         console.error('Polling error:', error);
         // 에러 발생 시 계속 시도
       }
+
+      await new Promise(resolve => setTimeout(resolve, pollInterval));
     }
 
     // 타임아웃 - 에러는 발생시키지 않고 그냥 진행
     console.warn('Test creation polling timeout');
+    return null;
   };
 
   const handleContentToggle = (contentId: number) => {
@@ -15,6 +15,10 @@ export interface WeeklyTest {
   time_spent?: string;
   created_at: string;
   updated_at: string;
+  expected_questions?: number;
+  generated_questions?: number;
+  // 준비 중이라도 최소 문제 수가 생성되면 true (시험 시작 가능)
+  ready?: boolean;
   questions?: WeeklyTestQuestion[];
   user_answers?: WeeklyTestAnswer[];
 }
@@ -24,18 +28,14 @@ export interface WeeklyTestQuestion {
   question_type: 'multiple_choice' | 'true_false';
   question_text: string;
   choices?: string[];
-  correct_answer: string;
-  explanation: string;
+  // 시험 진행 중에는 내려오지 않고, 결과 조회 시에만 포함
+  correct_answer?: string;
+  explanation?: string;
   order: number;
   points: number;
   content: {
     id: number;
     title: string;
-    content: string;
-    category?: {
-      id: number;
-      name: string;
-    };
   };
   created_at: string;
 }
@@ -51,6 +51,16 @@ export interface WeeklyTestAnswer {
   answered_at: string;
 }
 
+export interface ExamProgress {
+  id: number;
+  status: WeeklyTest['status'];
+  generated: number;
+  total: number;
+  eta_seconds: number | null;
+  ready: boolean;
+  min_ready_questions: number;
+}
+
 export interface CreateWeeklyTestData {
   title?: string;
   description?: string;
@@ -109,6 +119,12 @@ export const examsAPI = {
     return response.data;
   },
 
+  // 문제 생성 진행 상황 조회 (문제 목록 없는 경량 응답)
+  getExamProgress: async (id: number): Promise<ExamProgress> => {
+    const response = await api.get(`/exams/${id}/progress/`);
+    return response.data;
+  },
+
   // 시험 시작 (RESTful)
   startTest: async (testId: number): Promise<{ message: string; test: Exam }> => {
     const response = await api.post('/exams/test-sessions/', { test_id: testId });